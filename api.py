@@ -0,0 +1,200 @@
+# -*- coding: utf-8 -*-
+"""
+REST/JSON API over the credit valuation and the simulation model.
+
+    uvicorn api:app                  # standalone
+    streamlit run asgi.py            # or mounted beside the dashboard
+
+    GET  /api/v1/valuation                       Level 1/2/3 line items and totals, ₩ and USD
+    GET  /api/v1/scenario?hyrex=120&eaf=150      one scenario; POST the same as a JSON object
+    POST /api/v1/scenarios                       many scenarios in one call
+
+A scenario is the simulation page's five slider percentages (missing ones
+default to 100); outputs are its credits (₩B) and CO₂ intensity (kg/t),
+from ``core.scenarios.evaluate``. A batch is either ``{"scenarios": [{...},
+...]}`` or columns ``{"hyrex": [...], "eaf": [...], ...}`` (a missing or
+scalar column applies to every scenario), up to ``MAX_BATCH`` scenarios;
+it is evaluated in one vectorised pass and answered as columns in input
+order: ``{"count": n, "outputs": {"l1": [...], ...}}``.
+
+Responses are cached by endpoint and normalised parameters (``eaf=150``
+and ``{"eaf": 150.0, "hyrex": 100}`` share an entry), least-recently-used
+within ``CACHE_BYTES``; a batch is keyed by a hash of its normalised
+columns. Every response carries a strong ETag of its body and ``If-None-
+Match`` gets a 304. ``X-Cache`` says whether the body came from the cache.
+"""
+
+import json
+import threading
+from collections import OrderedDict
+from hashlib import blake2b
+
+import numpy as np
+from starlette.applications import Starlette
+from starlette.concurrency import run_in_threadpool
+from starlette.responses import JSONResponse, Response
+from starlette.routing import Route
+
+from core import credits, scenarios
+from core.data import DATA_VERSION, POSCO_DATA
+
+PREFIX = '/api/v1'
+MAX_BATCH = 100_000
+CACHE_BYTES = 64 * 1024 * 1024
+MAX_AGE_S = 3600
+
+
+class ResponseCache:
+    """Encoded JSON bodies and their ETags by key, evicted least-recently-used past ``max_bytes``."""
+
+    def __init__(self, max_bytes=CACHE_BYTES):
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()   # key -> (body, etag)
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = self.misses = self.evictions = 0
+
+    def get(self, key, build):
+        """``(body, etag, hit)`` for ``key``, encoding ``build()`` on a miss."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry + (True,)
+            self.misses += 1
+        body = json.dumps(build(), separators=(',', ':'), ensure_ascii=False).encode()
+        entry = (body, f'"{blake2b(body, digest_size=12).hexdigest()}"')
+        if len(body) <= self.max_bytes:
+            with self._lock:
+                if key not in self._entries:
+                    self._entries[key] = entry
+                    self._bytes += len(body)
+                    while self._bytes > self.max_bytes:
+                        _, (old, _) = self._entries.popitem(last=False)
+                        self._bytes -= len(old)
+                        self.evictions += 1
+        return entry + (False,)
+
+    def stats(self):
+        with self._lock:
+            return {'entries': len(self._entries), 'bytes': self._bytes, 'hits': self.hits,
+                    'misses': self.misses, 'evictions': self.evictions}
+
+
+CACHE = ResponseCache()
+
+
+def etag_matches(header, etag):
+    """Whether an ``If-None-Match`` header matches ``etag``: ``*``, or one of its tags by weak comparison."""
+    etag = etag.removeprefix('W/')
+    for tag in header.split(','):
+        tag = tag.strip()
+        if tag == '*' or tag.removeprefix('W/') == etag:
+            return True
+    return False
+
+
+def respond(request, key, build):
+    body, etag, hit = CACHE.get(key, build)
+    headers = {'ETag': etag, 'Cache-Control': f"public, max-age={MAX_AGE_S}", 'X-Cache': 'hit' if hit else 'miss'}
+    if etag_matches(request.headers.get('if-none-match', ''), etag):
+        return Response(status_code=304, headers=headers)
+    return Response(body, media_type='application/json', headers=headers)
+
+
+def error(status, message):
+    return JSONResponse({'error': message}, status_code=status)
+
+
+async def json_body(request):
+    try:
+        return json.loads(await request.body())
+    except ValueError:
+        raise ValueError('body must be JSON') from None
+
+
+# =============================================================================
+# VALUATION
+# =============================================================================
+
+def valuation():
+    levels = {level.key: {'lines': dict(level.lines), 'total': level.total} for level in POSCO_DATA.credits}
+    totals = credits.level_totals(POSCO_DATA.credits)
+    return {
+        'currency': 'KRW', 'per': 'year', 'krw_per_usd': credits.KRW_PER_USD,
+        'levels': levels,
+        'cumulative': totals,
+        'cumulative_usd': {k: credits.to_usd(v) for k, v in totals.items()},
+    }
+
+
+async def valuation_endpoint(request):
+    return respond(request, ('valuation', DATA_VERSION), valuation)
+
+
+# =============================================================================
+# SCENARIOS
+# =============================================================================
+
+def scenario(params):
+    outputs = scenarios.evaluate(**params)
+    return {
+        'params': params,
+        'outputs': {k: float(v) for k, v in outputs.items()},
+        'baseline': scenarios.BASELINE,
+    }
+
+
+async def scenario_endpoint(request):
+    try:
+        raw = dict(request.query_params) if request.method == 'GET' else await json_body(request)
+        if not isinstance(raw, dict):
+            raise ValueError('body must be a JSON object of parameters')
+        params = scenarios.normalise(raw)
+    except ValueError as e:
+        return error(400, str(e))
+    return respond(request, ('scenario',) + tuple(params.values()), lambda: scenario(params))
+
+
+def batch_columns(body):
+    """``(columns, n)`` of a batch body in either accepted shape."""
+    if isinstance(body, dict) and 'scenarios' in body:
+        rows = body['scenarios']
+        if not isinstance(rows, list) or not all(isinstance(r, dict) for r in rows):
+            raise ValueError('scenarios must be a list of objects')
+        keys = set().union(*rows) if rows else set()
+        return {p: [r.get(p, scenarios.DEFAULTS[p]) for r in rows] for p in keys}, len(rows)
+    if isinstance(body, dict):
+        lengths = {len(v) for v in body.values() if isinstance(v, list)}
+        if len(lengths) > 1:
+            raise ValueError('columns differ in length')
+        return body, lengths.pop() if lengths else 1
+    raise ValueError('body must be {"scenarios": [...]} or {param: [...]}')
+
+
+def batch(columns):
+    outputs = scenarios.evaluate(**columns)
+    return {'count': len(columns[scenarios.PARAMS[0]]), 'outputs': {k: v.tolist() for k, v in outputs.items()}}
+
+
+async def batch_endpoint(request):
+    try:
+        columns, n = batch_columns(await json_body(request))
+        if n > MAX_BATCH:
+            return error(413, f"{n} scenarios, at most {MAX_BATCH} per call")
+        columns = scenarios.normalise_columns(columns, n)
+    except ValueError as e:
+        return error(400, str(e))
+    stacked = np.stack([columns[p] for p in scenarios.PARAMS])
+    key = ('scenarios', n, blake2b(stacked.tobytes(), digest_size=16).digest())
+    return await run_in_threadpool(respond, request, key, lambda: batch(columns))
+
+
+routes = [
+    Route(f"{PREFIX}/valuation", valuation_endpoint),
+    Route(f"{PREFIX}/scenario", scenario_endpoint, methods=['GET', 'POST']),
+    Route(f"{PREFIX}/scenarios", batch_endpoint, methods=['POST']),
+]
+
+app = Starlette(routes=routes)
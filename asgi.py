@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+"""
+ASGI entry point for the POSCO × Rekarbon MRV dashboard.
+
+    streamlit run asgi.py            # or: uvicorn asgi:app
+
+Runs ``app_posco_v2.py`` unchanged, with long-lived cache headers on the
+versioned static assets (see ``ui.assets``). ``streamlit run
+app_posco_v2.py`` still works; assets are then revalidated by ETag.
+
+Alongside the app, ``/api/live/ws`` (WebSocket) and ``/api/live/events``
+(SSE) push the live gauges and furnace statuses as snapshot deltas to
+SCADA overlays and wallboards (see ``telemetry.push``); they read the same
+snapshot producer as the Live Monitoring page. The valuation and scenario
+REST API (``api.py``) is served under ``/api/v1``, and ``/metrics`` exports
+the rerun profile (``ui.profiling``) in the Prometheus text format.
+"""
+
+from pathlib import Path
+
+import streamlit as st
+from starlette.middleware import Middleware
+from starlette.responses import PlainTextResponse
+from starlette.routing import Route
+
+import api
+from telemetry.push import Hub
+from ui import profiling
+from ui.assets import StaticCacheControl
+
+
+def live_snapshot():
+    """Latest snapshot of the Live Monitoring page's producer, starting its feed on first use."""
+    from core.data import POSCO_DATA
+    from views.live import live_snapshots
+
+    return live_snapshots(tuple((d.key, d.sensors) for d in POSCO_DATA.divisions.values())).latest()
+
+
+async def metrics(request):
+    return PlainTextResponse(profiling.PROFILER.prometheus(), media_type='text/plain; version=0.0.4')
+
+
+hub = Hub(live_snapshot)
+
+app = st.App(
+    Path(__file__).resolve().parent / 'app_posco_v2.py',
+    lifespan=hub.lifespan,
+    routes=hub.routes() + api.routes + [Route('/metrics', metrics)],
+    middleware=[Middleware(StaticCacheControl)],
+)
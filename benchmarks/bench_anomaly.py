@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Streaming anomaly detectors: throughput at 60 sensors x 10 Hz on one core,
+and detection of injected drift against false alerts on clean data.
+
+    python benchmarks/bench_anomaly.py --seconds 60 --hz 10
+
+Throughput replays simulator readings (5 channels per sensor) through both
+update paths:
+
+    frame     Detectors.observe_frame: one reading for every ring per call
+    readings  Detectors.observe: individual readings in shuffled batches
+
+Detection runs ``SiteMonitor`` at the live feed's 10 s period over
+``--days`` of clean readings, then injects a CO₂ kg/t ramp on one furnace
+and a temperature step on another and reports how long each took to alert.
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from telemetry import CHANNELS, SensorSimulator, build_catalogue, site  # noqa: E402
+from telemetry.anomaly import Detectors  # noqa: E402
+
+DIVISIONS = {'steelmaking': 25, 'chemical': 15, 'construction': 10, 'energy': 10}
+PERIOD_S = 10
+
+
+def throughput(sensors, frames, hz, batch, seed):
+    ts = 1.7e9 + np.arange(len(frames)) / hz
+    warm = Detectors(sensors, CHANNELS)
+    warm.observe_frames(ts[:warm.warmup], frames[:warm.warmup])
+    state_bytes = warm.nbytes
+
+    det = Detectors(sensors, CHANNELS)
+    start = time.perf_counter()
+    det.observe_frames(ts, frames)
+    frame_s = time.perf_counter() - start
+
+    n_rings = frames.shape[1] * frames.shape[2]
+    rng = np.random.default_rng(seed)
+    ring = np.tile(np.arange(n_rings), len(frames))
+    tick = np.repeat(np.arange(len(frames)), n_rings)
+    order = np.lexsort((rng.random(len(ring)), tick // max(1, batch // n_rings)))
+    sensor_idx, channel_idx = np.divmod(ring[order], frames.shape[2])
+    values = frames.reshape(len(frames), -1)[tick[order], ring[order]]
+    det = Detectors(sensors, CHANNELS)
+    start = time.perf_counter()
+    for i in range(0, len(ring), batch):
+        det.observe(sensor_idx[i:i + batch], channel_idx[i:i + batch], ts[tick[order][i:i + batch]], values[i:i + batch])
+    readings_s = time.perf_counter() - start
+    assert det.nbytes == state_bytes
+    return len(frames) * n_rings, frame_s, readings_s, state_bytes
+
+
+def detection(sensors, days, seed):
+    sim = SensorSimulator(sensors, seed=seed)
+    monitor = site.SiteMonitor(sensors, CHANNELS, max_alerts=100_000)
+    n = days * 86400 // PERIOD_S
+    ts = 1.7e9 + PERIOD_S * np.arange(n, dtype=np.float64)
+    for i in range(0, n, monitor.REPLAY_TAIL):
+        chunk = ts[i:i + monitor.REPLAY_TAIL]
+        monitor.extend_frames(chunk, sim.next_frames(len(chunk)))
+    false_alerts = len(monitor.alerts)
+
+    # Drift: +3 % CO₂ kg/t ramped in over 30 min on BF-1, -30 °C step on BF-2.
+    frames = sim.next_frames(3 * 360)
+    after = ts[-1] + PERIOD_S * np.arange(1, len(frames) + 1)
+    co2, temp = CHANNELS.index('co2_kg_t'), CHANNELS.index('temp_c')
+    frames[:, 0, co2] += np.minimum(np.arange(len(frames)) / 180, 1) * 0.03 * frames[:, 0, co2].mean()
+    frames[:, 1, temp] -= 30
+    before = len(monitor.alerts)
+    monitor.extend_frames(after, frames)
+    delays = {}
+    for a in list(monitor.alerts)[before:]:
+        key = (a.sensor, a.channel)
+        if key in (('BF-1 Pohang', 'co2_kg_t'), ('BF-2 Pohang', 'temp_c')) and key not in delays:
+            delays[key] = (a.kind, a.ts - after[0])
+    return false_alerts, delays
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--seconds', type=float, default=60.0, help='simulated seconds of 10 Hz readings to replay')
+    parser.add_argument('--hz', type=float, default=10.0)
+    parser.add_argument('--batch', type=int, default=1000)
+    parser.add_argument('--days', type=int, default=2, help='clean days for the false-alert count')
+    parser.add_argument('--max-cpu', type=float, default=0.10, help='largest share of a core at --hz')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    sensors = build_catalogue(DIVISIONS)
+    frames = SensorSimulator(sensors, seed=args.seed).next_frames(int(args.seconds * args.hz))
+    readings, frame_s, readings_s, state_bytes = throughput(sensors, frames, args.hz, args.batch, args.seed)
+    required = len(sensors) * len(CHANNELS) * args.hz
+    print(f"{len(sensors)} sensors x {len(CHANNELS)} channels at {args.hz:g} Hz = {required:,.0f} readings/s; "
+          f"detector state {state_bytes / 1024:.0f} KiB, constant")
+    print(f"{'path':<10} {'readings/s':>12} {'µs/frame':>9} {'CPU at rate':>12}")
+    cpu = {}
+    for name, seconds in (('frame', frame_s), ('readings', readings_s)):
+        rate = readings / seconds
+        cpu[name] = required / rate
+        print(f"{name:<10} {rate:>12,.0f} {seconds / len(frames) * 1e6:>9.0f} {cpu[name]:>11.1%}")
+
+    false_alerts, delays = detection(sensors, args.days, args.seed)
+    print()
+    print(f"clean run, {args.days} days at {PERIOD_S} s: {false_alerts} alerts over "
+          f"{len(sensors) * len(CHANNELS)} rings ({false_alerts / args.days:.1f}/day)")
+    for (sensor, channel), label in ((('BF-1 Pohang', 'co2_kg_t'), '+3% CO₂ kg/t ramp'),
+                                     (('BF-2 Pohang', 'temp_c'), '-30 °C temperature step')):
+        kind, delay = delays.get((sensor, channel), (None, None))
+        print(f"{label:<24} {sensor}: " + (f"{kind} after {delay / 60:.1f} min" if kind else 'not detected'))
+
+    ok = max(cpu.values()) <= args.max_cpu and len(delays) == 2 and false_alerts <= 5 * args.days
+    print()
+    print(f"under {args.max_cpu:.0%} of a core at {args.hz:g} Hz, drift detected, "
+          f"<= 5 false alerts/day  {'PASS' if ok else 'FAIL'}")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == '__main__':
+    main()
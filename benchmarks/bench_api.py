@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+REST API latency and throughput: single scenarios (cache miss, hit and ETag
+revalidation), the valuation, and batches of up to 100,000 scenarios.
+
+    python benchmarks/bench_api.py --requests 2000
+
+``api:app`` runs under uvicorn in a child process; this process sends
+requests one at a time over a keep-alive connection, so latency is the full
+HTTP round trip on localhost (client and server share the CPU). Misses use
+distinct parameters, hits repeat them spelled differently (``eaf=150`` vs
+``eaf=150.0&hyrex=100``) to exercise key normalisation, and revalidations
+send the ETag back for a 304. It must also match in a list, weak or as
+``*``, and not when it only appears inside another tag. Batch outputs are
+checked against ``core.scenarios.evaluate``.
+"""
+
+import argparse
+import http.client
+import json
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from core import scenarios  # noqa: E402
+
+HOST = '127.0.0.1'
+BATCHES = (1_000, 10_000, 100_000)
+
+
+def request(conn, method, path, body=None, headers=None):
+    start = time.perf_counter()
+    conn.request(method, path, body=body, headers=headers or {})
+    response = conn.getresponse()
+    data = response.read()
+    return time.perf_counter() - start, response, data
+
+
+def pct(values, q):
+    values = sorted(values)
+    return values[int(q / 100 * (len(values) - 1))]
+
+
+def scenario_queries(n, rng):
+    """``n`` distinct single-scenario queries, and the same scenarios spelled another way."""
+    seen, first, second = set(), [], []
+    while len(first) < n:
+        eaf, h2 = int(rng.integers(50, 201)), int(rng.integers(50, 201))
+        hyrex = float(rng.integers(100, 401)) / 2
+        if (eaf, h2, hyrex) in seen:
+            continue
+        seen.add((eaf, h2, hyrex))
+        first.append(f"/api/v1/scenario?eaf={eaf}&h2={h2}&hyrex={hyrex:g}")
+        second.append(f"/api/v1/scenario?hyrex={hyrex:.1f}&h2={h2}.0&eaf={eaf}&scrap=100")
+    return first, second
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--requests', type=int, default=2000)
+    parser.add_argument('--port', type=int, default=8767)
+    parser.add_argument('--max-hit-p95-ms', type=float, default=5.0)
+    parser.add_argument('--max-batch-ms', type=float, default=1000.0, help='cold 10,000-scenario batch')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    server = subprocess.Popen([sys.executable, '-m', 'uvicorn', 'api:app', '--host', HOST, '--port', str(args.port),
+                               '--log-level', 'warning'], cwd=ROOT)
+    try:
+        for _ in range(100):
+            try:
+                conn = http.client.HTTPConnection(HOST, args.port)
+                request(conn, 'GET', '/api/v1/valuation')
+                break
+            except OSError:
+                time.sleep(0.2)
+        rng = np.random.default_rng(args.seed)
+        first, second = scenario_queries(args.requests, rng)
+
+        rows, ok = [], True
+        timings = {}
+        for label, paths, status, cache in (('miss', first, 200, 'miss'), ('hit', second, 200, 'hit')):
+            times = []
+            for path in paths:
+                t, r, _ = request(conn, 'GET', path)
+                ok &= r.status == status and r.getheader('X-Cache') == cache
+                times.append(t)
+            timings[label] = times
+        _, r, _ = request(conn, 'GET', first[0])
+        etag = r.getheader('ETag')
+        times = []
+        for _ in range(args.requests):
+            t, r, _ = request(conn, 'GET', first[0], headers={'If-None-Match': etag})
+            ok &= r.status == 304
+            times.append(t)
+        timings['304'] = times
+        for header, status in ((f'"other", {etag}', 304), (f"W/{etag}", 304), ('*', 304),
+                               (f'"{etag}"', 200), ('"other"', 200)):
+            _, r, _ = request(conn, 'GET', first[0], headers={'If-None-Match': header})
+            ok &= r.status == status
+        times = []
+        for _ in range(args.requests // 10):
+            t, r, _ = request(conn, 'GET', '/api/v1/valuation')
+            times.append(t)
+        timings['valuation'] = times
+        for label, times in timings.items():
+            rows.append((f"scenario {label}" if label != 'valuation' else 'valuation (hit)', len(times),
+                         statistics.median(times), pct(times, 95), len(times) / sum(times)))
+
+        batch_rows = []
+        for n in BATCHES:
+            columns = {p: rng.uniform(*scenarios.RANGES[p], n).round(1).tolist() for p in scenarios.PARAMS}
+            body = json.dumps(columns)
+            cold, r, data = request(conn, 'POST', '/api/v1/scenarios', body=body)
+            result = json.loads(data)
+            expected = scenarios.evaluate(**{p: np.array(v) for p, v in columns.items()})
+            ok &= r.status == 200 and all(np.array_equal(result['outputs'][k], expected[k]) for k in scenarios.OUTPUTS)
+            warm, r, _ = request(conn, 'POST', '/api/v1/scenarios', body=body)
+            ok &= r.getheader('X-Cache') == 'hit'
+            batch_rows.append((n, len(body), len(data), cold, warm))
+    finally:
+        server.terminate()
+        server.wait()
+
+    print(f"{'request':<20} {'n':>6} {'p50 ms':>8} {'p95 ms':>8} {'req/s':>8}")
+    for label, n, p50, p95, rate in rows:
+        print(f"{label:<20} {n:>6} {p50 * 1000:>8.2f} {p95 * 1000:>8.2f} {rate:>8.0f}")
+    print()
+    print(f"{'batch':>8} {'request KB':>11} {'response KB':>12} {'cold ms':>8} {'hit ms':>7} {'scenarios/s':>12}")
+    for n, sent, got, cold, warm in batch_rows:
+        print(f"{n:>8,} {sent / 1024:>11.0f} {got / 1024:>12.0f} {cold * 1000:>8.0f} {warm * 1000:>7.0f} "
+              f"{n / cold:>12,.0f}")
+
+    hit_p95 = rows[1][3] * 1000
+    batch_ms = next(cold for n, _, _, cold, _ in batch_rows if n == 10_000) * 1000
+    ok &= hit_p95 <= args.max_hit_p95_ms and batch_ms <= args.max_batch_ms
+    print()
+    print(f"cache hits p95 {hit_p95:.2f} ms <= {args.max_hit_p95_ms:g}, 10,000-scenario batch {batch_ms:.0f} ms "
+          f"<= {args.max_batch_ms:g}, outputs match the model  {'PASS' if ok else 'FAIL'}")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == '__main__':
+    main()
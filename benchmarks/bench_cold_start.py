@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Cold start and import-time profile: a fresh interpreter importing Streamlit
+and running the app to the first complete render of the home page, plus
+the one-off cost of each page's first visit.
+
+    python benchmarks/bench_cold_start.py --runs 5
+
+Each run is a new ``python -X importtime`` process, so nothing is warm. The
+profile lists the modules the app itself pulls in on the home page, by
+cumulative import time; heavy page dependencies must not appear there.
+"""
+
+import argparse
+import json
+import re
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+APP = str(ROOT / 'app_posco_v2.py')
+
+# Dependencies that only the pages using them may load.
+HOME_FORBIDDEN = ('pandas', 'numpy', 'pyarrow', 'cryptography', 'highspy', 'core.scenarios', 'core.montecarlo',
+                  'core.hyrex', 'core.trajectory', 'telemetry', 'views.live', 'views.simulation', 'views.hyrex')
+
+CHILD = r'''
+import json, sys, time
+t0 = time.perf_counter()
+import streamlit
+t1 = time.perf_counter()
+from streamlit.testing.v1 import AppTest
+before = set(sys.modules)
+at = AppTest.from_file(sys.argv[1], default_timeout=60)
+t2 = time.perf_counter()
+at.run()
+t3 = time.perf_counter()
+home = sorted(set(sys.modules) - before)
+visits = {}
+for page in sys.argv[2:]:
+    at.session_state['page'] = page
+    start = time.perf_counter()
+    at.run()
+    first = time.perf_counter() - start
+    start = time.perf_counter()
+    at.run()
+    visits[page] = (first, time.perf_counter() - start)
+print(json.dumps({'streamlit_s': t1 - t0, 'home_s': t3 - t2, 'home_modules': home, 'visits': visits}))
+'''
+
+IMPORT_LINE = re.compile(r'import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)')
+
+
+def python_startup_s(runs=5):
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, '-c', 'pass'], check=True)
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+def cold_run(pages):
+    proc = subprocess.run([sys.executable, '-X', 'importtime', '-c', CHILD, APP, *pages],
+                          capture_output=True, text=True, cwd=ROOT, check=True)
+    result = json.loads(proc.stdout.strip().splitlines()[-1])
+    profile = {}
+    for self_us, cumulative_us, _, name in IMPORT_LINE.findall(proc.stderr):
+        profile[name] = (int(self_us), int(cumulative_us))
+    return result, profile
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--budget', type=float, default=1.0, help='cold start budget, seconds')
+    parser.add_argument('--top', type=int, default=10)
+    args = parser.parse_args()
+
+    pages = ['live', 'greensteel', 'credits', 'business', 'simulation', 'hyrex', 'carbon_neutral', 'compliance', 'mrv']
+    startup = python_startup_s()
+    runs = [cold_run(pages if i == 0 else []) for i in range(args.runs)]
+    cold = [startup + r['streamlit_s'] + r['home_s'] for r, _ in runs]
+    first, profile = runs[0]
+
+    print(f"cold start to home rendered ({args.runs} fresh processes, median):")
+    print(f"  python startup      {startup * 1000:>7.0f} ms")
+    print(f"  import streamlit    {statistics.median(r['streamlit_s'] for r, _ in runs) * 1000:>7.0f} ms")
+    print(f"  first home run      {statistics.median(r['home_s'] for r, _ in runs) * 1000:>7.0f} ms")
+    print(f"  total               {statistics.median(cold) * 1000:>7.0f} ms")
+
+    app_modules = [m for m in first['home_modules'] if m.split('.')[0] in ('core', 'telemetry', 'ui', 'views')
+                   or m.split('.')[0] in ('pandas', 'numpy', 'plotly', 'scipy', 'pyarrow')]
+    print()
+    print(f"import profile of the app on the home page (top {args.top} by cumulative time):")
+    for name in sorted(app_modules, key=lambda m: -profile.get(m, (0, 0))[1])[:args.top]:
+        self_us, cumulative_us = profile.get(name, (0, 0))
+        print(f"  {name:<28} self {self_us / 1000:>6.1f} ms   cumulative {cumulative_us / 1000:>6.1f} ms")
+
+    print()
+    print(f"{'page':<16} {'first visit ms':>15} {'rerun ms':>9}")
+    for page, (once, again) in first['visits'].items():
+        print(f"{page:<16} {once * 1000:>15.0f} {again * 1000:>9.0f}")
+
+    leaked = sorted(m for m in first['home_modules']
+                    if any(m == f or m.startswith(f + '.') for f in HOME_FORBIDDEN))
+    fast = statistics.median(cold) <= args.budget
+    print()
+    print(f"cold start {statistics.median(cold):.2f} s  {'PASS' if fast else 'FAIL'} (<= {args.budget:g} s)")
+    print(f"home page loads no page-only dependencies  {'PASS' if not leaked else 'FAIL ' + ', '.join(leaked[:5])}")
+    sys.exit(0 if fast and not leaked else 1)
+
+
+if __name__ == '__main__':
+    main()
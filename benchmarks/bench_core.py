@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Headless core: import cost of each ``core`` module in a fresh interpreter,
+no Streamlit anywhere in the import graph, and identical results when the
+valuation runs in spawn-based worker processes.
+
+    python benchmarks/bench_core.py --workers 4
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from core import credits, progress, scenarios  # noqa: E402
+from core.data import POSCO_DATA  # noqa: E402
+
+MODULES = ('core.data', 'core.credits', 'core.progress', 'core.scenarios', 'core.montecarlo')
+
+CHILD = r'''
+import importlib, json, sys, time
+timings = {}
+for name in sys.argv[1:]:
+    start = time.perf_counter()
+    importlib.import_module(name)
+    timings[name] = time.perf_counter() - start
+ui = sorted(m for m in sys.modules if m.split('.')[0] in ('streamlit', 'plotly', 'pandas', 'ui', 'views'))
+print(json.dumps({'timings': timings, 'ui': ui}))
+'''
+
+
+def summary(scenario):
+    """Everything the dashboard derives from the data, for one slider scenario."""
+    result = scenarios.evaluate(**scenario)
+    return {
+        'levels': credits.level_totals(POSCO_DATA.credits),
+        'projection': credits.projection(POSCO_DATA.projection)['cumulative'],
+        'targets': [(r['key'], r['pct'], r['status']) for r in progress.target_progress(POSCO_DATA.korea_2050)],
+        'scenario': {k: float(v) for k, v in result.items()},
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--workers', type=int, default=2)
+    parser.add_argument('--budget-ms', type=float, default=10.0, help='pure-Python modules')
+    args = parser.parse_args()
+
+    proc = subprocess.run([sys.executable, '-c', CHILD, *MODULES], capture_output=True, text=True,
+                          cwd=ROOT, check=True)
+    child = json.loads(proc.stdout)
+    print("fresh-interpreter import time:")
+    for name, seconds in child['timings'].items():
+        print(f"  {name:<16} {seconds * 1000:>7.1f} ms")
+    pure = sum(child['timings'][m] for m in ('core.data', 'core.credits', 'core.progress')) * 1000
+    fast = pure <= args.budget_ms
+    headless = not child['ui']
+    print(f"data + credits + progress: {pure:.1f} ms  {'PASS' if fast else 'FAIL'} (<= {args.budget_ms:g} ms)")
+    print(f"no UI modules imported: {'PASS' if headless else 'FAIL ' + ', '.join(child['ui'][:5])}")
+
+    grid = [dict(scenarios.DEFAULTS, hyrex=h, ccus=c) for h in range(50, 201, 25) for c in range(50, 201, 25)]
+    local = [summary(s) for s in grid]
+    start = time.perf_counter()
+    with ProcessPoolExecutor(args.workers, mp_context=get_context('spawn')) as pool:
+        remote = list(pool.map(summary, grid))
+    elapsed = time.perf_counter() - start
+    same = local == remote
+    print(f"{len(grid)} scenarios on {args.workers} spawn workers in {elapsed:.2f} s, "
+          f"identical to in-process: {'PASS' if same else 'FAIL'}")
+    sys.exit(0 if fast and headless and same else 1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Data-model memory with many concurrent sessions: every session holding its
+own nested-dict copy of POSCO_DATA (built by each script rerun, as before)
+versus every session referencing the one process-level record store.
+
+    python benchmarks/bench_data_memory.py --sessions 200
+
+Memory is the traced allocation (tracemalloc) held while all sessions are
+alive; build time is what each rerun paid to rebuild its copy.
+"""
+
+import argparse
+import copy
+import statistics
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from core import data  # noqa: E402
+
+
+def held_bytes(make, sessions):
+    """Traced bytes kept alive by ``sessions`` results of ``make()``."""
+    tracemalloc.start()
+    base = tracemalloc.get_traced_memory()[0]
+    held = [make() for _ in range(sessions)]
+    size = tracemalloc.get_traced_memory()[0] - base
+    tracemalloc.stop()
+    del held
+    return size
+
+
+def build_us(make, runs=200):
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        make()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--sessions', type=int, default=200)
+    parser.add_argument('--max-per-session', type=int, default=256,
+                        help='budget for the shared store, bytes held per session')
+    args = parser.parse_args()
+
+    template = data.to_dict(data.POSCO_DATA)
+    per_session = lambda: copy.deepcopy(template)      # noqa: E731 - dict literal rebuilt per rerun
+    shared = lambda: data.POSCO_DATA                   # noqa: E731 - one store, referenced
+
+    store = held_bytes(data.build, 1)
+    before = held_bytes(per_session, args.sessions)
+    after = held_bytes(shared, args.sessions) + store
+
+    print(f"{args.sessions} concurrent sessions")
+    print(f"  per-session dict copies   {before / 1024:>9.1f} KiB   "
+          f"({before / args.sessions:,.0f} B/session, rebuilt in {build_us(per_session):.0f} us/rerun)")
+    print(f"  shared record store       {after / 1024:>9.1f} KiB   "
+          f"(store {store / 1024:.1f} KiB built once in {build_us(data.build):.0f} us, "
+          f"{(after - store) / args.sessions:,.0f} B/session)")
+    print(f"  saved                     {1 - after / before:>9.1%}")
+
+    a, b = data.build(), data.build()
+    same = data.version(a) == data.version(b) == data.DATA_VERSION
+    bounded = (after - store) / args.sessions <= args.max_per_session
+    print()
+    print(f"store is language-independent and deterministic (version {data.DATA_VERSION})  "
+          f"{'PASS' if same else 'FAIL'}")
+    print(f"per-session cost of the shared store  {'PASS' if bounded else 'FAIL'} "
+          f"(<= {args.max_per_session} B/session)")
+    sys.exit(0 if same and bounded else 1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Trend chart payloads over any time range: raw points against the rollup
+pyramid plus LTTB, as the Live Monitoring intensity chart draws them.
+
+    python benchmarks/bench_downsample.py --days 365 --budget-kb 100
+
+A year of 10-second readings of the three site series is folded into a
+``Rollup`` one simulated day at a time. For each range the chart spec is
+built both ways and serialised as Streamlit sends it; raw specs beyond
+``--raw-limit`` points are extrapolated from the bytes per point of the
+largest one serialised. Also reports the per-frame ingest cost of the
+pyramid and checks its means against the raw readings.
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+import plotly.io as pio
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from telemetry import Rollup  # noqa: E402
+from ui import downsample  # noqa: E402
+
+PERIOD_S = 10
+DAY_S = 86400
+RANGES = (('1 h', 3600), ('6 h', 6 * 3600), ('24 h', DAY_S), ('7 d', 7 * DAY_S),
+          ('30 d', 30 * DAY_S), ('90 d', 90 * DAY_S), ('365 d', 365 * DAY_S))
+
+
+def readings(days, seed):
+    """10-second site series (BF-BOF t/day, EAF t/day, intensity kg/t) with a daily cycle."""
+    rng = np.random.default_rng(seed)
+    n = days * DAY_S // PERIOD_S
+    ts = 1.7e9 + PERIOD_S * np.arange(n, dtype=np.float64)
+    cycle = np.sin(2 * np.pi * ts / DAY_S)
+    walk = np.cumsum(rng.standard_normal((n, 3)), axis=0) * 0.2
+    values = np.array([38000, 4000, 1857]) * (1 + 0.01 * cycle[:, None]) + walk + rng.normal(0, [60, 40, 15], (n, 3))
+    return ts, values
+
+
+def figure(x, y, low=None, high=None):
+    fig = go.Figure()
+    if low is not None:
+        fig.add_trace(go.Scatter(x=x, y=high, line=dict(width=0), showlegend=False))
+        fig.add_trace(go.Scatter(x=x, y=low, line=dict(width=0), fill='tonexty', showlegend=False))
+    fig.add_trace(go.Scatter(x=x, y=y, name='Intensity'))
+    fig.update_layout(height=350, xaxis_type='date')
+    return pio.to_json(fig, validate=False)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--days', type=int, default=365)
+    parser.add_argument('--budget-kb', type=float, default=100.0)
+    parser.add_argument('--raw-limit', type=int, default=60_000, help='largest raw trace actually serialised')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    ts, values = readings(args.days, args.seed)
+    rollup = Rollup(('bf_bof', 'eaf', 'intensity'))
+    per_day = DAY_S // PERIOD_S
+    start = time.perf_counter()
+    for i in range(0, len(ts), per_day):
+        rollup.extend(ts[i:i + per_day], values[i:i + per_day])
+    batch_rate = len(ts) / (time.perf_counter() - start)
+
+    tick = Rollup(rollup.series)
+    start = time.perf_counter()
+    for i in range(2000):
+        tick.extend(ts[i:i + 1], values[i:i + 1])
+    per_frame_us = (time.perf_counter() - start) / 2000 * 1e6
+    print(f"{len(ts):,} readings x {len(rollup.series)} series over {args.days} days; "
+          f"pyramid {rollup.nbytes / 2**20:.1f} MiB")
+    print(f"ingest: {batch_rate:,.0f} readings/s in daily batches, {per_frame_us:.0f} µs per live frame")
+
+    end = ts[-1] + PERIOD_S
+    i = rollup.series_index('intensity')
+    raw_bytes_per_point = None
+    worst = 0
+    print()
+    print(f"{'range':<7} {'level':>7} {'buckets':>8} {'points':>7} {'query ms':>9} {'lttb ms':>8} "
+          f"{'raw pts':>10} {'raw KB':>10} {'chart KB':>9}")
+    for label, span in RANGES:
+        if span > args.days * DAY_S:
+            continue
+        t0 = time.perf_counter()
+        window = rollup.query(end - span, end)
+        t1 = time.perf_counter()
+        x, y, low, high = downsample.trace(window.ts, window.mean[i], downsample.points_per_trace(3),
+                                           low=window.min[i], high=window.max[i])
+        t2 = time.perf_counter()
+        chart_kb = len(figure(x, y, low, high)) / 1024
+        worst = max(worst, chart_kb)
+
+        raw = ts >= end - span
+        n_raw = int(raw.sum())
+        if n_raw <= args.raw_limit:
+            raw_spec = figure(pd.to_datetime(ts[raw], unit='s'), values[raw, i])
+            raw_bytes_per_point = len(raw_spec) / n_raw
+            raw_kb, note = len(raw_spec) / 1024, ''
+        else:
+            raw_kb, note = n_raw * raw_bytes_per_point / 1024, '~'
+        print(f"{label:<7} {window.seconds:>6}s {len(window.ts):>8} {len(x):>7} {(t1 - t0) * 1000:>9.2f} "
+              f"{(t2 - t1) * 1000:>8.1f} {n_raw:>10,} {note + format(raw_kb, ',.0f'):>10} {chart_kb:>9.1f}")
+
+    # Rollup means against the raw readings, hour by hour over the last day.
+    first = (end - DAY_S) // 3600 * 3600
+    window = rollup.window(3600, first, end)
+    hour = ts[ts >= first] // 3600 * 3600
+    raw = values[ts >= first]
+    gap = max(abs(window.mean[s, k] - raw[hour == window.ts[k], s].mean()) / raw[hour == window.ts[k], s].mean()
+              for s in range(len(rollup.series)) for k in range(len(window.ts)))
+    print()
+    print(f"hourly rollup means vs raw readings: max relative gap {gap:.1e}")
+
+    ok = worst <= args.budget_kb and gap < 1e-9
+    print(f"largest chart {worst:.1f} KB within {args.budget_kb:g} KB, means exact  {'PASS' if ok else 'FAIL'}")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == '__main__':
+    main()
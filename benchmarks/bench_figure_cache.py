@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Static figure cache: page rerun time on ``greensteel`` and ``business`` with
+the cache cold on every rerun versus warm, alternating languages the way a
+control room with mixed ko/en viewers does.
+
+    python benchmarks/bench_figure_cache.py --reruns 20
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from streamlit.testing.v1 import AppTest  # noqa: E402
+
+from ui import figures  # noqa: E402
+
+APP = str(ROOT / 'app_posco_v2.py')
+PAGES = ('greensteel', 'business')
+
+
+def rerun_times(page, reruns, cold):
+    apps = {}
+    for lang in ('en', 'ko'):
+        at = AppTest.from_file(APP, default_timeout=60)
+        at.session_state['lang'] = lang
+        at.session_state['page'] = page
+        apps[lang] = at.run()
+    timings = []
+    for i in range(reruns):
+        at = apps['en' if i % 2 else 'ko']
+        if cold:
+            figures.FIGURES.clear()
+        start = time.perf_counter()
+        at.run()
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--reruns', type=int, default=20)
+    args = parser.parse_args()
+
+    print(f"{'page':<12} {'cold ms':>9} {'warm ms':>9} {'saved':>7} {'warm hit rate':>14}")
+    for page in PAGES:
+        cold = statistics.median(rerun_times(page, args.reruns, cold=True))
+        before = figures.FIGURES.stats()
+        warm = statistics.median(rerun_times(page, args.reruns, cold=False))
+        after = figures.FIGURES.stats()
+        hits, misses = after['hits'] - before['hits'], after['misses'] - before['misses']
+        print(f"{page:<12} {cold * 1000:>9.1f} {warm * 1000:>9.1f} {1 - warm / cold:>7.0%} "
+              f"{hits / (hits + misses):>14.1%}")
+
+    stats = figures.FIGURES.stats()
+    print()
+    print(f"cache: {stats['entries']} entries, {stats['bytes'] / 1024:.1f} KiB of "
+          f"{stats['max_bytes'] / 1024:.0f} KiB, {stats['evictions']} evictions")
+
+
+if __name__ == '__main__':
+    main()
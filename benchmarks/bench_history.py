@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Furnace history store: 90-day trend query latency over all eleven
+furnaces, from memory-mapped Arrow files, before and after compaction.
+
+    python benchmarks/bench_history.py --days 90 --budget-ms 200
+
+Generates a per-minute dataset into a temporary directory, then times ``HistoryStore.trend`` per channel with the files
+not yet mapped (first query of a process) and mapped (every later one).
+The latest day is also written as the live recorder would, one part per
+10 minutes, to time the query against uncompacted parts and the compaction
+itself. Trend means are checked against a plain NumPy reduction.
+"""
+
+import argparse
+import importlib
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from telemetry import Sensor, SensorSimulator  # noqa: E402
+from telemetry import history  # noqa: E402
+from telemetry.sensors import CHANNELS  # noqa: E402
+
+
+def live_day(store, day, flush_s=600, seed=1):
+    """One day of rows written as the recorder flushes them: a part per ``flush_s``."""
+    sensors = [Sensor(f"BF-{i + 1:02d}", f, 'steelmaking', 'bf') for i, f in enumerate(store.furnaces)]
+    cols = [CHANNELS.index(c) for c in history.HISTORY_CHANNELS]
+    frames = SensorSimulator(sensors, seed=seed).next_frames(history.DAY_S // history.MINUTE_S)[..., cols]
+    per_part = flush_s // history.MINUTE_S
+    ts = day * history.DAY_S + history.MINUTE_S * np.arange(len(frames), dtype=np.float64)
+    for i in range(0, len(frames), per_part):
+        store.append(ts[i:i + per_part], frames[i:i + per_part])
+    return len(frames) // per_part
+
+
+def timed_trends(store, start, end, runs, mapped):
+    timings = []
+    for _ in range(runs):
+        for channel in history.HISTORY_CHANNELS:
+            if not mapped:
+                history._mapped.cache_clear()
+            t0 = time.perf_counter()
+            store.trend(channel, start, end)
+            timings.append(time.perf_counter() - t0)
+    return timings
+
+
+def describe(timings):
+    timings = sorted(timings)
+    return statistics.median(timings) * 1000, timings[int(0.95 * (len(timings) - 1))] * 1000
+
+
+def check(store, start, end):
+    """Largest relative gap between ``trend`` and hourly means of ``read``, first furnace."""
+    table = store.read(store.furnaces[0], start, end)
+    ts = table.column('ts').to_numpy()
+    gap = 0.0
+    for channel in history.HISTORY_CHANNELS:
+        starts, means = store.trend(channel, start, end)
+        values = table.column(channel).to_numpy().astype(np.float64)
+        bucket = ((ts - starts[0]) // 3600).astype(np.int64)
+        expected = np.bincount(bucket, weights=values, minlength=len(starts)) / np.bincount(bucket, minlength=len(starts))
+        gap = max(gap, float(np.nanmax(np.abs(means[0] - expected) / np.abs(expected))))
+    return gap
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--days', type=int, default=90)
+    parser.add_argument('--budget-ms', type=float, default=200.0)
+    parser.add_argument('--runs', type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = history.HistoryStore(tmp)
+        today = history.day_of(time.time())
+        end = today * history.DAY_S
+        start = end - args.days * history.DAY_S
+        t0 = time.perf_counter()
+        rows = history.generate(store, args.days, end=end)
+        print(f"generated {rows:,} rows ({args.days} days x {len(store.furnaces)} furnaces, per minute) "
+              f"in {time.perf_counter() - t0:.1f} s")
+        print(f"on disk: {store.nbytes() / 2**20:.1f} MiB, {len(store.days())} days")
+
+        importlib.import_module('pandas')  # pyarrow's lazy import: paid once per process, not per query
+        unmapped = timed_trends(store, start, end, args.runs, mapped=False)
+        mapped = timed_trends(store, start, end, args.runs, mapped=True)
+        gap = check(store, start, end)
+
+        print()
+        print(f"{args.days}-day hourly trend, {len(store.furnaces)} furnaces, one channel per query")
+        print(f"{'':<28} {'p50 ms':>8} {'p95 ms':>8}")
+        for name, timings in (('files not yet mapped', unmapped), ('files mapped', mapped)):
+            print(f"{name:<28} {describe(timings)[0]:>8.1f} {describe(timings)[1]:>8.1f}")
+
+        parts = live_day(store, today)
+        live_start, live_end = start + history.DAY_S, end + history.DAY_S
+        before = timed_trends(store, live_start, live_end, args.runs, mapped=False)
+        t0 = time.perf_counter()
+        store.compact(today)
+        compaction = time.perf_counter() - t0
+        after = timed_trends(store, live_start, live_end, args.runs, mapped=False)
+        print()
+        print(f"latest day as {parts} parts per furnace: p95 {describe(before)[1]:.1f} ms; "
+              f"compacted in {compaction * 1000:.0f} ms: p95 {describe(after)[1]:.1f} ms")
+        print(f"trend vs NumPy reduction: max relative gap {gap:.1e}")
+
+    worst = max(describe(unmapped)[1], describe(after)[1])
+    ok = worst <= args.budget_ms and gap < 1e-6
+    print()
+    print(f"{args.days}-day trend p95 {worst:.1f} ms within {args.budget_ms:g} ms, means agree  {'PASS' if ok else 'FAIL'}")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == '__main__':
+    main()
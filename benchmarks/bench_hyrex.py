@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+HyREX process model: steady-state solve latency while sweeping the sliders,
+with and without the memo cache, the vectorised operating-envelope path
+against a scalar loop, and the full page rerun per slider move.
+
+    python benchmarks/bench_hyrex.py --budget-ms 50
+
+Also checks that the mass balance closes and that the vectorised and
+scalar paths agree at every slider position.
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from core import hyrex  # noqa: E402
+
+APP = str(ROOT / 'app_posco_v2.py')
+
+
+def sweep():
+    """Slider moves of a user dragging each slider end to end and back."""
+    point = dict(hyrex.DEFAULTS)
+    moves = []
+    for param in ('purity', 'grade', 'temperature'):
+        values = hyrex.axis(param).tolist()
+        for value in values + values[::-1]:
+            point[param] = value
+            moves.append(dict(point))
+        point[param] = hyrex.DEFAULTS[param]
+    return moves
+
+
+def timed(fn, moves):
+    timings = []
+    for move in moves:
+        start = time.perf_counter()
+        fn(**move)
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def describe(timings):
+    timings = sorted(timings)
+    p95 = timings[int(0.95 * (len(timings) - 1))]
+    return statistics.median(timings) * 1000, p95 * 1000, timings[-1] * 1000
+
+
+def page_moves(moves, limit):
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_file(APP, default_timeout=60)
+    at.session_state['page'] = 'hyrex'
+    at.run()
+    sliders = {'purity': 0, 'grade': 1, 'temperature': 2}
+    timings, previous = [], dict(hyrex.DEFAULTS)
+    for move in moves[:limit]:
+        param = next((p for p in move if move[p] != previous[p]), 'purity')
+        start = time.perf_counter()
+        at.slider[sliders[param]].set_value(move[param]).run()
+        timings.append(time.perf_counter() - start)
+        previous = move
+    if at.exception:
+        raise RuntimeError(at.exception[0].message)
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--budget-ms', type=float, default=50.0)
+    parser.add_argument('--page-moves', type=int, default=60, help='slider moves replayed through the page (0 to skip)')
+    args = parser.parse_args()
+
+    moves = sweep()
+    uncached = timed(hyrex.steady_state.__wrapped__, moves)
+    hyrex.steady_state.cache_clear()
+    first = timed(hyrex.steady_state, moves)
+    again = timed(hyrex.steady_state, moves)
+    info = hyrex.steady_state.cache_info()
+
+    print(f"slider sweep: {len(moves)} moves over purity, grade and temperature")
+    print(f"{'':<22} {'p50 ms':>8} {'p95 ms':>8} {'max ms':>8}")
+    for name, timings in (('solve, no cache', uncached), ('memoised, first sweep', first),
+                          ('memoised, repeat', again)):
+        print(f"{name:<22} {describe(timings)[0]:>8.3f} {describe(timings)[1]:>8.3f} {describe(timings)[2]:>8.3f}")
+    print(f"cache: {info.currsize}/{info.maxsize} entries, {info.hits} hits, {info.misses} misses")
+
+    purities, temperatures = hyrex.axis('purity'), hyrex.axis('temperature')
+    grade = hyrex.DEFAULTS['grade']
+    start = time.perf_counter()
+    batch = hyrex.balance(purities[:, None], grade, temperatures[None, :])
+    vectorised = time.perf_counter() - start
+    start = time.perf_counter()
+    scalar = [[hyrex.steady_state.__wrapped__(p, grade, t) for t in temperatures] for p in purities]
+    looped = time.perf_counter() - start
+    gap = max(abs(getattr(batch, f)[i, j] - getattr(scalar[i][j], f)) / max(abs(getattr(scalar[i][j], f)), 1e-12)
+              for f in ('h2_makeup_kg', 'energy_kwh', 'bed_temperature')
+              for i in range(len(purities)) for j in range(len(temperatures)))
+    print()
+    print(f"envelope {len(purities)} x {len(temperatures)} points: vectorised {vectorised * 1000:.1f} ms, "
+          f"scalar loop {looped * 1000:.1f} ms ({looped / vectorised:.0f}x), max relative gap {gap:.1e}")
+
+    grid = hyrex.balance(hyrex.axis('purity')[:, None, None], hyrex.axis('grade')[None, :, None],
+                         hyrex.axis('temperature')[None, None, :])
+    closure = float(np.max(hyrex.mass_closure(grid)))
+    print(f"full slider grid {grid.h2_makeup_kg.size} points: mass balance closes to {closure:.1e}, "
+          f"{grid.iterations} iterations")
+
+    ok = describe(first)[1] <= args.budget_ms and closure < 1e-9 and gap < 1e-6
+    if args.page_moves:
+        page = page_moves(moves, args.page_moves)
+        p50, p95, worst = describe(page)
+        print(f"page rerun per slider move ({len(page)} moves, AppTest): p50 {p50:.1f} ms  p95 {p95:.1f} ms  max {worst:.1f} ms")
+        ok &= p95 <= args.budget_ms
+
+    print()
+    print(f"slider sweep within {args.budget_ms:g} ms, balance closed, paths agree  {'PASS' if ok else 'FAIL'}")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Translation cost per rerun: every label resolved the old way, an inline
+``'…' if is_ko() else '…'`` that reads ``st.session_state`` each time,
+versus one ``messages()`` lookup and attribute reads on the compiled
+catalogue. Also reports page rerun times with the per-language fragment
+caches warm.
+
+    python benchmarks/bench_i18n.py --reruns 200
+
+The label timings run inside a real Streamlit script run (AppTest), so
+``st.session_state`` goes through the same proxy a page does.
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from streamlit.testing.v1 import AppTest  # noqa: E402
+
+from ui import i18n  # noqa: E402
+
+APP = str(ROOT / 'app_posco_v2.py')
+PAGES = ('home', 'greensteel', 'credits', 'business', 'carbon_neutral', 'compliance', 'mrv')
+
+
+def label_script():
+    import statistics
+    import time
+
+    import streamlit as st
+
+    from ui.i18n import CATALOGUE, messages
+
+    def is_ko():
+        return st.session_state.get('lang', 'en') == 'ko'
+
+    fields = CATALOGUE['en']._fields[1:]
+    pairs = [(getattr(CATALOGUE['ko'], f), getattr(CATALOGUE['en'], f)) for f in fields]
+    old, new = [], []
+    for _ in range(st.session_state.reruns):
+        start = time.perf_counter()
+        for ko, en in pairs:
+            label = ko if is_ko() else en       # assigned: a bare expression is Streamlit magic
+        old.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        m = messages()
+        for f in fields:
+            label = getattr(m, f)
+        new.append(time.perf_counter() - start)
+    del label
+    st.session_state.result = (len(fields), statistics.median(old), statistics.median(new))
+
+
+def label_times(lang, reruns):
+    at = AppTest.from_function(label_script, default_timeout=120)
+    at.session_state['lang'] = lang
+    at.session_state['reruns'] = reruns
+    at.run()
+    if at.exception:
+        raise RuntimeError(at.exception[0].message)
+    return at.session_state['result']
+
+
+def page_rerun_ms(page, lang, reruns):
+    at = AppTest.from_file(APP, default_timeout=60)
+    at.session_state['lang'] = lang
+    at.session_state['page'] = page
+    at.run()
+    timings = []
+    for _ in range(reruns):
+        start = time.perf_counter()
+        at.run()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--reruns', type=int, default=200)
+    parser.add_argument('--page-reruns', type=int, default=10)
+    args = parser.parse_args()
+
+    print(f"{'lang':<6} {'labels':>7} {'inline is_ko() us':>18} {'catalogue us':>13} {'speed-up':>9}")
+    faster = True
+    for lang in i18n.LANGUAGES:
+        n, old, new = label_times(lang, args.reruns)
+        faster &= new < old
+        print(f"{lang:<6} {n:>7} {old * 1e6:>18.1f} {new * 1e6:>13.1f} {old / new:>8.1f}x")
+
+    print()
+    print(f"{'page':<16} " + " ".join(f"{lang + ' ms':>8}" for lang in i18n.LANGUAGES))
+    for page in PAGES:
+        times = [page_rerun_ms(page, lang, args.page_reruns) for lang in i18n.LANGUAGES]
+        print(f"{page:<16} " + " ".join(f"{ms:>8.1f}" for ms in times))
+
+    complete = {code: i18n.untranslated(code) for code in i18n.LANGUAGES}
+    print()
+    print(f"catalogue resolves faster than inline lookups  {'PASS' if faster else 'FAIL'}")
+    for code, missing in complete.items():
+        print(f"{code}: {len(i18n.Messages._fields) - 1 - len(missing)}/{len(i18n.Messages._fields) - 1} "
+              f"messages translated" + (f" (missing: {', '.join(missing[:5])})" if missing else ''))
+    sys.exit(0 if faster else 1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Sustained ingest throughput of the telemetry ring store on one core.
+
+Replays pre-generated simulator readings into a RingStore for ``--seconds``
+through both write paths:
+
+    batch   RingStore.append: individual (sensor, channel, ts, value) readings
+    frame   RingStore.append_frame: one reading for every ring per call
+
+    python benchmarks/bench_ingest.py --seconds 5 --batch 1000
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from telemetry import CHANNELS, RingStore, SensorSimulator, build_catalogue  # noqa: E402
+
+DIVISIONS = {'steelmaking': 25, 'chemical': 15, 'construction': 10, 'energy': 10}
+
+
+def reading_batches(sensors, batch, count, seed):
+    """Simulator frames flattened into shuffled per-reading batches."""
+    sim = SensorSimulator(sensors, seed=seed)
+    n_rings = len(sensors) * len(CHANNELS)
+    frames = sim.next_frames(batch * count // n_rings + 1).reshape(-1)
+    rng = np.random.default_rng(seed)
+    ring = np.tile(np.arange(n_rings), len(frames) // n_rings)
+    order = rng.permutation(len(ring))[:batch * count]
+    sensor_idx, channel_idx = np.divmod(ring[order], len(CHANNELS))
+    ts = np.sort(rng.uniform(0, 3600, batch * count))
+    values = frames[order]
+    split = lambda a: np.split(a, count)  # noqa: E731
+    return list(zip(split(sensor_idx), split(channel_idx), split(ts), split(values)))
+
+
+def run(write, seconds):
+    calls = readings = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < seconds:
+        readings += write(calls)
+        calls += 1
+    return readings / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--seconds', type=float, default=5.0)
+    parser.add_argument('--batch', type=int, default=1000)
+    parser.add_argument('--capacity', type=int, default=8640)
+    parser.add_argument('--target', type=float, default=100_000)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    sensors = build_catalogue(DIVISIONS)
+    store = RingStore(sensors, CHANNELS, args.capacity)
+    print(f"{len(sensors)} sensors x {len(CHANNELS)} channels x {args.capacity} slots "
+          f"= {store.nbytes / 1e6:.1f} MB")
+
+    batches = reading_batches(sensors, args.batch, 64, args.seed)
+
+    def write_batch(i):
+        s, c, ts, v = batches[i % len(batches)]
+        store.append(s, c, ts, v)
+        return len(v)
+
+    frames = SensorSimulator(sensors, seed=args.seed).next_frames(256)
+
+    def write_frame(i):
+        store.append_frame(float(i), frames[i % len(frames)])
+        return frames.shape[1] * frames.shape[2]
+
+    ok = True
+    for name, write in (('batch', write_batch), ('frame', write_frame)):
+        rate = run(write, args.seconds)
+        ok &= rate >= args.target
+        print(f"{name:<6} {rate:>14,.0f} readings/s  {'PASS' if rate >= args.target else 'FAIL'}"
+              f" (target {args.target:,.0f})")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Reruns per second on the Live Monitoring page, before and after the
+fragment-scoped refresh engine.
+
+Before: the page did ``time.sleep(0.1); st.rerun()``, so each viewer
+re-executed the whole script back to back. This is replayed headlessly with
+AppTest for ``--seconds`` and the script executions are counted.
+
+After: the frontend timer re-runs only the ``live_panels`` fragment every
+``interval`` seconds (``HIDDEN_INTERVAL_S`` while the tab is hidden). The
+fragment cost is taken from ``ui.refresh.STATS``.
+
+    python benchmarks/bench_live_refresh.py --seconds 5 --viewers 12
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from streamlit.testing.v1 import AppTest  # noqa: E402
+
+from ui import refresh  # noqa: E402
+
+APP = str(ROOT / 'app_posco_v2.py')
+
+
+def live_app(auto_refresh):
+    at = AppTest.from_file(APP, default_timeout=60)
+    at.session_state['page'] = 'live'
+    at.run()
+    if auto_refresh:
+        at.checkbox[0].check().run()
+    return at
+
+
+def measure_busy_loop(seconds):
+    """Replay the old sleep(0.1) + st.rerun() loop and count full reruns."""
+    at = live_app(auto_refresh=False)
+    durations = []
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        start = time.perf_counter()
+        at.run()
+        durations.append(time.perf_counter() - start)
+        time.sleep(0.1)
+    return len(durations) / seconds, statistics.median(durations)
+
+
+def measure_fragment(samples):
+    """Median full-script and fragment-only cost with auto-refresh enabled."""
+    at = live_app(auto_refresh=True)
+    full = []
+    refresh.STATS.reset()
+    for _ in range(samples):
+        start = time.perf_counter()
+        at.run()
+        full.append(time.perf_counter() - start)
+    return statistics.median(full), refresh.STATS.snapshot()['mean_s']
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--seconds', type=float, default=5.0)
+    parser.add_argument('--samples', type=int, default=10)
+    parser.add_argument('--viewers', type=int, default=12)
+    parser.add_argument('--interval', type=float, default=refresh.DEFAULT_INTERVAL_S)
+    args = parser.parse_args()
+
+    before_rate, before_cost = measure_busy_loop(args.seconds)
+    full_cost, frag_cost = measure_fragment(args.samples)
+    after_rate = 1.0 / args.interval
+    hidden_rate = 1.0 / refresh.effective_interval(args.interval, visible=False)
+
+    rows = [
+        ('before: sleep(0.1) + st.rerun()', 'full script', before_rate, before_cost),
+        (f'after: fragment every {args.interval:g}s', 'live_panels', after_rate, frag_cost),
+        ('after: tab hidden', 'live_panels', hidden_rate, frag_cost),
+    ]
+
+    print(f"full script (auto-refresh on): {full_cost * 1000:.1f} ms median, "
+          f"fragment only: {frag_cost * 1000:.1f} ms mean")
+    print()
+    print(f"{'mode':<36} {'reruns':<12} {'reruns/s':>9} {'ms/rerun':>9} "
+          f"{'CPU/viewer':>11} {f'CPU x{args.viewers}':>9}")
+    for mode, scope, rate, cost in rows:
+        cpu = rate * cost
+        print(f"{mode:<36} {scope:<12} {rate:>9.2f} {cost * 1000:>9.1f} "
+              f"{cpu:>10.1%} {cpu * args.viewers:>9.1%}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Live Monitoring CPU per tick against the number of viewers, with the shared
+snapshot producer.
+
+    python benchmarks/bench_live_viewers.py --viewers 1 10 25 50 100
+
+Every viewer is a headless AppTest session on the live page, all in one
+process like the sessions of one Streamlit server. Each tick publishes one
+snapshot, as the feed does per frame, then reruns every viewer. The shared
+work of a tick (the snapshot build and the figures built for its version)
+is read from the producer and ``views.live.LIVE_FIGURES``; the rest of the
+tick's process CPU is the per-viewer render (script execution and element
+serialisation), which is inherent to one Streamlit session per viewer.
+
+Shared time is thread CPU, so it also picks up any garbage collection the
+viewers' allocations trigger mid-build; hence the tolerance on its growth.
+The pass condition is on work: one snapshot per tick (plus any frame the
+feed published meanwhile) and one figure set per version, at any N.
+
+Before the producer, every viewer computed gauges, furnace rows, alerts,
+the trend window and the signed root, and built and serialised six
+figures, on each of its own reruns; that per-session cost is replayed for
+comparison.
+"""
+
+import argparse
+import math
+import statistics
+import sys
+import time
+from pathlib import Path
+
+import plotly.io as pio
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from streamlit.testing.v1 import AppTest  # noqa: E402
+
+from core.data import POSCO_DATA  # noqa: E402
+from telemetry import site  # noqa: E402
+from views import live  # noqa: E402
+
+APP = str(ROOT / 'app_posco_v2.py')
+SPAN = live.TREND_RANGES['24h']
+
+
+def viewer():
+    at = AppTest.from_file(APP, default_timeout=60)
+    at.session_state['page'] = 'live'
+    at.run()
+    return at
+
+
+def per_session_compute(producer, samples):
+    """Mean CPU seconds of what each viewer computed per rerun before the shared snapshot."""
+    _, operator = live.proof_packs()
+    times = []
+    for _ in range(samples):
+        start = time.process_time()
+        now = time.time()
+        gauges = site.gauges(producer.store)
+        site.furnaces(producer.store, producer.monitor)
+        producer.monitor.recent()
+        producer.proofs.pack_of(now).export(operator)
+        window = producer.rollup.query(now - SPAN, now + 1)
+        figs = [live.gauge_figure(key, gauges[key]) for key in live.GAUGES]
+        figs += [live.production_figure(producer.rollup, window, 'Production'),
+                 live.intensity_figure(producer.rollup, window, 'Intensity')]
+        for fig in figs:
+            pio.to_json(fig, validate=False)
+        times.append(time.process_time() - start)
+    return statistics.mean(times)
+
+
+def measure(producer, n, ticks):
+    """Per tick: CPU seconds, shared seconds, shared seconds per snapshot, snapshots and figure builds.
+
+    Also returns whether no more snapshots were built than the ticks and feed
+    frames, and the number of viewers whose rerun raised.
+    """
+    viewers = [viewer() for _ in range(n)]
+    builds, build_s = producer.builds, producer.build_s
+    figures = live.LIVE_FIGURES.stats()
+    start, wall = time.process_time(), time.perf_counter()
+    for _ in range(ticks):
+        producer.publish()
+        for at in viewers:
+            at.run()
+    cpu = (time.process_time() - start) / ticks
+    # The feed thread keeps publishing a version per frame on its own timer.
+    feed_frames = math.ceil((time.perf_counter() - wall) / live.TELEMETRY_PERIOD_S)
+    after = live.LIVE_FIGURES.stats()
+    versions = producer.builds - builds
+    shared = (producer.build_s - build_s + after['build_s'] - figures['build_s']) / ticks
+    failed = sum(bool(at.exception) for at in viewers)
+    return (cpu, shared, shared * ticks / versions, versions / ticks, (after['misses'] - figures['misses']) / ticks,
+            versions <= ticks + feed_frames, failed)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--viewers', type=int, nargs='+', default=[1, 10, 25, 50, 100])
+    parser.add_argument('--ticks', type=int, default=3)
+    parser.add_argument('--max-shared-growth', type=float, default=2.0,
+                        help='shared CPU per snapshot at the most viewers over that at the fewest')
+    args = parser.parse_args()
+
+    viewer()    # starts the feed and warms imports and caches
+    producer = live.live_snapshots(tuple((d.key, d.sensors) for d in POSCO_DATA.divisions.values()))
+    before = per_session_compute(producer, 10)
+    print(f"per-session compute before the shared snapshot: {before * 1000:.1f} ms per viewer per tick")
+    print()
+    print(f"{'viewers':>7} {'snapshots':>9} {'figures':>8} {'shared ms':>10} {'ms/snapshot':>12} "
+          f"{'render ms/viewer':>17} {'CPU ms/tick':>12} {'before ms/tick':>15}")
+    rows = []
+    for n in args.viewers:
+        cpu, shared, per_snapshot, versions, misses, one_per_tick, failed = measure(producer, n, args.ticks)
+        rows.append((n, per_snapshot, versions, misses, one_per_tick and not failed))
+        print(f"{n:>7} {versions:>9.1f} {misses:>8.1f} {shared * 1000:>10.1f} {per_snapshot * 1000:>12.1f} "
+              f"{(cpu - shared) / n * 1000:>17.1f} {cpu * 1000:>12.0f} {(cpu - shared + before * n) * 1000:>15.0f}")
+
+    growth = rows[-1][1] / rows[0][1]
+    print()
+    print(f"shared CPU per snapshot, {rows[-1][0]} viewers over {rows[0][0]}: x{growth:.2f}")
+    figures_per_version = len(live.GAUGES) + 2
+    ok = growth <= args.max_shared_growth and all(r[4] and r[3] <= figures_per_version * r[2] for r in rows)
+    print(f"one snapshot and one figure set per version whatever the viewers, shared CPU flat  "
+          f"{'PASS' if ok else 'FAIL'}")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == '__main__':
+    main()
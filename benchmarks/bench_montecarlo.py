@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Monte Carlo credit valuation: throughput, peak RSS, reproducibility and
+sketch accuracy.
+
+    python benchmarks/bench_montecarlo.py --draws 10000000 --workers 4
+
+Peak RSS is reported for the parent and, when a pool is used, for the
+largest worker (``ru_maxrss`` of reaped children, Linux/macOS only).
+"""
+
+import argparse
+import os
+import resource
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from core import montecarlo  # noqa: E402
+
+
+def peak_rss_mb(who):
+    rss = resource.getrusage(who).ru_maxrss
+    return rss / 1024 / (1024 if sys.platform == 'darwin' else 1)
+
+
+def accuracy(n, seed):
+    """Worst relative error of the sketched percentiles against exact ones."""
+    sketches = montecarlo.run(n, seed=seed, workers=1)
+    # Re-draw the same chunks and keep every sample, for reference only.
+    values = {k: [] for k in montecarlo.OUTPUTS}
+    for s, size in _chunks(n, seed):
+        rng = np.random.default_rng(s)
+        draws = {k: montecarlo.draw(rng, montecarlo.DEFAULT_DISTRIBUTIONS[k], size) for k in montecarlo.INPUTS}
+        for k, v in montecarlo.value(draws, dict(montecarlo.scenarios.DEFAULTS)).items():
+            values[k].append(np.broadcast_to(v, (size,)))
+    worst = 0.0
+    for k in montecarlo.OUTPUTS:
+        allv = np.concatenate(values[k])
+        for p in montecarlo.PERCENTILES:
+            worst = max(worst, abs(sketches[k].quantile(p / 100) / np.percentile(allv, p) - 1))
+    return worst
+
+
+def _chunks(n, seed, chunk=montecarlo.CHUNK):
+    sizes = [chunk] * (n // chunk) + ([n % chunk] if n % chunk else [])
+    return zip(np.random.SeedSequence(seed).spawn(len(sizes)), sizes)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--draws', type=int, default=10_000_000)
+    parser.add_argument('--workers', type=int, default=os.cpu_count())
+    parser.add_argument('--seed', type=int, default=2024)
+    parser.add_argument('--rss-limit', type=float, default=50.0, help='MB')
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    sketches = montecarlo.run(args.draws, seed=args.seed, workers=args.workers)
+    elapsed = time.perf_counter() - start
+    summary = montecarlo.summarise(sketches)
+    print(f"{args.draws:,} draws on {args.workers} worker(s): {elapsed:.2f} s "
+          f"({args.draws / elapsed / 1e6:.1f}M draws/s)")
+    for k, row in summary.items():
+        print(f"  {k:<10} P5 {row[5]:>9,.1f}  P50 {row[50]:>9,.1f}  P95 {row[95]:>9,.1f}  mean {row['mean']:>9,.1f}")
+
+    parent = peak_rss_mb(resource.RUSAGE_SELF)
+    child = peak_rss_mb(resource.RUSAGE_CHILDREN)
+    rss_ok = max(parent, child) <= args.rss_limit
+    print(f"peak RSS: parent {parent:.1f} MB, largest worker {child:.1f} MB  "
+          f"{'PASS' if rss_ok else 'FAIL'} (<= {args.rss_limit:g} MB)")
+
+    small = min(args.draws, 1_000_000)
+    one = montecarlo.summarise(montecarlo.run(small, seed=args.seed, workers=1))
+    many = montecarlo.summarise(montecarlo.run(small, seed=args.seed, workers=max(2, args.workers)))
+    same = one == many
+    print(f"seed {args.seed}: 1 worker vs {max(2, args.workers)} workers identical: {same}  "
+          f"{'PASS' if same else 'FAIL'}")
+
+    worst = accuracy(min(args.draws, 1_000_000), args.seed)
+    print(f"sketch vs exact percentiles: worst relative error {worst:.4%}  "
+          f"{'PASS' if worst <= 0.005 else 'FAIL'} (<= 0.5%)")
+    sys.exit(0 if rss_ok and same and worst <= 0.005 else 1)
+
+
+if __name__ == '__main__':
+    main()
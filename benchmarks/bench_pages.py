@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Page render benchmark: rerun latency, peak memory, elements and payload of
+every sidebar page in both languages, compared with a JSON baseline.
+
+    python benchmarks/bench_pages.py                 # compare with the baseline
+    python benchmarks/bench_pages.py --update        # record a new baseline
+    python benchmarks/bench_pages.py --only simulation live+refresh --lang ko
+
+Every page of ``views.PAGES`` × {en, ko} is a headless AppTest session. Its
+first run (imports, cold caches) is reported but not compared; then
+``--runs`` reruns give the p50 and p95 wall time. One more rerun, outside
+the timed ones, is traced for the Python heap peak (``tracemalloc``) and
+profiled (``ui.profiling``) for the elements enqueued and their serialised
+bytes, which is what the browser receives on every interaction.
+
+Two scenarios replay interactive use:
+
+* ``live+refresh``: the Live Monitoring page with auto-refresh on, a new
+  snapshot published before every rerun, as the feed does each frame.
+* ``simulation+sweep``: the Simulation page with one slider moved per
+  rerun, each slider in turn across its range.
+
+Results are compared with ``--baseline`` (``benchmarks/baselines/pages.json``):
+a rerun time above baseline × (1 + ``--time-tolerance``) plus
+``--time-slack-ms``, a heap peak above baseline × (1 +
+``--memory-tolerance``), or elements or bytes above baseline × (1 +
+``--size-tolerance``), is a regression. Timings only compare on the machine
+that recorded them; record a baseline there first with ``--update``. A
+missing baseline is recorded rather than compared.
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from itertools import cycle
+from pathlib import Path
+
+import streamlit
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from streamlit.testing.v1 import AppTest  # noqa: E402
+
+import views  # noqa: E402
+from core.data import POSCO_DATA  # noqa: E402
+from ui import profiling  # noqa: E402
+
+APP = str(ROOT / 'app_posco_v2.py')
+BASELINE = ROOT / 'benchmarks' / 'baselines' / 'pages.json'
+LANGS = ('en', 'ko')
+SCENARIOS = ('live+refresh', 'simulation+sweep')
+SWEEP_STEP = 25
+TIMES = ('p50_ms', 'p95_ms')
+SIZES = ('elements', 'bytes')
+
+
+def pct(values, q):
+    values = sorted(values)
+    return values[int(q / 100 * (len(values) - 1))]
+
+
+# =============================================================================
+# SCENARIOS
+# =============================================================================
+# Each returns the session after its first run and a step run before every
+# timed rerun.
+
+def page_session(page, lang):
+    at = AppTest.from_file(APP, default_timeout=60)
+    at.session_state['lang'] = lang
+    at.session_state['page'] = page
+    at.run()
+    return at
+
+
+def plain(page, lang):
+    return page_session(page, lang), lambda at: None
+
+
+def live_refresh(lang):
+    from views import live
+
+    at = page_session('live', lang)
+    at.checkbox[0].check().run()
+    producer = live.live_snapshots(tuple((d.key, d.sensors) for d in POSCO_DATA.divisions.values()))
+    return at, lambda at: producer.publish()
+
+
+def simulation_sweep(lang):
+    at = page_session('simulation', lang)
+    moves = cycle([(slider.key, value) for slider in at.slider
+                   for value in range(int(slider.min), int(slider.max) + 1, SWEEP_STEP)])
+
+    def move(at):
+        key, value = next(moves)
+        at.slider(key=key).set_value(value)
+
+    return at, move
+
+
+def scenario(name, lang):
+    if name == 'live+refresh':
+        return live_refresh(lang)
+    if name == 'simulation+sweep':
+        return simulation_sweep(lang)
+    return plain(name, lang)
+
+
+# =============================================================================
+# MEASUREMENT
+# =============================================================================
+
+def measure(name, lang, runs):
+    start = time.perf_counter()
+    at, step = scenario(name, lang)
+    first = time.perf_counter() - start
+    times = []
+    for _ in range(runs):
+        step(at)
+        start = time.perf_counter()
+        at.run()
+        times.append(time.perf_counter() - start)
+        if at.exception:
+            raise RuntimeError(f"{name}/{lang}: {at.exception[0].message}")
+
+    profiler = profiling.PROFILER
+    profiler.reset()
+    profiler.enable(True)
+    step(at)
+    tracemalloc.start()
+    try:
+        at.run()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+        profiler.enable(False)
+    snap = profiler.snapshot()
+    profiler.reset()
+    return {
+        'first_ms': round(first * 1000, 1),
+        'p50_ms': round(statistics.median(times) * 1000, 2),
+        'p95_ms': round(pct(times, 95) * 1000, 2),
+        'peak_kb': round(peak / 1024),
+        'elements': sum(snap['elements'].values()),
+        'bytes': sum(snap['bytes'].values()),
+    }
+
+
+def compare(results, baseline, args):
+    """``(key, metric, now, then)`` of every regression against ``baseline``."""
+    regressions = []
+    for key, now in results.items():
+        then = baseline.get(key)
+        if then is None:
+            continue
+        for metric in TIMES:
+            if now[metric] > then[metric] * (1 + args.time_tolerance) + args.time_slack_ms:
+                regressions.append((key, metric, now[metric], then[metric]))
+        if now['peak_kb'] > then['peak_kb'] * (1 + args.memory_tolerance):
+            regressions.append((key, 'peak_kb', now['peak_kb'], then['peak_kb']))
+        for metric in SIZES:
+            if now[metric] > then[metric] * (1 + args.size_tolerance):
+                regressions.append((key, metric, now[metric], then[metric]))
+    return regressions
+
+
+def change(now, then):
+    if not then:
+        return ''
+    return f"{now / then - 1:+.0%}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--runs', type=int, default=20)
+    parser.add_argument('--lang', choices=LANGS, action='append')
+    parser.add_argument('--only', nargs='+', choices=views.PAGES + SCENARIOS)
+    parser.add_argument('--baseline', type=Path, default=BASELINE)
+    parser.add_argument('--update', action='store_true', help='write the results as the new baseline')
+    parser.add_argument('--time-tolerance', type=float, default=0.25)
+    parser.add_argument('--time-slack-ms', type=float, default=3.0)
+    parser.add_argument('--memory-tolerance', type=float, default=0.25)
+    parser.add_argument('--size-tolerance', type=float, default=0.05)
+    args = parser.parse_args()
+
+    recorded = json.loads(args.baseline.read_text()) if args.baseline.exists() else None
+    baseline = recorded['results'] if recorded else {}
+
+    results = {}
+    print(f"{'page':<18} {'lang':<4} {'first ms':>9} {'p50 ms':>8} {'p95 ms':>8} {'Δp50':>6} "
+          f"{'peak KB':>8} {'elements':>9} {'KB':>7} {'ΔKB':>5}")
+    for lang in args.lang or LANGS:
+        for name in args.only or views.PAGES + SCENARIOS:
+            key = f"{name}/{lang}"
+            r = results[key] = measure(name, lang, args.runs)
+            then = baseline.get(key, {})
+            print(f"{name:<18} {lang:<4} {r['first_ms']:>9.0f} {r['p50_ms']:>8.1f} {r['p95_ms']:>8.1f} "
+                  f"{change(r['p50_ms'], then.get('p50_ms')):>6} {r['peak_kb']:>8,} {r['elements']:>9} "
+                  f"{r['bytes'] / 1024:>7.0f} {change(r['bytes'], then.get('bytes')):>5}")
+
+    print()
+    if args.update or recorded is None:
+        # A partial run (--only, --lang) updates its own entries only
+        merged = dict(baseline, **results) if args.only or args.lang else results
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.baseline.write_text(json.dumps({
+            'recorded': time.strftime('%Y-%m-%d %H:%M:%S'),
+            'python': platform.python_version(),
+            'streamlit': streamlit.__version__,
+            'machine': platform.machine(),
+            'runs': args.runs,
+            'results': dict(sorted(merged.items())),
+        }, indent=1, ensure_ascii=False) + '\n')
+        print(f"baseline recorded: {args.baseline} ({len(results)} results)  PASS")
+        sys.exit(0)
+
+    regressions = compare(results, baseline, args)
+    for key, metric, now, then in regressions:
+        print(f"regression {key} {metric}: {now:,} vs {then:,} in the baseline")
+    missing = sorted(set(results) - set(baseline))
+    if missing:
+        print(f"not in the baseline (not compared): {', '.join(missing)}")
+    ok = not regressions
+    print(f"{len(results) - len(missing)} results against the baseline of {recorded['recorded']}: "
+          f"{len(regressions)} regressions  {'PASS' if ok else 'FAIL'}")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == '__main__':
+    main()
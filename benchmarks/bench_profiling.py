@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Profiling overhead per rerun: every page with ``ui.profiling`` enabled,
+against the rerun time of the page itself.
+
+    python benchmarks/bench_profiling.py --runs 5
+
+Each page is a headless AppTest session rerun ``--runs`` times with
+profiling off and on, interleaved; the medians are printed, but on a
+shared CPU their difference is mostly noise. The overhead is therefore
+counted instead: the spans each rerun records (from the profile itself)
+times the measured cost of one span, plus the rerun bookkeeping with the
+enqueue wrapper's work on that rerun's own elements (``ByteSize`` and the
+fold into the totals at ``end()`` included), as a share of the median
+rerun. It must stay under ``--max-overhead``.
+
+Disabled, ``DeltaGenerator._enqueue`` must be Streamlit's own function and
+``span()`` the one shared no-op context, so nothing runs but an attribute
+check per span.
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from streamlit.delta_generator import DeltaGenerator  # noqa: E402
+from streamlit.testing.v1 import AppTest  # noqa: E402
+
+import views  # noqa: E402
+from ui import profiling  # noqa: E402
+
+APP = str(ROOT / 'app_posco_v2.py')
+CALLS = 100_000
+
+
+def session(page):
+    at = AppTest.from_file(APP, default_timeout=60)
+    at.session_state['page'] = page
+    at.run()
+    return at
+
+
+def rerun(at):
+    start = time.perf_counter()
+    at.run()
+    assert not at.exception, at.exception
+    return time.perf_counter() - start
+
+
+def per_call(fn, calls=CALLS):
+    start = time.perf_counter()
+    for _ in range(calls):
+        fn()
+    return (time.perf_counter() - start) / calls
+
+
+def span_cost(profiler):
+    """Seconds per enabled span inside a rerun, and per begin/end pair."""
+    profiler.begin('bench')
+
+    def timed():
+        with profiler.span('bench'):
+            pass
+
+    span_s = per_call(timed)
+    profiler.end()
+
+    def rerun_pair():
+        profiler.begin('bench')
+        profiler.end()
+
+    return span_s, per_call(rerun_pair, CALLS // 10)
+
+
+def captured_elements(at):
+    """``(delta_type, element_proto)`` of everything one rerun of ``at`` enqueues."""
+    captured = []
+    enqueue = DeltaGenerator._enqueue
+
+    def capture(dg, delta_type, element_proto, *args, **kwargs):
+        captured.append((delta_type, element_proto))
+        return enqueue(dg, delta_type, element_proto, *args, **kwargs)
+
+    DeltaGenerator._enqueue = capture
+    try:
+        at.run()
+    finally:
+        DeltaGenerator._enqueue = enqueue
+    return captured
+
+
+def rerun_cost(profiler, elements):
+    """Seconds of a begin/end pair with the enqueue wrapper's work on ``elements`` (one rerun's worth)."""
+    start = time.perf_counter()
+    for _ in range(20):
+        profiler.begin('bench')
+        for delta_type, proto in elements:
+            profiler.emitted(delta_type, proto.ByteSize())
+        profiler.end()
+    return (time.perf_counter() - start) / 20
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--max-overhead', type=float, default=0.01, help='share of the rerun time')
+    args = parser.parse_args()
+
+    profiler = profiling.PROFILER
+    original = DeltaGenerator._enqueue
+    profiler.enable(False)
+    ok = DeltaGenerator._enqueue is original and profiling.span('a') is profiling.span('b')
+    disabled_s = per_call(lambda: profiling.span('bench'))
+
+    profiler.enable(True)
+    ok &= DeltaGenerator._enqueue is not original
+    span_s, pair_s = span_cost(profiler)
+    profiler.enable(False)
+    ok &= DeltaGenerator._enqueue is original
+
+    print(f"span() disabled {disabled_s * 1e9:.0f} ns, enabled span {span_s * 1e6:.2f} µs, "
+          f"begin/end {pair_s * 1e6:.2f} µs, enqueue wrapper restored: {DeltaGenerator._enqueue is original}")
+    print()
+    print(f"{'page':<16} {'off ms':>8} {'on ms':>8} {'spans':>6} {'elements':>9} {'KB':>7} "
+          f"{'instr ms':>9} {'overhead':>9}")
+
+    worst = 0.0
+    for page in views.PAGES + views.HIDDEN:
+        at = session(page)
+        off, on = [], []
+        for _ in range(args.runs):
+            profiler.enable(False)
+            off.append(rerun(at))
+            profiler.enable(True)
+            on.append(rerun(at))
+        profiler.reset()
+        elements = captured_elements(at)
+        profiler.enable(False)
+        snap = profiler.snapshot()
+        (record,) = snap['recent']
+        spans = sum(s['count'] for s in snap['spans'].values())
+        count = sum(snap['elements'].values())
+        ok &= count == len(elements) and record['page'] == page
+
+        instrumented = spans * span_s + rerun_cost(profiler, elements)
+        base = statistics.median(off)
+        overhead = instrumented / base
+        worst = max(worst, overhead)
+        print(f"{page:<16} {base * 1000:>8.1f} {statistics.median(on) * 1000:>8.1f} {spans:>6} {count:>9} "
+              f"{record['bytes'] / 1024:>7.0f} {instrumented * 1000:>9.3f} {overhead:>9.3%}")
+
+    profiler.reset()
+    ok &= worst < args.max_overhead
+    print()
+    print(f"worst instrumentation overhead {worst:.3%} < {args.max_overhead:.0%}, nothing installed while disabled  "
+          f"{'PASS' if ok else 'FAIL'}")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+DT-SEQ proof packs: append cost, inclusion-proof latency and footprint of
+the on-disk Merkle tree against a month of 60 sensors at 1 Hz.
+
+    python benchmarks/bench_proofs.py --leaves 1000000
+
+``--leaves`` leaf hashes are appended in frames of 60, as the feed adds a
+frame's verified payloads, into a pack in a temporary directory. The
+benchmark reports the append rate and the worst frame, the Python memory
+held by the pack, and the disk bytes per leaf extrapolated to a month
+(~155M leaves). Inclusion proofs are then built for random leaves at a
+quarter, half and the full size and checked with ``verify_inclusion``;
+a run of signed payloads goes through ``ProofPacks`` to time the
+payload-to-proof lookup, and the pack is reopened to time recovery.
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from telemetry import SensorSimulator, build_catalogue, edge, proofs  # noqa: E402
+
+DIVISIONS = {'steelmaking': 25, 'chemical': 15, 'construction': 10, 'energy': 10}
+FRAME = 60
+MONTH_LEAVES = 60 * 86400 * 30
+
+
+def disk_bytes(path):
+    return sum(os.path.getsize(os.path.join(d, f)) for d, _, files in os.walk(path) for f in files)
+
+
+def proof_latency(pack, samples, rng):
+    times, ok = [], True
+    for i in rng.integers(0, pack.size, samples):
+        start = time.perf_counter()
+        proof = pack.proof(int(i))
+        times.append((time.perf_counter() - start) * 1000)
+        ok &= proofs.verify_inclusion(proof.leaf, proof.index, proof.size, proof.path, proof.root)
+    times.sort()
+    return statistics.median(times), times[int(0.95 * (len(times) - 1))], len(proof.path), ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--leaves', type=int, default=1_000_000)
+    parser.add_argument('--samples', type=int, default=1000, help='proofs per checkpoint')
+    parser.add_argument('--payload-ticks', type=int, default=300, help='ticks of signed payloads for ProofPacks')
+    parser.add_argument('--max-proof-ms', type=float, default=5.0, help='p95 budget per proof')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    checkpoints = {args.leaves // 4 // FRAME * FRAME, args.leaves // 2 // FRAME * FRAME}
+    with tempfile.TemporaryDirectory() as tmp:
+        pack = proofs.ProofPack(os.path.join(tmp, '2026-10'))
+        frames = []
+        tracemalloc.start()
+        base = tracemalloc.get_traced_memory()[0]
+        rows = []
+        total = 0.0
+        for n in range(0, args.leaves, FRAME):
+            leaves = [rng.bytes(32) for _ in range(min(FRAME, args.leaves - n))]
+            start = time.perf_counter()
+            pack.extend(leaves)
+            elapsed = time.perf_counter() - start
+            total += elapsed
+            frames.append(elapsed)
+            if n + FRAME in checkpoints:
+                rows.append((pack.size,) + proof_latency(pack, args.samples, rng))
+        held = tracemalloc.get_traced_memory()[0] - base
+        tracemalloc.stop()
+        rows.append((pack.size,) + proof_latency(pack, args.samples, rng))
+        root = pack.root()
+        pack.flush()
+        per_leaf = disk_bytes(pack.path) / pack.size
+        pack.close()
+
+        start = time.perf_counter()
+        reopened = proofs.ProofPack(os.path.join(tmp, '2026-10'))
+        reopen_ms = (time.perf_counter() - start) * 1000
+        same = reopened.size == args.leaves and reopened.root() == root
+        reopened.close()
+
+        rate = args.leaves / total
+        frames.sort()
+        print(f"{args.leaves:,} leaves in frames of {FRAME}: {rate:,.0f} leaves/s, "
+              f"{total / len(frames) * 1e6:.0f} µs per frame (p99 {frames[int(0.99 * (len(frames) - 1))] * 1e6:.0f}, "
+              f"max {frames[-1] * 1e6:.0f})")
+        print(f"pack memory {held / 1024:.1f} KiB; disk {per_leaf:.1f} B/leaf, "
+              f"{per_leaf * MONTH_LEAVES / 1e9:.1f} GB for a month ({MONTH_LEAVES / 1e6:.0f}M leaves), "
+              f"built in {MONTH_LEAVES / rate / 60:.0f} min at this rate; reopen {reopen_ms:.1f} ms, "
+              f"same root: {same}")
+        print()
+        print(f"{'leaves':>12} {'path':>5} {'p50 ms':>8} {'p95 ms':>8} {'verified':>9}")
+        for size, p50, p95, depth, ok in rows:
+            print(f"{size:>12,} {depth:>5} {p50:>8.3f} {p95:>8.3f} {'yes' if ok else 'NO':>9}")
+
+        # Signed payloads, routed by period and looked up by (device, sequence number)
+        sensors = build_catalogue(DIVISIONS)
+        devices = edge.EdgeDevices(sensors, seed=args.seed)
+        packs = proofs.ProofPacks(os.path.join(tmp, 'packs'))
+        sim = SensorSimulator(sensors, seed=args.seed)
+        payloads = []
+        for tick in range(args.payload_ticks):
+            frame = devices.sign_frame(1.7e9 + tick, sim.next_frame())
+            packs.add(frame)
+            payloads.extend(frame)
+        times, found = [], True
+        for i in rng.integers(0, len(payloads), args.samples):
+            p = payloads[int(i)]
+            start = time.perf_counter()
+            proof = packs.proof(p)
+            times.append((time.perf_counter() - start) * 1000)
+            found &= proof is not None and proof.leaf == proofs.leaf_hash(proofs.payload_bytes(p)) and \
+                proofs.verify_inclusion(proof.leaf, proof.index, proof.size, proof.path, proof.root)
+        sealed = packs.pack(proofs.period_of(payloads[0].ts)).seal(edge.seeded_key(args.seed))
+        packs.close()
+        times.sort()
+        print()
+        print(f"payload -> proof over {len(payloads):,} signed payloads: p50 {statistics.median(times):.3f} ms, "
+              f"p95 {times[int(0.95 * (len(times) - 1))]:.3f} ms, all found and verified: {found}; "
+              f"sealed root verifies: {proofs.verify_root(sealed)}")
+
+    worst_p95 = max(r[2] for r in rows)
+    ok = (all(r[4] for r in rows) and found and same and proofs.verify_root(sealed)
+          and worst_p95 <= args.max_proof_ms and rate >= 10 * FRAME)
+    print()
+    print(f"proof p95 {worst_p95:.3f} ms <= {args.max_proof_ms:g} ms, all proofs verify, "
+          f"append >= 10x the 1 Hz rate  {'PASS' if ok else 'FAIL'}")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == '__main__':
+    main()
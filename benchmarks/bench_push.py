@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Push API fan-out: 1,000 WebSocket subscribers at 1 Hz against one server
+process, plus coalescing and backpressure of stalled subscribers.
+
+    python benchmarks/bench_push.py --subscribers 1000 --seconds 30
+
+The server runs in a child process (uvicorn, one event loop) with the live
+feed at one frame per second and the ``telemetry.push`` hub polling every
+second, as under ``asgi.py`` but without Streamlit. This process opens the
+WebSocket clients and applies every message to its own copy of the state.
+Reported: the server's CPU share of one core over the steady window (read
+from /proc, so client CPU on the same core is not counted), the time from
+the first to the last subscriber receiving each version, and whether every
+subscriber saw every version with the server's final state.
+
+Slow consumers are exercised in process: a hub with ``--stalled``
+subscribers that never read must merge every delta into one pending
+message, match the latest state when finally read, and drop the ones left
+behind for ``MAX_LAG`` deltas.
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import subprocess
+import sys
+import time
+import urllib.request
+from pathlib import Path
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from core.data import POSCO_DATA  # noqa: E402
+from telemetry import CHANNELS, Feed, RingStore, SensorSimulator, build_catalogue, push, site, snapshot  # noqa: E402
+
+HOST = '127.0.0.1'
+CONNECT_BATCH = 100
+
+
+def catalogue():
+    return build_catalogue({d.key: d.sensors for d in POSCO_DATA.divisions.values()})
+
+
+def live_producer(period_s):
+    sensors = catalogue()
+    store = RingStore(sensors, CHANNELS, 3600)
+    monitor = site.SiteMonitor(sensors, CHANNELS)
+    producer = snapshot.SnapshotProducer(store, site.SiteRollup(sensors, CHANNELS), monitor)
+    Feed(store, SensorSimulator(sensors, seed=0), period_s=period_s, backfill=360, monitor=monitor,
+         snapshots=producer).start()
+    return producer
+
+
+def serve(port):
+    import uvicorn
+    from starlette.applications import Starlette
+
+    producer = live_producer(period_s=1.0)
+    hub = push.Hub(producer.latest, period_s=1.0)
+    app = Starlette(routes=hub.routes(), lifespan=hub.lifespan)
+    uvicorn.run(app, host=HOST, port=port, log_level='warning')
+
+
+def cpu_seconds(pid):
+    fields = Path(f"/proc/{pid}/stat").read_text().rsplit(')', 1)[1].split()
+    return (int(fields[11]) + int(fields[12])) / 100  # utime + stime, clock ticks
+
+
+def rss_mb(pid):
+    for line in Path(f"/proc/{pid}/status").read_text().splitlines():
+        if line.startswith('VmRSS:'):
+            return int(line.split()[1]) / 1024
+
+
+def stats(port):
+    with urllib.request.urlopen(f"http://{HOST}:{port}/api/live/stats", timeout=5) as r:
+        return json.load(r)
+
+
+# =============================================================================
+# NETWORK FAN-OUT
+# =============================================================================
+
+async def subscriber(port, received, states, stop):
+    import websockets
+
+    state, versions = {}, []
+    async with websockets.connect(f"ws://{HOST}:{port}/api/live/ws", max_queue=None) as ws:
+        while not stop.is_set():
+            try:
+                text = await asyncio.wait_for(ws.recv(), 0.5)
+            except asyncio.TimeoutError:
+                continue
+            now = time.perf_counter()
+            message = json.loads(text)
+            push.merge(state, {k: message[k] for k in ('gauges', 'furnaces') if k in message})
+            versions.append(message['version'])
+            first_last = received.setdefault(message['version'], [now, now, 0])
+            first_last[1] = max(first_last[1], now)
+            first_last[2] += 1
+    states.append((versions, state))
+
+
+async def fan_out(port, n, seconds, pid):
+    received, states, stop = {}, [], asyncio.Event()
+    tasks = []
+    for i in range(0, n, CONNECT_BATCH):
+        tasks += [asyncio.create_task(subscriber(port, received, states, stop)) for _ in range(min(CONNECT_BATCH, n - i))]
+        await asyncio.sleep(0.2)
+    while stats(port)['subscribers'] < n:
+        await asyncio.sleep(0.2)
+    await asyncio.sleep(2)      # let every subscriber pass its first full snapshot
+    start_version = stats(port)['version']
+    cpu0, wall0 = cpu_seconds(pid), time.perf_counter()
+    await asyncio.sleep(seconds)
+    cpu = (cpu_seconds(pid) - cpu0) / (time.perf_counter() - wall0)
+    end = stats(port)
+    await asyncio.sleep(1.5)    # last broadcast in flight
+    stop.set()
+    await asyncio.gather(*tasks)
+    window = range(start_version + 1, end['version'] + 1)
+    spreads = [received[v][1] - received[v][0] for v in window if v in received]
+    complete = sum(received.get(v, (0, 0, 0))[2] == n for v in window)
+    return cpu, end, window, spreads, complete, states
+
+
+# =============================================================================
+# STALLED SUBSCRIBERS
+# =============================================================================
+
+def stalled(n, fast):
+    """Hub with ``n`` subscribers that never read and ``fast`` that read every delta.
+
+    Returns whether each stalled one holds one merged message, whether that
+    message rebuilds the latest state, and how many were dropped once
+    ``MAX_LAG`` deltas behind.
+    """
+    sensors = catalogue()
+    sim = SensorSimulator(sensors, seed=1)
+    store = RingStore(sensors, CHANNELS, 3600)
+    producer = snapshot.SnapshotProducer(store, site.SiteRollup(sensors, CHANNELS))
+    hub = push.Hub(producer.latest)
+    loop = asyncio.new_event_loop()
+
+    def tick():
+        store.extend_frames(np.array([time.time()]), sim.next_frames(1))
+        hub.poll(producer.publish())
+        for s in subs[n:]:
+            loop.run_until_complete(s.next())
+
+    store.extend_frames(np.array([time.time()]), sim.next_frames(1))
+    hub.poll(producer.publish())
+    subs = [hub.subscribe() for _ in range(n + fast)]
+    for s in subs:
+        loop.run_until_complete(s.next())
+    state = hub.state
+    for _ in range(hub.max_lag):
+        tick()
+    pending_ok = all(s.pending is not None and s.lag == hub.max_lag - 1 for s in subs[:n])
+    merged = json.loads(loop.run_until_complete(subs[0].next()))
+    matches = (merged['version'] == hub.version
+               and push.merge(json.loads(json.dumps(state)), {k: merged[k] for k in state if k in merged}) == hub.state)
+    tick()      # the other stalled ones are now max_lag behind
+    dropped = sum(s.closed for s in subs[1:n])
+    loop.close()
+    return pending_ok, matches, dropped
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--subscribers', type=int, default=1000)
+    parser.add_argument('--seconds', type=float, default=30.0)
+    parser.add_argument('--stalled', type=int, default=100)
+    parser.add_argument('--port', type=int, default=8766)
+    parser.add_argument('--max-cpu', type=float, default=0.5, help='server share of one core')
+    parser.add_argument('--max-spread-ms', type=float, default=500.0, help='p95 first-to-last delivery')
+    parser.add_argument('--serve', action='store_true', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.serve:
+        return serve(args.port)
+
+    server = subprocess.Popen([sys.executable, __file__, '--serve', '--port', str(args.port)])
+    try:
+        for _ in range(100):
+            try:
+                stats(args.port)
+                break
+            except OSError:
+                time.sleep(0.2)
+        cpu, end, window, spreads, complete, states = asyncio.run(
+            fan_out(args.port, args.subscribers, args.seconds, server.pid))
+        rss = rss_mb(server.pid)
+    finally:
+        server.terminate()
+        server.wait()
+
+    final = max(states, key=lambda s: s[0][-1])
+    consistent = sum(s[0][-1] == final[0][-1] and s[1] == final[1] for s in states)
+    spreads.sort()
+    p95 = spreads[int(0.95 * (len(spreads) - 1))] if spreads else float('inf')
+    print(f"{args.subscribers:,} WebSocket subscribers, {len(window)} versions in {args.seconds:g} s")
+    print(f"server CPU {cpu:.1%} of one core, RSS {rss:.0f} MB, {end['coalesced']} coalesced, "
+          f"{end['dropped']} dropped")
+    if spreads:
+        print(f"first-to-last delivery per version: median {statistics.median(spreads) * 1000:.0f} ms, "
+              f"p95 {p95 * 1000:.0f} ms")
+    print(f"versions delivered to every subscriber: {complete}/{len(window)}, "
+          f"final state identical on {consistent}/{len(states)}")
+
+    pending_ok, matches, dropped = stalled(args.stalled, 10)
+    print(f"stalled subscribers: one merged pending message each {'yes' if pending_ok else 'NO'}, "
+          f"merged message reproduces the latest state {'yes' if matches else 'NO'}, "
+          f"{dropped}/{args.stalled - 1} dropped at {push.MAX_LAG} deltas behind")
+
+    ok = (cpu <= args.max_cpu and p95 * 1000 <= args.max_spread_ms and len(window) >= args.seconds * 0.8
+          and complete == len(window) and consistent == len(states) == args.subscribers
+          and pending_ok and matches and dropped == args.stalled - 1)
+    print(f"fan-out at 1 Hz within {args.max_cpu:.0%} of a core, p95 <= {args.max_spread_ms:g} ms, "
+          f"slow consumers coalesced and bounded  {'PASS' if ok else 'FAIL'}")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+K-ETS reports: cold and incremental build time of an annual report from the
+furnace history, exports, and how long the building job stalls the caller.
+
+    python benchmarks/bench_reports.py --days 365
+
+A year of per-minute rows for the eleven furnaces is generated into a
+temporary history. The annual report is built through ``ReportJobs`` with
+an empty aggregate cache (every day read), rebuilt unchanged (no day read),
+and rebuilt after one more day is appended, which must recompute exactly
+that day. While the cold build runs, the main thread ticks every 10 ms as
+a dashboard script would and the worst delay is reported. Totals are
+checked against a direct reduction of the history rows.
+"""
+
+import argparse
+import calendar
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from telemetry import history, reports  # noqa: E402
+
+TICK_S = 0.01
+
+
+def run(jobs, kind, period):
+    """Build through the queue while ticking the main thread; returns (job, seconds, worst tick delay)."""
+    start = time.perf_counter()
+    job = jobs.submit(kind, period)
+    worst = 0.0
+    while job.pending:
+        t0 = time.perf_counter()
+        time.sleep(TICK_S)
+        worst = max(worst, time.perf_counter() - t0 - TICK_S)
+    return job, time.perf_counter() - start, worst
+
+
+def direct_totals(store, days):
+    production = emissions = 0.0
+    for furnace in store.furnaces:
+        table = store.read(furnace, days[0] * history.DAY_S, (days[-1] + 1) * history.DAY_S,
+                           columns=('output_t_day', 'co2_kg_t'))
+        tonnes = table.column('output_t_day').to_numpy().astype(np.float64) / reports.MINUTES_PER_DAY
+        production += tonnes.sum()
+        emissions += (tonnes * table.column('co2_kg_t').to_numpy().astype(np.float64)).sum() / 1000
+    return production, emissions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--days', type=int, default=365)
+    parser.add_argument('--max-stall-ms', type=float, default=100.0, help='worst main-thread delay during a build')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = history.HistoryStore(os.path.join(tmp, 'history'))
+        # End the history on 1 January so last year's annual report covers it.
+        year = time.gmtime().tm_year - 1
+        end = calendar.timegm((year + 1, 1, 1, 0, 0, 0))
+        year = str(year)
+        start = time.perf_counter()
+        rows = history.generate(store, args.days, end=end, seed=args.seed)
+        print(f"history: {rows:,} rows ({args.days} days x {len(store.furnaces)} furnaces) "
+              f"in {time.perf_counter() - start:.1f} s")
+
+        aggregates = reports.DailyAggregates(store, os.path.join(tmp, 'reports', 'daily.json'))
+        jobs = reports.ReportJobs(aggregates)
+        cold, cold_s, cold_stall = run(jobs, 'year', year)
+        warm, warm_s, _ = run(jobs, 'year', year)
+
+        # One more day of rows, as the recorder would flush them, lands in the period.
+        days = [d for d in reports.period_days('year', year) if d in set(store.days())]
+        last = days[-1]
+        history.generate(store, 1, end=(last + 1) * history.DAY_S, seed=args.seed + 1)
+        changed, changed_s, _ = run(jobs, 'year', year)
+
+        reloaded = reports.DailyAggregates(store, aggregates.path)
+        start = time.perf_counter()
+        recomputed_after_restart = reloaded.update(reports.period_days('year', year))
+        restart_s = time.perf_counter() - start
+        production, emissions = direct_totals(store, days)
+        jobs.close()
+
+        print(f"annual report {year}: {cold.report.totals['days_with_data']} days with data, "
+              f"{cold.report.totals['emissions_t'] / 1e6:,.2f} MtCO2")
+        print()
+        print(f"{'build':<22} {'seconds':>8} {'days read':>10}")
+        for label, job, seconds in (('cold (empty cache)', cold, cold_s), ('unchanged', warm, warm_s),
+                                    ('one day changed', changed, changed_s)):
+            print(f"{label:<22} {seconds:>8.3f} {job.report.recomputed:>10}")
+        print(f"{'reloaded from disk':<22} {restart_s:>8.3f} {recomputed_after_restart:>10}")
+        print(f"main thread worst delay during the cold build: {cold_stall * 1000:.1f} ms")
+
+        print()
+        for fmt in reports.EXPORTS:
+            start = time.perf_counter()
+            size = len(changed.export(fmt))
+            print(f"export {fmt:<5} {size / 1024:>7.1f} KB in {(time.perf_counter() - start) * 1000:.0f} ms")
+
+    t = changed.report.totals
+    gap = max(abs(t['production_t'] - production) / production, abs(t['emissions_t'] - emissions) / emissions)
+    print()
+    print(f"totals vs direct reduction: max relative gap {gap:.1e}")
+    ok = (gap < 1e-9 and cold.report.recomputed >= cold.report.totals['days_with_data']
+          and warm.report.recomputed == 0 and changed.report.recomputed == 1 and recomputed_after_restart == 0
+          and cold_stall * 1000 <= args.max_stall_ms)
+    print(f"unchanged rebuild reads nothing, one changed day reads one, stall <= {args.max_stall_ms:g} ms  "
+          f"{'PASS' if ok else 'FAIL'}")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == '__main__':
+    main()
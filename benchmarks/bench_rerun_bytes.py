@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Bytes sent per rerun: size of the element deltas each page pushes to the
+browser, with the stylesheet inlined (static serving off, the old
+behaviour) versus linked from ``app/static``.
+
+    python benchmarks/bench_rerun_bytes.py
+
+Sizes are the serialised element protos of one full rerun, which is what
+Streamlit re-sends on every widget interaction. The stylesheet and its
+font subsets are fetched once per browser and reported separately.
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from streamlit import config  # noqa: E402
+from streamlit.testing.v1 import AppTest  # noqa: E402
+
+from ui import assets  # noqa: E402
+
+APP = str(ROOT / 'app_posco_v2.py')
+PAGES = ('home', 'live', 'greensteel', 'credits', 'business', 'simulation',
+         'hyrex', 'carbon_neutral', 'compliance', 'mrv')
+
+
+def tree_bytes(node):
+    size = 0
+    proto = getattr(node, 'proto', None)
+    if proto is not None:
+        size += proto.ByteSize()
+    for child in getattr(node, 'children', {}).values():
+        size += tree_bytes(child)
+    return size
+
+
+def rerun_bytes(page, lang, static_serving):
+    config.set_option('server.enableStaticServing', static_serving)
+    at = AppTest.from_file(APP, default_timeout=60)
+    at.session_state['lang'] = lang
+    at.session_state['page'] = page
+    at.run()
+    if at.exception:
+        raise RuntimeError(f"{page}/{lang}: {at.exception[0].message}")
+    return tree_bytes(at._tree)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--lang', choices=('en', 'ko'), action='append')
+    args = parser.parse_args()
+
+    rows = []
+    for lang in args.lang or ('en', 'ko'):
+        for page in PAGES:
+            rows.append((lang, page, rerun_bytes(page, lang, False), rerun_bytes(page, lang, True)))
+
+    print(f"{'lang':<5} {'page':<15} {'inline B':>10} {'linked B':>10} {'saved':>7}")
+    for lang, page, inline, linked in rows:
+        print(f"{lang:<5} {page:<15} {inline:>10,} {linked:>10,} {1 - linked / inline:>7.0%}")
+    inline = sum(r[2] for r in rows)
+    linked = sum(r[3] for r in rows)
+    print(f"{'all':<21} {inline:>10,} {linked:>10,} {1 - linked / inline:>7.0%}")
+
+    css = len((assets.STATIC_DIR / assets.STYLESHEET).read_bytes())
+    print()
+    fonts = {f.name: f.stat().st_size for f in sorted((assets.STATIC_DIR / 'fonts').glob('*.woff2'))}
+    print(f"stylesheet: {css:,} B fetched once per browser; "
+          f"<link> per rerun: {len(assets.stylesheet_html(True).encode()):,} B")
+    print("fonts, fetched once per browser when a page draws their characters: "
+          + ', '.join(f"{name} {size:,} B" for name, size in fonts.items()))
+    ok = all(linked < inline for _, _, inline, linked in rows)
+    print(f"every page sends fewer bytes per rerun: {'PASS' if ok else 'FAIL'}")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Vectorised scenario engine: speed over the 5-D slider grid and exact
+equality with the original scalar simulation-page formulas.
+
+    python benchmarks/bench_scenarios.py --steps 16 --repeat 5
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from core import scenarios  # noqa: E402
+
+
+def scalar_reference(hyrex, eaf, scrap, h2, ccus):
+    """The simulation page's arithmetic before it moved into core.scenarios."""
+    sim_carbon = 157.5 * (ccus / 100)
+    sim_green = 246 * (hyrex / 100) * (eaf / 100)
+    sim_scrap = 127.5 * (scrap / 100)
+    sim_h2 = 79 * (h2 / 100)
+    sim_l1 = sim_carbon + sim_green + sim_scrap + sim_h2
+    sim_l2 = sim_l1 + 3200 * ((hyrex + eaf) / 200)
+    sim_l3 = sim_l2 + 3800 * ((hyrex + h2) / 200)
+    intensity = 1857 * (1 - (hyrex - 100) / 200 * 0.5)
+    return (sim_carbon, sim_green, sim_scrap, sim_h2, sim_l1, sim_l2, sim_l3, intensity)
+
+
+def check_equality(inputs, result):
+    """Compare every scenario against the scalar formulas, bit for bit."""
+    columns = [inputs[p].tolist() for p in scenarios.PARAMS]
+    expected = np.array([scalar_reference(*row) for row in zip(*columns)])
+    actual = np.stack([result[k] for k in scenarios.OUTPUTS], axis=1)
+    return int((expected != actual).sum())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--steps', type=int, default=16, help='grid points per parameter')
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    # Integer slider positions, as the page produces them.
+    inputs = {p: np.round(v) for p, v in scenarios.grid(args.steps).items()}
+    n = len(inputs['hyrex'])
+
+    timings = []
+    for _ in range(args.repeat):
+        start = time.perf_counter()
+        result = scenarios.evaluate(**inputs)
+        timings.append(time.perf_counter() - start)
+    best, median = min(timings), statistics.median(timings)
+    print(f"{n:,} scenarios: median {median * 1000:.1f} ms, best {best * 1000:.1f} ms "
+          f"({n / median / 1e6:.1f}M scenarios/s)  {'PASS' if median < 1 else 'FAIL'} (< 1 s)")
+
+    rng = np.random.default_rng(0)
+    sample = {p: scenarios.RANGES[p][0] + rng.random(n) * np.ptp(scenarios.RANGES[p])
+              for p in scenarios.PARAMS}
+    mismatches = check_equality(inputs, result) + check_equality(sample, scenarios.evaluate(**sample))
+    print(f"scalar equality over {2 * n:,} grid + random scenarios: {mismatches} mismatches  "
+          f"{'PASS' if mismatches == 0 else 'FAIL'}")
+    sys.exit(0 if median < 1 and mismatches == 0 else 1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Session memory: 1,000 synthetic sessions through the server-side session
+store, whose memory must stay within its budget.
+
+    python benchmarks/bench_sessions.py --sessions 1000 --budget-mb 32
+
+Each synthetic session does to its workspace what a Simulation page visit
+does: random slider values, added to its history, and the page's reactive
+cells (metrics, radar, credits, sensitivity heatmap) evaluated into its
+cache. Visits arrive ``--interval-s`` apart on average (exponentially
+distributed, on a simulated clock): lulls past the ``--ttl-s`` idle
+timeout expire sessions, bursts fill the byte budget and evict them. Every
+``--revisit``-th visit returns to an earlier session: with SQLite spill (to
+a temporary file) its sliders must come back as it left them, without it
+they may reset to the defaults.
+
+The Python heap growth (``tracemalloc``) with the store kept must stay
+under budget × (1 + ``--tolerance``): the store's estimate leaves out
+allocator and interpreter overhead, a few percent here. Its peak may add
+``--slack-mb`` for the visit in flight, the one workspace being written to
+before the store sizes it again. Keeping every session in
+``st.session_state``, as before, would hold the sum of their sizes. Once
+past the idle timeout, one call must leave only its own workspace.
+
+A workspace pinned by a rerun must survive other sessions filling the
+budget, and the rerun's writes must still be there after its release.
+
+Then ``--app-sessions`` headless AppTest sessions open the Simulation page
+and move a slider: each one's ``st.session_state`` (workspace key,
+language, page and widget values) must stay under
+``--max-session-state-kb``.
+"""
+
+import argparse
+import gc
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from streamlit.testing.v1 import AppTest  # noqa: E402
+
+from core import scenarios  # noqa: E402
+from ui import sessions  # noqa: E402
+from views.simulation import METRICS, SIMULATION  # noqa: E402
+
+APP = str(ROOT / 'app_posco_v2.py')
+OUTPUTS = ('l1', 'l2', 'l3', 'intensity', 'radar', 'credits', 'heatmap')
+MB = 1024 * 1024
+
+
+def visit(ws, rng):
+    """What a Simulation page rerun does to its workspace; returns its slider values."""
+    sim = {p: int(rng.integers(lo, hi + 1)) for p, (lo, hi) in scenarios.RANGES.items()}
+    ws.params['sim'] = sim
+    ws.remember(sim)
+    cells = SIMULATION.run(dict(sim, sx='hyrex', sy='eaf', metric=str(rng.choice(list(METRICS)))),
+                           ws.cache.setdefault('sim_cells', {}))
+    for name in OUTPUTS:
+        cells[name]
+    return sim
+
+
+def synthetic(args, path):
+    """Replay the sessions against one store; returns its figures."""
+    now = [0.0]
+    store = sessions.SessionStore(max_bytes=args.budget_mb * MB, ttl_s=args.ttl_s, path=path,
+                                  clock=lambda: now[0])
+    rng = np.random.default_rng(args.seed)
+    keys, sims, sizes = [], {}, {}
+    restored = revisits = 0
+
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    try:
+        for i in range(args.sessions):
+            now[0] += rng.exponential(args.interval_s)
+            if i and i % args.revisit == 0:
+                key = keys[int(rng.integers(len(keys)))]
+                ws = store.get(key)
+                revisits += 1
+                restored += ws.params.get('sim') == sims[key]
+            else:
+                ws = store.get(None)
+                keys.append(ws.key)
+            sims[ws.key] = visit(ws, rng)
+            sizes[ws.key] = ws.size()
+            del ws
+        store.get(keys[-1])
+        held, peak = tracemalloc.get_traced_memory()
+        elapsed = time.perf_counter() - start
+        stats = store.stats()
+
+        now[0] += args.ttl_s + 1
+        store.get(None)
+        idle = store.stats()
+    finally:
+        tracemalloc.stop()
+        store.close()
+    return {
+        'seconds': elapsed, 'held': held, 'peak': peak, 'stats': stats, 'idle': idle,
+        'sessions': len(keys), 'unbounded': sum(sizes.values()), 'largest': max(sizes.values()),
+        'revisits': revisits, 'restored': restored,
+    }
+
+
+def pinned(args, path):
+    """Whether writes to a pinned workspace, after a burst evicts the others, are spilled once it is released.
+
+    Had the burst evicted it, they would have gone to a workspace no longer in the store.
+    """
+    store = sessions.SessionStore(max_bytes=args.budget_mb * MB // 8, ttl_s=args.ttl_s, path=path)
+    rng = np.random.default_rng(args.seed)
+    ws = store.get(None, pin=True)
+    visit(ws, rng)
+    for _ in range(50):
+        visit(store.get(None), rng)
+    sim = visit(ws, rng)
+    store.release(ws.key)
+    for _ in range(50):
+        visit(store.get(None), rng)
+    restored = store.get(ws.key)
+    evicted = store.stats()['evictions']
+    store.close()
+    return evicted > 0 and restored.params.get('sim') == sim and len(restored.history) == 2
+
+
+def app_sessions(args):
+    """``st.session_state`` sizes of AppTest sessions on the Simulation page, and the shared store after them."""
+    store = sessions.STORE
+    store.clear()
+    store.max_bytes = args.budget_mb * MB
+    rng = np.random.default_rng(args.seed)
+    state_sizes = []
+    for _ in range(args.app_sessions):
+        at = AppTest.from_file(APP, default_timeout=60)
+        at.session_state['page'] = 'simulation'
+        at.run()
+        p = str(rng.choice(scenarios.PARAMS))
+        at.slider(key=f"sim_{p}").set_value(int(rng.integers(*scenarios.RANGES[p]))).run()
+        if at.exception:
+            raise RuntimeError(at.exception[0].message)
+        state_sizes.append(sessions.sizeof({k: at.session_state[k] for k in at.session_state}))
+    return state_sizes, store.stats()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--sessions', type=int, default=1000)
+    parser.add_argument('--budget-mb', type=int, default=32)
+    parser.add_argument('--ttl-s', type=float, default=600.0)
+    parser.add_argument('--interval-s', type=float, default=10.0, help='mean time between session visits')
+    parser.add_argument('--revisit', type=int, default=5, help='every n-th visit returns to an earlier session')
+    parser.add_argument('--tolerance', type=float, default=0.1)
+    parser.add_argument('--slack-mb', type=float, default=4.0)
+    parser.add_argument('--app-sessions', type=int, default=30)
+    parser.add_argument('--max-session-state-kb', type=float, default=4.0)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    limit = args.budget_mb * MB * (1 + args.tolerance)
+    peak_limit = limit + args.slack_mb * MB
+    ok = True
+    print(f"{'store':<8} {'s':>6} {'kept':>5} {'held MB':>8} {'peak MB':>8} {'est MB':>7} {'evicted':>8} "
+          f"{'expired':>8} {'spilled':>8} {'restored':>9} {'after ttl':>10}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for label, path in (('memory', None), ('sqlite', Path(tmp) / 'sessions.db')):
+            r = synthetic(args, path)
+            s = r['stats']
+            print(f"{label:<8} {r['seconds']:>6.1f} {s['workspaces']:>5} {r['held'] / MB:>8.1f} "
+                  f"{r['peak'] / MB:>8.1f} {s['bytes'] / MB:>7.1f} {s['evictions']:>8} {s['expirations']:>8} "
+                  f"{s['spills']:>8} {r['restored']:>4}/{r['revisits']:<4} {r['idle']['workspaces']:>10}")
+            bounded = r['held'] <= limit and r['peak'] <= peak_limit and s['bytes'] <= s['max_bytes']
+            restored = path is None or r['restored'] == r['revisits']
+            ok &= bounded and restored and r['idle']['workspaces'] == 1
+        if path is not None:
+            print(f"{'':<8} SQLite file {sum(f.stat().st_size for f in Path(tmp).iterdir()) / 1024:,.0f} KB")
+    print(f"kept in st.session_state instead: {r['unbounded'] / MB:,.0f} MB for {r['sessions']} sessions "
+          f"(largest {r['largest'] / 1024:,.0f} KB)")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        survived = pinned(args, Path(tmp) / 'sessions.db')
+    print(f"pinned workspace kept through a burst of evictions, writes restored after release: {survived}")
+    ok &= survived
+
+    state_sizes, store = app_sessions(args)
+    print(f"{args.app_sessions} AppTest sessions: st.session_state max {max(state_sizes) / 1024:.1f} KB, "
+          f"shared store {store['workspaces']} workspaces, {store['bytes'] / MB:.1f} MB")
+    ok &= max(state_sizes) <= args.max_session_state_kb * 1024 and store['bytes'] <= store['max_bytes']
+
+    print()
+    print(f"{args.sessions} sessions held within {limit / MB:.1f} MB, peak {peak_limit / MB:.1f} MB "
+          f"(budget {args.budget_mb} MB), "
+          f"spilled sessions restored, st.session_state <= {args.max_session_state_kb:g} KB  "
+          f"{'PASS' if ok else 'FAIL'}")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == '__main__':
+    main()
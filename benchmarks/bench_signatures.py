@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Ed25519 payload verification: throughput against 60 sensors x 10 Hz, and
+quarantine of tampered, replayed and unknown payloads.
+
+    python benchmarks/bench_signatures.py --seconds 30 --hz 10
+
+``EdgeDevices`` signs ``--seconds`` of simulator frames (one payload per
+sensor per tick). The payloads are then verified in bulk for each pool
+size and batch size, and frame by frame as the live feed does, and the
+CPU share needed at ``--hz`` is reported. A second pass corrupts a slice
+of payloads in each way the verifier rejects and checks that exactly
+those, and nothing else, end up in the quarantine.
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from telemetry import CHANNELS, SensorSimulator, build_catalogue, edge  # noqa: E402
+
+DIVISIONS = {'steelmaking': 25, 'chemical': 15, 'construction': 10, 'energy': 10}
+
+
+def signed(sensors, ticks, hz, seed):
+    devices = edge.EdgeDevices(sensors, seed=seed)
+    frames = SensorSimulator(sensors, seed=seed).next_frames(ticks)
+    start = time.perf_counter()
+    payloads = [devices.sign_frame(1.7e9 + i / hz, frame) for i, frame in enumerate(frames)]
+    return devices, payloads, time.perf_counter() - start
+
+
+def tamper(payloads, rng, share):
+    """Corrupt ``share`` of the payloads per rejection reason; returns (payloads, expected reasons)."""
+    payloads = list(payloads)
+    expected = {}
+    picks = rng.choice(len(payloads), size=4 * max(1, int(share * len(payloads))), replace=False)
+    for reason, idx in zip(edge.REASONS, np.array_split(picks, 4)):
+        for i in idx:
+            p = payloads[i]
+            if reason == 'unknown_device':
+                p = p._replace(device='ROGUE-01')
+            elif reason == 'malformed':
+                p = p._replace(values=p.values[:-1])
+            elif reason == 'bad_signature':
+                p = p._replace(values=p.values + np.eye(len(p.values))[0])
+            payloads[i] = p
+            expected[i] = reason
+    # A replay is a genuine payload sent again: append copies instead of editing in place.
+    replays = [i for i, reason in expected.items() if reason == 'replayed']
+    for i in replays:
+        del expected[i]
+    for i in replays:
+        expected[len(payloads)] = 'replayed'
+        payloads.append(payloads[i])
+    return payloads, expected
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--seconds', type=float, default=30.0)
+    parser.add_argument('--hz', type=float, default=10.0)
+    parser.add_argument('--headroom', type=float, default=3.0, help='required multiple of the live rate')
+    parser.add_argument('--tamper', type=float, default=0.005, help='share of payloads corrupted per reason')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    sensors = build_catalogue(DIVISIONS)
+    ticks = int(args.seconds * args.hz)
+    devices, frames, sign_s = signed(sensors, ticks, args.hz, args.seed)
+    payloads = [p for frame in frames for p in frame]
+    required = len(sensors) * args.hz
+    print(f"{len(sensors)} devices at {args.hz:g} Hz = {required:,.0f} payloads/s; "
+          f"{len(payloads):,} payloads, signing {sign_s / len(payloads) * 1e6:.0f} µs each (device side)")
+
+    keys = devices.public_keys()
+    raw = next(iter(keys.values()))
+    edge._public_key.cache_clear()
+    start = time.perf_counter()
+    for _ in range(1000):
+        edge.Ed25519PublicKey.from_public_bytes(raw)
+    load_us = (time.perf_counter() - start) / 1000 * 1e6
+    print(f"public key load {load_us:.1f} µs, avoided per payload by the key cache")
+
+    print()
+    print(f"{'workers':>7} {'batch':>6} {'payloads/s':>11} {'CPU at rate':>12}")
+    best = 0.0
+    for workers in (1, 2, 4):
+        for batch in (60, 256, 1024):
+            verifier = edge.Verifier(edge.KeyRing(keys), channels=len(CHANNELS), workers=workers, batch=batch)
+            start = time.perf_counter()
+            accepted = verifier.verify(payloads)
+            rate = len(payloads) / (time.perf_counter() - start)
+            verifier.close()
+            assert len(accepted) == len(payloads)
+            best = max(best, rate)
+            print(f"{workers:>7} {batch:>6} {rate:>11,.0f} {required / rate:>11.1%}")
+
+    verifier = edge.Verifier(edge.KeyRing(keys), channels=len(CHANNELS))
+    latency = []
+    for frame in frames:
+        start = time.perf_counter()
+        verifier.verify(frame)
+        latency.append((time.perf_counter() - start) * 1000)
+    verifier.close()
+    frame_rate = len(payloads) / (sum(latency) / 1000)
+    latency.sort()
+    print(f"frame by frame (defaults): {frame_rate:,.0f} payloads/s, per frame p50 {statistics.median(latency):.1f} ms, "
+          f"p95 {latency[int(0.95 * (len(latency) - 1))]:.1f} ms")
+
+    rng = np.random.default_rng(args.seed)
+    bad, expected = tamper(payloads, rng, args.tamper)
+    verifier = edge.Verifier(edge.KeyRing(keys), channels=len(CHANNELS))
+    accepted = verifier.verify(bad)
+    verifier.close()
+    got = dict(verifier.quarantine.counts)
+    want = {reason: sum(r == reason for r in expected.values()) for reason in edge.REASONS}
+    exact = got == want and len(accepted) == len(bad) - len(expected)
+    print()
+    print(f"tampered run: {len(bad):,} payloads, {len(accepted):,} accepted")
+    for reason in edge.REASONS:
+        print(f"  {reason:<15} quarantined {got.get(reason, 0):>4}  expected {want[reason]:>4}")
+
+    ok = min(best, frame_rate) >= args.headroom * required and exact
+    print()
+    print(f">= {args.headroom:g}x the live rate, quarantine exact  {'PASS' if ok else 'FAIL'}")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == '__main__':
+    main()
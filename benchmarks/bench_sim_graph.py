@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Simulation page: latency of one slider move with the reactive cell graph
+against recomputing every value and figure.
+
+    python benchmarks/bench_sim_graph.py --moves 60
+
+A random walk moves one of the five sliders by one step per rerun, as a
+user dragging them does. The same walk is replayed twice in a headless
+AppTest session: once with the page's cell memo kept across reruns (the
+graph, in the session's ``ui.sessions`` workspace), once with it dropped
+before every rerun (a full recompute, as the page did before). Both must
+produce the same metrics and figures.
+
+With ``ui.profiling`` on, every graph rerun also records which cells
+recomputed (their ``cell:`` spans); each must be downstream of the slider
+that moved (``SIMULATION.downstream``). The cells alone are timed the same
+way, outside Streamlit.
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from streamlit.testing.v1 import AppTest  # noqa: E402
+
+from core import scenarios  # noqa: E402
+from ui import profiling, sessions  # noqa: E402
+from views.simulation import SIMULATION  # noqa: E402
+
+APP = str(ROOT / 'app_posco_v2.py')
+STEP = 5
+PREFIX = f"cell:{SIMULATION.name}/"
+AXES = {'sx': 'hyrex', 'sy': 'eaf', 'metric': 'l3'}
+
+
+def pct(values, q):
+    values = sorted(values)
+    return values[int(q / 100 * (len(values) - 1))]
+
+
+def walk(moves, rng):
+    """``(slider, value)`` of a one-step-per-move random walk from the defaults."""
+    values = dict(scenarios.DEFAULTS)
+    steps = []
+    for _ in range(moves):
+        p = str(rng.choice(scenarios.PARAMS))
+        lo, hi = scenarios.RANGES[p]
+        values[p] = int(np.clip(values[p] + rng.choice((-1, 1)) * STEP, lo, hi))
+        steps.append((p, values[p]))
+    return steps
+
+
+def outputs(at):
+    return [m.value for m in at.metric], [c.proto.spec for c in at.get('plotly_chart')]
+
+
+def replay(steps, lang, graph):
+    """Per-move rerun times, outputs and, for the graph, cells recomputed outside each move's downstream."""
+    at = AppTest.from_file(APP, default_timeout=60)
+    at.session_state['lang'] = lang
+    at.session_state['page'] = 'simulation'
+    at.run()
+    profiler = profiling.PROFILER
+    profiler.reset()
+    profiler.enable(graph)
+    times, results, stray, computed = [], [], 0, 0
+    try:
+        for p, value in steps:
+            at.slider(key=f"sim_{p}").set_value(value)
+            if not graph:
+                sessions.STORE.get(at.session_state[sessions.KEY]).cache.pop('sim_cells', None)
+            start = time.perf_counter()
+            at.run()
+            times.append(time.perf_counter() - start)
+            if at.exception:
+                raise RuntimeError(f"{lang}: {at.exception[0].message}")
+            results.append(outputs(at))
+            if graph:
+                spans = profiler.snapshot()['recent'][-1]['spans']
+                cells = {k[len(PREFIX):] for k in spans if k.startswith(PREFIX)}
+                stray += len(cells - SIMULATION.downstream({p}))
+                computed += len(cells)
+    finally:
+        profiler.enable(False)
+        profiler.reset()
+    return times, results, stray, computed
+
+
+def cells_alone(steps, memo):
+    """Per-move time of pulling every cell, with ``memo`` kept (graph) or ``None`` (fresh each move)."""
+    inputs, times = dict(scenarios.DEFAULTS, **AXES), []
+    for p, value in steps:
+        inputs[p] = value
+        start = time.perf_counter()
+        run = SIMULATION.run(dict(inputs), {} if memo is None else memo)
+        for name in SIMULATION.cells:
+            run[name]
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--moves', type=int, default=60)
+    parser.add_argument('--lang', choices=('en', 'ko'), default='en')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    steps = walk(args.moves, np.random.default_rng(args.seed))
+    graph, graph_out, stray, computed = replay(steps, args.lang, graph=True)
+    full, full_out, _, _ = replay(steps, args.lang, graph=False)
+    memo = {}
+    cells_alone(steps[:1], memo)
+    alone = {'graph': cells_alone(steps, memo), 'full': cells_alone(steps, None)}
+
+    print(f"{'per slider move':<22} {'p50 ms':>8} {'p95 ms':>8} {'max ms':>8}")
+    for label, times in (('rerun, graph', graph), ('rerun, full recompute', full),
+                         ('cells, graph', alone['graph']), ('cells, full recompute', alone['full'])):
+        print(f"{label:<22} {statistics.median(times) * 1000:>8.2f} {pct(times, 95) * 1000:>8.2f} "
+              f"{max(times) * 1000:>8.2f}")
+    print()
+    print(f"cells recomputed per move: {computed / len(steps):.1f} of {len(SIMULATION.cells)}, "
+          f"{stray} outside the moved slider's downstream")
+
+    same = graph_out == full_out
+    faster = statistics.median(graph) < statistics.median(full)
+    ok = same and faster and stray == 0
+    print(f"graph rerun p50 x{statistics.median(full) / statistics.median(graph):.2f} faster than a full recompute, "
+          f"same outputs: {same}, only downstream cells recomputed: {stray == 0}  {'PASS' if ok else 'FAIL'}")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == '__main__':
+    main()
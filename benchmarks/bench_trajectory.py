@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+2050 trajectory optimiser: re-solve time after one constraint slider
+change, warm from the previous solve against cold.
+
+    python benchmarks/bench_trajectory.py --moves 200
+
+From the defaults, a random walk moves one slider by one step per solve, as
+a user dragging them does. Warm solves go through one ``Planner`` (the
+page's: bounds changed in place, previous basis or plan kept); cold ones
+clear the solver first, so HiGHS starts from scratch on the same model.
+Memoisation is bypassed. Both solve the same walk and must agree on the
+cost (the LP exactly, whole plants within the MIP gap). Building the model
+and a first solve are reported separately.
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from core import trajectory  # noqa: E402
+
+
+def pct(values, q):
+    values = sorted(values)
+    return values[int(q / 100 * (len(values) - 1))]
+
+
+def walk(moves, rng):
+    """Parameter tuples of a one-step-per-move random walk from the defaults."""
+    params = dict(trajectory.DEFAULTS)
+    steps = []
+    for _ in range(moves):
+        p = str(rng.choice(list(trajectory.RANGES)))
+        lo, hi = trajectory.RANGES[p]
+        params[p] = float(np.clip(params[p] + rng.choice((-1, 1)) * trajectory.STEPS[p], lo, hi))
+        steps.append(trajectory.key(params))
+    return steps
+
+
+def solve_walk(planner, steps, cold):
+    times, costs, iterations, infeasible = [], [], [], 0
+    for params in steps:
+        if cold:
+            planner.highs.clearSolver()
+            planner._warm, planner._solution = False, None
+        start = time.perf_counter()
+        plan = planner.solve(params)
+        times.append(time.perf_counter() - start)
+        costs.append(plan.cost)
+        iterations.append(plan.iterations)
+        infeasible += plan.status not in trajectory.FEASIBLE
+    return times, costs, iterations, infeasible
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--moves', type=int, default=200)
+    parser.add_argument('--max-warm-p95-ms', type=float, default=200.0)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    steps = walk(args.moves, np.random.default_rng(args.seed))
+    print(f"{'model':<14} {'build ms':>9} {'first ms':>9} {'solve':<5} {'p50 ms':>8} {'p95 ms':>8} {'max ms':>8} "
+          f"{'iters':>6} {'infeasible':>10}")
+    ok, worst = True, 0.0
+    for modules in (False, True):
+        start = time.perf_counter()
+        planner = trajectory.Planner(modules)
+        built = time.perf_counter() - start
+        first = planner.solve(trajectory.key({})).seconds
+        results = {}
+        for label, cold in (('warm', False), ('cold', True)):
+            planner.solve(trajectory.key({}))
+            times, costs, iterations, infeasible = results[label] = solve_walk(planner, steps, cold)
+            print(f"{'whole plants' if modules else 'LP':<14} {built * 1000:>9.1f} {first * 1000:>9.1f} {label:<5} "
+                  f"{statistics.median(times) * 1000:>8.2f} {pct(times, 95) * 1000:>8.2f} {max(times) * 1000:>8.2f} "
+                  f"{statistics.median(iterations):>6.0f} {infeasible:>10}")
+        warm, cold = results['warm'], results['cold']
+        tolerance = trajectory.MIP_GAP if modules else 1e-7
+        agree = all((a is None) == (b is None) and (a is None or abs(a - b) <= tolerance * abs(b))
+                    for a, b in zip(warm[1], cold[1]))
+        ok &= agree
+        worst = max(worst, pct(warm[0], 95) * 1000)
+        print(f"{'':<14} warm/cold median speed-up x{statistics.median(cold[0]) / statistics.median(warm[0]):.1f}, "
+              f"costs agree: {agree}")
+
+    ok &= worst < args.max_warm_p95_ms
+    print()
+    print(f"warm re-solve after one slider step p95 {worst:.1f} ms < {args.max_warm_p95_ms:g} ms, "
+          f"warm and cold plans agree  {'PASS' if ok else 'FAIL'}")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,15 @@
+"""
+Headless computation core for the POSCO × Rekarbon MRV dashboard (no Streamlit).
+
+    data        POSCO_DATA, the language-independent data model
+    credits     three-level credit aggregation, USD conversion, projections
+    progress    progress-to-target for the Korea 2050 targets
+    scenarios   simulation valuation model (vectorised over scenarios)
+    montecarlo  uncertainty bands over prices and capacity factors
+    sketch      fixed-memory quantile sketch used by montecarlo
+    hyrex       H2 shaft-furnace mass and energy balance (HyREX page)
+
+Everything here is plain data and pure functions, safe to import from batch
+jobs, tests and process-pool workers. ``data``, ``credits`` and
+``progress`` are pure Python; only the numeric modules import NumPy.
+"""
@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+"""
+Credit aggregation over the three-level valuation framework.
+
+Level 1 is tradeable credits, Level 2 adds economic value, Level 3 adds
+future markets. Values are ₩ unless a name says otherwise; "Level N" in
+headline figures is cumulative (Level 2 = L1 + L2 increments).
+"""
+
+KRW_PER_USD = 1250
+LEVELS = ('level_1', 'level_2', 'level_3')
+
+
+def line_items(level):
+    """``(name, ₩)`` pairs of a ``CreditLevel``'s components."""
+    return tuple(level.lines.items())
+
+
+def level_totals(credits):
+    """Cumulative value per level: ``{'l1': L1, 'l2': L1+L2, 'l3': L1+L2+L3}``."""
+    l1 = credits.level_1.total
+    l2 = l1 + credits.level_2.total
+    l3 = l2 + credits.level_3.total
+    return {'l1': l1, 'l2': l2, 'l3': l3}
+
+
+def total_value(credits):
+    """Total environmental economic value, all three levels (₩/year)."""
+    return level_totals(credits)['l3']
+
+
+def unreconciled(credits):
+    """Levels whose line items do not add up to their stated total."""
+    return [level.key for level in credits if sum(level.lines.values()) != level.total]
+
+
+def to_usd(krw):
+    return krw / KRW_PER_USD
+
+
+def projection(plan):
+    """Yearly total and running cumulative of a per-level revenue plan.
+
+    ``plan`` is a ``Projection`` (``years`` and one series per level); the
+    result is its fields as a dict plus ``total`` and ``cumulative`` lists.
+    """
+    totals = [sum(values) for values in zip(*(getattr(plan, key) for key in LEVELS))]
+    cumulative = []
+    running = 0
+    for value in totals:
+        running += value
+        cumulative.append(running)
+    return dict(plan._asdict(), total=totals, cumulative=cumulative)
@@ -0,0 +1,184 @@
+# -*- coding: utf-8 -*-
+"""
+POSCO Holdings data model: company profile, the four divisions, the
+three-level credit valuation, green-steel plans, compliance scores and
+Korea 2050 targets.
+
+``POSCO_DATA`` is built once per process, on first import, and shared by
+every session. Records are namedtuples (immutable, no per-instance dict)
+and every keyed collection is a read-only mapping in display order, so
+views look items up by key without scanning. Nothing here depends on the
+session language: labels that differ carry a ``*_ko`` sibling and the view
+picks one at render time.
+"""
+
+import zlib
+from collections import namedtuple
+from types import MappingProxyType
+
+Company = namedtuple('Company', [
+    'name', 'name_ko', 'founded', 'revenue_krw', 'revenue_usd', 'employees',
+    'production_mt', 'world_rank', 'hq',
+])
+
+# Division-specific capacities are None where they do not apply.
+Division = namedtuple('Division', [
+    'key', 'name', 'name_ko', 'emoji', 'pct', 'revenue_krw', 'credits_krw', 'sensors',
+    'production_mt', 'bf_bof_mt', 'eaf_mt', 'intensity_kg_co2',
+    'lithium_kt', 'hydrogen_kt', 'lng_mt', 'renewable_mw',
+], defaults=(None,) * 8)
+
+# ``lines`` maps line item -> ₩/year; ``total`` is the stated level total.
+CreditLevel = namedtuple('CreditLevel', ['key', 'lines', 'total'])
+Credits = namedtuple('Credits', ['level_1', 'level_2', 'level_3'])
+
+HyrexPlan = namedtuple('HyrexPlan', [
+    'pilot_year', 'pilot_kt', 'commercial_year', 'commercial_mt', 'co2_reduction', 'h2_per_tonne',
+])
+EafPlan = namedtuple('EafPlan', ['current_mt', 'target_mt', 'scrap_rate', 'kwh_per_tonne'])
+CcusPlan = namedtuple('CcusPlan', ['pilot_mt', 'target_2030_mt', 'target_2050_mt'])
+Roadmap = namedtuple('Roadmap', ['years', 'bf_bof', 'eaf', 'hyrex'])
+GreenSteel = namedtuple('GreenSteel', ['hyrex', 'eaf', 'ccus', 'roadmap', 'route_intensity'])
+
+Projection = namedtuple('Projection', ['years', 'level_1', 'level_2', 'level_3'])
+Standard = namedtuple('Standard', ['key', 'name', 'score', 'status'])
+Target = namedtuple('Target', ['key', 'current', 'target', 'year', 'unit'])
+
+PoscoData = namedtuple('PoscoData', [
+    'company', 'divisions', 'credits', 'green_steel', 'projection', 'compliance', 'korea_2050',
+])
+
+
+def _index(records):
+    """Read-only ``{record.key: record}`` in the given order."""
+    return MappingProxyType({r.key: r for r in records})
+
+
+def _level(key, **lines):
+    total = lines.pop('total')
+    return CreditLevel(key, MappingProxyType(lines), total)
+
+
+def build():
+    return PoscoData(
+        company=Company(
+            name='POSCO Holdings',
+            name_ko='포스코홀딩스',
+            founded=1968,
+            revenue_krw=73000000000000,     # ₩73T
+            revenue_usd=60000000000,        # $60B
+            employees=36000,
+            production_mt=42,
+            world_rank=6,
+            hq='Pohang/Seoul, Korea',
+        ),
+
+        divisions=_index([
+            Division('steelmaking', 'Steelmaking', '제철', '🏭', pct=60,
+                     revenue_krw=43800000000000, credits_krw=350000000000, sensors=25,    # ₩350B
+                     production_mt=42, bf_bof_mt=38, eaf_mt=4, intensity_kg_co2=1857),
+            Division('chemical', 'Chemical', '화학', '⚗️', pct=15,
+                     revenue_krw=10950000000000, credits_krw=120000000000, sensors=15,    # ₩120B
+                     lithium_kt=85, hydrogen_kt=125),
+            Division('construction', 'Construction', '건설', '🏗️', pct=15,
+                     revenue_krw=10950000000000, credits_krw=80000000000, sensors=10),    # ₩80B
+            Division('energy', 'Energy', '에너지', '⚡', pct=10,
+                     revenue_krw=7300000000000, credits_krw=60000000000, sensors=10,      # ₩60B
+                     lng_mt=3.5, renewable_mw=80),
+        ]),
+
+        credits=Credits(
+            level_1=_level(
+                'level_1',
+                carbon_k_ets=157500000000,          # ₩157.5B - K-ETS
+                green_steel_premium=246000000000,   # ₩246B - HyREX + EAF premium
+                scrap_recycling=127500000000,       # ₩127.5B - Circular steel
+                hydrogen=79000000000,               # ₩79B - Green H2
+                total=610000000000,                 # ₩610B
+            ),
+            level_2=_level(
+                'level_2',
+                operational=1200000000000,          # ₩1.2T
+                technology=900000000000,            # ₩900B
+                compliance=750000000000,            # ₩750B
+                social=350000000000,                # ₩350B
+                total=3200000000000,                # ₩3.2T
+            ),
+            level_3=_level(
+                'level_3',
+                hyrex_commercial=1500000000000,     # ₩1.5T - HyREX 5Mt
+                hydrogen_scale=800000000000,        # ₩800B - 125Kt H2
+                battery_materials=950000000000,     # ₩950B - Lithium, cathodes
+                ccus=550000000000,                  # ₩550B - 10Mt CO2
+                total=3800000000000,                # ₩3.8T
+            ),
+        ),
+
+        green_steel=GreenSteel(
+            hyrex=HyrexPlan(pilot_year=2024, pilot_kt=50, commercial_year=2030, commercial_mt=5.0,
+                            co2_reduction=95, h2_per_tonne=50),
+            eaf=EafPlan(current_mt=4.0, target_mt=8.0, scrap_rate=100, kwh_per_tonne=450),
+            ccus=CcusPlan(pilot_mt=0.1, target_2030_mt=1.0, target_2050_mt=10.0),
+            roadmap=Roadmap(                                        # Mt/year by route
+                years=(2024, 2026, 2028, 2030, 2040, 2050),
+                bf_bof=(38, 36, 32, 25, 10, 0),
+                eaf=(4, 5, 6, 8, 15, 20),
+                hyrex=(0.05, 0.5, 2, 5, 15, 22),
+            ),
+            route_intensity=MappingProxyType({                      # kg CO₂/t steel
+                'BF-BOF': 1857,
+                'EAF (Grid)': 650,
+                'EAF (Renewable)': 450,
+                'HyREX': 100,
+            }),
+        ),
+
+        projection=Projection(                                      # ₩T/year, years 1-5
+            years=(1, 2, 3, 4, 5),
+            level_1=(0.61, 0.65, 0.70, 0.75, 0.80),
+            level_2=(3.2, 3.4, 3.6, 3.8, 4.0),
+            level_3=(0.5, 1.2, 2.0, 3.0, 3.8),
+        ),
+
+        compliance=_index([
+            Standard('k_ets', 'K-ETS Phase 3', 96, '✅'),
+            Standard('responsible_steel', 'ResponsibleSteel', 94, '✅'),
+            Standard('iso14064', 'ISO 14064-1:2018', 100, '✅'),
+            Standard('iso50001', 'ISO 50001:2018', 100, '✅'),
+            Standard('ghg', 'GHG Protocol', 98, '✅'),
+            Standard('tcfd', 'TCFD', 95, '✅'),
+            Standard('cdp', 'CDP A-', 92, '🏆'),
+            Standard('sbti', 'SBTi Committed', 88, '🎯'),
+        ]),
+
+        korea_2050=_index([
+            Target('emissions_reduction', current=18, target=40, year=2030, unit='%'),
+            Target('renewable_steel', current=10, target=50, year=2030, unit='%'),
+            Target('hydrogen_steel', current=0.1, target=12, year=2030, unit='%'),
+            Target('recycling_rate', current=20, target=40, year=2030, unit='%'),
+            Target('ccus_capacity', current=0.1, target=1.0, year=2030, unit='Mt'),
+        ]),
+    )
+
+
+def to_dict(record):
+    """Plain nested dicts/lists of a record tree, e.g. for JSON export."""
+    if hasattr(record, '_asdict'):
+        return {k: to_dict(v) for k, v in record._asdict().items()}
+    if isinstance(record, MappingProxyType):
+        return {k: to_dict(v) for k, v in record.items()}
+    if isinstance(record, tuple):
+        return [to_dict(v) for v in record]
+    return record
+
+
+def version(data):
+    """Short content hash of a data tree; cached figures are keyed on it.
+
+    A cache key, not a signature: CRC-32 avoids importing hashlib (~4 ms).
+    """
+    return f"{zlib.crc32(repr(to_dict(data)).encode()):08x}"
+
+
+POSCO_DATA = build()
+DATA_VERSION = version(POSCO_DATA)
@@ -0,0 +1,168 @@
+# -*- coding: utf-8 -*-
+"""
+HyREX hydrogen direct-reduction model: steady-state mass and energy balance
+of an H2 shaft furnace, per tonne of DRI.
+
+Hematite ore (``grade`` wt% Fe) is reduced to ``METALLISATION`` metallic
+iron, the rest leaving as FeO. Reducing gas is recycled: top gas is cooled,
+water knocked out, a fixed fraction purged to bleed the inerts that come in
+with make-up hydrogen of ``purity`` vol%, and the rest reheated to
+``temperature`` and returned.
+
+The shaft has two zones. In the reduction zone the gas gets ``APPROACH`` of
+the way to FeO/Fe-H2 equilibrium at the bed temperature, while supplying
+the (endothermic) reaction heat and shell losses, which cools it to that
+bed temperature. The more gas the chemistry needs, the smaller the drop,
+so the balance is a fixed point on the bed temperature. Above it, the top
+gas preheats the cold ore and leaves at the top-gas temperature.
+
+``balance`` accepts scalars or broadcastable NumPy arrays, which is how
+operating envelopes are computed in one pass; ``steady_state`` is the
+memoised scalar solve the page calls on every slider move.
+"""
+
+from collections import namedtuple
+from functools import lru_cache
+
+import numpy as np
+
+# Slider ranges and defaults: make-up H2 purity (vol%), ore grade (wt% Fe),
+# reducing-gas inlet temperature (°C).
+RANGES = {
+    'purity': (95.0, 100.0),
+    'grade': (60.0, 69.0),
+    'temperature': (750.0, 1000.0),
+}
+STEPS = {'purity': 0.5, 'grade': 0.5, 'temperature': 10.0}
+DEFAULTS = {'purity': 99.0, 'grade': 67.0, 'temperature': 900.0}
+
+# Molar masses, g/mol; molar volume, Nm³/mol.
+M_FE, M_O, M_H2, M_H2O, M_INERT = 55.845, 15.999, 2.016, 18.015, 28.0
+NM3_PER_MOL = 0.022414
+
+METALLISATION = 0.94        # metallic Fe / total Fe in the DRI
+APPROACH = 0.85             # fraction of equilibrium H2 utilisation reached per pass
+PURGE = 0.03                # share of recycled dry gas purged
+DH_J_PER_MOL_H2 = 32.9e3    # Fe2O3 + 3 H2 -> 2 Fe + 3 H2O(g), per mol H2
+CP_GAS = 30.0               # J/mol·K, H2-rich reducing gas
+CP_SOLIDS = 900.0           # J/kg·K, ore/DRI, 25 °C to bed temperature
+HEAT_LOSS_J = 0.1e9         # shell losses per tonne of DRI
+ORE_IN_C = 25.0
+RECYCLE_C = 40.0            # gas temperature after the scrubber, before the heater
+ELECTROLYSIS_KWH_PER_KG = 50.0
+LIFECYCLE_KG_CO2_PER_KWH = 0.03     # renewable power, lifecycle
+
+TOLERANCE_C = 1e-6
+MAX_ITERATIONS = 100
+
+Balance = namedtuple('Balance', [
+    'purity', 'grade', 'temperature',
+    'bed_temperature', 'top_gas_temperature', 'utilisation', 'inert_fraction', 'iterations',
+    'ore_t', 'h2_reacted_kg', 'h2_makeup_kg', 'h2_purged_kg', 'inert_purged_kg', 'water_t',
+    'gas_flow_nm3', 'electrolysis_kwh', 'heater_kwh', 'energy_kwh', 'co2_kg',
+])
+
+
+def equilibrium_h2o(temperature_c):
+    """H2O mole fraction at FeO/Fe-H2 equilibrium (dG° = 13160 - 7.82 T J/mol)."""
+    t = np.asarray(temperature_c, dtype=np.float64) + 273.15
+    k = np.exp(-(13160.0 - 7.82 * t) / (8.314 * t))
+    return k / (1 + k)
+
+
+def balance(purity, grade, temperature):
+    """Steady state for one or many operating points; a ``Balance`` of arrays.
+
+    Flows are per tonne of DRI: masses in kg or t as named, gas at the
+    furnace inlet in Nm³, energy in kWh.
+    """
+    p, g, t_in = np.broadcast_arrays(*(np.asarray(a, dtype=np.float64) / s
+                                       for a, s in ((purity, 100), (grade, 100), (temperature, 1))))
+
+    # Mass balance per tonne of Fe, then scaled to a tonne of DRI.
+    n_fe = 1e6 / M_FE
+    reacted = n_fe * (0.5 + METALLISATION)          # mol O removed = mol H2 reacted
+    ore_t = 1 / g
+    dri_t = ore_t - reacted * M_O / 1e6
+    reacted = reacted / dri_t
+    ore_t = ore_t / dri_t
+    solids_kg = ore_t * 1000
+
+    # Fixed point on the bed temperature.
+    bed = t_in - 100.0
+    for iterations in range(1, MAX_ITERATIONS + 1):
+        utilisation = APPROACH * equilibrium_h2o(bed)
+        h2_in = reacted / utilisation
+        makeup = (reacted + PURGE * (h2_in - reacted)) / p
+        a = makeup * (1 - p) / (PURGE * h2_in)
+        inert = a / (1 + a)
+        gas = h2_in / (1 - inert)
+        new_bed = t_in - (reacted * DH_J_PER_MOL_H2 + HEAT_LOSS_J) / (gas * CP_GAS)
+        converged = np.max(np.abs(new_bed - bed)) < TOLERANCE_C
+        bed = new_bed
+        if converged:
+            break
+
+    utilisation = APPROACH * equilibrium_h2o(bed)
+    h2_in = reacted / utilisation
+    makeup = (reacted + PURGE * (h2_in - reacted)) / p
+    a = makeup * (1 - p) / (PURGE * h2_in)
+    inert = a / (1 + a)
+    gas = h2_in / (1 - inert)
+    top_gas = bed - solids_kg * CP_SOLIDS * (bed - ORE_IN_C) / (gas * CP_GAS)
+
+    makeup_kg = makeup * p * M_H2 / 1000
+    electrolysis = makeup_kg * ELECTROLYSIS_KWH_PER_KG
+    heater = gas * CP_GAS * (t_in - RECYCLE_C) / 3.6e6
+    energy = electrolysis + heater
+    return Balance(
+        purity=p * 100, grade=g * 100, temperature=t_in,
+        bed_temperature=bed, top_gas_temperature=top_gas, utilisation=utilisation, inert_fraction=inert, iterations=iterations,
+        ore_t=ore_t,
+        h2_reacted_kg=reacted * M_H2 / 1000,
+        h2_makeup_kg=makeup_kg,
+        h2_purged_kg=PURGE * (h2_in - reacted) * M_H2 / 1000,
+        inert_purged_kg=makeup * (1 - p) * M_INERT / 1000,
+        water_t=reacted * M_H2O / 1e6,
+        gas_flow_nm3=gas * NM3_PER_MOL,
+        electrolysis_kwh=electrolysis,
+        heater_kwh=heater,
+        energy_kwh=energy,
+        co2_kg=energy * LIFECYCLE_KG_CO2_PER_KWH,
+    )
+
+
+@lru_cache(maxsize=4096)
+def steady_state(purity, grade, temperature):
+    """Memoised scalar ``balance``; a ``Balance`` of floats.
+
+    The cache is process-wide and bounded (about three quarters of the
+    slider grid, ~1 KB per entry), so sweeping a slider back and forth is a
+    dictionary lookup.
+    """
+    return Balance(*(v.item() if isinstance(v, np.ndarray) else v for v in balance(purity, grade, temperature)))
+
+
+def axis(param):
+    """Every slider position of ``param``."""
+    low, high = RANGES[param]
+    return np.arange(low, high + STEPS[param] / 2, STEPS[param])
+
+
+@lru_cache(maxsize=32)
+def envelope(grade):
+    """Operating envelope over every purity × temperature slider position.
+
+    Returns ``(purities, temperatures, Balance)`` with arrays shaped
+    ``(len(purities), len(temperatures))``; one vectorised solve per grade.
+    """
+    purities, temperatures = axis('purity'), axis('temperature')
+    return purities, temperatures, balance(purities[:, None], grade, temperatures[None, :])
+
+
+def mass_closure(b):
+    """Relative gap between mass in (ore, make-up gas) and out (DRI, water, purge)."""
+    makeup_gas_t = (b.h2_makeup_kg + b.inert_purged_kg) / 1000
+    mass_in = b.ore_t + makeup_gas_t
+    mass_out = 1.0 + b.water_t + (b.h2_purged_kg + b.inert_purged_kg) / 1000
+    return abs(mass_in - mass_out) / mass_in
@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+"""
+Monte Carlo uncertainty bands for the credit valuation.
+
+Market prices (K-ETS, green-steel premium, H2) and plant capacity factors
+are drawn from configurable distributions. Each draw is valued with
+``core.scenarios.evaluate`` and the Level 1/2/3 and intensity outputs are
+streamed into fixed-memory ``QuantileSketch`` es, so no sample is kept.
+
+Draws are split into fixed-size chunks. Each chunk has its own seed spawned
+from one ``SeedSequence``, so a given seed produces the same result no
+matter how many worker processes the chunks are spread across.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+
+import numpy as np
+
+from core import scenarios
+from core.sketch import QuantileSketch
+
+# Plan prices behind the Level 1 line items: ₩157.5B = 15.75 Mt × ₩10,000/t,
+# ₩246B = 2 Mt × ₩123,000/t, ₩79B = 10 kt × ₩7,900/kg.
+BASE_PRICES = {
+    'kets_price': 10_000,      # ₩ per t CO₂ (KAU)
+    'green_premium': 123_000,  # ₩ per t green steel
+    'h2_price': 7_900,         # ₩ per kg H2
+}
+
+# Each input is (kind, *params). Supported kinds:
+#   ('fixed', value)   ('uniform', low, high)   ('triangular', low, mode, high)
+#   ('normal', mean, sd)  -- clipped at zero
+#   ('lognormal', median, sigma)
+DEFAULT_DISTRIBUTIONS = {
+    'kets_price': ('triangular', 7_000, 10_000, 15_000),
+    'green_premium': ('triangular', 80_000, 123_000, 160_000),
+    'h2_price': ('triangular', 5_000, 7_900, 10_000),
+    'cf_hyrex': ('triangular', 0.70, 0.95, 1.00),
+    'cf_eaf': ('triangular', 0.80, 0.95, 1.00),
+    'cf_ccus': ('triangular', 0.60, 0.90, 1.00),
+}
+
+INPUTS = tuple(DEFAULT_DISTRIBUTIONS)
+OUTPUTS = ('l1', 'l2', 'l3', 'intensity')
+PERCENTILES = (5, 50, 95)
+CHUNK = 65_536
+
+
+def draw(rng, dist, n):
+    kind, *p = dist
+    if kind == 'fixed':
+        return np.full(n, float(p[0]))
+    if kind == 'uniform':
+        return rng.uniform(p[0], p[1], n)
+    if kind == 'triangular':
+        return rng.triangular(p[0], p[1], p[2], n)
+    if kind == 'normal':
+        return np.maximum(rng.normal(p[0], p[1], n), 0.0)
+    if kind == 'lognormal':
+        return rng.lognormal(np.log(p[0]), p[1], n)
+    raise ValueError(f"Unknown distribution kind: {kind!r}")
+
+
+def value(draws, scenario):
+    """Outputs for a block of draws around one slider ``scenario``."""
+    r = scenarios.evaluate(
+        scenario['hyrex'] * draws['cf_hyrex'], scenario['eaf'] * draws['cf_eaf'],
+        scenario['scrap'], scenario['h2'], scenario['ccus'] * draws['cf_ccus'],
+    )
+    l1 = (r['carbon'] * (draws['kets_price'] / BASE_PRICES['kets_price'])
+          + r['green'] * (draws['green_premium'] / BASE_PRICES['green_premium'])
+          + r['scrap']
+          + r['h2'] * (draws['h2_price'] / BASE_PRICES['h2_price']))
+    l2 = l1 + (r['l2'] - r['l1'])
+    l3 = l2 + (r['l3'] - r['l2'])
+    return {'l1': l1, 'l2': l2, 'l3': l3, 'intensity': r['intensity']}
+
+
+def _run_chunks(scenario, distributions, seeds, sizes):
+    """Worker entry point: value the given chunks into one set of sketches."""
+    sketches = {k: QuantileSketch() for k in OUTPUTS}
+    for seed, n in zip(seeds, sizes):
+        rng = np.random.default_rng(seed)
+        draws = {k: draw(rng, distributions[k], n) for k in INPUTS}
+        for k, v in value(draws, scenario).items():
+            sketches[k].add(v)
+    return sketches
+
+
+def make_pool(workers=None):
+    """Spawn-based process pool for ``run``, or None on a single core."""
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        return None
+    return ProcessPoolExecutor(workers, mp_context=get_context('spawn'))
+
+
+def run(n, scenario=None, distributions=None, seed=None, workers=None, executor=None, chunk=CHUNK):
+    """Run ``n`` draws and return ``{output: QuantileSketch}``.
+
+    ``workers=1`` runs in-process. Otherwise chunks are spread over
+    ``executor`` or a temporary spawn-based process pool of ``workers``
+    processes (default: every core).
+    """
+    scenario = dict(scenarios.DEFAULTS, **(scenario or {}))
+    distributions = dict(DEFAULT_DISTRIBUTIONS, **(distributions or {}))
+    sizes = [chunk] * (n // chunk) + ([n % chunk] if n % chunk else [])
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    workers = workers or os.cpu_count() or 1
+
+    if workers == 1 and executor is None:
+        return _run_chunks(scenario, distributions, seeds, sizes)
+
+    tasks = max(1, min(len(sizes), workers * 4))
+    parts = [(seeds[i::tasks], sizes[i::tasks]) for i in range(tasks)]
+    own = executor is None
+    if own:
+        executor = make_pool(workers)
+    try:
+        futures = [executor.submit(_run_chunks, scenario, distributions, s, z) for s, z in parts]
+        merged = {k: QuantileSketch() for k in OUTPUTS}
+        for f in futures:
+            for k, sketch in f.result().items():
+                merged[k].merge(sketch)
+        return merged
+    finally:
+        if own:
+            executor.shutdown()
+
+
+def summarise(sketches, percentiles=PERCENTILES):
+    """``{output: {'mean': m, 5: p5, 50: p50, 95: p95}}`` from ``run``'s sketches."""
+    return {
+        k: {'mean': s.mean(), **{p: s.quantile(p / 100) for p in percentiles}}
+        for k, s in sketches.items()
+    }
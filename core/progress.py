@@ -0,0 +1,31 @@
+# -*- coding: utf-8 -*-
+"""
+Progress-to-target calculations for the Korea 2050 targets.
+"""
+
+# Progress bands for target tracking, in percent of target reached.
+ON_TRACK_PCT = 70
+AT_RISK_PCT = 40
+
+
+def progress_pct(current, target):
+    return current / target * 100
+
+
+def status(pct):
+    """``'on_track'``, ``'at_risk'`` or ``'behind'`` for a progress percentage."""
+    if pct >= ON_TRACK_PCT:
+        return 'on_track'
+    if pct >= AT_RISK_PCT:
+        return 'at_risk'
+    return 'behind'
+
+
+def target_progress(targets):
+    """One dict per ``Target`` in ``targets``: its fields plus ``pct`` and ``status``."""
+    rows = []
+    for target in targets.values():
+        pct = progress_pct(target.current, target.target)
+        rows.append(dict(target._asdict(), pct=pct, status=status(pct)))
+    return rows
+
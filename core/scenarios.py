@@ -0,0 +1,170 @@
+# -*- coding: utf-8 -*-
+"""
+Simulation-page valuation model, vectorised over scenarios.
+
+A scenario is the five slider percentages (HyREX, EAF, scrap, H2, CCUS),
+100 = today's plan. ``evaluate`` accepts scalars or any broadcastable NumPy
+arrays and returns every output in one pass. The arithmetic is written in
+the same order as the original scalar page code, so a single scenario
+evaluates to bit-identical floats.
+"""
+
+import numpy as np
+
+PARAMS = ('hyrex', 'eaf', 'scrap', 'h2', 'ccus')
+
+# (min, max) slider range per parameter, in percent.
+RANGES = {
+    'hyrex': (50, 200),
+    'eaf': (50, 200),
+    'scrap': (50, 150),
+    'h2': (50, 200),
+    'ccus': (50, 200),
+}
+
+DEFAULTS = {p: 100 for p in PARAMS}
+
+# Level 1 line items at 100% (₩B), Level 2/3 increments (₩B), BF-BOF kg CO₂/t.
+CARBON_B = 157.5
+GREEN_B = 246
+SCRAP_B = 127.5
+H2_B = 79
+LEVEL_2_B = 3200
+LEVEL_3_B = 3800
+INTENSITY_KG_T = 1857
+
+OUTPUTS = ('carbon', 'green', 'scrap', 'h2', 'l1', 'l2', 'l3', 'intensity')
+
+
+def carbon_credit(ccus):
+    return CARBON_B * (ccus / 100)
+
+
+def green_credit(hyrex, eaf):
+    return GREEN_B * (hyrex / 100) * (eaf / 100)
+
+
+def scrap_credit(scrap):
+    return SCRAP_B * (scrap / 100)
+
+
+def h2_credit(h2):
+    return H2_B * (h2 / 100)
+
+
+def level_1(carbon, green, scrap, h2):
+    return carbon + green + scrap + h2
+
+
+def level_2(l1, hyrex, eaf):
+    return l1 + LEVEL_2_B * ((hyrex + eaf) / 200)
+
+
+def level_3(l2, hyrex, h2):
+    return l2 + LEVEL_3_B * ((hyrex + h2) / 200)
+
+
+def co2_intensity(hyrex):
+    return INTENSITY_KG_T * (1 - (hyrex - 100) / 200 * 0.5)
+
+
+def evaluate(hyrex, eaf, scrap, h2, ccus):
+    """Credits (₩B) and CO₂ intensity (kg/t) for one or many scenarios.
+
+    Returns a dict keyed by ``OUTPUTS``; each value has the broadcast shape
+    of the inputs. Each output is one of the functions above, of only the
+    inputs it depends on, which is how the simulation page's dependency
+    graph recomputes just what a slider move changes.
+    """
+    hyrex, eaf, scrap, h2, ccus = (np.asarray(a, dtype=np.float64) for a in (hyrex, eaf, scrap, h2, ccus))
+    carbon = carbon_credit(ccus)
+    green = green_credit(hyrex, eaf)
+    scrap_v = scrap_credit(scrap)
+    h2_v = h2_credit(h2)
+    l1 = level_1(carbon, green, scrap_v, h2_v)
+    l2 = level_2(l1, hyrex, eaf)
+    l3 = level_3(l2, hyrex, h2)
+    return {
+        'carbon': carbon, 'green': green, 'scrap': scrap_v, 'h2': h2_v,
+        'l1': l1, 'l2': l2, 'l3': l3, 'intensity': np.broadcast_to(co2_intensity(hyrex), l1.shape),
+    }
+
+
+BASELINE = {k: float(v) for k, v in evaluate(**DEFAULTS).items()}
+
+
+def normalise(scenario):
+    """Validated percentages of a partial ``scenario`` mapping, as floats in ``PARAMS`` order.
+
+    Missing parameters take ``DEFAULTS``, so ``{'eaf': 150}`` and ``{'eaf':
+    150.0, 'hyrex': 100}`` normalise alike. Raises ``ValueError`` on an
+    unknown parameter or a value outside ``RANGES``.
+    """
+    unknown = set(scenario) - set(PARAMS)
+    if unknown:
+        raise ValueError(f"unknown parameter(s): {', '.join(sorted(map(str, unknown)))}")
+    values = {}
+    for p in PARAMS:
+        try:
+            v = float(scenario.get(p, DEFAULTS[p]))
+        except (TypeError, ValueError):
+            raise ValueError(f"{p} must be a number") from None
+        lo, hi = RANGES[p]
+        if not lo <= v <= hi:
+            raise ValueError(f"{p}={v:g} outside {lo}-{hi}")
+        values[p] = v
+    return values
+
+
+def normalise_columns(columns, n):
+    """``normalise`` for ``n`` scenarios given as ``{param: list of n values}``.
+
+    A missing column takes its default for every scenario. Returns a dict
+    of float64 arrays keyed by ``PARAMS``; the error names the first bad
+    scenario.
+    """
+    unknown = set(columns) - set(PARAMS)
+    if unknown:
+        raise ValueError(f"unknown parameter(s): {', '.join(sorted(map(str, unknown)))}")
+    values = {}
+    for p in PARAMS:
+        try:
+            v = np.asarray(columns.get(p, DEFAULTS[p]), dtype=np.float64)
+            v = np.broadcast_to(v, (n,)) if v.ndim == 0 else v
+        except (TypeError, ValueError):
+            raise ValueError(f"{p} must be numbers") from None
+        if v.shape != (n,):
+            raise ValueError(f"{p} has {v.size} values for {n} scenarios")
+        lo, hi = RANGES[p]
+        bad = np.flatnonzero(~((v >= lo) & (v <= hi)))
+        if len(bad):
+            raise ValueError(f"scenario {bad[0]}: {p}={v[bad[0]]:g} outside {lo}-{hi}")
+        values[p] = v
+    return values
+
+
+def grid(steps=16, **fixed):
+    """Full-factorial grid over every parameter not given in ``fixed``.
+
+    Each free parameter gets ``steps`` evenly spaced values across its
+    slider range (16 steps over all five is ~10^6 scenarios). Returns a dict
+    of flat arrays keyed by ``PARAMS``, ready for ``evaluate(**grid(...))``.
+    """
+    axes = [np.full(1, fixed[p], dtype=np.float64) if p in fixed else np.linspace(*RANGES[p], steps)
+            for p in PARAMS]
+    mesh = np.meshgrid(*axes, indexing='ij')
+    return {p: m.reshape(-1) for p, m in zip(PARAMS, mesh)}
+
+
+def sensitivity(x, y, output, scenario, resolution=1):
+    """2-D sweep of ``output`` over parameters ``x`` and ``y``.
+
+    The other three parameters stay at ``scenario``'s values (``x`` and
+    ``y`` need not be in it). Returns ``(x_values, y_values, z)`` with
+    ``z[i, j]`` at ``(y_values[i], x_values[j])``.
+    """
+    xs = np.arange(RANGES[x][0], RANGES[x][1] + resolution, resolution, dtype=np.float64)
+    ys = np.arange(RANGES[y][0], RANGES[y][1] + resolution, resolution, dtype=np.float64)
+    args = {p: scenario[p] for p in PARAMS if p not in (x, y)}
+    args[x], args[y] = xs[None, :], ys[:, None]
+    return xs, ys, evaluate(**args)[output]
@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+"""
+Fixed-memory streaming quantile sketch.
+
+A log-bucketed histogram in the style of DDSketch: every value ``x`` falls
+in bucket ``ceil(log_gamma(x))`` with ``gamma = (1 + alpha) / (1 - alpha)``,
+so any quantile is returned within relative error ``alpha``. Buckets span
+``[min_value, max_value]`` and are preallocated, so memory never grows with
+the number of samples. Counts are integers and the running sum is kept as
+exact Shewchuk partials, so merging sketches from different processes is
+exact and order-independent.
+"""
+
+import math
+
+import numpy as np
+
+
+class QuantileSketch:
+
+    def __init__(self, alpha=0.005, min_value=1e-3, max_value=1e9):
+        self.alpha = alpha
+        self.min_value = min_value
+        self.max_value = max_value
+        self._log_gamma = math.log((1 + alpha) / (1 - alpha))
+        self._offset = math.ceil(math.log(min_value) / self._log_gamma)
+        size = math.ceil(math.log(max_value) / self._log_gamma) - self._offset + 1
+        self.counts = np.zeros(size, dtype=np.int64)
+        self.low = 0           # values below min_value (incl. zero and negatives)
+        self.count = 0
+        self._partials = []    # exact running sum of added values
+
+    @property
+    def nbytes(self):
+        return self.counts.nbytes
+
+    def add(self, values):
+        values = np.asarray(values, dtype=np.float64).reshape(-1)
+        self.count += len(values)
+        self._accumulate(float(values.sum()))
+        positive = values[values >= self.min_value]
+        self.low += len(values) - len(positive)
+        idx = np.ceil(np.log(positive) / self._log_gamma).astype(np.int64) - self._offset
+        np.clip(idx, 0, len(self.counts) - 1, out=idx)
+        self.counts += np.bincount(idx, minlength=len(self.counts))
+
+    def merge(self, other):
+        if len(other.counts) != len(self.counts) or other.alpha != self.alpha:
+            raise ValueError("Cannot merge sketches with different parameters")
+        self.counts += other.counts
+        self.low += other.low
+        self.count += other.count
+        for x in other._partials:
+            self._accumulate(x)
+        return self
+
+    def _accumulate(self, x):
+        partials = self._partials
+        i = 0
+        for y in partials:
+            if abs(x) < abs(y):
+                x, y = y, x
+            hi = x + y
+            lo = y - (hi - x)
+            if lo:
+                partials[i] = lo
+                i += 1
+            x = hi
+        partials[i:] = [x]
+
+    @property
+    def total(self):
+        return math.fsum(self._partials)
+
+    def mean(self):
+        return self.total / self.count if self.count else float('nan')
+
+    def quantile(self, q):
+        """Value at quantile ``q`` in [0, 1], within relative error ``alpha``."""
+        if not self.count:
+            return float('nan')
+        rank = q * (self.count - 1)
+        if rank < self.low:
+            return 0.0
+        i = int(np.searchsorted(np.cumsum(self.counts), rank - self.low, side='right'))
+        i = min(i, len(self.counts) - 1)
+        gamma = math.exp(self._log_gamma)
+        return 2 * gamma ** (i + self._offset) / (gamma + 1)
+
+    def quantiles(self, qs):
+        return [self.quantile(q) for q in qs]
@@ -0,0 +1,370 @@
+# -*- coding: utf-8 -*-
+"""
+Carbon-neutral 2050 trajectory: the cheapest yearly 2024-2050 production
+mix that meets the Korea 2030 targets and net zero in 2050.
+
+Each year the plan chooses steel output by route (BF-BOF, EAF, HyREX), new
+EAF, HyREX and CCUS capacity, BF-BOF retirements and the CO₂ captured. It
+minimises the discounted cost of capex, operating cost, CCUS and the
+K-ETS carbon price on net emissions, subject to:
+
+* output meets demand, interpolated from the green-steel roadmap totals;
+  every route (and CCUS) runs between ``MIN_UTILISATION`` and all of its
+  capacity, so plants are retired rather than idled; BF-BOF can only
+  retire;
+* yearly capex within the budget (``budget``, ₩T);
+* HyREX output within the hydrogen supply, ramped linearly from the pilot
+  to ``h2_2030`` and on to ``h2_2050`` (kt H₂);
+* CCUS capacity within a linear ramp from the pilot to ``ccus_2050``
+  (Mt CO₂);
+* every ``korea_2050`` target met from its year on (``TARGETS`` says how
+  each is read), net emissions non-increasing after 2030, net zero in
+  2050.
+
+The start (2024 capacity by route) and demand come from
+``POSCO_DATA.green_steel``; route intensities from its ``route_intensity``,
+the EAF moving from grid to renewable power by 2050.
+
+The model is a linear program solved with HiGHS (``highspy``). A slider
+only changes bounds (the budget rows, the H₂ and CCUS column bounds), so a
+``Planner`` keeps one HiGHS model and re-solves it from the previous
+optimal basis, a few simplex iterations instead of a solve from scratch.
+With ``modules=True`` new EAF and HyREX capacity comes in whole plants
+(``MODULE_MT``), a mixed-integer program started from the previous plan.
+
+A plan's ``status`` is 'optimal', 'feasible' (the solver stopped at its
+time limit with a plan that meets every constraint but is not proven
+cheapest), 'time_limit' (it stopped without one) or 'infeasible'; only
+the first two (``FEASIBLE``) carry a plan. ``plan`` memoises optimal plans
+by parameters; the others are solved again on the next call.
+"""
+
+import threading
+import time
+from collections import OrderedDict, namedtuple
+
+import highspy
+import numpy as np
+
+from core.data import POSCO_DATA
+
+YEARS = np.arange(2024, 2051)
+ROUTES = ('bf_bof', 'eaf', 'hyrex')
+BUILT = ('eaf', 'hyrex', 'ccus')
+
+# Constraint sliders: (min, max), step and default.
+RANGES = {
+    'budget': (1.0, 6.0),       # ₩T capex per year
+    'h2_2030': (50, 500),       # kt H₂ available to HyREX in 2030
+    'h2_2050': (250, 2500),     # kt H₂ in 2050
+    'ccus_2050': (5, 20),       # Mt CO₂ capture capacity reachable by 2050, ramped from the pilot
+}
+STEPS = {'budget': 0.25, 'h2_2030': 25, 'h2_2050': 50, 'ccus_2050': 1}
+DEFAULTS = {'budget': 3.5, 'h2_2030': 250, 'h2_2050': 1500, 'ccus_2050': 12}
+
+# Capex, ₩B per Mt/year of capacity (CCUS: per Mt CO₂/year captured).
+CAPEX_B = {'eaf': 600, 'hyrex': 1600, 'ccus': 150}
+# Operating cost, ₩B per Mt of steel (HyREX including hydrogen), and CCUS
+# per Mt CO₂ captured.
+OPEX_B = {'bf_bof': 450, 'eaf': 480, 'hyrex': 630}
+CCUS_OPEX_B = 60
+CARBON_PRICE_B = 10         # ₩B per Mt CO₂ (₩10,000/t)
+DISCOUNT_RATE = 0.05
+MIN_UTILISATION = 0.8
+# Whole-plant sizes with ``modules=True``, Mt/year.
+MODULE_MT = {'eaf': 2.5, 'hyrex': 1.0}
+MIP_GAP = 1e-2
+MIP_TIME_LIMIT_S = 2.0
+PLAN_CACHE = 256
+FEASIBLE = ('optimal', 'feasible')
+
+# How each ``korea_2050`` target constrains its year: net emissions below
+# the baseline by the target %, a route share of output in %, or CCUS
+# capacity in Mt.
+TARGETS = {
+    'emissions_reduction': 'reduction',
+    'renewable_steel': ('share', ('eaf', 'hyrex')),
+    'hydrogen_steel': ('share', ('hyrex',)),
+    'recycling_rate': ('share', ('eaf',)),
+    'ccus_capacity': 'ccus',
+}
+
+Plan = namedtuple('Plan', [
+    'params', 'modules', 'status', 'years', 'output', 'capacity', 'built', 'capture', 'emissions',
+    'capex', 'cost', 'iterations', 'seconds', 'warm',
+])
+
+
+def demand():
+    """Steel demand by year (Mt), interpolated from the roadmap totals."""
+    roadmap = POSCO_DATA.green_steel.roadmap
+    totals = [sum(v) for v in zip(roadmap.bf_bof, roadmap.eaf, roadmap.hyrex)]
+    return np.interp(YEARS, roadmap.years, totals)
+
+
+def intensity():
+    """t CO₂ per t steel by route and year."""
+    kg = POSCO_DATA.green_steel.route_intensity
+    share = (YEARS - YEARS[0]) / (YEARS[-1] - YEARS[0])
+    return {
+        'bf_bof': np.full(len(YEARS), kg['BF-BOF'] / 1000),
+        'eaf': (kg['EAF (Grid)'] + (kg['EAF (Renewable)'] - kg['EAF (Grid)']) * share) / 1000,
+        'hyrex': np.full(len(YEARS), kg['HyREX'] / 1000),
+    }
+
+
+def ramp(start, mid, end, mid_year=2030):
+    """Linear from ``start`` (2024) to ``mid`` at ``mid_year`` and ``end`` in 2050."""
+    return np.interp(YEARS, (YEARS[0], mid_year, YEARS[-1]), (start, mid, end))
+
+
+def key(params):
+    """Validated parameters as a tuple in ``RANGES`` order (missing ones default)."""
+    values = []
+    for p, (lo, hi) in RANGES.items():
+        v = float(params.get(p, DEFAULTS[p]))
+        if not lo <= v <= hi:
+            raise ValueError(f"{p} must be within [{lo:g}, {hi:g}]")
+        values.append(v)
+    return tuple(values)
+
+
+# =============================================================================
+# MODEL
+# =============================================================================
+
+class _Model:
+    """Columns and rows of the LP, by name and year, built as a HighsLp."""
+
+    def __init__(self):
+        self.cols = {}
+        self.lower, self.upper, self.cost = [], [], []
+        self.rows = {}
+        self.row_lower, self.row_upper = [], []
+        self.entries = []                   # (row, col, value)
+
+    def var(self, name, lower=0.0, upper=highspy.kHighsInf, cost=0.0):
+        n = len(YEARS)
+        start = len(self.lower)
+        self.cols[name] = np.arange(start, start + n)
+        self.lower.extend(np.broadcast_to(lower, n))
+        self.upper.extend(np.broadcast_to(upper, n))
+        self.cost.extend(np.broadcast_to(cost, n))
+        return self.cols[name]
+
+    def row(self, name, terms, lower=-highspy.kHighsInf, upper=highspy.kHighsInf):
+        """Add one row ``lower <= sum(value * col) <= upper``; rows of one name are kept together."""
+        row = len(self.row_lower)
+        self.rows.setdefault(name, []).append(row)
+        for col, value in terms:
+            self.entries.append((row, int(col), float(value)))
+        self.row_lower.append(lower)
+        self.row_upper.append(upper)
+        return row
+
+    def highs_lp(self):
+        lp = highspy.HighsLp()
+        lp.num_col_ = len(self.lower)
+        lp.num_row_ = len(self.row_lower)
+        lp.col_cost_ = np.array(self.cost)
+        lp.col_lower_ = np.array(self.lower)
+        lp.col_upper_ = np.array(self.upper)
+        lp.row_lower_ = np.array(self.row_lower)
+        lp.row_upper_ = np.array(self.row_upper)
+        entries = sorted(self.entries, key=lambda e: (e[1], e[0]))
+        cols = np.array([e[1] for e in entries])
+        lp.a_matrix_.format_ = highspy.MatrixFormat.kColwise
+        lp.a_matrix_.start_ = np.searchsorted(cols, np.arange(lp.num_col_ + 1))
+        lp.a_matrix_.index_ = np.array([e[0] for e in entries])
+        lp.a_matrix_.value_ = np.array([e[2] for e in entries])
+        return lp
+
+
+def build_model(modules=False):
+    """The ``_Model`` at ``DEFAULTS``; ``Planner`` moves its bounds."""
+    data = POSCO_DATA
+    roadmap = data.green_steel.roadmap
+    d = demand()
+    co2 = intensity()
+    discount = (1 + DISCOUNT_RATE) ** -(YEARS - YEARS[0]).astype(float)
+    year = {int(y): i for i, y in enumerate(YEARS)}
+    model = _Model()
+    inf = highspy.kHighsInf
+
+    # Output and capacity by route; new capacity in (possibly whole) modules
+    x = {r: model.var(f"x_{r}", cost=discount * (OPEX_B[r] + CARBON_PRICE_B * co2[r])) for r in ROUTES}
+    start = {'bf_bof': roadmap.bf_bof[0], 'eaf': roadmap.eaf[0], 'hyrex': roadmap.hyrex[0],
+             'ccus': data.green_steel.ccus.pilot_mt}
+    cap = {}
+    for r in ROUTES + ('ccus',):
+        upper = np.full(len(YEARS), inf)
+        lower = np.zeros(len(YEARS))
+        lower[0] = upper[0] = start[r]
+        cap[r] = model.var(f"cap_{r}", lower, upper)
+    size = {'eaf': MODULE_MT['eaf'], 'hyrex': MODULE_MT['hyrex'], 'ccus': 1.0}
+    build = {}
+    for r in BUILT:
+        upper = np.full(len(YEARS), inf)
+        upper[0] = 0.0
+        build[r] = model.var(f"build_{r}", 0.0, upper, discount * CAPEX_B[r] * size[r])
+    capture = model.var('capture', cost=discount * (CCUS_OPEX_B - CARBON_PRICE_B))
+
+    for t in range(len(YEARS)):
+        model.row('demand', [(x[r][t], 1) for r in ROUTES], d[t], d[t])
+        for r in ROUTES:
+            model.row('capacity', [(x[r][t], 1), (cap[r][t], -1)], upper=0)
+            model.row('utilisation', [(x[r][t], 1), (cap[r][t], -MIN_UTILISATION)], lower=0)
+        model.row('capture', [(capture[t], 1), (cap['ccus'][t], -1)], upper=0)
+        model.row('utilisation', [(capture[t], 1), (cap['ccus'][t], -MIN_UTILISATION)], lower=0)
+        if t == 0:
+            continue
+        model.row('retire', [(cap['bf_bof'][t], 1), (cap['bf_bof'][t - 1], -1)], upper=0)
+        for r in BUILT:
+            model.row('build', [(cap[r][t], 1), (cap[r][t - 1], -1), (build[r][t], -size[r])], 0, 0)
+        model.row('budget', [(build[r][t], CAPEX_B[r] * size[r] / 1000) for r in BUILT],
+                  upper=DEFAULTS['budget'])
+
+    # Net emissions, Mt CO₂
+    def net(t):
+        return [(x[r][t], co2[r][t]) for r in ROUTES] + [(capture[t], -1)]
+
+    emitted_2024 = sum(co2[r][0] * start[r] for r in ROUTES) - start['ccus']
+    for target in data.korea_2050.values():
+        rule = TARGETS[target.key]
+        for t in range(year[target.year], len(YEARS)):
+            if rule == 'reduction':
+                baseline = emitted_2024 / (1 - target.current / 100)
+                model.row('target', net(t), upper=baseline * (1 - target.target / 100))
+            elif rule == 'ccus':
+                model.row('target', [(cap['ccus'][t], 1)], lower=target.target)
+            else:
+                model.row('target', [(x[r][t], 1) for r in rule[1]], lower=d[t] * target.target / 100)
+    for t in range(year[2030] + 1, len(YEARS)):
+        model.row('no_backsliding', net(t) + [(c, -v) for c, v in net(t - 1)], upper=0)
+    model.row('net_zero', net(len(YEARS) - 1), upper=0)
+
+    model.x, model.cap, model.build, model.capture = x, cap, build, capture
+    model.size, model.co2 = size, co2
+    model.integer = [int(c) for r in MODULE_MT for c in build[r]] if modules else []
+    return model
+
+
+# =============================================================================
+# SOLVER
+# =============================================================================
+
+class Planner:
+    """One HiGHS model re-solved in place, warm from the previous solve."""
+
+    def __init__(self, modules=False):
+        self.modules = modules
+        self.model = build_model(modules)
+        self.highs = highspy.Highs()
+        self.highs.setOptionValue('output_flag', False)
+        self.highs.setOptionValue('mip_rel_gap', MIP_GAP)
+        self.highs.setOptionValue('time_limit', MIP_TIME_LIMIT_S)
+        self.highs.passModel(self.model.highs_lp())
+        if modules:
+            cols = np.array(self.model.integer, dtype=np.int32)
+            self.highs.changeColsIntegrality(len(cols), cols,
+                                             np.full(len(cols), highspy.HighsVarType.kInteger))
+        self._lock = threading.Lock()
+        self._warm = False              # a basis (and, for whole plants, a plan) is kept
+        self._solution = None
+        self.solves = 0
+
+    def _set_bounds(self, params):
+        budget, h2_2030, h2_2050, ccus_2050 = params
+        model, highs = self.model, self.highs
+        rows = np.array(model.rows['budget'], dtype=np.int32)
+        highs.changeRowsBounds(len(rows), rows, np.full(len(rows), -highspy.kHighsInf), np.full(len(rows), budget))
+        # HyREX output per kt H₂ (50 kg/t: 20 kt steel per kt H₂), from the pilot's use
+        per_kt = 1 / POSCO_DATA.green_steel.hyrex.h2_per_tonne
+        pilot = POSCO_DATA.green_steel.roadmap.hyrex[0] * POSCO_DATA.green_steel.hyrex.h2_per_tonne
+        hyrex_max = ramp(pilot, h2_2030, h2_2050) * per_kt
+        ccus_max = np.linspace(POSCO_DATA.green_steel.ccus.pilot_mt, ccus_2050, len(YEARS))
+        for cols, upper in ((model.x['hyrex'], hyrex_max), (model.cap['ccus'][1:], ccus_max[1:])):
+            cols = np.asarray(cols, dtype=np.int32)
+            highs.changeColsBounds(len(cols), cols, np.zeros(len(cols)), upper)
+
+    def solve(self, params):
+        """``Plan`` for a ``key()`` tuple of parameters."""
+        with self._lock:
+            start = time.perf_counter()
+            warm = self._warm
+            self._set_bounds(params)
+            if self.modules and self._solution is not None:
+                solution = highspy.HighsSolution()
+                solution.col_value = list(self._solution)
+                self.highs.setSolution(solution)
+            self.highs.run()
+            model_status = self.highs.getModelStatus()
+            self.solves += 1
+            info = self.highs.getInfo()
+            iterations = info.simplex_iteration_count
+            seconds = time.perf_counter() - start
+            if model_status == highspy.HighsModelStatus.kOptimal:
+                status = 'optimal'
+            elif info.primal_solution_status == highspy.kSolutionStatusFeasible:
+                status = 'feasible'
+            elif model_status == highspy.HighsModelStatus.kTimeLimit:
+                status = 'time_limit'
+            else:
+                status = 'infeasible'
+            if status not in FEASIBLE:
+                # Start the next solve cold rather than from an infeasible basis
+                self.highs.clearSolver()
+                self._warm, self._solution = False, None
+                return Plan(dict(zip(RANGES, params)), self.modules, status, YEARS, None, None, None,
+                            None, None, None, None, iterations, seconds, warm)
+            values = np.array(self.highs.getSolution().col_value)
+            self._warm = True
+            if self.modules:
+                self._solution = values
+            return self._result(params, status, values, info.objective_function_value, iterations, seconds, warm)
+
+    def _result(self, params, status, values, objective, iterations, seconds, warm):
+        model = self.model
+        output = {r: values[model.x[r]] for r in ROUTES}
+        capacity = {r: values[model.cap[r]] for r in ROUTES + ('ccus',)}
+        built = {r: values[model.build[r]] * model.size[r] for r in BUILT}
+        capture = values[model.capture]
+        emissions = sum(output[r] * model.co2[r] for r in ROUTES) - capture
+        capex = sum(built[r] * CAPEX_B[r] for r in BUILT) / 1000
+        cost = objective / 1000
+        return Plan(dict(zip(RANGES, params)), self.modules, status, YEARS, output, capacity, built, capture,
+                    emissions, capex, cost, iterations, seconds, warm)
+
+
+_PLANNERS = {}
+_PLANNERS_LOCK = threading.Lock()
+
+
+def planner(modules=False):
+    """The process-wide ``Planner`` for LP or whole-plant plans."""
+    with _PLANNERS_LOCK:
+        if modules not in _PLANNERS:
+            _PLANNERS[modules] = Planner(modules)
+        return _PLANNERS[modules]
+
+
+_PLANS = OrderedDict()      # (key, modules) -> optimal Plan, least recently used first
+_PLANS_LOCK = threading.Lock()
+
+
+def plan(modules=False, **params):
+    """Cheapest ``Plan`` for the slider ``params`` (missing ones default); raises ``ValueError`` out of range."""
+    k = (key(params), modules)
+    with _PLANS_LOCK:
+        cached = _PLANS.get(k)
+        if cached is not None:
+            _PLANS.move_to_end(k)
+            return cached
+    result = planner(modules).solve(k[0])
+    # A plan cut short by the time limit may solve next time
+    if result.status == 'optimal':
+        with _PLANS_LOCK:
+            _PLANS[k] = result
+            while len(_PLANS) > PLAN_CACHE:
+                _PLANS.popitem(last=False)
+    return result
@@ -0,0 +1,12 @@
+"""Sensor ingestion: catalogue, ring-buffer store, rollup pyramid, simulator and feed."""
+
+from telemetry.feed import Feed
+from telemetry.rollup import Rollup
+from telemetry.sensors import CHANNELS, Sensor, build_catalogue
+from telemetry.simulator import Replay, SensorSimulator, record
+from telemetry.store import RingStore
+
+__all__ = [
+    'CHANNELS', 'Feed', 'Replay', 'RingStore', 'Rollup', 'Sensor', 'SensorSimulator',
+    'build_catalogue', 'record',
+]
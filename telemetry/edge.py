@@ -0,0 +1,285 @@
+# -*- coding: utf-8 -*-
+"""
+Signed edge payloads: Ed25519 signing on the devices, verification on ingest.
+
+Each edge device (one per sensor) signs every reading it sends: a
+``Payload`` carries the device id, a per-device sequence number, the
+timestamp and the channel values, and the signature over their canonical
+bytes (``message``). Nothing reaches the store, rollups or detectors before
+its signature checks out, so every reading behind a K-ETS figure is
+attributable to a registered device.
+
+``Verifier`` checks payloads in batches on a thread pool: the feed thread
+hands over a frame's payloads and the Streamlit script threads never wait
+on signature checks. Neither ``cryptography`` nor PyNaCl exposes Ed25519
+multi-signature batch verification, so a batch is one pool task verifying
+its payloads one by one against public keys loaded once per device
+(``KeyRing``). A payload is rejected, and kept in the ``Quarantine`` with
+its reason, if its device is unknown, its values are malformed, its
+signature fails or its sequence number does not advance. With a ``state``
+path the last accepted sequence number per device is saved there after
+every batch and loaded back on start, so a payload captured before a
+restart is still a replay after it.
+
+``EdgeDevices`` stands in for the devices: it derives a key pair per sensor
+from a seed and signs simulator frames; ``resume`` continues its counters
+after the verifier's, as real devices keep theirs across restarts.
+``VerifiedSource`` puts both in front of a frame source for the ``Feed``:
+live frames are signed with the timestamp the feed gives them and
+verified, and a rejected sensor keeps its last accepted reading (NaN
+before it has one). The startup backfill is synthetic history that no
+device signed and passes through unverified.
+"""
+
+import json
+import os
+import struct
+import threading
+import time
+from collections import Counter, deque, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+import numpy as np
+from cryptography.exceptions import InvalidSignature
+from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey, Ed25519PublicKey
+from cryptography.hazmat.primitives.serialization import Encoding, PublicFormat
+
+HEADER = struct.Struct('<16sQd')    # device id, sequence number, timestamp
+WORKERS = 2
+BATCH = 256
+MAX_KEYS = 4096
+QUARANTINE_ROWS = 1000
+REASONS = ('unknown_device', 'malformed', 'bad_signature', 'replayed')
+
+Payload = namedtuple('Payload', ['device', 'seq', 'ts', 'values', 'signature'])
+Quarantined = namedtuple('Quarantined', ['received', 'reason', 'payload'])
+
+
+def message(device, seq, ts, values):
+    """Canonical bytes a device signs: header, then the values as little-endian float64."""
+    return HEADER.pack(device.encode('ascii'), seq, ts) + np.asarray(values, dtype='<f8').tobytes()
+
+
+@lru_cache(maxsize=MAX_KEYS)
+def _public_key(raw):
+    return Ed25519PublicKey.from_public_bytes(raw)
+
+
+class KeyRing:
+    """Registered device public keys (32 raw bytes each), loaded once per key."""
+
+    def __init__(self, keys=None):
+        self._raw = dict(keys or {})
+
+    def __contains__(self, device):
+        return device in self._raw
+
+    def __len__(self):
+        return len(self._raw)
+
+    def register(self, device, raw):
+        self._raw[device] = bytes(raw)
+
+    def key(self, device):
+        """Loaded public key of ``device``, or None if it is not registered."""
+        raw = self._raw.get(device)
+        return None if raw is None else _public_key(raw)
+
+    def save(self, path):
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({device: raw.hex() for device, raw in self._raw.items()}, f, indent=1)
+
+    @classmethod
+    def load(cls, path):
+        with open(path, encoding='utf-8') as f:
+            return cls({device: bytes.fromhex(raw) for device, raw in json.load(f).items()})
+
+
+class Quarantine:
+    """Rejected payloads: the latest ``maxlen`` in memory, every one appended to ``path`` if given."""
+
+    def __init__(self, maxlen=QUARANTINE_ROWS, path=None):
+        self.rows = deque(maxlen=maxlen)
+        self.counts = Counter()
+        self.path = path
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return sum(self.counts.values())
+
+    def add(self, rejected):
+        """Quarantine ``(payload, reason)`` pairs."""
+        if not rejected:
+            return
+        now = time.time()
+        rows = [Quarantined(now, reason, p) for p, reason in rejected]
+        with self._lock:
+            self.rows.extend(rows)
+            self.counts.update(reason for _, reason in rejected)
+            if self.path is not None:
+                with open(self.path, 'a', encoding='utf-8') as f:
+                    for row in rows:
+                        p = row.payload
+                        f.write(json.dumps({
+                            'received': row.received, 'reason': row.reason, 'device': p.device, 'seq': p.seq,
+                            'ts': p.ts, 'values': [float(v) for v in p.values], 'signature': p.signature.hex(),
+                        }) + '\n')
+
+    def recent(self, n=None):
+        """Latest quarantined payloads, newest first."""
+        with self._lock:
+            rows = list(self.rows)
+        rows.reverse()
+        return rows if n is None else rows[:n]
+
+
+class Verifier:
+    """Batch payload verification on a worker pool."""
+
+    def __init__(self, keyring, quarantine=None, channels=None, workers=WORKERS, batch=BATCH, state=None):
+        self.keyring = keyring
+        self.quarantine = Quarantine() if quarantine is None else quarantine
+        self.channels = channels
+        self.batch = batch
+        self.state = state
+        self.verified = 0
+        self._last_seq = {}
+        if state is not None and os.path.exists(state):
+            with open(state, encoding='utf-8') as f:
+                self._last_seq = {device: int(seq) for device, seq in json.load(f).items()}
+        self._lock = threading.Lock()
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='edge-verify')
+
+    def _check(self, payloads):
+        """Signature check of one batch: a reason per payload, None if it verified."""
+        reasons = []
+        for p in payloads:
+            key = self.keyring.key(p.device)
+            if key is None:
+                reasons.append('unknown_device')
+                continue
+            if self.channels is not None and len(p.values) != self.channels:
+                reasons.append('malformed')
+                continue
+            try:
+                key.verify(p.signature, message(p.device, p.seq, p.ts, p.values))
+                reasons.append(None)
+            except (InvalidSignature, ValueError):
+                reasons.append('bad_signature')
+        return reasons
+
+    def submit(self, payloads):
+        """Queue signature checks; returns one future per batch of ``self.batch`` payloads."""
+        return [self._pool.submit(self._check, payloads[i:i + self.batch])
+                for i in range(0, len(payloads), self.batch)]
+
+    def verify(self, payloads):
+        """Verify ``payloads`` (oldest first per device) and return the accepted ones, in order.
+
+        Rejected payloads go to the quarantine. Blocks the calling thread
+        only, until the pool has checked every batch.
+        """
+        payloads = list(payloads)
+        reasons = [r for future in self.submit(payloads) for r in future.result()]
+        accepted, rejected = [], []
+        with self._lock:
+            for p, reason in zip(payloads, reasons):
+                if reason is None and p.seq <= self._last_seq.get(p.device, -1):
+                    reason = 'replayed'
+                if reason is None:
+                    self._last_seq[p.device] = p.seq
+                    accepted.append(p)
+                else:
+                    rejected.append((p, reason))
+            self.verified += len(accepted)
+            if accepted and self.state is not None:
+                self._save()
+        self.quarantine.add(rejected)
+        return accepted
+
+    def _save(self):
+        # Written before the accepted payloads go anywhere: after a crash a
+        # sequence number may be skipped, never accepted twice
+        tmp = f"{self.state}.tmp"
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(self._last_seq, f)
+        os.replace(tmp, self.state)
+
+    def last_seqs(self):
+        """``{device: last accepted sequence number}``."""
+        with self._lock:
+            return dict(self._last_seq)
+
+    def close(self):
+        self._pool.shutdown(wait=True)
+
+
+def seeded_key(seed):
+    """Ed25519 private key derived from ``seed``, for simulated devices and demo operators."""
+    return Ed25519PrivateKey.from_private_bytes(np.random.default_rng(seed).bytes(32))
+
+
+class EdgeDevices:
+    """Simulated edge devices, one Ed25519 key pair per sensor derived from ``seed``."""
+
+    def __init__(self, sensors, seed=0):
+        self.sensors = list(sensors)
+        rng = np.random.default_rng(seed)
+        self._keys = [Ed25519PrivateKey.from_private_bytes(rng.bytes(32)) for _ in self.sensors]
+        self._seq = np.zeros(len(self.sensors), dtype=np.int64)
+
+    def resume(self, last_seqs):
+        """Continue each device's sequence after ``last_seqs`` (``{device: seq}``, e.g. ``Verifier.last_seqs()``)."""
+        for i, s in enumerate(self.sensors):
+            if s.id in last_seqs:
+                self._seq[i] = max(self._seq[i], last_seqs[s.id] + 1)
+        return self
+
+    def public_keys(self):
+        """``{device id: raw public key}`` to register in a ``KeyRing``."""
+        return {s.id: k.public_key().public_bytes(Encoding.Raw, PublicFormat.Raw)
+                for s, k in zip(self.sensors, self._keys)}
+
+    def sign_frame(self, ts, frame):
+        """One signed ``Payload`` per sensor row of ``frame`` (sensors, channels)."""
+        payloads = []
+        for i, (s, key) in enumerate(zip(self.sensors, self._keys)):
+            seq = int(self._seq[i])
+            values = np.asarray(frame[i], dtype=np.float64)
+            payloads.append(Payload(s.id, seq, float(ts), values, key.sign(message(s.id, seq, ts, values))))
+        self._seq += 1
+        return payloads
+
+
+class VerifiedSource:
+    """Frame source whose live frames go through device signing and verification.
+
+    Accepted payloads are also added to ``proofs`` (``telemetry.proofs.ProofPacks``) if given.
+    """
+
+    def __init__(self, source, devices, verifier, proofs=None):
+        self.source = source
+        self.devices = devices
+        self.verifier = verifier
+        self.proofs = proofs
+        self._row = {s.id: i for i, s in enumerate(devices.sensors)}
+        self._last = None
+
+    def next_frame(self, ts=None):
+        """The next frame, its payloads signed at ``ts`` (the feed's timestamp for it; now if None)."""
+        frame = self.source.next_frame(ts)
+        accepted = self.verifier.verify(self.devices.sign_frame(time.time() if ts is None else ts, frame))
+        if self.proofs is not None:
+            self.proofs.add(accepted)
+        verified = np.full_like(frame, np.nan) if self._last is None else self._last.copy()
+        for p in accepted:
+            verified[self._row[p.device]] = p.values
+        self._last = verified
+        return verified
+
+    def next_frames(self, n):
+        frames = self.source.next_frames(n)
+        if len(frames):
+            self._last = frames[-1].copy()
+        return frames
@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+"""
+Ingestion feed: pulls frames from a source and writes them into a RingStore.
+
+On start the store is backfilled with ``backfill`` frames ending now, so
+trend charts have history on first paint; afterwards one frame is appended
+every ``period_s`` seconds from a daemon thread. The source is given the
+frame's timestamp (``next_frame(ts)``), so one that signs its payloads
+signs the time the frame is stored under.
+
+An optional ``rollup`` (``telemetry.site.SiteRollup``) and ``monitor``
+(``telemetry.site.SiteMonitor``) are extended with every frame, backfill
+included, so trend charts read pre-aggregated buckets and the anomaly
+detectors start with learned baselines. An optional ``recorder``
+(``telemetry.history.HistoryRecorder``) sees every live frame, so the
+furnaces' per-minute history persists on disk; the backfill is synthetic
+and is not recorded. An optional ``snapshots``
+(``telemetry.snapshot.SnapshotProducer``) publishes a new snapshot after
+the backfill and after every live frame, once every other sink has it.
+
+A tick that raises is logged and skipped; the loop carries on with the
+next one. ``status()`` (a ``FeedStatus``: last good tick, last error and
+when it happened, error count) goes to ``snapshots`` after every tick, so
+the page can show a feed that has stopped advancing as stale.
+"""
+
+import logging
+import threading
+import time
+from collections import namedtuple
+
+import numpy as np
+
+log = logging.getLogger(__name__)
+
+FeedStatus = namedtuple('FeedStatus', ['last_tick', 'last_error', 'error_ts', 'errors'])
+
+
+class Feed:
+
+    def __init__(self, store, source, period_s=10.0, backfill=None, rollup=None, monitor=None, recorder=None,
+                 snapshots=None):
+        self.store = store
+        self.source = source
+        self.rollup = rollup
+        self.monitor = monitor
+        self.recorder = recorder
+        self.snapshots = snapshots
+        self.period_s = period_s
+        self.backfill = store.capacity if backfill is None else backfill
+        self.frames = 0
+        self.last_tick = None
+        self.last_error = None
+        self.error_ts = None
+        self.errors = 0
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        if self._thread is not None:
+            return self
+        now = time.time()
+        if self.backfill:
+            ts = now - self.period_s * np.arange(self.backfill, 0, -1)
+            frames = self.source.next_frames(self.backfill)
+            self.store.extend_frames(ts, frames)
+            for sink in (self.rollup, self.monitor):
+                if sink is not None:
+                    sink.extend_frames(ts, frames)
+            self.frames += self.backfill
+        self.last_tick = now
+        if self.snapshots is not None:
+            self.snapshots.report(self.status())
+            self.snapshots.publish(now)
+        self._thread = threading.Thread(target=self._run, name='telemetry-feed', daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        if self.recorder is not None:
+            self.recorder.close()
+
+    def _run(self):
+        next_tick = time.time()
+        while not self._stop.wait(max(0.0, next_tick - time.time())):
+            ts = time.time()
+            try:
+                self._tick(ts)
+            except Exception as e:
+                log.exception('telemetry feed tick at %.0f failed', ts)
+                self.last_error, self.error_ts = f"{type(e).__name__}: {e}", ts
+                self.errors += 1
+                if self.snapshots is not None:
+                    self.snapshots.report(self.status())
+            next_tick += self.period_s
+
+    def _tick(self, ts):
+        frame = self.source.next_frame(ts)
+        self.store.append_frame(ts, frame)
+        for sink in (self.rollup, self.monitor):
+            if sink is not None:
+                sink.extend_frames(np.array([ts]), np.asarray(frame)[None])
+        if self.recorder is not None:
+            self.recorder.observe(ts, frame)
+        self.frames += 1
+        self.last_tick = ts
+        if self.snapshots is not None:
+            self.snapshots.report(self.status())
+            self.snapshots.publish(ts)
+
+    def status(self):
+        return FeedStatus(self.last_tick, self.last_error, self.error_ts, self.errors)
@@ -0,0 +1,372 @@
+# -*- coding: utf-8 -*-
+"""
+Append-only columnar history of the furnaces (blast furnaces and EAF shops),
+one row per minute.
+
+Rows hold ``ts`` (float64 epoch seconds) and the four furnace channels
+(float32). They live in uncompressed Arrow IPC files, partitioned by UTC day
+and furnace::
+
+    <root>/day=2026-10-18/furnace=BF-1_Pohang/part-000001.arrow
+                                              part-000002.arrow
+                                              compact-000002.arrow
+
+Files are written once (to a temporary name, then renamed) and never
+modified. ``compact`` merges a partition's parts into one sorted file named
+after the last part it covers, then deletes those parts; readers ignore any
+part at or below a compacted sequence, so a query racing a compaction never
+counts a row twice.
+
+Reads memory-map the files and take only the projected columns: their
+Arrow chunks are concatenated once (``pa.concat_arrays``) into the NumPy
+arrays a trend is reduced from with ``np.bincount``, on integer seconds.
+Days outside a query are never opened. Partition listings are cached per
+store, dropped on every write and compaction and revalidated against the
+partition directory's mtime, so a query lists only partitions another
+process changed.
+
+``HistoryRecorder`` turns the ingestion feed's frames into per-minute means;
+``generate`` writes a synthetic backfill for demos and benchmarks::
+
+    python -m telemetry.history generate --days 90
+    python -m telemetry.history compact
+"""
+
+import argparse
+import calendar
+import math
+import os
+import re
+import time
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
+import pyarrow as pa
+
+from telemetry.sensors import CHANNELS, ELECTRIC_ARC_FURNACES, FURNACES, Sensor
+from telemetry.simulator import SensorSimulator
+
+HISTORY_CHANNELS = ('output_t_day', 'temp_c', 'co2_kg_t', 'efficiency_pct')
+DEFAULT_ROOT = Path(__file__).resolve().parent.parent / 'history'
+DAY_S = 86400
+MINUTE_S = 60
+MAPPED_FILES = 4096         # ~1 year of compacted partitions for eleven furnaces
+RACY_NS = 2 * 10**9         # listings of a directory modified more recently are not cached
+
+SCHEMA = pa.schema([('ts', pa.float64())] + [(c, pa.float32()) for c in HISTORY_CHANNELS])
+_FILE = re.compile(r'^(part|compact)-(\d{6})\.arrow$')
+
+
+def day_of(ts):
+    """UTC day number (days since the epoch) of epoch seconds ``ts``."""
+    return int(ts // DAY_S)
+
+
+def days_between(start, end):
+    """Days overlapping ``[start, end)``."""
+    return range(day_of(start), math.ceil(end / DAY_S))
+
+
+@lru_cache(maxsize=4096)
+def day_label(day):
+    return time.strftime('%Y-%m-%d', time.gmtime(day * DAY_S))
+
+
+def _slug(furnace):
+    return furnace.replace(' ', '_')
+
+
+@lru_cache(maxsize=MAPPED_FILES)
+def _mapped(path):
+    """Record batches of one history file, memory-mapped once per process.
+
+    Files are immutable, so the batches can be shared by every query. The
+    mapping outlives the closed file handle for as long as a batch refers to
+    it, so the cache holds address space, not descriptors.
+    """
+    with pa.memory_map(path) as source:
+        reader = pa.ipc.open_file(source)
+        return tuple(reader.get_batch(i) for i in range(reader.num_record_batches))
+
+
+class HistoryStore:
+
+    def __init__(self, root=DEFAULT_ROOT, furnaces=FURNACES):
+        self.root = Path(root)
+        self.furnaces = list(furnaces)
+        self._listings = {}     # partition -> (directory mtime, live files)
+
+    def _partition(self, day, furnace):
+        return os.path.join(self.root, f"day={day_label(day)}", f"furnace={_slug(furnace)}")
+
+    def days(self):
+        """Days (since the epoch) that have at least one partition, ascending."""
+        if not self.root.is_dir():
+            return []
+        return sorted(day_of(calendar.timegm(time.strptime(p.name[4:], '%Y-%m-%d')))
+                      for p in self.root.iterdir() if p.name.startswith('day='))
+
+    def _files(self, partition):
+        """Live files of a partition: the newest compacted file plus any later parts."""
+        try:
+            mtime = os.stat(partition).st_mtime_ns
+        except FileNotFoundError:
+            return []
+        cached = self._listings.get(partition)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        files = _list(partition)
+        # Directory mtimes are coarse: another file may land under the same
+        # one, so a listing is only trusted once the directory has settled
+        if time.time_ns() - mtime > RACY_NS:
+            self._listings[partition] = (mtime, files)
+        return files
+
+    def fingerprint(self, day):
+        """Names and sizes of a day's live files; changes whenever the day gains rows or is compacted."""
+        return [[f"{_slug(furnace)}/{os.path.basename(path)}", os.path.getsize(path)]
+                for furnace in self.furnaces for _, _, path in self._files(self._partition(day, furnace))]
+
+    # -------------------------------------------------------------------------
+    # Writes
+    # -------------------------------------------------------------------------
+
+    def append(self, ts, values):
+        """Append rows: ``ts`` shape (n,), ``values`` shape (n, furnaces, HISTORY_CHANNELS).
+
+        Writes one new part per (day, furnace) touched; returns the number of parts.
+        """
+        ts = np.asarray(ts, dtype=np.float64)
+        values = np.asarray(values, dtype=np.float32)
+        if not len(ts):
+            return 0
+        day = (ts // DAY_S).astype(np.int64)
+        parts = 0
+        for d in np.unique(day):
+            rows = day == d
+            for i, furnace in enumerate(self.furnaces):
+                columns = [pa.array(ts[rows])] + [pa.array(values[rows, i, c]) for c in range(len(HISTORY_CHANNELS))]
+                self._write(self._partition(int(d), furnace), 'part', pa.record_batch(columns, schema=SCHEMA))
+                parts += 1
+        return parts
+
+    def _write(self, partition, kind, batch, seq=None):
+        os.makedirs(partition, exist_ok=True)
+        if seq is None:
+            seq = max((s for s, _, _ in self._files(partition)), default=0) + 1
+        name = f"{kind}-{seq:06d}.arrow"
+        path, tmp = os.path.join(partition, name), os.path.join(partition, f".{name}.tmp")
+        with pa.OSFile(tmp, 'wb') as sink, pa.ipc.new_file(sink, SCHEMA) as writer:
+            writer.write_batch(batch)
+        os.replace(tmp, path)
+        self._listings.pop(partition, None)
+        return path
+
+    def compact(self, day=None):
+        """Merge each partition's files into one sorted batch.
+
+        Compacts every day, or only ``day``; returns the number of partitions rewritten.
+        """
+        rewritten = 0
+        for d in self.days() if day is None else [day]:
+            for furnace in self.furnaces:
+                partition = self._partition(d, furnace)
+                files = self._files(partition)
+                if len(files) < 2 and not any(kind == 'part' for _, kind, _ in files):
+                    continue
+                table = pa.concat_tables(self._read(path) for _, _, path in files).combine_chunks()
+                order = np.argsort(table.column('ts').to_numpy(), kind='stable')
+                batch = table.take(pa.array(order)).to_batches()[0]
+                self._write(partition, 'compact', batch, seq=files[-1][0])
+                for _, _, path in files:
+                    os.remove(path)
+                self._listings.pop(partition, None)
+                rewritten += 1
+        return rewritten
+
+    # -------------------------------------------------------------------------
+    # Reads
+    # -------------------------------------------------------------------------
+
+    @staticmethod
+    def _read(path):
+        return pa.Table.from_batches(_mapped(path))
+
+    def _batches(self, day, furnace):
+        """Record batches of one partition, memory-mapped.
+
+        A file removed by a concurrent compaction is retried once against the
+        fresh listing.
+        """
+        partition = self._partition(day, furnace)
+        for attempt in range(2):
+            try:
+                return [b for _, _, path in self._files(partition) for b in _mapped(path)]
+            except FileNotFoundError:
+                self._listings.pop(partition, None)
+                if attempt:
+                    raise
+
+    def _columns(self, start, end, channel, furnaces):
+        """``(furnace_index, ts, values)`` of every row of ``furnaces`` in ``[start, end)``.
+
+        Only the ``ts`` and ``channel`` columns are touched; their chunks in
+        the mapped files are copied once, into the concatenated result.
+        """
+        column = SCHEMA.get_field_index(channel)
+        owner, rows, ts, values = [], [], [], []
+        for day in days_between(start, end):
+            for i in furnaces:
+                for batch in self._batches(day, self.furnaces[i]):
+                    owner.append(i)
+                    rows.append(batch.num_rows)
+                    ts.append(batch.column(0))
+                    values.append(batch.column(column))
+        if not ts:
+            return np.zeros(0, dtype=np.int64), np.zeros(0), np.zeros(0, dtype=np.float32)
+        index = np.repeat(np.array(owner, dtype=np.int64), rows)
+        ts, values = pa.concat_arrays(ts).to_numpy(), pa.concat_arrays(values).to_numpy()
+        keep = (ts >= start) & (ts < end)
+        if not keep.all():
+            index, ts, values = index[keep], ts[keep], values[keep]
+        return index, ts, values
+
+    def read(self, furnace, start, end, columns=HISTORY_CHANNELS):
+        """Rows of one furnace with ``start <= ts < end`` as a ``pyarrow.Table`` sorted by ``ts``."""
+        i = self.furnaces.index(furnace)
+        table = {}
+        for channel in columns:
+            _, ts, table[channel] = self._columns(start, end, channel, [i])
+        order = np.argsort(ts, kind='stable')
+        return pa.table({'ts': ts[order], **{c: v[order] for c, v in table.items()}})
+
+    def trend(self, channel, start, end, bucket_s=3600):
+        """Mean of ``channel`` per furnace in ``bucket_s`` windows over ``[start, end)``.
+
+        Returns ``(bucket_start_ts, means)`` with ``means`` shaped
+        (furnaces, buckets); windows without rows are NaN.
+        """
+        first = int(start // bucket_s)
+        n = math.ceil(end / bucket_s) - first
+        index, ts, values = self._columns(start, end, channel, range(len(self.furnaces)))
+        # Whole seconds: integer floor division is ~9x faster than float, same buckets for whole ``bucket_s``
+        cell = index * n + ts.astype(np.int64) // int(bucket_s) - first
+        shape = (len(self.furnaces), n)
+        sums = np.bincount(cell, weights=values, minlength=shape[0] * n).reshape(shape)
+        counts = np.bincount(cell, minlength=shape[0] * n).reshape(shape)
+        with np.errstate(invalid='ignore'):
+            means = sums / counts
+        return (first + np.arange(n)) * float(bucket_s), means
+
+    def nbytes(self):
+        """Bytes on disk across every partition."""
+        return sum(p.stat().st_size for p in self.root.rglob('*.arrow')) if self.root.is_dir() else 0
+
+
+def _list(partition):
+    try:
+        names = os.listdir(partition)
+    except FileNotFoundError:
+        return []
+    files = sorted((int(m.group(2)), m.group(1), name) for name in names if (m := _FILE.match(name)))
+    compacted = max((seq for seq, kind, _ in files if kind == 'compact'), default=0)
+    return [(seq, kind, os.path.join(partition, name)) for seq, kind, name in files
+            if seq > compacted or (kind == 'compact' and seq == compacted)]
+
+
+class HistoryRecorder:
+    """Per-minute means of the furnace rows of feed frames, flushed to a ``HistoryStore``.
+
+    Rows are buffered and written every ``flush_s`` seconds or when the UTC
+    day rolls over; a finished day is compacted straight away.
+    """
+
+    def __init__(self, history, sensors, channels=CHANNELS, flush_s=600):
+        self.history = history
+        names = [s.name for s in sensors]
+        self.rows = np.array([names.index(f) for f in history.furnaces], dtype=np.int64)
+        self.cols = np.array([tuple(channels).index(c) for c in HISTORY_CHANNELS], dtype=np.int64)
+        self.flush_s = flush_s
+        self._minute = None
+        self._sum = None
+        self._n = 0
+        self._ts = []
+        self._values = []
+
+    def observe(self, ts, frame):
+        minute = int(ts // MINUTE_S)
+        if minute != self._minute:
+            self._close_minute()
+            self._minute, self._sum = minute, np.zeros((len(self.rows), len(self.cols)))
+            if self._ts and (day_of(minute * MINUTE_S) != day_of(self._ts[0])
+                             or minute * MINUTE_S - self._ts[0] >= self.flush_s):
+                self.flush()
+        self._sum += np.asarray(frame)[np.ix_(self.rows, self.cols)]
+        self._n += 1
+
+    def _close_minute(self):
+        if self._n:
+            self._ts.append(self._minute * MINUTE_S)
+            self._values.append(self._sum / self._n)
+            self._n = 0
+
+    def flush(self):
+        """Write buffered minutes; compacts their day if the recorder has moved past it."""
+        if not self._ts:
+            return
+        day = day_of(self._ts[0])
+        self.history.append(np.array(self._ts), np.stack(self._values))
+        self._ts, self._values = [], []
+        if self._minute is not None and day_of(self._minute * MINUTE_S) != day:
+            self.history.compact(day)
+
+    def close(self):
+        """Write everything observed so far, including the current partial minute."""
+        self._close_minute()
+        self.flush()
+
+
+def generate(history, days, end=None, period_s=MINUTE_S, seed=0):
+    """Fill ``history`` with ``days`` of simulated furnace rows ending at ``end``.
+
+    ``end`` defaults to the start of the current UTC day, so a generated
+    backfill never overlaps what a live recorder writes today. One part per
+    day and furnace is written, then compacted. Returns the number of rows.
+    """
+    end = day_of(time.time()) * DAY_S if end is None else end
+    sensors = [Sensor(f"FUR-{i + 1:02d}", name, 'steelmaking', 'eaf' if name in ELECTRIC_ARC_FURNACES else 'bf')
+               for i, name in enumerate(history.furnaces)]
+    sim = SensorSimulator(sensors, seed=seed)
+    cols = [CHANNELS.index(c) for c in HISTORY_CHANNELS]
+    per_day = DAY_S // period_s
+    first = day_of(end) - days
+    for day in range(first, first + days):
+        ts = day * DAY_S + period_s * np.arange(per_day, dtype=np.float64)
+        history.append(ts, sim.next_frames(per_day)[..., cols])
+        history.compact(day)
+    return days * per_day * len(history.furnaces)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Furnace history store maintenance.')
+    parser.add_argument('--root', type=Path, default=DEFAULT_ROOT)
+    commands = parser.add_subparsers(dest='command', required=True)
+    gen = commands.add_parser('generate', help='write a simulated backfill ending today (UTC)')
+    gen.add_argument('--days', type=int, default=90)
+    gen.add_argument('--seed', type=int, default=0)
+    commands.add_parser('compact', help='merge every partition into one file')
+    args = parser.parse_args()
+
+    history = HistoryStore(args.root)
+    start = time.perf_counter()
+    if args.command == 'generate':
+        rows = generate(history, args.days, seed=args.seed)
+        print(f"{rows:,} rows over {args.days} days in {time.perf_counter() - start:.1f} s, "
+              f"{history.nbytes() / 2**20:.1f} MiB at {history.root}")
+    else:
+        print(f"{history.compact()} partitions compacted in {time.perf_counter() - start:.1f} s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,386 @@
+# -*- coding: utf-8 -*-
+"""
+DT-SEQ proof packs: an append-only Merkle tree of verified readings per
+reporting period (UTC month).
+
+Trees follow RFC 9162 (Certificate Transparency v2): a leaf hash is
+``SHA-256(0x00 || payload bytes)``, an inner node ``SHA-256(0x01 || left ||
+right)``, and a tree of any size splits at the largest power of two below
+it. Every complete subtree is stored once, in one append-only file of
+32-byte hashes per level::
+
+    <root>/2026-10/level-00.bin     leaf hashes
+                   level-01.bin     parents of leaf pairs
+                   ...
+                   index/STE-01.bin (sequence number, leaf index) per device
+
+Appending a leaf writes it and each parent it completes, reading only the
+pending left sibling per level, which is kept in memory: O(log n) work and
+memory however long the period, and nothing already written is rehashed.
+The root folds those pending nodes. An inclusion proof reads one stored
+hash per level (plus the right-edge subtrees of an incomplete tree), so it
+costs O(log n) disk reads whatever the period's size.
+
+A month of 60 sensors at 1 Hz is ~155M leaves: ~10 GB of hashes and ~2.5 GB
+of index, with 28 levels. A reopened pack repairs a torn write by dropping
+partial hashes and recomputing any parents the last append did not reach.
+
+A device's index is binary-searched by sequence number, so its numbers
+must keep increasing, across restarts too (the verifier persists them and
+the devices resume after them, ``telemetry.edge``). A pack restores each
+device's last indexed number on open and refuses a payload that does not
+follow it.
+
+``seal`` signs the period's root and size with the operator's Ed25519 key;
+``verify_inclusion`` and ``verify_root`` let an auditor check a reading
+against an exported root with nothing but the payload bytes.
+"""
+
+import json
+import os
+import threading
+import time
+from collections import namedtuple
+from hashlib import sha256
+from pathlib import Path
+
+import numpy as np
+from cryptography.exceptions import InvalidSignature
+from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PublicKey
+from cryptography.hazmat.primitives.serialization import Encoding, PublicFormat
+
+from telemetry.edge import message
+
+DEFAULT_ROOT = Path(__file__).resolve().parent.parent / 'proofs'
+HASH_SIZE = 32
+INDEX_DTYPE = np.dtype([('seq', '<u8'), ('leaf', '<u8')])
+EMPTY_ROOT = sha256(b'').digest()
+
+Proof = namedtuple('Proof', ['period', 'index', 'size', 'leaf', 'path', 'root'])
+SignedRoot = namedtuple('SignedRoot', ['period', 'size', 'root', 'sealed_at', 'public_key', 'signature'])
+
+
+def leaf_hash(data):
+    return sha256(b'\x00' + data).digest()
+
+
+def node_hash(left, right):
+    return sha256(b'\x01' + left + right).digest()
+
+
+def payload_bytes(payload):
+    """Leaf data of a verified payload: the signed message followed by its signature."""
+    return message(payload.device, payload.seq, payload.ts, payload.values) + payload.signature
+
+
+def period_of(ts):
+    """Reporting period (UTC ``YYYY-MM``) of epoch seconds ``ts``."""
+    return time.strftime('%Y-%m', time.gmtime(ts))
+
+
+def _split(n):
+    """Largest power of two below ``n`` (n > 1)."""
+    return 1 << ((n - 1).bit_length() - 1)
+
+
+def verify_inclusion(leaf, index, size, path, root):
+    """Check an RFC 9162 inclusion ``path`` of leaf hash ``leaf`` at ``index`` in a tree of ``size``."""
+    if index >= size:
+        return False
+    fn, sn, r = index, size - 1, leaf
+    for p in path:
+        if sn == 0:
+            return False
+        if fn & 1 or fn == sn:
+            r = node_hash(p, r)
+            while not fn & 1 and fn:
+                fn, sn = fn >> 1, sn >> 1
+        else:
+            r = node_hash(r, p)
+        fn, sn = fn >> 1, sn >> 1
+    return sn == 0 and r == root
+
+
+def _sealed_message(period, size, root, sealed_at):
+    return f"DT-SEQ|{period}|{size}|{root.hex()}|{sealed_at:.3f}".encode('ascii')
+
+
+def verify_root(sealed):
+    """Check a ``SignedRoot``'s signature against the public key it carries."""
+    try:
+        Ed25519PublicKey.from_public_bytes(sealed.public_key).verify(
+            sealed.signature, _sealed_message(sealed.period, sealed.size, sealed.root, sealed.sealed_at))
+        return True
+    except InvalidSignature:
+        return False
+
+
+class ProofPack:
+    """Merkle tree and per-device index of one period, on disk under ``path``."""
+
+    def __init__(self, path, period=None):
+        self.path = str(path)
+        self.period = period or os.path.basename(self.path)
+        self._index_dir = os.path.join(self.path, 'index')
+        os.makedirs(self._index_dir, exist_ok=True)
+        self._counts = []       # nodes per level
+        self._last = []         # last node per level
+        self._writers = []
+        self._readers = []
+        self._index = {}
+        self._last_seq = {}     # device -> last indexed sequence number
+        self._lock = threading.Lock()
+        self._open()
+
+    @property
+    def size(self):
+        return self._counts[0] if self._counts else 0
+
+    def _level_path(self, level):
+        return os.path.join(self.path, f"level-{level:02d}.bin")
+
+    # -------------------------------------------------------------------------
+    # Files
+    # -------------------------------------------------------------------------
+
+    def _add_level(self):
+        level = len(self._counts)
+        self._writers.append(open(self._level_path(level), 'ab'))
+        self._readers.append(os.open(self._level_path(level), os.O_RDONLY))
+        self._counts.append(0)
+        self._last.append(None)
+
+    def _open(self):
+        """Load the level counts and pending nodes, repairing a torn append."""
+        level = 0
+        while os.path.exists(self._level_path(level)):
+            path = self._level_path(level)
+            count = os.path.getsize(path) // HASH_SIZE
+            os.truncate(path, count * HASH_SIZE)
+            expected = self._counts[level - 1] // 2 if level else count
+            if count > expected:
+                os.truncate(path, expected * HASH_SIZE)
+                count = expected
+            self._add_level()
+            self._counts[level] = count
+            if count:
+                self._last[level] = self._read(level, count - 1)
+            level += 1
+        # Parents an interrupted append did not reach
+        level = 0
+        while level < len(self._counts) and self._counts[level] > 1:
+            if level + 1 == len(self._counts):
+                self._add_level()
+            missing = range(self._counts[level + 1], self._counts[level] // 2)
+            if len(missing):
+                parents = [node_hash(self._read(level, 2 * i), self._read(level, 2 * i + 1)) for i in missing]
+                self._writers[level + 1].write(b''.join(parents))
+                self._writers[level + 1].flush()
+                self._counts[level + 1] += len(parents)
+                self._last[level + 1] = parents[-1]
+            level += 1
+        if not self._counts:
+            self._add_level()
+        # Index records of leaves that did not make it
+        for name in os.listdir(self._index_dir):
+            index = os.path.join(self._index_dir, name)
+            n = os.path.getsize(index) // INDEX_DTYPE.itemsize
+            records = np.memmap(index, dtype=INDEX_DTYPE, mode='r', shape=(n,)) if n else None
+            keep = int(np.searchsorted(records['leaf'], self.size)) if n else 0
+            if keep:
+                self._last_seq[name[:-len('.bin')]] = int(records['seq'][keep - 1])
+            del records
+            os.truncate(index, keep * INDEX_DTYPE.itemsize)
+
+    def _read(self, level, i):
+        if i == self._counts[level] - 1 and self._last[level] is not None:
+            return self._last[level]
+        return os.pread(self._readers[level], HASH_SIZE, i * HASH_SIZE)
+
+    def flush(self):
+        with self._lock:
+            for f in self._writers:
+                f.flush()
+            for f in self._index.values():
+                f.flush()
+
+    def close(self):
+        with self._lock:
+            for f in self._writers + list(self._index.values()):
+                f.close()
+            for fd in self._readers:
+                os.close(fd)
+            self._writers, self._readers, self._index = [], [], {}
+
+    # -------------------------------------------------------------------------
+    # Appends
+    # -------------------------------------------------------------------------
+
+    def extend(self, leaves):
+        """Append leaf hashes; returns the index of the first."""
+        with self._lock:
+            return self._extend(leaves)
+
+    def _extend(self, leaves):
+        first = self.size
+        level, nodes = 0, list(leaves)
+        while nodes:
+            if level == len(self._counts):
+                self._add_level()
+            self._writers[level].write(b''.join(nodes))
+            pending = [self._last[level]] + nodes if self._counts[level] & 1 else nodes
+            self._counts[level] += len(nodes)
+            self._last[level] = nodes[-1]
+            nodes = [node_hash(pending[i], pending[i + 1]) for i in range(0, len(pending) - 1, 2)]
+            level += 1
+        return first
+
+    def add(self, payloads):
+        """Append verified payloads as leaves and index them by (device, sequence number).
+
+        Each device's sequence numbers must increase, across reopens too,
+        for ``locate`` to search its index; a batch that would break that
+        raises ValueError and adds nothing.
+        """
+        if not payloads:
+            return
+        with self._lock:
+            last = {}
+            for p in payloads:
+                previous = last.get(p.device, self._last_seq.get(p.device, -1))
+                if p.seq <= previous:
+                    raise ValueError(f"{self.period}: {p.device} sequence {p.seq} does not follow {previous}")
+                last[p.device] = p.seq
+            first = self._extend([leaf_hash(payload_bytes(p)) for p in payloads])
+            by_device = {}
+            for i, p in enumerate(payloads):
+                by_device.setdefault(p.device, []).append((p.seq, first + i))
+            self._last_seq.update(last)
+            for device, records in by_device.items():
+                f = self._index.get(device)
+                if f is None:
+                    f = self._index[device] = open(os.path.join(self._index_dir, f"{device}.bin"), 'ab')
+                f.write(np.array(records, dtype=INDEX_DTYPE).tobytes())
+
+    # -------------------------------------------------------------------------
+    # Roots and proofs
+    # -------------------------------------------------------------------------
+
+    def _root(self):
+        root = None
+        for level, count in enumerate(self._counts):
+            if count & 1:
+                root = self._last[level] if root is None else node_hash(self._last[level], root)
+        return EMPTY_ROOT if root is None else root
+
+    def root(self):
+        with self._lock:
+            return self._root()
+
+    def _subtree(self, start, end):
+        n = end - start
+        if n & (n - 1) == 0:
+            level = n.bit_length() - 1
+            return self._read(level, start >> level)
+        k = _split(n)
+        return node_hash(self._subtree(start, start + k), self._subtree(start + k, end))
+
+    def proof(self, index):
+        """Inclusion ``Proof`` of leaf ``index`` against the current root."""
+        with self._lock:
+            for f in self._writers:
+                f.flush()
+            size = self.size
+            if not 0 <= index < size:
+                raise IndexError(f"leaf {index} outside a tree of {size}")
+            path, start, end = [], 0, size
+            while end - start > 1:
+                k = _split(end - start)
+                if index < start + k:
+                    path.append(self._subtree(start + k, end))
+                    end = start + k
+                else:
+                    path.append(self._subtree(start, start + k))
+                    start += k
+            path.reverse()
+            return Proof(self.period, index, size, self._read(0, index), path, self._root())
+
+    def locate(self, device, seq):
+        """Leaf index of ``device``'s reading ``seq``, or None."""
+        with self._lock:
+            f = self._index.get(device)
+            if f is not None:
+                f.flush()
+        path = os.path.join(self._index_dir, f"{device}.bin")
+        if not os.path.exists(path) or not os.path.getsize(path):
+            return None
+        records = np.memmap(path, dtype=INDEX_DTYPE, mode='r')
+        i = int(np.searchsorted(records['seq'], seq))
+        return int(records['leaf'][i]) if i < len(records) and records['seq'][i] == seq else None
+
+    def seal(self, signer):
+        """``SignedRoot`` of the period so far, signed with Ed25519 private key ``signer``."""
+        with self._lock:
+            size, root = self.size, self._root()
+        sealed_at = round(time.time(), 3)
+        public_key = signer.public_key().public_bytes(Encoding.Raw, PublicFormat.Raw)
+        signature = signer.sign(_sealed_message(self.period, size, root, sealed_at))
+        return SignedRoot(self.period, size, root, sealed_at, public_key, signature)
+
+    def export(self, signer):
+        """Sealed root as JSON, for the audit trail."""
+        sealed = self.seal(signer)
+        return json.dumps({
+            'period': sealed.period, 'size': sealed.size, 'root': sealed.root.hex(),
+            'sealed_at': sealed.sealed_at, 'public_key': sealed.public_key.hex(),
+            'signature': sealed.signature.hex(), 'tree': 'RFC 9162 SHA-256',
+        }, indent=1)
+
+
+class ProofPacks:
+    """Proof packs by period under ``root``; verified payloads go to the pack of their timestamp."""
+
+    def __init__(self, root=DEFAULT_ROOT):
+        self.root = str(root)
+        os.makedirs(self.root, exist_ok=True)
+        self._packs = {}
+        self._lock = threading.Lock()
+
+    def periods(self):
+        return sorted(p for p in os.listdir(self.root) if os.path.isdir(os.path.join(self.root, p)))
+
+    def pack(self, period):
+        with self._lock:
+            pack = self._packs.get(period)
+            if pack is None:
+                pack = self._packs[period] = ProofPack(os.path.join(self.root, period), period)
+            return pack
+
+    def pack_of(self, ts):
+        """Pack of the period containing epoch seconds ``ts``."""
+        return self.pack(period_of(ts))
+
+    def add(self, payloads):
+        by_period = {}
+        for p in payloads:
+            by_period.setdefault(period_of(p.ts), []).append(p)
+        for period, batch in by_period.items():
+            self.pack(period).add(batch)
+
+    def proof(self, payload):
+        """Inclusion ``Proof`` of a verified payload, or None if it was never added."""
+        pack = self.pack(period_of(payload.ts))
+        index = pack.locate(payload.device, payload.seq)
+        return None if index is None else pack.proof(index)
+
+    def flush(self):
+        with self._lock:
+            packs = list(self._packs.values())
+        for pack in packs:
+            pack.flush()
+
+    def close(self):
+        with self._lock:
+            packs, self._packs = list(self._packs.values()), {}
+        for pack in packs:
+            pack.close()
@@ -0,0 +1,288 @@
+# -*- coding: utf-8 -*-
+"""
+Push API for the live gauges and furnace statuses, outside the Streamlit UI.
+
+    GET /api/live/ws        WebSocket, one JSON text message per update
+    GET /api/live/events    Server-Sent Events, ``event: snapshot|delta``
+
+A ``Hub`` polls the shared live snapshot (``telemetry.snapshot``) every
+``period_s`` on the event loop. When the version changed it diffs the wire
+state against the previous one and broadcasts only the changed gauges and
+furnace fields. Every subscriber first receives the full state::
+
+    {"type": "snapshot", "version": 41, "ts": 1792300000.0,
+     "gauges": {"production": 41230.5, "intensity": 1843.2, ...},
+     "furnaces": {"BF-1 Pohang": {"output": 11020.4, ..., "status": "running"}, ...}}
+
+Furnaces are keyed by sensor name, as on the Live Monitoring page.
+
+then deltas of the same shape holding only what changed (``"type":
+"delta"``). Applying every message in order yields the latest state.
+
+A delta is encoded once and the same bytes go to every subscriber that is
+keeping up. A subscriber has one pending slot, not a queue: if it has not
+sent its last message when the next delta arrives, the two are merged, so
+a slow consumer skips intermediate values but never loses a change and
+costs at most one pending state of memory. One that stays behind for
+``max_lag`` consecutive deltas is disconnected (WebSocket close 1013, end
+of the SSE stream) so it can reconnect to a fresh snapshot. Sends are
+awaited, so a full socket buffer throttles that subscriber only.
+"""
+
+import asyncio
+import copy
+import json
+from contextlib import asynccontextmanager
+
+from starlette.responses import JSONResponse, StreamingResponse
+from starlette.routing import Route, WebSocketRoute
+from starlette.websockets import WebSocketDisconnect
+
+PERIOD_S = 1.0
+MAX_LAG = 30
+MAX_SUBSCRIBERS = 5000
+DIGITS = 2
+SSE_PING_S = 15.0
+
+
+def wire_state(snapshot):
+    """JSON-ready gauges and furnace rows of a ``Snapshot``, floats rounded to ``DIGITS``."""
+    return {
+        'gauges': {k: round(float(v), DIGITS) for k, v in snapshot.gauges.items()},
+        'furnaces': {row['name']: {k: v if isinstance(v, (str, bool)) else round(float(v), DIGITS)
+                                   for k, v in row.items() if k not in ('name', 'running')}
+                     for row in snapshot.furnaces},
+    }
+
+
+def diff(old, new):
+    """Entries of the nested state ``new`` that differ from ``old``."""
+    changed = {}
+    for key, value in new.items():
+        if isinstance(value, dict):
+            sub = diff(old.get(key, {}), value)
+            if sub:
+                changed[key] = sub
+        elif old.get(key) != value:
+            changed[key] = value
+    return changed
+
+
+def merge(into, delta):
+    """Apply ``delta`` to the nested state ``into`` in place; returns it."""
+    for key, value in delta.items():
+        if isinstance(value, dict):
+            merge(into.setdefault(key, {}), value)
+        else:
+            into[key] = value
+    return into
+
+
+class Subscriber:
+    """One consumer's pending slot: the next message, coalesced while it is busy."""
+
+    def __init__(self, hub):
+        self.hub = hub
+        self.pending = None         # (message dict, encoded text or None)
+        self.lag = 0                # deltas merged since the last send
+        self.sent = 0
+        self.closed = False
+        self._ready = asyncio.Event()
+
+    def offer(self, message, encoded):
+        if self.pending is None:
+            self.pending = (message, encoded)
+        else:
+            first = self.pending[0]
+            # The first pending message may be the broadcast one every subscriber shares
+            merged = merge(copy.deepcopy(first) if self.lag == 0 else first, message)
+            merged['type'] = first['type']
+            self.pending = (merged, None)
+            self.lag += 1
+            self.hub.coalesced += 1
+            if self.lag >= self.hub.max_lag:
+                self.close()
+        self._ready.set()
+
+    def close(self, dropped=True):
+        if not self.closed:
+            self.closed = True
+            self.hub.dropped += dropped
+            self._ready.set()
+
+    async def next(self):
+        """Next encoded message, or None once closed."""
+        while self.pending is None and not self.closed:
+            self._ready.clear()
+            await self._ready.wait()
+        if self.closed:
+            return None
+        message, encoded = self.pending
+        self.pending, self.lag = None, 0
+        self.sent += 1
+        return encoded if encoded is not None else json.dumps(message, separators=(',', ':'))
+
+
+class Hub:
+    """Broadcasts the live snapshot returned by ``latest()`` to WebSocket and SSE subscribers."""
+
+    def __init__(self, latest, period_s=PERIOD_S, max_lag=MAX_LAG, max_subscribers=MAX_SUBSCRIBERS):
+        self.latest = latest
+        self.period_s = period_s
+        self.max_lag = max_lag
+        self.max_subscribers = max_subscribers
+        self.subscribers = set()
+        self.version = self.ts = None
+        self.state = None
+        self.broadcasts = self.encoded = self.coalesced = self.dropped = 0
+        self.error = None
+        self._task = None
+
+    # -------------------------------------------------------------------------
+    # Broadcast
+    # -------------------------------------------------------------------------
+
+    def poll(self, snapshot=None):
+        """Broadcast the delta to ``snapshot`` (default: the latest) if its version is new; returns whether it was."""
+        snapshot = self.latest() if snapshot is None else snapshot
+        if snapshot.version == self.version:
+            return False
+        state = wire_state(snapshot)
+        delta = diff(self.state or {}, state)
+        self.version, self.ts, self.state = snapshot.version, snapshot.ts, state
+        message = dict(delta, type='delta', version=snapshot.version, ts=snapshot.ts)
+        encoded = json.dumps(message, separators=(',', ':'))
+        self.encoded += 1
+        self.broadcasts += 1
+        for subscriber in self.subscribers:
+            subscriber.offer(message, encoded)
+        return True
+
+    async def refresh(self):
+        """``poll`` with the snapshot read off the event loop: the first read may start the feed."""
+        return self.poll(await asyncio.to_thread(self.latest))
+
+    async def run(self):
+        while True:
+            try:
+                await self.refresh()
+            except Exception as e:  # surfaced in stats, the push loop carries on
+                self.error = f"{type(e).__name__}: {e}"
+            await asyncio.sleep(self.period_s)
+
+    def start(self):
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self.run())
+        return self
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        for subscriber in list(self.subscribers):
+            subscriber.close(dropped=False)
+
+    @asynccontextmanager
+    async def lifespan(self, app):
+        self.start()
+        try:
+            yield
+        finally:
+            await self.stop()
+
+    # -------------------------------------------------------------------------
+    # Subscribers
+    # -------------------------------------------------------------------------
+
+    def subscribe(self):
+        """New ``Subscriber`` primed with the full state, or None when at capacity."""
+        if len(self.subscribers) >= self.max_subscribers:
+            return None
+        if self.state is None:
+            self.poll()
+        subscriber = Subscriber(self)
+        subscriber.offer(dict(self.state, type='snapshot', version=self.version, ts=self.ts), None)
+        self.subscribers.add(subscriber)
+        return subscriber
+
+    def unsubscribe(self, subscriber):
+        self.subscribers.discard(subscriber)
+
+    def stats(self):
+        return {
+            'subscribers': len(self.subscribers),
+            'version': self.version,
+            'broadcasts': self.broadcasts,
+            'encoded': self.encoded,
+            'coalesced': self.coalesced,
+            'dropped': self.dropped,
+            'error': self.error,
+        }
+
+    # -------------------------------------------------------------------------
+    # Endpoints
+    # -------------------------------------------------------------------------
+
+    async def websocket(self, websocket):
+        if self.state is None:
+            await self.refresh()
+        subscriber = self.subscribe()
+        if subscriber is None:
+            await websocket.close(code=1013)
+            return
+        await websocket.accept()
+
+        async def watch():
+            # Clients only listen; a receive returns when they go away.
+            try:
+                while True:
+                    await websocket.receive_text()
+            except WebSocketDisconnect:
+                subscriber.close(dropped=False)
+
+        watcher = asyncio.create_task(watch())
+        try:
+            while (text := await subscriber.next()) is not None:
+                await websocket.send_text(text)
+            if not watcher.done():
+                await websocket.close(code=1013)
+        except (WebSocketDisconnect, RuntimeError):
+            pass
+        finally:
+            watcher.cancel()
+            self.unsubscribe(subscriber)
+
+    async def events(self, request):
+        if self.state is None:
+            await self.refresh()
+        subscriber = self.subscribe()
+        if subscriber is None:
+            return JSONResponse({'error': 'too many subscribers'}, status_code=503)
+
+        async def stream():
+            try:
+                while True:
+                    try:
+                        text = await asyncio.wait_for(subscriber.next(), SSE_PING_S)
+                    except asyncio.TimeoutError:
+                        yield ': ping\n\n'
+                        continue
+                    if text is None:
+                        return
+                    kind = 'snapshot' if subscriber.sent == 1 else 'delta'
+                    yield f"event: {kind}\ndata: {text}\n\n"
+            finally:
+                self.unsubscribe(subscriber)
+
+        return StreamingResponse(stream(), media_type='text/event-stream',
+                                 headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
+
+    async def status(self, request):
+        return JSONResponse(self.stats())
+
+    def routes(self, prefix='/api/live'):
+        return [
+            WebSocketRoute(f"{prefix}/ws", self.websocket),
+            Route(f"{prefix}/events", self.events),
+            Route(f"{prefix}/stats", self.status),
+        ]
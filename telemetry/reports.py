@@ -0,0 +1,314 @@
+# -*- coding: utf-8 -*-
+"""
+K-ETS emission reports from the furnace history, built in the background.
+
+A report covers a calendar month or year. Emissions are computed per
+furnace from its per-minute rows as tonnage x intensity (``output_t_day /
+1440`` tonnes at ``co2_kg_t``), then summed by route (BF-BOF for the blast
+furnaces, EAF for the arc furnace shops) and by day.
+
+``DailyAggregates`` keeps one row of sums per (day, furnace) together with
+a fingerprint of the day's history files (names and sizes), and persists
+them as JSON. Building a report recomputes only days whose fingerprint
+changed, so re-running a month touches today's partitions and the days
+since the last run, not the whole period.
+
+``ReportJobs`` runs builds on a local thread pool. ``submit`` returns a
+``Job`` at once (the same one while a build of that period is pending),
+and the job's ``done`` / ``total`` days track progress for the UI. A
+finished ``Report`` exports to CSV, XLSX (openpyxl) and PDF (fpdf2); both
+libraries are imported only when that format is asked for.
+"""
+
+import calendar
+import io
+import json
+import os
+import threading
+import time
+import uuid
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from telemetry.history import DAY_S, MINUTE_S, day_label, day_of
+from telemetry.sensors import ELECTRIC_ARC_FURNACES
+
+DEFAULT_PATH = Path(__file__).resolve().parent.parent / 'reports' / 'daily.json'
+MINUTES_PER_DAY = DAY_S // MINUTE_S
+WORKERS = 1
+MAX_JOBS = 50
+
+Report = namedtuple('Report', ['kind', 'period', 'generated', 'recomputed', 'totals', 'routes', 'furnaces', 'daily'])
+
+
+def route_of(furnace):
+    return 'EAF' if furnace in ELECTRIC_ARC_FURNACES else 'BF-BOF'
+
+
+def period_days(kind, period):
+    """UTC days (since the epoch) of a ``'month'`` (``YYYY-MM``) or ``'year'`` (``YYYY``)."""
+    if kind == 'month':
+        year, month = (int(p) for p in period.split('-'))
+        first = calendar.timegm((year, month, 1, 0, 0, 0))
+        n = calendar.monthrange(year, month)[1]
+    elif kind == 'year':
+        first = calendar.timegm((int(period), 1, 1, 0, 0, 0))
+        n = 366 if calendar.isleap(int(period)) else 365
+    else:
+        raise ValueError(f"unknown report kind {kind!r}")
+    return range(day_of(first), day_of(first) + n)
+
+
+def periods(days, kind):
+    """Periods of ``kind`` that contain any of ``days``, newest first."""
+    fmt = '%Y-%m' if kind == 'month' else '%Y'
+    return sorted({time.strftime(fmt, time.gmtime(d * DAY_S)) for d in days}, reverse=True)
+
+
+class DailyAggregates:
+    """Per (day, furnace) production, emissions and minute counts, cached by file fingerprint."""
+
+    def __init__(self, history, path=DEFAULT_PATH):
+        self.history = history
+        self.path = None if path is None else str(path)
+        self._days = {}
+        self._lock = threading.Lock()
+        if self.path and os.path.exists(self.path):
+            with open(self.path, encoding='utf-8') as f:
+                self._days = {int(day): entry for day, entry in json.load(f).items()}
+
+    def _compute(self, day):
+        """``{furnace: [production_t, emissions_t, minutes]}`` of one day."""
+        start, end = day * DAY_S, (day + 1) * DAY_S
+        rows = {}
+        for furnace in self.history.furnaces:
+            table = self.history.read(furnace, start, end, columns=('output_t_day', 'co2_kg_t'))
+            if not table.num_rows:
+                continue
+            tonnes = table.column('output_t_day').to_numpy().astype(np.float64) / MINUTES_PER_DAY
+            co2 = table.column('co2_kg_t').to_numpy().astype(np.float64)
+            rows[furnace] = [float(tonnes.sum()), float((tonnes * co2).sum() / 1000), table.num_rows]
+        return rows
+
+    def update(self, days, progress=None):
+        """Bring ``days`` up to date; returns how many were recomputed.
+
+        ``progress(done, total)`` is called after each day.
+        """
+        days = list(days)
+        recomputed = 0
+        for i, day in enumerate(days):
+            fingerprint = self.history.fingerprint(day)
+            with self._lock:
+                cached = self._days.get(day)
+            if cached is None or cached['fingerprint'] != fingerprint:
+                entry = {'fingerprint': fingerprint, 'rows': self._compute(day) if fingerprint else {}}
+                with self._lock:
+                    self._days[day] = entry
+                recomputed += 1
+            if progress is not None:
+                progress(i + 1, len(days))
+        if recomputed and self.path:
+            self.save()
+        return recomputed
+
+    def rows(self, days):
+        """Long table of the cached aggregates: day, furnace, route, production_t, emissions_t, minutes."""
+        with self._lock:
+            records = [(day, furnace, route_of(furnace), *values)
+                       for day in days for furnace, values in self._days.get(day, {'rows': {}})['rows'].items()]
+        return pd.DataFrame.from_records(
+            records, columns=['day', 'furnace', 'route', 'production_t', 'emissions_t', 'minutes'])
+
+    def save(self):
+        with self._lock:
+            data = json.dumps({str(day): entry for day, entry in self._days.items()})
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp = f"{self.path}.tmp"
+        with open(tmp, 'w', encoding='utf-8') as f:
+            f.write(data)
+        os.replace(tmp, self.path)
+
+
+def _summarise(frame, by):
+    out = frame.groupby(by, sort=True)[['production_t', 'emissions_t', 'minutes']].sum().reset_index()
+    out['intensity_kg_t'] = out['emissions_t'] * 1000 / out['production_t']
+    return out
+
+
+def build(aggregates, kind, period, progress=None):
+    """``Report`` of one period from ``aggregates``, updating the days that changed."""
+    days = [d for d in period_days(kind, period) if d <= day_of(time.time())]
+    recomputed = aggregates.update(days, progress)
+    rows = aggregates.rows(days)
+    rows['date'] = [day_label(d) for d in rows['day']]
+    furnaces = _summarise(rows, ['route', 'furnace'])
+    furnaces['coverage_pct'] = furnaces['minutes'] / (len(days) * MINUTES_PER_DAY) * 100
+    routes = _summarise(rows, ['route'])
+    daily = _summarise(rows, ['date', 'route'])
+    production, emissions = float(rows['production_t'].sum()), float(rows['emissions_t'].sum())
+    totals = {
+        'days': len(days),
+        'days_with_data': int(rows['day'].nunique()),
+        'production_t': production,
+        'emissions_t': emissions,
+        'intensity_kg_t': emissions * 1000 / production if production else float('nan'),
+    }
+    return Report(kind, period, time.time(), recomputed, totals, routes, furnaces, daily)
+
+
+# =============================================================================
+# EXPORTS
+# =============================================================================
+
+def to_csv(report):
+    """Daily rows per route as CSV bytes."""
+    return report.daily.drop(columns='minutes').to_csv(index=False, float_format='%.3f').encode('utf-8')
+
+
+def to_xlsx(report):
+    """Workbook with Summary, Furnaces and Daily sheets."""
+    summary = pd.DataFrame(list(report.totals.items()), columns=['item', 'value'])
+    buffer = io.BytesIO()
+    with pd.ExcelWriter(buffer, engine='openpyxl') as writer:
+        summary.to_excel(writer, sheet_name='Summary', index=False)
+        report.routes.to_excel(writer, sheet_name='Summary', index=False, startrow=len(summary) + 2)
+        report.furnaces.to_excel(writer, sheet_name='Furnaces', index=False)
+        report.daily.to_excel(writer, sheet_name='Daily', index=False)
+    return buffer.getvalue()
+
+
+def to_pdf(report):
+    """PDF of the totals and the route and furnace tables."""
+    from fpdf import FPDF
+
+    pdf = FPDF()
+    pdf.set_auto_page_break(auto=True, margin=15)
+    pdf.add_page()
+    pdf.set_font('Helvetica', 'B', 16)
+    pdf.cell(0, 10, f"K-ETS emission report - {report.kind} {report.period}", new_x='LMARGIN', new_y='NEXT')
+    pdf.set_font('Helvetica', size=9)
+    pdf.cell(0, 6, f"Generated {time.strftime('%Y-%m-%d %H:%M UTC', time.gmtime(report.generated))} from furnace "
+                   f"telemetry ({report.totals['days_with_data']} of {report.totals['days']} days with data)",
+             new_x='LMARGIN', new_y='NEXT')
+    pdf.ln(4)
+    t = report.totals
+    for label, value in (('Production (t)', f"{t['production_t']:,.0f}"),
+                         ('Emissions (tCO2)', f"{t['emissions_t']:,.0f}"),
+                         ('Intensity (kg CO2/t)', f"{t['intensity_kg_t']:,.1f}")):
+        pdf.cell(60, 7, label, border=1)
+        pdf.cell(50, 7, value, border=1, align='R', new_x='LMARGIN', new_y='NEXT')
+    for title, frame, columns in (
+        ('By route', report.routes, ['route']),
+        ('By furnace', report.furnaces, ['route', 'furnace']),
+    ):
+        pdf.ln(6)
+        pdf.set_font('Helvetica', 'B', 11)
+        pdf.cell(0, 8, title, new_x='LMARGIN', new_y='NEXT')
+        pdf.set_font('Helvetica', size=9)
+        headers = columns + ['Production (t)', 'Emissions (tCO2)', 'kg CO2/t']
+        widths = [30] * len(columns) + [40, 40, 30]
+        if 'furnace' in columns:
+            widths[1] = 40
+        for header, width in zip(headers, widths):
+            pdf.cell(width, 7, header.title() if header in columns else header, border=1)
+        pdf.ln()
+        for row in frame.itertuples():
+            cells = [str(getattr(row, c)) for c in columns] + [
+                f"{row.production_t:,.0f}", f"{row.emissions_t:,.0f}", f"{row.intensity_kg_t:,.1f}"]
+            for value, width, header in zip(cells, widths, headers):
+                pdf.cell(width, 6, value, border=1, align='L' if header in columns else 'R')
+            pdf.ln()
+    return bytes(pdf.output())
+
+
+EXPORTS = {
+    'csv': (to_csv, 'text/csv'),
+    'xlsx': (to_xlsx, 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'),
+    'pdf': (to_pdf, 'application/pdf'),
+}
+
+
+# =============================================================================
+# JOBS
+# =============================================================================
+
+class Job:
+
+    def __init__(self, kind, period):
+        self.id = uuid.uuid4().hex[:12]
+        self.kind = kind
+        self.period = period
+        self.status = 'queued'          # queued, running, done, failed
+        self.done = 0
+        self.total = 0
+        self.report = None
+        self.error = None
+        self._exports = {}
+        self.submitted = time.time()
+        self.finished = None
+
+    @property
+    def pending(self):
+        return self.status in ('queued', 'running')
+
+    @property
+    def progress(self):
+        return self.done / self.total if self.total else 0.0
+
+    def export(self, fmt):
+        """Bytes of the finished report in ``fmt`` (a key of ``EXPORTS``), built once."""
+        if fmt not in self._exports:
+            self._exports[fmt] = EXPORTS[fmt][0](self.report)
+        return self._exports[fmt]
+
+
+class ReportJobs:
+    """Local background queue of report builds over one ``DailyAggregates``."""
+
+    def __init__(self, aggregates, workers=WORKERS, max_jobs=MAX_JOBS):
+        self.aggregates = aggregates
+        self.max_jobs = max_jobs
+        self._jobs = {}
+        self._lock = threading.Lock()
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='kets-report')
+
+    def submit(self, kind, period):
+        """Queue a build of ``period``; returns the pending ``Job`` for it if there is one."""
+        period_days(kind, period)
+        with self._lock:
+            for job in self._jobs.values():
+                if job.pending and (job.kind, job.period) == (kind, period):
+                    return job
+            job = Job(kind, period)
+            self._jobs[job.id] = job
+            finished = [j for j in self._jobs.values() if not j.pending]
+            for old in sorted(finished, key=lambda j: j.submitted)[:max(0, len(self._jobs) - self.max_jobs)]:
+                del self._jobs[old.id]
+        self._pool.submit(self._run, job)
+        return job
+
+    def get(self, job_id):
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def _run(self, job):
+        job.status = 'running'
+
+        def progress(done, total):
+            job.done, job.total = done, total
+
+        try:
+            job.report = build(self.aggregates, job.kind, job.period, progress)
+            job.status = 'done'
+        except Exception as e:  # surfaced on the job, the pool thread carries on
+            job.error = f"{type(e).__name__}: {e}"
+            job.status = 'failed'
+        job.finished = time.time()
+
+    def close(self):
+        self._pool.shutdown(wait=True)
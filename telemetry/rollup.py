@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+"""
+Rollup pyramid: min / mean / max of a few series at fixed resolutions.
+
+Each level (1 s, 1 min, 15 min, 1 h, 1 day) is a preallocated ring of
+buckets holding, per series, the minimum, maximum, sum and count of the
+readings that fell in it. ``extend`` folds a batch of readings into every
+level at once (``np.*.reduceat`` over the batch's bucket runs), merging
+into the newest open bucket, so the pyramid is maintained on ingest and a
+query never touches raw readings.
+
+``query`` answers a time range from the finest level that covers it in at
+most ``max_points`` buckets, so a chart over an hour and one over a year
+cost about the same.
+
+Timestamps must not go backwards between batches: readings older than a
+level's newest bucket are dropped from that level.
+"""
+
+import threading
+from collections import namedtuple
+
+import numpy as np
+
+LEVELS = (1, 60, 900, 3600, 86400)
+# Span kept per level: 1 h of seconds, 7 days of minutes, 90 days of
+# quarter-hours, a year of hours, ten years of days.
+CAPACITY = {1: 3600, 60: 7 * 1440, 900: 90 * 96, 3600: 366 * 24, 86400: 3660}
+MAX_POINTS = 2400
+
+Window = namedtuple('Window', ['seconds', 'ts', 'min', 'mean', 'max', 'count'])
+
+
+class _Level:
+
+    def __init__(self, seconds, capacity, n_series):
+        self.seconds = seconds
+        self.capacity = capacity
+        self.bucket = np.full(capacity, -1, dtype=np.int64)
+        self.min = np.zeros((n_series, capacity))
+        self.max = np.zeros((n_series, capacity))
+        self.sum = np.zeros((n_series, capacity))
+        self.count = np.zeros(capacity, dtype=np.int64)
+        self.head = -1      # newest slot
+
+    @property
+    def nbytes(self):
+        return self.bucket.nbytes + self.min.nbytes + self.max.nbytes + self.sum.nbytes + self.count.nbytes
+
+    def extend(self, ts, values):
+        bucket = (ts // self.seconds).astype(np.int64)
+        newest = self.bucket[self.head] if self.head >= 0 else -1
+        if bucket[0] < newest:
+            keep = bucket >= newest
+            bucket, values = bucket[keep], values[keep]
+            if not len(bucket):
+                return
+        starts = np.flatnonzero(np.r_[True, bucket[1:] != bucket[:-1]])
+        buckets = bucket[starts]
+        lo = np.minimum.reduceat(values, starts).T
+        hi = np.maximum.reduceat(values, starts).T
+        total = np.add.reduceat(values, starts).T
+        count = np.diff(np.r_[starts, len(bucket)])
+
+        if buckets[0] == newest:
+            h = self.head
+            np.minimum(self.min[:, h], lo[:, 0], out=self.min[:, h])
+            np.maximum(self.max[:, h], hi[:, 0], out=self.max[:, h])
+            self.sum[:, h] += total[:, 0]
+            self.count[h] += count[0]
+            buckets, lo, hi, total, count = buckets[1:], lo[:, 1:], hi[:, 1:], total[:, 1:], count[1:]
+        if not len(buckets):
+            return
+        if len(buckets) > self.capacity:
+            buckets, lo, hi, total, count = (buckets[-self.capacity:], lo[:, -self.capacity:], hi[:, -self.capacity:],
+                                             total[:, -self.capacity:], count[-self.capacity:])
+        slots = (self.head + 1 + np.arange(len(buckets))) % self.capacity
+        self.bucket[slots] = buckets
+        self.min[:, slots] = lo
+        self.max[:, slots] = hi
+        self.sum[:, slots] = total
+        self.count[slots] = count
+        self.head = int(slots[-1])
+
+    def window(self, start, end):
+        first, last = start // self.seconds, -(-end // self.seconds)
+        slots = np.flatnonzero((self.bucket >= first) & (self.bucket < last))
+        slots = slots[np.argsort(self.bucket[slots], kind='stable')]
+        count = self.count[slots]
+        return Window(self.seconds, self.bucket[slots] * float(self.seconds), self.min[:, slots],
+                      self.sum[:, slots] / count, self.max[:, slots], count)
+
+
+class Rollup:
+
+    def __init__(self, series, levels=LEVELS, capacity=None):
+        self.series = tuple(series)
+        capacity = capacity or CAPACITY
+        self._levels = {s: _Level(s, capacity[s], len(self.series)) for s in levels}
+        self._lock = threading.Lock()
+
+    @property
+    def levels(self):
+        return tuple(self._levels)
+
+    @property
+    def nbytes(self):
+        return sum(level.nbytes for level in self._levels.values())
+
+    def series_index(self, name):
+        return self.series.index(name)
+
+    def extend(self, ts, values):
+        """Fold readings into every level: ``ts`` shape (n,), ``values`` shape (n, series)."""
+        ts = np.asarray(ts, dtype=np.float64)
+        if not len(ts):
+            return
+        values = np.asarray(values, dtype=np.float64).reshape(len(ts), len(self.series))
+        with self._lock:
+            for level in self._levels.values():
+                level.extend(ts, values)
+
+    def level_for(self, start, end, max_points=MAX_POINTS):
+        """Finest level whose ring spans ``[start, end)`` in at most ``max_points`` buckets."""
+        span = end - start
+        for seconds, level in self._levels.items():
+            if span / seconds <= max_points and level.capacity * seconds >= span:
+                return seconds
+        return self.levels[-1]
+
+    def window(self, seconds, start, end):
+        """Buckets of one level overlapping ``[start, end)``, oldest first.
+
+        Returns a ``Window``; ``min``/``mean``/``max`` are shaped (series, buckets).
+        """
+        level = self._levels[seconds]
+        with self._lock:
+            return level.window(start, end)
+
+    def query(self, start, end, max_points=MAX_POINTS):
+        """``window`` at ``level_for(start, end, max_points)``."""
+        return self.window(self.level_for(start, end, max_points), start, end)
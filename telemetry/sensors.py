@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+"""
+Edge sensor catalogue.
+
+Every sensor reports the same channels so the store can keep one ring per
+(sensor, channel). Steelmaking sensors start with the nine blast furnaces and
+the two EAF shops that feed the Live Monitoring page; the remaining sensors
+of each division are auxiliary process meters.
+"""
+
+from collections import namedtuple
+
+CHANNELS = ('output_t_day', 'temp_c', 'co2_kg_t', 'efficiency_pct', 'scrap_pct')
+
+BLAST_FURNACES = [
+    "BF-1 Pohang", "BF-2 Pohang", "BF-3 Pohang", "BF-4 Pohang", "BF-1 Gwangyang",
+    "BF-2 Gwangyang", "BF-3 Gwangyang", "BF-4 Gwangyang", "BF-5 Gwangyang",
+]
+ELECTRIC_ARC_FURNACES = ["EAF-1 Pohang", "EAF-1 Gwangyang"]
+FURNACES = BLAST_FURNACES + ELECTRIC_ARC_FURNACES
+
+# (mean, noise sd) per channel, in CHANNELS order. BF-BOF 38 Mt + EAF 4 Mt
+# gives ~42,000 t/day at an output-weighted ~1,857 kg CO₂/t and ~20% scrap.
+PROFILES = {
+    'bf': ((4222, 60), (1500, 8), (1984, 15), (92.5, 0.8), (12, 0.5)),
+    'eaf': ((2000, 40), (1620, 10), (650, 10), (94.0, 0.6), (100, 0)),
+    'aux': ((1000, 25), (350, 5), (200, 5), (90.0, 1.0), (0, 0)),
+}
+
+Sensor = namedtuple('Sensor', ['id', 'name', 'division', 'kind'])
+
+
+def build_catalogue(division_sensors):
+    """Build the sensor list from ``{division: sensor_count}``.
+
+    Order is stable, so a sensor's index is its row in the ring store.
+    """
+    sensors = []
+    for division, count in division_sensors.items():
+        named = []
+        if division == 'steelmaking':
+            named = [(n, 'bf') for n in BLAST_FURNACES] + [(n, 'eaf') for n in ELECTRIC_ARC_FURNACES]
+        for i in range(count):
+            name, kind = named[i] if i < len(named) else (f"{division.title()} #{i + 1}", 'aux')
+            sensors.append(Sensor(f"{division[:3].upper()}-{i + 1:02d}", name, division, kind))
+    return sensors
@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+"""
+Replayable stand-in for the edge sensors.
+
+``SensorSimulator`` produces frames of shape (sensors, channels) from a
+seeded mean-reverting AR(1) process per ring, with occasional maintenance
+stops on the blast furnaces and EAFs. The same seed always yields the same
+sequence, and ``record`` / ``Replay`` capture and play back a run from an
+``.npz`` file, so a demo or a benchmark can be reproduced exactly.
+"""
+
+import numpy as np
+
+from telemetry.sensors import CHANNELS, PROFILES
+
+PHI = 0.95                 # AR(1) persistence per tick
+MAINTENANCE_P = 0.0005     # chance per tick that a furnace starts a stop
+MAINTENANCE_TICKS = (30, 180)
+
+# Multipliers applied to (output, temp, co2, efficiency, scrap) during a stop.
+MAINTENANCE_FACTOR = np.array([0.15, 0.9, 1.0, 0.85, 1.0])
+
+
+class SensorSimulator:
+
+    def __init__(self, sensors, seed=0, channels=CHANNELS):
+        self.sensors = list(sensors)
+        self.channels = tuple(channels)
+        self.seed = seed
+        profile = np.array([PROFILES[s.kind] for s in self.sensors], dtype=np.float64)
+        self.mean = profile[..., 0]
+        self.sd = profile[..., 1]
+        self.furnace = np.array([s.kind in ('bf', 'eaf') for s in self.sensors])
+        self.reset()
+
+    def reset(self):
+        """Rewind to the first frame for this seed."""
+        self._rng = np.random.default_rng(self.seed)
+        self._state = self.mean.copy()
+        self._stop_left = np.zeros(len(self.sensors), dtype=np.int64)
+
+    def next_frame(self, ts=None):
+        """The next frame (``ts``, the feed's timestamp for it, does not change a simulated one)."""
+        rng = self._rng
+        noise = rng.standard_normal(self._state.shape) * self.sd * np.sqrt(1 - PHI ** 2)
+        self._state = self.mean + PHI * (self._state - self.mean) + noise
+
+        starting = self.furnace & (self._stop_left == 0) & (rng.random(len(self.sensors)) < MAINTENANCE_P)
+        self._stop_left[starting] = rng.integers(*MAINTENANCE_TICKS, size=int(starting.sum()))
+        frame = self._state.copy()
+        stopped = self._stop_left > 0
+        frame[stopped] *= MAINTENANCE_FACTOR
+        self._stop_left[stopped] -= 1
+        return frame
+
+    def next_frames(self, n):
+        return np.stack([self.next_frame() for _ in range(n)]) if n else np.zeros((0,) + self.mean.shape)
+
+
+def record(source, n, path):
+    """Capture ``n`` frames from ``source`` to an ``.npz`` file."""
+    np.savez_compressed(path, frames=source.next_frames(n))
+
+
+class Replay:
+    """Play back frames captured with ``record``, looping at the end."""
+
+    def __init__(self, path):
+        self.frames = np.load(path)['frames']
+        self._pos = 0
+
+    def reset(self):
+        self._pos = 0
+
+    def next_frame(self, ts=None):
+        frame = self.frames[self._pos]
+        self._pos = (self._pos + 1) % len(self.frames)
+        return frame
+
+    def next_frames(self, n):
+        idx = (self._pos + np.arange(n)) % len(self.frames)
+        self._pos = (self._pos + n) % len(self.frames)
+        return self.frames[idx]
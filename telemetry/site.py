@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+"""
+Site-level views over the ring store for the Live Monitoring page.
+
+Production, CO₂ intensity and scrap rate are computed over the blast
+furnaces and EAF shops only; intensity and scrap are output-weighted.
+Gauges and the furnace table read the latest frame from the ring store;
+the trend charts read ``SiteRollup`` and furnace statuses and alerts come
+from ``SiteMonitor``, both of which the feed keeps up to date.
+"""
+
+import numpy as np
+
+from telemetry.anomaly import Detectors
+from telemetry.rollup import Rollup
+from telemetry.sensors import PROFILES
+
+# Free K-ETS allocation per tonne; compliance = allocation / actual intensity.
+K_ETS_ALLOCATION_KG_T = 1792
+SITE_SERIES = ('bf_bof', 'eaf', 'intensity')
+STOP_RATIO = 0.5            # output below this share of the profile mean is a maintenance stop
+DRIFT_CHANNELS = ('temp_c', 'co2_kg_t')
+
+
+def _rows_of(sensors, kinds):
+    return np.array([i for i, s in enumerate(sensors) if s.kind in kinds], dtype=np.int64)
+
+
+def _rows(store, kinds):
+    return _rows_of(store.sensors, kinds)
+
+
+def _weighted(output, values):
+    total = output.sum(axis=0)
+    return np.divide((output * values).sum(axis=0), total, out=np.zeros_like(total), where=total > 0)
+
+
+def gauges(store):
+    """Latest production (t/day), CO₂ intensity (kg/t), scrap (%) and K-ETS compliance (%)."""
+    _, latest = store.latest()
+    rows = _rows(store, ('bf', 'eaf'))
+    ch = store.channel_index
+    output = latest[rows, ch('output_t_day')]
+    intensity = float(_weighted(output, latest[rows, ch('co2_kg_t')]))
+    return {
+        'production': float(output.sum()),
+        'intensity': intensity,
+        'scrap': float(_weighted(output, latest[rows, ch('scrap_pct')])),
+        'compliance': min(100.0, K_ETS_ALLOCATION_KG_T / intensity * 100) if intensity else 0.0,
+    }
+
+
+def furnaces(store, monitor=None):
+    """Latest reading per blast furnace, with a status.
+
+    Status is ``maintenance`` while output is below ``STOP_RATIO`` of its
+    profile mean; otherwise, with a ``monitor``, ``drift`` if temperature or
+    CO₂ intensity drifted and ``anomaly`` if any other detector signalled
+    within its hold time; else ``running``.
+    """
+    ts, latest = store.latest()
+    ch = store.channel_index
+    baseline = PROFILES['bf'][0][0]
+    active = monitor.active(float(ts.max())) if monitor is not None else None
+    drift = [ch(c) for c in DRIFT_CHANNELS]
+    rows = []
+    for i in _rows(store, ('bf',)):
+        output = latest[i, ch('output_t_day')]
+        if output < baseline * STOP_RATIO:
+            status = 'maintenance'
+        elif active is not None and active[i, drift, 1:3].any():
+            status = 'drift'
+        elif active is not None and active[i].any():
+            status = 'anomaly'
+        else:
+            status = 'running'
+        rows.append({
+            'name': store.sensors[i].name,
+            'output': output,
+            'temp': latest[i, ch('temp_c')],
+            'co2': latest[i, ch('co2_kg_t')],
+            'efficiency': latest[i, ch('efficiency_pct')],
+            'running': status != 'maintenance',
+            'status': status,
+        })
+    return rows
+
+
+class SiteRollup(Rollup):
+    """Rollup pyramid of the site series, fed with full sensor frames.
+
+    Series are BF-BOF and EAF production (t/day, summed over the furnaces)
+    and output-weighted CO₂ intensity (kg/t), one value per frame.
+    """
+
+    def __init__(self, sensors, channels, **kwargs):
+        super().__init__(SITE_SERIES, **kwargs)
+        self._bf = _rows_of(sensors, ('bf',))
+        self._eaf = _rows_of(sensors, ('eaf',))
+        self._output = channels.index('output_t_day')
+        self._co2 = channels.index('co2_kg_t')
+
+    def extend_frames(self, ts, frames):
+        """Fold frames shaped (n, sensors, channels) into the pyramid."""
+        frames = np.asarray(frames)
+        rows = np.r_[self._bf, self._eaf]
+        output = frames[:, rows, self._output].T
+        self.extend(ts, np.column_stack([
+            output[:len(self._bf)].sum(axis=0),
+            output[len(self._bf):].sum(axis=0),
+            _weighted(output, frames[:, rows, self._co2].T),
+        ]))
+
+
+class SiteMonitor(Detectors):
+    """Anomaly detectors over every sensor channel, fed with full sensor frames.
+
+    Furnaces on a maintenance stop are skipped. A backfill longer than
+    ``warmup + REPLAY_TAIL`` frames only replays its tail: enough to learn
+    the baselines without paying for a day of history at startup.
+    """
+
+    REPLAY_TAIL = 360
+
+    def __init__(self, sensors, channels, **kwargs):
+        super().__init__(sensors, channels, **kwargs)
+        self._furnace = np.array([s.kind in ('bf', 'eaf') for s in self.sensors])
+        self._stop_level = np.array([PROFILES[s.kind][0][0] * STOP_RATIO for s in self.sensors])
+        self._output = self.channels.index('output_t_day')
+
+    def extend_frames(self, ts, frames):
+        """Observe frames shaped (n, sensors, channels)."""
+        frames = np.asarray(frames)
+        tail = self.warmup + self.REPLAY_TAIL
+        if len(frames) > tail:
+            ts, frames = ts[-tail:], frames[-tail:]
+        skip = self._furnace & (frames[..., self._output] < self._stop_level)
+        self.observe_frames(ts, frames, skip)
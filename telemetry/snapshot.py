@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+"""
+Process-wide live snapshots shared by every viewer of the Live Monitoring
+page.
+
+The feed calls ``SnapshotProducer.publish`` once per frame, after the store,
+rollup and detectors have taken it. ``publish`` computes everything the page
+shows that does not depend on the viewer (gauges, furnace rows and
+statuses, recent alerts, signature and proof-pack counters with the
+period's signed root, and the rollup window of every trend range) into one ``Snapshot``, and swaps it in as
+``latest``. Sessions only read ``latest()``: N viewers cost one computation
+per tick, and all of them see the same numbers under the same ``version``.
+
+Snapshots are immutable. Rows are read-only mappings, arrays are flagged
+read-only, and a published snapshot is never modified: the next tick builds
+a new one and replaces the reference, a single assignment. A session keeps
+the snapshot it read for the whole rerun, so a tick landing mid-rerun never
+mixes two frames.
+
+``report`` records the feed's ``telemetry.feed.FeedStatus``; each snapshot
+carries the latest one. A failed tick publishes no new snapshot, so
+``report`` also swaps in a copy of the latest with the new status under the
+same ``version``: the data are unchanged, only the page's stale banner is.
+"""
+
+import threading
+import time
+from collections import namedtuple
+from types import MappingProxyType
+
+from telemetry import site
+
+ALERT_ROWS = 8
+ALERT_WINDOW_S = 3600
+
+Snapshot = namedtuple('Snapshot', [
+    'version', 'ts', 'gauges', 'furnaces', 'alerts', 'alerts_last_hour',
+    'verified', 'quarantined', 'proof', 'trends', 'feed',
+])
+ProofStatus = namedtuple('ProofStatus', ['period', 'size', 'root', 'sealed'])
+
+
+def _frozen(window):
+    for array in window[1:]:
+        array.flags.writeable = False
+    return window
+
+
+class SnapshotProducer:
+    """Builds the live ``Snapshot`` of ``store`` and its sinks; ``ranges`` are trend spans in seconds.
+
+    With ``proofs`` and an Ed25519 ``signer``, each snapshot carries the
+    current period's root sealed once for every viewer's export button.
+    """
+
+    def __init__(self, store, rollup, monitor=None, verifier=None, proofs=None, signer=None, ranges=(),
+                 alert_rows=ALERT_ROWS):
+        self.store = store
+        self.rollup = rollup
+        self.monitor = monitor
+        self.verifier = verifier
+        self.proofs = proofs
+        self.signer = signer
+        self.ranges = tuple(ranges)
+        self.alert_rows = alert_rows
+        self.builds = 0
+        self.build_s = 0.0
+        self.feed = None
+        self._latest = None
+        self._lock = threading.Lock()
+
+    def publish(self, now=None):
+        """Compute and publish the snapshot of the current store state; returns it."""
+        with self._lock:
+            start = time.thread_time()
+            now = time.time() if now is None else float(now)
+            alerts = self.monitor.recent() if self.monitor is not None else []
+            proof = None
+            if self.proofs is not None:
+                pack = self.proofs.pack_of(now)
+                sealed = pack.export(self.signer) if self.signer is not None else None
+                proof = ProofStatus(pack.period, pack.size, pack.root().hex(), sealed)
+            snapshot = Snapshot(
+                version=self.builds + 1,
+                ts=now,
+                gauges=MappingProxyType(site.gauges(self.store)),
+                furnaces=tuple(MappingProxyType(row) for row in site.furnaces(self.store, self.monitor)),
+                alerts=tuple(alerts[:self.alert_rows]),
+                alerts_last_hour=sum(a.ts > now - ALERT_WINDOW_S for a in alerts),
+                verified=self.verifier.verified if self.verifier is not None else 0,
+                quarantined=len(self.verifier.quarantine) if self.verifier is not None else 0,
+                proof=proof,
+                trends=MappingProxyType({span: _frozen(self.rollup.query(now - span, now + 1))
+                                         for span in self.ranges}),
+                feed=self.feed,
+            )
+            self._latest = snapshot
+            self.builds += 1
+            self.build_s += time.thread_time() - start
+            return snapshot
+
+    def report(self, status):
+        """Record the feed's ``FeedStatus``, in the latest snapshot too."""
+        with self._lock:
+            self.feed = status
+            if self._latest is not None:
+                self._latest = self._latest._replace(feed=status)
+
+    def latest(self):
+        """The newest published snapshot, publishing a first one if the feed has not yet."""
+        snapshot = self._latest
+        return snapshot if snapshot is not None else self.publish()
@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+"""
+Bounded ring-buffer time-series store.
+
+One preallocated ring per (sensor, channel), held as two 3-D arrays of shape
+``(n_sensors, n_channels, capacity)``: timestamps (float64 epoch seconds) and
+values. Memory is fixed at construction; old readings are overwritten.
+
+A single writer (the ingestion feed) and any number of readers (Streamlit
+sessions) share one instance. Reads return copies, so callers never see a
+ring being overwritten underneath them.
+"""
+
+import threading
+
+import numpy as np
+
+
+class RingStore:
+
+    def __init__(self, sensors, channels, capacity, dtype=np.float32):
+        self.sensors = list(sensors)
+        self.channels = tuple(channels)
+        self.capacity = int(capacity)
+        self.shape = (len(self.sensors), len(self.channels))
+        self._sensor_index = {s.id: i for i, s in enumerate(self.sensors)}
+        self._ts = np.zeros(self.shape + (self.capacity,), dtype=np.float64)
+        self._values = np.zeros(self.shape + (self.capacity,), dtype=dtype)
+        self._head = np.zeros(self.shape, dtype=np.int64)   # next slot to write
+        self._count = np.zeros(self.shape, dtype=np.int64)  # filled slots
+        self._lock = threading.Lock()
+
+    @classmethod
+    def for_budget(cls, sensors, channels, max_bytes, dtype=np.float32):
+        """Largest store whose ring arrays fit in ``max_bytes``."""
+        per_slot = len(sensors) * len(channels) * (8 + np.dtype(dtype).itemsize)
+        return cls(sensors, channels, max(1, max_bytes // per_slot), dtype)
+
+    @property
+    def nbytes(self):
+        return self._ts.nbytes + self._values.nbytes + self._head.nbytes + self._count.nbytes
+
+    def sensor_index(self, sensor_id):
+        return self._sensor_index[sensor_id]
+
+    def channel_index(self, channel):
+        return self.channels.index(channel)
+
+    # -------------------------------------------------------------------------
+    # Writes
+    # -------------------------------------------------------------------------
+
+    def append_frame(self, ts, values):
+        """Append one reading to every ring; ``values`` has shape (sensors, channels)."""
+        self.extend_frames(np.asarray([ts], dtype=np.float64), np.asarray(values)[None])
+
+    def extend_frames(self, ts, values):
+        """Append ``n`` full frames: ``ts`` shape (n,), ``values`` shape (n, sensors, channels)."""
+        n = len(ts)
+        if n > self.capacity:
+            ts, values, n = ts[-self.capacity:], values[-self.capacity:], self.capacity
+        s, c = np.indices(self.shape)
+        with self._lock:
+            slots = (self._head[..., None] + np.arange(n)) % self.capacity
+            self._ts[s[..., None], c[..., None], slots] = ts
+            self._values[s[..., None], c[..., None], slots] = np.moveaxis(values, 0, -1)
+            self._head += n
+            self._head %= self.capacity
+            np.minimum(self._count + n, self.capacity, out=self._count)
+
+    def append(self, sensor_idx, channel_idx, ts, values):
+        """Append a batch of individual readings in arrival order.
+
+        All arguments are equal-length 1-D arrays. Readings for the same ring
+        keep their relative order; only the newest ``capacity`` per ring are
+        written.
+        """
+        sensor_idx = np.asarray(sensor_idx, dtype=np.int64)
+        channel_idx = np.asarray(channel_idx, dtype=np.int64)
+        ring = sensor_idx * self.shape[1] + channel_idx
+        order = np.argsort(ring, kind='stable')
+        ring = ring[order]
+        counts = np.bincount(ring, minlength=self.shape[0] * self.shape[1])
+        starts = np.cumsum(counts) - counts
+        rank = np.arange(len(ring)) - starts[ring]
+        keep = rank >= counts[ring] - self.capacity
+        ring, rank, order = ring[keep], rank[keep], order[keep]
+
+        with self._lock:
+            head = self._head.reshape(-1)
+            slots = (head[ring] + rank) % self.capacity
+            s, c = np.divmod(ring, self.shape[1])
+            self._ts[s, c, slots] = np.asarray(ts, dtype=np.float64)[order]
+            self._values[s, c, slots] = np.asarray(values)[order]
+            head[:] = (head + counts) % self.capacity
+            count = self._count.reshape(-1)
+            np.minimum(count + counts, self.capacity, out=count)
+
+    # -------------------------------------------------------------------------
+    # Reads
+    # -------------------------------------------------------------------------
+
+    def latest(self):
+        """Newest (ts, values) per ring, each of shape (sensors, channels)."""
+        with self._lock:
+            last = (self._head - 1) % self.capacity
+            s, c = np.indices(self.shape)
+            return self._ts[s, c, last], self._values[s, c, last].astype(np.float64)
+
+    def tail(self, channel, sensors=None, n=None):
+        """Last ``n`` readings of ``channel`` for ``sensors``, oldest first.
+
+        Returns ``(ts, values)`` of shape (len(sensors), n). ``n`` is clipped
+        to the shortest ring among the selected sensors.
+        """
+        c = self.channel_index(channel)
+        rows = np.arange(self.shape[0]) if sensors is None else np.asarray(sensors)
+        with self._lock:
+            filled = int(self._count[rows, c].min())
+            n = filled if n is None else min(n, filled)
+            slots = (self._head[rows, c][:, None] - n + np.arange(n)) % self.capacity
+            ts = self._ts[rows[:, None], c, slots]
+            values = self._values[rows[:, None], c, slots].astype(np.float64)
+        return ts, values
+
+    def since(self, channel, sensors, t0):
+        """Readings of ``channel`` newer than epoch ``t0``, oldest first.
+
+        The cut is taken on the first sensor's timestamps, so the selected
+        sensors must be written in lockstep (``extend_frames``).
+        """
+        ts, values = self.tail(channel, sensors)
+        keep = ts[0] > t0 if len(ts) else np.zeros(0, dtype=bool)
+        return ts[:, keep], values[:, keep]
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Bundled web font: woff2 subsets of Noto Sans CJK Regular for the characters
+the dashboard draws, served from ``static/fonts/``.
+
+    python tools/subset_fonts.py path/to/NotoSansCJKkr-Regular.otf
+
+Any regional cut of Noto Sans CJK serves: their Hangul and Latin glyphs are
+the same as Noto Sans KR's, they differ only in Han characters, which the
+dashboard does not use. Two files are written, split by ``unicode-range``
+so a session in English never downloads the Hangul one:
+
+* Latin: ASCII, Latin-1 and the punctuation and symbols of the UI text;
+* Hangul: every syllable and jamo in the pages, locales and data.
+
+The generated ``@font-face`` block of ``static/css/posco.css`` is rewritten
+with their ``?v=<content hash>`` URLs, which ``asgi.py`` serves as
+immutable. Rerun after adding Korean text; ``--check`` only lists the
+characters the bundled subsets lack (drawn with the next font in the
+stack). Needs ``fonttools`` and ``brotli``.
+"""
+
+import argparse
+import hashlib
+import re
+import sys
+from pathlib import Path
+
+from fontTools import subset
+from fontTools.ttLib import TTFont
+
+ROOT = Path(__file__).resolve().parent.parent
+FONTS = ROOT / 'static' / 'fonts'
+STYLESHEET = ROOT / 'static' / 'css' / 'posco.css'
+SOURCES = ('app_posco_v2.py', 'core', 'ui', 'views')
+FAMILY = 'Noto Sans KR Subset'
+BEGIN = '/* @font-face: generated by tools/subset_fonts.py */'
+END = '/* end @font-face */'
+LATIN = set(range(0x20, 0x7F)) | set(range(0xA0, 0x100))
+HANGUL = ((0x1100, 0x11FF), (0x3130, 0x318F), (0xAC00, 0xD7A3))     # jamo, compatibility jamo, syllables
+
+
+def is_hangul(cp):
+    return any(lo <= cp <= hi for lo, hi in HANGUL)
+
+
+def used():
+    """Code points in the dashboard's sources: pages, locales, data."""
+    cps = set()
+    for name in SOURCES:
+        path = ROOT / name
+        for f in ([path] if path.is_file() else sorted(path.rglob('*.py'))):
+            cps.update(map(ord, f.read_text(encoding='utf-8')))
+    return {cp for cp in cps if cp >= 0x20}
+
+
+def subsets(cmap):
+    """``{name: sorted code points}`` of each file, limited to what the font has."""
+    chars = used() | LATIN
+    hangul = sorted(cp for cp in chars if is_hangul(cp) and cp in cmap)
+    latin = sorted(cp for cp in chars if not is_hangul(cp) and cp in cmap and cp < 0x2E80)
+    return {'latin': latin, 'hangul': hangul}
+
+
+def unicode_range(cps):
+    """``U+`` ranges of sorted code points, consecutive ones collapsed."""
+    ranges, start = [], cps[0]
+    for prev, cp in zip(cps, cps[1:] + [None]):
+        if cp != prev + 1:
+            ranges.append(f"U+{start:X}" if start == prev else f"U+{start:X}-{prev:X}")
+            start = cp
+    return ', '.join(ranges)
+
+
+def build(source, cps, out):
+    options = subset.Options()
+    options.flavor = 'woff2'
+    options.hinting = False
+    options.desubroutinize = True
+    options.layout_features = ['kern', 'liga', 'locl', 'ccmp']
+    options.name_IDs = [0, 1, 2, 3, 4, 5, 6, 13, 14]
+    font = TTFont(source, recalcTimestamp=False)     # same bytes, same version, for the same source
+    subsetter = subset.Subsetter(options)
+    subsetter.populate(unicodes=cps)
+    subsetter.subset(font)
+    font.flavor = 'woff2'
+    font.save(out)
+    return hashlib.blake2b(out.read_bytes(), digest_size=6).hexdigest()
+
+
+def font_face(name, version, ranges):
+    return (f"@font-face {{\n"
+            f"    font-family: '{FAMILY}';\n"
+            f"    font-style: normal;\n"
+            f"    font-weight: 400;\n"
+            f"    font-display: swap;\n"
+            f"    src: url('../fonts/noto-sans-kr-{name}.woff2?v={version}') format('woff2');\n"
+            f"    unicode-range: {ranges};\n"
+            f"}}\n")
+
+
+def missing():
+    """Characters the sources use that no bundled subset has."""
+    have = set()
+    for f in FONTS.glob('*.woff2'):
+        have.update(TTFont(f).getBestCmap())
+    return sorted(cp for cp in used() if cp not in have and cp not in (0x0A, 0x0D))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('source', nargs='?', help='Noto Sans CJK Regular (.otf or .ttf)')
+    parser.add_argument('--check', action='store_true', help='only list characters the subsets lack')
+    args = parser.parse_args()
+
+    if not args.check:
+        if args.source is None:
+            parser.error('the Noto Sans CJK source font is required')
+        cmap = TTFont(args.source).getBestCmap()
+        FONTS.mkdir(parents=True, exist_ok=True)
+        faces = []
+        for name, cps in subsets(cmap).items():
+            out = FONTS / f"noto-sans-kr-{name}.woff2"
+            version = build(args.source, cps, out)
+            # The Hangul file claims its whole blocks: a syllable it lacks falls back glyph by glyph
+            ranges = ', '.join(f"U+{lo:X}-{hi:X}" for lo, hi in HANGUL) if name == 'hangul' else unicode_range(cps)
+            faces.append(font_face(name, version, ranges))
+            print(f"{out.relative_to(ROOT)}: {len(cps)} characters, {out.stat().st_size / 1024:.0f} KB")
+        css = STYLESHEET.read_text(encoding='utf-8')
+        block = f"{BEGIN}\n" + '\n'.join(faces) + END
+        css, n = re.subn(re.escape(BEGIN) + '.*?' + re.escape(END), lambda _: block, css, flags=re.S)
+        if n != 1:
+            sys.exit(f"{STYLESHEET.relative_to(ROOT)}: no generated @font-face block to replace")
+        STYLESHEET.write_text(css, encoding='utf-8')
+
+    gaps = [chr(cp) for cp in missing()]
+    drawn = [c for c in gaps if not (0x1F000 <= ord(c) or 0x2600 <= ord(c) <= 0x27BF or ord(c) == 0xFE0F)]
+    print(f"not in the subsets: {''.join(gaps)}")
+    print(f"of which text (not emoji): {''.join(drawn) or 'none'}")
+
+
+if __name__ == '__main__':
+    main()
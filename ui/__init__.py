@@ -0,0 +1 @@
+"""Streamlit-side helpers for the POSCO × Rekarbon MRV dashboard."""
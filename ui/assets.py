@@ -0,0 +1,224 @@
+# -*- coding: utf-8 -*-
+"""
+Static assets and pre-rendered HTML for the dashboard.
+
+The stylesheet lives in ``static/css/posco.css`` and is served by
+Streamlit's static file server (``server.enableStaticServing``), so each
+rerun only sends a short versioned ``<link>``. The browser revalidates it
+by ETag, or, when served through ``asgi.py``, caches it as immutable. If
+static serving is disabled the same file is inlined, as before. Its web
+font, woff2 subsets of Noto Sans CJK in ``static/fonts/`` (regenerated by
+``tools/subset_fonts.py``), is linked from it the same way, never from
+another host.
+
+The HTML blocks that never change within a language (sidebar logo and quick
+stats, page headers, MRV architecture, footer) are rendered once per
+language and memoised for the life of the process.
+"""
+
+import hashlib
+from functools import lru_cache
+from pathlib import Path
+
+import streamlit as st
+
+from core.credits import to_usd
+from ui.i18n import messages
+
+STATIC_DIR = Path(__file__).resolve().parent.parent / 'static'
+STYLESHEET = 'css/posco.css'
+
+# =============================================================================
+# STYLESHEET
+# =============================================================================
+
+
+@lru_cache(maxsize=None)
+def _read(name):
+    data = (STATIC_DIR / name).read_bytes()
+    return data.decode('utf-8'), hashlib.blake2b(data, digest_size=6).hexdigest()
+
+
+@lru_cache(maxsize=None)
+def stylesheet_html(static_serving):
+    css, version = _read(STYLESHEET)
+    if static_serving:
+        return f"<link rel='stylesheet' href='app/static/{STYLESHEET}?v={version}'>"
+    return f"<style>\n{css}</style>"
+
+
+def stylesheet():
+    """Link (or, without static serving, inline) the dashboard stylesheet."""
+    st.markdown(stylesheet_html(bool(st.get_option('server.enableStaticServing'))),
+                unsafe_allow_html=True)
+
+# =============================================================================
+# PRE-RENDERED HTML
+# =============================================================================
+
+
+@lru_cache(maxsize=None)
+def header(title, subtitle):
+    return f"""
+<div class='posco-header'>
+    <h1>{title}</h1>
+    <p class='subtitle'>{subtitle}</p>
+</div>
+"""
+
+
+@lru_cache(maxsize=None)
+def sidebar_logo(lang):
+    return f"""
+<div class='sidebar-logo'>
+    <div class='icon'>🏭</div>
+    <h2>{messages(lang).company}</h2>
+    <p>× Rekarbon MRV</p>
+</div>
+"""
+
+
+@lru_cache(maxsize=None)
+def sidebar_stats(lang):
+    m = messages(lang)
+    return f"""
+<div class='sidebar-stats'>
+    <p>
+        <strong>{m.founded}:</strong> 1968<br>
+        <strong>{m.revenue}:</strong> ₩73T<br>
+        <strong>{m.production}:</strong> 42 Mt<br>
+        <strong>{m.world_rank}:</strong> #6<br>
+        <strong>{m.sensors_stat}:</strong> 60 IoT
+    </p>
+</div>
+"""
+
+
+@lru_cache(maxsize=None)
+def mrv_architecture():
+    return """
+<div class='mrv-arch'>
+    <h3>Rekarbon MRV Platform Architecture</h3>
+    <div class='layers'>
+        <div class='layer edge'>
+            <div class='icon'>📡</div>
+            <h4>EDGE</h4>
+            <small>60 IoT Sensors<br>Raspberry Pi 5<br>Ed25519 Signatures</small>
+        </div>
+        <div class='layer rec'>
+            <div class='icon'>🔐</div>
+            <h4>DT-REC</h4>
+            <small>MRV Validation<br>Steel Intensity Calc<br>K-ETS Reporting</small>
+        </div>
+        <div class='layer seq'>
+            <div class='icon'>🔗</div>
+            <h4>DT-SEQ</h4>
+            <small>ERC-3643 Tokens<br>T-REX Compliant<br>Proof Packs</small>
+        </div>
+        <div class='layer market'>
+            <div class='icon'>💰</div>
+            <h4>MARKET</h4>
+            <small>K-ETS (KRX)<br>ResponsibleSteel<br>Green Premium</small>
+        </div>
+    </div>
+</div>
+"""
+
+
+@lru_cache(maxsize=None)
+def cerbere(lang):
+    m = messages(lang)
+    return f"""
+<div class='cerbere'>
+    <div class='layers'>
+        <div>
+            <div class='icon'>🔒</div>
+            <h4>Watchdog</h4>
+            <p>{m.intrusion_detection}</p>
+        </div>
+        <div>
+            <div class='icon'>🔐</div>
+            <h4>Nexus (SIEM)</h4>
+            <p>{m.event_correlation}</p>
+        </div>
+        <div>
+            <div class='icon'>👻</div>
+            <h4>Ghost</h4>
+            <p>{m.honeypots}</p>
+        </div>
+    </div>
+</div>
+"""
+
+
+@lru_cache(maxsize=None)
+def footer(lang, total):
+    """``(banner, cert, carbon, roi, contact)`` HTML for the page footer."""
+    m = messages(lang)
+    year = m.year
+    banner = f"""
+<div class='rk-footer'>
+    <h2>{m.company_full} × Rekarbon</h2>
+    <div class='total'>₩{total/1e12:.1f}T / {year}</div>
+    <p>${to_usd(total)/1e9:.1f}B / {year} - {m.total_value}</p>
+</div>
+"""
+    cert = f"""
+<div class='rk-footer-card'>
+    <h4>{m.certifications}</h4>
+    <p>K-ETS • ResponsibleSteel<br>ISO 14064 • TCFD • CDP A-</p>
+</div>
+"""
+    carbon = f"""
+<div class='rk-footer-card'>
+    <h4>🇰🇷 {m.carbon_neutral_short}</h4>
+    <p>89.5% {m.alignment}<br>2050 Net-Zero</p>
+</div>
+"""
+    roi = f"""
+<div class='rk-footer-card'>
+    <h4>💰 ROI</h4>
+    <p>{m.payback}: 1 {m.days}<br>5Y ROI: 425,000%</p>
+</div>
+"""
+    contact = f"""
+<div class='rk-contact'>
+    <p><strong>Nicolas Bernot</strong> - {m.founder_ceo}</p>
+    <p class='mail'>📧 support@rekarbon.com | 🌐 www.rekarbon.com</p>
+    <p class='fine'>© 2026 Rekarbon SAS | Paris 🇫🇷 • La Réunion 🇷🇪</p>
+</div>
+"""
+    return banner, cert, carbon, roi, contact
+
+# =============================================================================
+# CACHE HEADERS
+# =============================================================================
+
+IMMUTABLE = b'public, max-age=31536000, immutable'
+
+
+class StaticCacheControl:
+    """ASGI middleware marking versioned ``app/static`` responses immutable.
+
+    Streamlit's static route sends an ETag but no ``Cache-Control``, so a
+    browser revalidates (and re-downloads) the stylesheet on every page
+    load. URLs carrying ``?v=<content hash>`` never change content, so they
+    can be cached for a year.
+    """
+
+    def __init__(self, app, prefix='/app/static/'):
+        self.app = app
+        self.prefix = prefix
+
+    async def __call__(self, scope, receive, send):
+        if (scope['type'] != 'http' or not scope['path'].startswith(self.prefix)
+                or not scope.get('query_string', b'').startswith(b'v=')):
+            return await self.app(scope, receive, send)
+
+        async def send_cached(message):
+            if message['type'] == 'http.response.start' and message['status'] == 200:
+                headers = [(k, v) for k, v in message.get('headers', []) if k.lower() != b'cache-control']
+                message = dict(message, headers=headers + [(b'cache-control', IMMUTABLE)])
+            await send(message)
+
+        await self.app(scope, receive, send_cached)
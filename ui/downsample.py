@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+"""
+Visual downsampling for trend charts.
+
+``lttb`` (Largest-Triangle-Three-Buckets) keeps the first and last points
+and, from each of ``n - 2`` equal buckets in between, the point forming the
+largest triangle with the previously kept point and the next bucket's
+average. Peaks and dips survive, so a line drawn through ``n`` points looks
+like the line through all of them as long as ``n`` is about the chart's
+pixel width.
+
+``trace`` applies it to one series, and reduces an optional min/max band
+over the same buckets, so extremes dropped from the line stay visible.
+Timestamps are sent as epoch milliseconds and values rounded, which keeps
+the Plotly spec of a chart to a few tens of KB whatever its time range.
+"""
+
+import numpy as np
+
+CHART_POINTS = 600          # points per trace: about a half-width chart's pixel width
+CHART_BUDGET = 3000         # points per chart, shared between its traces
+DECIMALS = 1
+
+
+def lttb(x, y, n):
+    """Indices of the ``n`` (at least 3) points of ``(x, y)`` that LTTB keeps, ascending.
+
+    Chart inputs are already bounded by the rollup level (a few thousand
+    points, two or three per bucket), where a plain loop over Python floats
+    is several times faster than NumPy calls per bucket.
+    """
+    size = len(x)
+    if n >= size:
+        return np.arange(size)
+    edges = ((np.arange(n - 1) * ((size - 2) / (n - 2))).astype(np.int64) + 1).tolist() + [size]
+    xs = np.asarray(x, dtype=np.float64).tolist()
+    ys = np.asarray(y, dtype=np.float64).tolist()
+    keep = [0]
+    a = 0
+    for i in range(n - 2):
+        lo, hi, nxt = edges[i], edges[i + 1], edges[i + 2]
+        cx = sum(xs[hi:nxt]) / (nxt - hi)
+        cy = sum(ys[hi:nxt]) / (nxt - hi)
+        ax, ay = xs[a], ys[a]
+        best, a = -1.0, lo
+        for j in range(lo, hi):
+            area = abs((ax - cx) * (ys[j] - ay) - (ax - xs[j]) * (cy - ay))
+            if area > best:
+                best, a = area, j
+        keep.append(a)
+    keep.append(size - 1)
+    return np.array(keep, dtype=np.int64)
+
+
+def points_per_trace(traces, budget=CHART_BUDGET, width=CHART_POINTS):
+    """Points each of ``traces`` traces may keep within a chart's budget."""
+    return max(3, min(width, budget // max(traces, 1)))
+
+
+def trace(ts, y, n=CHART_POINTS, low=None, high=None):
+    """Downsample one series for Plotly.
+
+    Returns ``(x_ms, y)``, or ``(x_ms, y, low, high)`` when a band is given,
+    with NaN points dropped. ``low``/``high`` are the min/max over each
+    kept point's run of input points.
+    """
+    ts, y = np.asarray(ts, dtype=np.float64), np.asarray(y, dtype=np.float64)
+    finite = np.isfinite(y)
+    if not finite.all():
+        ts, y = ts[finite], y[finite]
+        low = None if low is None else np.asarray(low)[finite]
+        high = None if high is None else np.asarray(high)[finite]
+    keep = lttb(ts, y, n)
+    x_ms = (ts[keep] * 1000).astype(np.int64)
+    y = np.round(y[keep], DECIMALS)
+    if low is None or not len(keep):
+        return (x_ms, y) if low is None else (x_ms, y, y, y)
+    # Runs start halfway between kept points, so each band value brackets its point.
+    bounds = np.r_[0, (keep[:-1] + keep[1:] + 1) // 2]
+    return (x_ms, y, np.round(np.minimum.reduceat(low, bounds), DECIMALS),
+            np.round(np.maximum.reduceat(high, bounds), DECIMALS))
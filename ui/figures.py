@@ -0,0 +1,189 @@
+# -*- coding: utf-8 -*-
+"""
+Process-wide cache of pre-serialised Plotly figures.
+
+Static figures (green-steel roadmap, route intensities, business
+projection) are built once per (page, figure id, language, data version)
+and kept as the JSON spec Streamlit sends to the browser. Entries are
+evicted least-recently-used once the cache exceeds its byte budget, and a
+new ``core.data.DATA_VERSION`` drops that language's stale entries.
+
+``plotly_chart`` hands the cached spec straight to Streamlit's Plotly
+element, skipping figure construction, validation and serialisation on
+every rerun. Concurrent misses on one key build it once: later callers wait
+for the first build instead of repeating it, which keeps a new live
+snapshot version from being serialised once per viewer.
+
+Figures redrawn on every interaction (``ui.reactive`` cells) skip the
+Plotly objects instead: ``frame`` serialises a layout once, ``trace`` one
+trace's properties, and ``compose`` joins them into the same spec.
+"""
+
+import json
+import re
+import threading
+import time
+from collections import OrderedDict
+
+import plotly.io as pio
+import streamlit as st
+
+from ui import profiling
+
+DEFAULT_MAX_BYTES = 8 * 1024 * 1024
+_NON_ASCII = re.compile(r'[^\x00-\x7f]')
+
+
+class FigureCache:
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()   # key -> (spec, height)
+        self._versions = {}             # language -> data version last seen
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._building = {}             # key -> Event set when its build finishes
+        self.hits = self.misses = self.evictions = self.invalidations = 0
+        self.build_s = 0.0
+
+    def sync(self, lang, version):
+        """Drop ``lang`` entries built from a different data version."""
+        with self._lock:
+            if self._versions.get(lang) == version:
+                return
+            self._versions[lang] = version
+            stale = [k for k in self._entries if k[2] == lang and k[3] != version]
+            for key in stale:
+                self._drop(key)
+            self.invalidations += len(stale)
+
+    def get(self, page, fig_id, lang, version, build):
+        """Cached ``(spec, height)`` for the key, building it with ``build()`` on a miss."""
+        key = (page, fig_id, lang, version)
+        while True:
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is not None:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return entry
+                building = self._building.get(key)
+                if building is None:
+                    building = self._building[key] = threading.Event()
+                    self.misses += 1
+                    break
+            # Another session is building this key; a failed or evicted build retries here.
+            building.wait()
+
+        try:
+            start = time.thread_time()
+            entry = serialise(build())
+            with self._lock:
+                self.build_s += time.thread_time() - start
+                self._entries[key] = entry
+                self._bytes += len(entry[0])
+                while self._bytes > self.max_bytes and len(self._entries) > 1:
+                    self._drop(next(iter(self._entries)))
+                    self.evictions += 1
+        finally:
+            with self._lock:
+                del self._building[key]
+            building.set()
+        return entry
+
+    def _drop(self, key):
+        spec, _ = self._entries.pop(key)
+        self._bytes -= len(spec)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'entries': len(self._entries),
+                'bytes': self._bytes,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'evictions': self.evictions,
+                'invalidations': self.invalidations,
+                'build_s': self.build_s,
+            }
+
+
+FIGURES = FigureCache()
+
+
+def serialise(fig):
+    """``(spec, height)`` of a figure, as the cache keeps it."""
+    return pio.to_json(fig, validate=False), fig.layout.height
+
+
+def frame(fig):
+    """``(layout, height)`` of a figure whose traces change: its layout serialised once, for ``compose``."""
+    return _ascii(pio.json.to_json_plotly(fig.layout.to_plotly_json())), fig.layout.height
+
+
+def trace(**props):
+    """One trace (``type`` and its properties, unvalidated) serialised for ``compose``."""
+    return _ascii(pio.json.to_json_plotly(props))
+
+
+def _ascii(spec):
+    # One ₩ in a title makes Python keep the whole string at 2 bytes per
+    # character; non-ASCII only occurs inside JSON strings, so escape it
+    if spec.isascii():
+        return spec
+    return _NON_ASCII.sub(lambda c: json.dumps(c.group())[1:-1], spec)
+
+
+def compose(frame, *traces):
+    """``serialise``d figure of a ``frame`` and ``trace``s, without building a Plotly figure."""
+    layout, height = frame
+    return f'{{"data":[{",".join(traces)}],"layout":{layout}}}', height
+
+
+def plotly_chart(page, fig_id, lang, version, build, cache=FIGURES):
+    """Render a cached figure full-width, building it only on a cache miss (every time with no ``cache``)."""
+    with profiling.span(f"figure:{page}/{fig_id}"):
+        _render(*(serialise(build()) if cache is None else cache.get(page, fig_id, lang, version, build)))
+
+
+def plotly_spec(page, fig_id, entry):
+    """Render a ``serialise``d figure kept elsewhere (e.g. by a ``ui.reactive`` cell) full-width."""
+    with profiling.span(f"figure:{page}/{fig_id}"):
+        _render(*entry)
+
+
+def _render(spec, height):
+    try:
+        _enqueue_spec(spec, height)
+    except (ImportError, AttributeError, TypeError):
+        # Streamlit internals moved: fall back to the public API.
+        st.plotly_chart(pio.from_json(spec, skip_invalid=True), use_container_width=True)
+
+
+def _enqueue_spec(spec, height):
+    """Mirror of ``st.plotly_chart(fig, use_container_width=True)`` for a ready spec."""
+    from streamlit.elements.lib.form_utils import current_form_id
+    from streamlit.elements.lib.layout_utils import LayoutConfig
+    from streamlit.elements.lib.utils import compute_and_register_element_id
+    from streamlit.proto.PlotlyChart_pb2 import PlotlyChart as PlotlyChartProto
+
+    dg = st._main
+    proto = PlotlyChartProto()
+    proto.theme = 'streamlit'
+    proto.form_id = current_form_id(dg)
+    proto.spec = spec
+    proto.config = '{}'
+    proto.id = compute_and_register_element_id(
+        'plotly_chart', user_key=None, key_as_main_identity=False, dg=dg,
+        plotly_spec=spec, plotly_config=proto.config, selection_mode=(),
+        is_selection_activated=False, theme=proto.theme, width='stretch', height='content', alt=None,
+    )
+    dg._enqueue('plotly_chart', proto, layout_config=LayoutConfig(width='stretch', height=height or 450))
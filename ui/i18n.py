@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+"""
+Session language and the compiled message catalogue.
+
+Messages live in ``ui/locales/<code>.py``; English is the reference and
+defines the keys. At import every locale is compiled into one ``Messages``
+namedtuple, a flat tuple whose fields are read by index, with untranslated
+keys falling back to English. A view resolves the catalogue once per rerun
+with ``m = messages()`` and reads labels as ``m.live``, ``m.year``, ...
+
+Adding a language (e.g. Japanese) is a new ``ui/locales/ja.py`` and an
+entry in ``LANGUAGES``; ``untranslated('ja')`` lists what is still in
+English.
+"""
+
+from collections import namedtuple
+from importlib import import_module
+
+import streamlit as st
+
+LANGUAGES = ('ko', 'en')    # sidebar order
+REFERENCE = 'en'
+
+
+def compile_catalogue(tables, reference=REFERENCE):
+    """``(Messages, {code: Messages})`` from ``{code: {key: text}}`` tables."""
+    keys = tuple(tables[reference])
+    for code, table in tables.items():
+        unknown = sorted(set(table) - set(keys))
+        if unknown:
+            raise ValueError(f"locale {code!r} has keys missing from {reference!r}: {', '.join(unknown)}")
+    Messages = namedtuple('Messages', ('lang',) + keys)
+    fallback = tables[reference]
+    return Messages, {
+        code: Messages(code, *(table.get(key, fallback[key]) for key in keys))
+        for code, table in tables.items()
+    }
+
+
+TABLES = {code: import_module(f'ui.locales.{code}').MESSAGES for code in LANGUAGES}
+Messages, CATALOGUE = compile_catalogue(TABLES)
+
+
+def untranslated(code):
+    """Keys ``code`` still shows in the reference language."""
+    return [key for key in TABLES[REFERENCE] if key not in TABLES[code]]
+
+
+def lang():
+    return st.session_state.get('lang', REFERENCE)
+
+
+def messages(code=None):
+    """Compiled catalogue for ``code``, by default the session language."""
+    return CATALOGUE.get(code or lang()) or CATALOGUE[REFERENCE]
+
+
+def localized(record, field, code):
+    """``record.<field>_<code>`` (e.g. ``name_ko``) if the record has it, else ``record.<field>``."""
+    return getattr(record, f'{field}_{code}', None) or getattr(record, field)
@@ -0,0 +1 @@
+"""Message tables, one module per language: ``MESSAGES = {key: text}``."""
@@ -0,0 +1,262 @@
+# -*- coding: utf-8 -*-
+"""English messages: the reference locale, which defines every key."""
+
+MESSAGES = {
+    # Language switch
+    'language': '🇬🇧 English',
+
+    # Navigation (also the page header titles)
+    'home': '🏠 Dashboard',
+    'live': '📡 Live Monitoring',
+    'greensteel': '🌱 Green Steel',
+    'credits': '💰 Environmental Credits',
+    'business': '📊 Business Case',
+    'simulation': '🎮 Simulation',
+    'hyrex': '⚗️ HyREX Technology',
+    'carbon_neutral': '🇰🇷 2050 Carbon Neutral',
+    'compliance': '📋 Compliance',
+    'mrv': '🔗 MRV Architecture',
+
+    # Shared
+    'company': 'POSCO',
+    'company_full': 'POSCO Holdings',
+    'year': 'year',
+    'days': 'days',
+    'sensors': 'sensors',
+    'employees': 'employees',
+    'revenue': 'Revenue',
+    'payback': 'Payback',
+    'total_value': 'Total Environmental Economic Value',
+    'current': 'Current',
+    'target': 'Target',
+    'pilot': 'Pilot',
+    'commercial': 'Commercial',
+    'certified': 'Certified',
+    'compliant': 'Compliant',
+
+    # Sidebar and footer
+    'founded': 'Founded',
+    'production': 'Production',
+    'world_rank': 'World Rank',
+    'sensors_stat': 'Sensors',
+    'certifications': 'Certifications',
+    'carbon_neutral_short': 'Carbon Neutral',
+    'alignment': 'Alignment',
+    'founder_ceo': 'Founder & CEO',
+
+    # Home
+    'home_title': 'POSCO HOLDINGS × REKARBON',
+    'home_subtitle': 'Edge-Native MRV Platform for Green Steel & Decarbonization • 60 IoT Sensors • 4 Divisions',
+    'level_1_card': 'LEVEL 1: TRADEABLE CREDITS',
+    'level_2_card': 'LEVEL 2: ECONOMIC VALUE',
+    'level_3_card': 'LEVEL 3: FUTURE MARKETS',
+    'usd_equivalent': 'USD EQUIVALENT',
+    'divisions_title': '4 Business Divisions',
+    'technologies_title': 'Green Steel Technologies',
+    'hyrex_dri': '(Hydrogen DRI)',
+    'co2_reduction_vs_bf': 'CO₂ Reduction vs BF-BOF',
+    'pilot_commercial': 'Pilot 2024 • Commercial 2030',
+    'eaf_name': 'Electric Arc Furnace',
+    'target_2030': '2030 Target',
+    'scrap_recycling_100': '100% Scrap Recycling',
+    'carbon_capture': '(Carbon Capture)',
+    'target_2050': '2050 Target',
+    'east_sea_storage': 'East Sea Storage',
+    'certifications_title': 'Certifications',
+
+    # Live monitoring
+    'live_subtitle': 'Real-time data from 60 IoT sensors • CERBERE Protected',
+    'refresh_interval': 'Refresh interval (s)',
+    'status': 'Status',
+    'gauges_title': 'Real-Time Gauges',
+    'furnace_dashboard': 'Blast Furnace Monitoring Dashboard',
+    'production_chart': 'Production by Route (t/day)',
+    'intensity_chart': 'CO₂ Intensity (kg/t steel)',
+    'furnace_history': 'Furnace history',
+    'history_empty': 'No furnace history yet: the live feed records one row per furnace per minute, or run `python -m telemetry.history generate` for a 90-day backfill.',
+    'trend_range': 'Range',
+    'alerts_title': 'Detector Alerts',
+    'no_alerts': 'No alerts: every sensor channel is within its learned baseline.',
+    'alerts_last_hour': 'alerts (1 h)',
+    'signatures_verified': 'verified',
+    'quarantined': 'quarantined',
+    'proof_leaves': 'verified readings in the proof pack',
+    'export_root': 'Export signed root',
+    'feed_stale': 'Live feed stale: no new reading since',
+    'feed_error': 'last error',
+
+    # Green steel
+    'greensteel_subtitle': 'Decarbonizing Steel with HyREX + EAF + CCUS',
+    'roadmap_title': 'Green Steel Roadmap',
+    'roadmap_chart': 'Steel Production Mix (Mt/year)',
+    'roadmap_computed': 'Cheapest path to net zero 2050, under the constraints set on the 2050 Carbon Neutral page.',
+    'roadmap_default': 'No path meets the constraints set on the 2050 Carbon Neutral page: cheapest path to net zero 2050 under the default constraints.',
+    'roadmap_published': 'POSCO published roadmap: no path to net zero 2050 could be computed.',
+    'route_intensity_chart': 'CO₂ Intensity by Route (kg/t)',
+    'hyrex_core': 'Technology',
+    'principle': 'Principle',
+    'h2_reduces_ore': 'H₂ reduces iron ore',
+    'efficiency': 'Efficiency',
+    'steel': 'steel',
+    'reduction': 'reduction',
+
+    # Credits
+    'credits_subtitle': '3-Level Valuation Framework',
+    'level_1_title': 'Level 1: Tradeable Credits',
+    'level_1_total': 'Level 1 Total',
+    'level_2_title': 'Level 2: Additional Value',
+    'level_3_title': 'Level 3: Future Markets',
+
+    # Business case
+    'business_subtitle': 'Return on Investment Analysis',
+    'investment': 'INVESTMENT',
+    'payback_card': 'PAYBACK',
+    'hours_short': 'h',
+    'roi_5y': '5-YEAR ROI',
+    'exceptional': 'Exceptional',
+    'profit_5y': '5-YEAR PROFIT',
+    'projection_chart': '5-Year Revenue & Cumulative',
+
+    # Simulation
+    'simulation_title': '🎮 Interactive Simulation',
+    'simulation_subtitle': 'Adjust parameters and see real-time impact',
+    'slider_hyrex': 'HyREX Production (%)',
+    'slider_eaf': 'EAF Capacity (%)',
+    'slider_scrap': 'Scrap Rate (%)',
+    'slider_h2': 'Green H2 (%)',
+    'slider_ccus': 'CCUS Capture (%)',
+    'scenarios_title': '💾 Scenarios',
+    'scenario_name': 'Scenario name',
+    'save_share': 'Save & share',
+    'share_link': 'Link for other analysts',
+    'shared_scenarios': 'Saved by analysts',
+    'load_scenario': 'Load',
+    'recent_scenarios': 'Recent in this session',
+    'restore': 'Restore',
+    'scenario_loaded': 'Shared scenario loaded',
+    'scenario_missing': 'This shared scenario is no longer available.',
+    'results_title': 'Simulation Results',
+    'sensitivity_title': 'Sensitivity Analysis',
+    'metric': 'Metric',
+    'mc_title': 'Monte Carlo Uncertainty',
+    'mc_mode': 'Monte Carlo mode',
+    'mc_kets_price': 'K-ETS (₩/tCO₂)',
+    'mc_green_premium': 'Green Steel Premium (₩/t)',
+    'mc_h2_price': 'H2 Price (₩/kg)',
+    'mc_cf_hyrex': 'HyREX Capacity Factor',
+    'mc_cf_eaf': 'EAF Capacity Factor',
+    'mc_cf_ccus': 'CCUS Capacity Factor',
+    'mc_distributions': 'Distributions (triangular: low / mode / high)',
+    'draws': 'Draws',
+    'seed': 'Seed',
+    'run': '▶ Run',
+    'simulating': 'Simulating...',
+    'mc_rerun': 'Sliders, distributions, seed or draws changed since the last run: run it again for their uncertainty.',
+
+    # HyREX process model
+    'hyrex_subtitle': 'H₂ shaft furnace mass & energy balance, per tonne of DRI',
+    'h2_purity': 'H₂ purity (vol%)',
+    'ore_grade': 'Ore grade (wt% Fe)',
+    'gas_temperature': 'Gas inlet temperature (°C)',
+    'h2_makeup': 'H₂ make-up (kg/t)',
+    'vs_plan': 'vs plan',
+    'h2_utilisation': 'H₂ utilisation per pass',
+    'bed_temperature': 'reduction zone',
+    'electricity': 'Electricity (MWh/t)',
+    'co2_per_t': 'CO₂ (kg/t)',
+    'vs_bf_bof': 'vs BF-BOF',
+    'mass_balance_title': 'Mass Balance (per t DRI)',
+    'energy_title': 'Energy & Gas Loop',
+    'stream': 'Stream',
+    'flow_in': 'In',
+    'flow_out': 'Out',
+    'amount': 'Amount',
+    'unit': 'Unit',
+    'iron_ore': 'Iron ore',
+    'inerts': 'Inerts (N₂)',
+    'dri': 'DRI',
+    'water': 'Water',
+    'purge_h2': 'Purged H₂',
+    'purge_inerts': 'Purged inerts',
+    'electrolysis': 'Electrolysis',
+    'gas_heater': 'Gas heater',
+    'gas_flow': 'Reducing gas',
+    'top_gas': 'Top gas',
+    'temperature_profile': 'Inlet → bed → top gas',
+    'mass_closure': 'Mass balance closes to',
+    'iterations': 'iterations',
+    'envelope_title': 'Operating Envelope',
+    'envelope_metric': 'Envelope metric',
+    'at_commercial_scale': 'At commercial scale',
+
+    # Carbon neutral
+    'carbon_neutral_subtitle': 'Full alignment with Korea Carbon Neutrality Framework Act',
+    'overall_alignment': 'Overall Alignment Score',
+    'industry_leader': 'Steel Industry Leader',
+    'trajectory_title': 'Cheapest Path to Net Zero 2050',
+    'trajectory_caption': 'Yearly 2024–2050 production mix that meets every 2030 target above and net zero in 2050 at the least discounted cost.',
+    'capex_budget': 'Capex budget (₩T/year)',
+    'h2_supply_2030': 'H₂ supply 2030 (kt)',
+    'h2_supply_2050': 'H₂ supply 2050 (kt)',
+    'ccus_capacity_2050': 'CCUS capacity 2050 (Mt CO₂)',
+    'whole_plants': 'Whole plants (MILP)',
+    'trajectory_infeasible': 'No path meets every target under these constraints. Raise the capex budget, H₂ supply or CCUS capacity.',
+    'trajectory_time_limit': 'The solver ran out of time before finding a path under these constraints. Try again, or clear Whole plants (MILP).',
+    'trajectory_feasible': 'Best path found within the solver time limit: it meets every target but may not be the cheapest.',
+    'discounted_cost': 'Discounted cost',
+    'emissions_2030': '2030 net emissions',
+    'bf_bof_exit': 'Last BF-BOF year',
+    'solve_time': 'Solve time',
+    'warm_start': 'warm start',
+    'cold_start': 'cold start',
+    'production_path': 'Production Path (Mt/year)',
+    'emissions_path': 'Net Emissions and CCUS Capture (Mt CO₂)',
+    'capex_path': 'Capex by Technology (₩T)',
+    'net_emissions': 'Net emissions',
+    'captured': 'Captured',
+
+    # Compliance
+    'compliance_subtitle': 'Certified across 8 international standards',
+    'kets_reports': 'K-ETS Emission Reports',
+    'report_kind': 'Report',
+    'report_month': 'Monthly',
+    'report_year': 'Annual',
+    'report_period': 'Period',
+    'generate_report': 'Generate',
+    'report_building': 'Building report',
+    'report_failed': 'Report failed',
+    'days_with_data': 'Days with data',
+    'days_recomputed': 'days recomputed from telemetry, the rest from cached daily aggregates',
+    'korean_regulations': 'Korean Regulations',
+    'kets_phase_3': 'Phase 3 Compliant',
+    'carbon_neutral_act': 'Carbon Neutral Act',
+    'clean_air_act': 'Clean Air Act',
+    'international_standards': 'International Standards',
+    'rating': 'Rating',
+
+    # MRV architecture
+    'mrv_subtitle': '7-Layer: Edge → DT-REC → DT-SEQ → Marketplace',
+    'cerbere_title': 'CERBERE Security Integration',
+    'intrusion_detection': 'Real-time intrusion detection',
+    'event_correlation': 'Event correlation',
+    'honeypots': 'Honeypots & Stealth',
+
+    # Diagnostics (hidden page)
+    'diagnostics': '🩺 Diagnostics',
+    'diagnostics_subtitle': 'Where reruns spend their time: spans, rerun counters and bytes sent to the browser',
+    'profiling_enabled': 'Profiling enabled (process-wide)',
+    'profiling_off': 'Profiling is off: nothing is timed or counted. Turn it on, use the dashboard, then come back.',
+    'reset_profile': 'Reset',
+    'profiled_reruns': 'Profiled reruns',
+    'profiled_sessions': 'Sessions',
+    'bytes_emitted': 'Bytes emitted',
+    'profiling_since': 'Since',
+    'spans_title': 'Spans',
+    'reruns_by_page': 'Reruns by page',
+    'bytes_by_element': 'Bytes by element type',
+    'recent_reruns': 'Recent reruns',
+    'export_prometheus': 'Prometheus text',
+    'export_json': 'JSON',
+    'save_profile': 'Save JSON to disk',
+    'saved_to': 'Saved to',
+}
@@ -0,0 +1,262 @@
+# -*- coding: utf-8 -*-
+"""Korean messages."""
+
+MESSAGES = {
+    # Language switch
+    'language': '🇰🇷 한국어',
+
+    # Navigation (also the page header titles)
+    'home': '🏠 대시보드',
+    'live': '📡 실시간 모니터링',
+    'greensteel': '🌱 그린스틸',
+    'credits': '💰 환경 크레딧',
+    'business': '📊 비즈니스 케이스',
+    'simulation': '🎮 시뮬레이션',
+    'hyrex': '⚗️ HyREX 기술',
+    'carbon_neutral': '🇰🇷 2050 탄소중립',
+    'compliance': '📋 컴플라이언스',
+    'mrv': '🔗 MRV 아키텍처',
+
+    # Shared
+    'company': '포스코',
+    'company_full': '포스코홀딩스',
+    'year': '년',
+    'days': '일',
+    'sensors': '센서',
+    'employees': '직원',
+    'revenue': '매출',
+    'payback': '투자회수',
+    'total_value': '총 환경경제가치',
+    'current': '현재',
+    'target': '목표',
+    'pilot': '파일럿',
+    'commercial': '상용화',
+    'certified': '인증',
+    'compliant': '준수',
+
+    # Sidebar and footer
+    'founded': '설립',
+    'production': '생산량',
+    'world_rank': '세계순위',
+    'sensors_stat': '센서',
+    'certifications': '인증',
+    'carbon_neutral_short': '탄소중립',
+    'alignment': '준수점수',
+    'founder_ceo': '창립자 & CEO',
+
+    # Home
+    'home_title': '포스코홀딩스 × 리카본',
+    'home_subtitle': '그린스틸 및 탈탄소화를 위한 엣지 네이티브 MRV 플랫폼 • 60 IoT 센서 • 4개 사업부문',
+    'level_1_card': '레벨1: 거래가능 크레딧',
+    'level_2_card': '레벨2: 총경제가치',
+    'level_3_card': '레벨3: 미래시장 포함',
+    'usd_equivalent': 'USD 환산',
+    'divisions_title': '4개 사업부문',
+    'technologies_title': '그린스틸 기술',
+    'hyrex_dri': '(수소환원제철)',
+    'co2_reduction_vs_bf': 'CO₂ 감축 vs BF-BOF',
+    'pilot_commercial': '파일럿 2024 • 상용 2030',
+    'eaf_name': '전기로 (EAF)',
+    'target_2030': '2030년 목표',
+    'scrap_recycling_100': '100% 스크랩 재활용',
+    'carbon_capture': '(탄소포집)',
+    'target_2050': '2050년 목표',
+    'east_sea_storage': '동해 해저 저장',
+    'certifications_title': '인증 및 표준',
+
+    # Live monitoring
+    'live_subtitle': '60개 IoT 센서 실시간 데이터 • CERBERE 보안',
+    'refresh_interval': '갱신 주기 (초)',
+    'status': '상태',
+    'gauges_title': '실시간 게이지',
+    'furnace_dashboard': '고로 모니터링 대시보드',
+    'production_chart': '생산경로별 생산량 (t/일)',
+    'intensity_chart': 'CO₂ 집약도 (kg/t 철강)',
+    'furnace_history': '고로 이력',
+    'history_empty': '아직 고로 이력이 없습니다. 실시간 피드가 고로별로 1분마다 한 행씩 기록하며, 90일 백필은 `python -m telemetry.history generate`로 생성할 수 있습니다.',
+    'trend_range': '기간',
+    'alerts_title': '이상 탐지 알림',
+    'no_alerts': '알림 없음: 모든 센서 채널이 학습된 기준선 이내입니다.',
+    'alerts_last_hour': '건 알림 (1시간)',
+    'signatures_verified': '검증',
+    'quarantined': '격리',
+    'proof_leaves': '건의 검증된 측정값',
+    'export_root': '서명된 루트 내보내기',
+    'feed_stale': '실시간 피드 지연: 마지막 측정 시각',
+    'feed_error': '최근 오류',
+
+    # Green steel
+    'greensteel_subtitle': 'HyREX + EAF + CCUS로 탈탄소 철강 실현',
+    'roadmap_title': '그린스틸 로드맵',
+    'roadmap_chart': '철강 생산믹스 (Mt/년)',
+    'roadmap_computed': '2050 탄소중립 페이지에서 설정한 제약 조건에서의 넷제로 2050 최소비용 경로',
+    'roadmap_default': '2050 탄소중립 페이지의 제약 조건을 만족하는 경로가 없어 기본 제약 조건에서의 넷제로 2050 최소비용 경로를 표시합니다.',
+    'roadmap_published': 'POSCO 공개 로드맵: 넷제로 2050 경로를 계산할 수 없습니다.',
+    'route_intensity_chart': '생산경로별 CO₂ 집약도 (kg/t)',
+    'hyrex_core': '기술 핵심',
+    'principle': '원리',
+    'h2_reduces_ore': '수소로 철광석 환원',
+    'efficiency': '효율',
+    'steel': '철강',
+    'reduction': '감축',
+
+    # Credits
+    'credits_subtitle': '3단계 가치평가 프레임워크',
+    'level_1_title': '레벨1: 거래가능 크레딧',
+    'level_1_total': '레벨1 합계',
+    'level_2_title': '레벨2: 추가경제가치',
+    'level_3_title': '레벨3: 미래시장',
+
+    # Business case
+    'business_subtitle': '투자수익률 분석',
+    'investment': '투자액',
+    'payback_card': '투자회수',
+    'hours_short': '시간',
+    'roi_5y': '5-년 ROI',
+    'exceptional': '탁월',
+    'profit_5y': '5-년 순이익',
+    'projection_chart': '5년 매출 및 누적',
+
+    # Simulation
+    'simulation_title': '🎮 인터랙티브 시뮬레이션',
+    'simulation_subtitle': '파라미터를 조정하고 실시간 영향 확인',
+    'slider_hyrex': 'HyREX 생산 (%)',
+    'slider_eaf': '전기로 용량 (%)',
+    'slider_scrap': '스크랩 비율 (%)',
+    'slider_h2': '그린수소 (%)',
+    'slider_ccus': 'CCUS 포집 (%)',
+    'scenarios_title': '💾 시나리오',
+    'scenario_name': '시나리오 이름',
+    'save_share': '저장 및 공유',
+    'share_link': '다른 분석가용 링크',
+    'shared_scenarios': '분석가 저장 시나리오',
+    'load_scenario': '불러오기',
+    'recent_scenarios': '이 세션의 최근 시나리오',
+    'restore': '복원',
+    'scenario_loaded': '공유 시나리오를 불러왔습니다',
+    'scenario_missing': '이 공유 시나리오는 더 이상 사용할 수 없습니다.',
+    'results_title': '시뮬레이션 결과',
+    'sensitivity_title': '민감도 분석',
+    'metric': '지표',
+    'mc_title': '몬테카를로 불확실성',
+    'mc_mode': '몬테카를로 모드',
+    'mc_kets_price': 'K-ETS 가격 (₩/tCO₂)',
+    'mc_green_premium': '그린스틸 프리미엄 (₩/t)',
+    'mc_h2_price': '수소 가격 (₩/kg)',
+    'mc_cf_hyrex': 'HyREX 가동률',
+    'mc_cf_eaf': '전기로 가동률',
+    'mc_cf_ccus': 'CCUS 가동률',
+    'mc_distributions': '분포 설정 (삼각분포: 최소 / 최빈 / 최대)',
+    'draws': '추출 횟수',
+    'seed': '시드',
+    'run': '▶ 실행',
+    'simulating': '시뮬레이션 중...',
+    'mc_rerun': '마지막 실행 이후 슬라이더, 분포, 시드 또는 추출 횟수가 바뀌었습니다. 다시 실행하면 불확실성을 계산합니다.',
+
+    # HyREX process model
+    'hyrex_subtitle': '수소 샤프트로 물질·에너지 수지 (DRI 톤당)',
+    'h2_purity': '수소 순도 (vol%)',
+    'ore_grade': '철광석 품위 (wt% Fe)',
+    'gas_temperature': '가스 유입 온도 (°C)',
+    'h2_makeup': '수소 보충량 (kg/t)',
+    'vs_plan': '계획 대비',
+    'h2_utilisation': '수소 1회 이용률',
+    'bed_temperature': '환원대',
+    'electricity': '전력 (MWh/t)',
+    'co2_per_t': 'CO₂ (kg/t)',
+    'vs_bf_bof': 'BF-BOF 대비',
+    'mass_balance_title': '물질수지 (DRI 톤당)',
+    'energy_title': '에너지 및 가스 루프',
+    'stream': '스트림',
+    'flow_in': '투입',
+    'flow_out': '산출',
+    'amount': '양',
+    'unit': '단위',
+    'iron_ore': '철광석',
+    'inerts': '불활성가스 (N₂)',
+    'dri': 'DRI',
+    'water': '물',
+    'purge_h2': '퍼지 수소',
+    'purge_inerts': '퍼지 불활성가스',
+    'electrolysis': '수전해',
+    'gas_heater': '가스 가열기',
+    'gas_flow': '환원가스',
+    'top_gas': '노정가스',
+    'temperature_profile': '유입 → 환원대 → 노정가스',
+    'mass_closure': '물질수지 오차',
+    'iterations': '회 반복',
+    'envelope_title': '운전 영역',
+    'envelope_metric': '영역 지표',
+    'at_commercial_scale': '상용 규모 기준',
+
+    # Carbon neutral
+    'carbon_neutral_subtitle': '한국 탄소중립 기본법 완전 준수',
+    'overall_alignment': '전체 준수 점수',
+    'industry_leader': '철강업계 선도',
+    'trajectory_title': '넷제로 2050 최소비용 경로',
+    'trajectory_caption': '위의 2030 목표와 2050 넷제로를 모두 달성하는 최소 할인비용 연도별 생산믹스 (2024–2050)',
+    'capex_budget': '설비투자 예산 (₩조/년)',
+    'h2_supply_2030': '2030 수소 공급 (kt)',
+    'h2_supply_2050': '2050 수소 공급 (kt)',
+    'ccus_capacity_2050': '2050 CCUS 용량 (Mt CO₂)',
+    'whole_plants': '설비 단위 (MILP)',
+    'trajectory_infeasible': '이 제약 조건으로는 모든 목표를 달성하는 경로가 없습니다. 설비투자 예산, 수소 공급 또는 CCUS 용량을 늘리세요.',
+    'trajectory_time_limit': '이 제약 조건에서 경로를 찾기 전에 솔버 시간 제한에 도달했습니다. 다시 시도하거나 설비 단위 (MILP)를 해제하세요.',
+    'trajectory_feasible': '솔버 시간 제한 내에서 찾은 최선의 경로입니다. 모든 목표를 충족하지만 최소비용이 아닐 수 있습니다.',
+    'discounted_cost': '할인 총비용',
+    'emissions_2030': '2030 순배출량',
+    'bf_bof_exit': 'BF-BOF 마지막 연도',
+    'solve_time': '계산 시간',
+    'warm_start': '웜 스타트',
+    'cold_start': '콜드 스타트',
+    'production_path': '생산 경로 (Mt/년)',
+    'emissions_path': '순배출량 및 CCUS 포집량 (Mt CO₂)',
+    'capex_path': '기술별 설비투자 (₩조)',
+    'net_emissions': '순배출량',
+    'captured': '포집량',
+
+    # Compliance
+    'compliance_subtitle': '8개 국제표준 인증',
+    'kets_reports': 'K-ETS 배출량 보고서',
+    'report_kind': '보고서',
+    'report_month': '월간',
+    'report_year': '연간',
+    'report_period': '기간',
+    'generate_report': '생성',
+    'report_building': '보고서 생성 중',
+    'report_failed': '보고서 생성 실패',
+    'days_with_data': '데이터 보유 일수',
+    'days_recomputed': '일은 텔레메트리에서 재계산, 나머지는 캐시된 일별 집계 사용',
+    'korean_regulations': '한국 규제',
+    'kets_phase_3': '3기 완전 준수',
+    'carbon_neutral_act': '탄소중립기본법',
+    'clean_air_act': '대기환경보전법',
+    'international_standards': '국제 표준',
+    'rating': '등급',
+
+    # MRV architecture
+    'mrv_subtitle': '7계층: Edge → DT-REC → DT-SEQ → 마켓플레이스',
+    'cerbere_title': 'CERBERE 보안 통합',
+    'intrusion_detection': '실시간 침입탐지',
+    'event_correlation': '이벤트 상관분석',
+    'honeypots': '허니팟 & 스텔스',
+
+    # Diagnostics (hidden page)
+    'diagnostics': '🩺 진단',
+    'diagnostics_subtitle': '재실행 시간 분석: 구간 타이밍, 재실행 카운터, 브라우저 전송 바이트',
+    'profiling_enabled': '프로파일링 사용 (프로세스 전체)',
+    'profiling_off': '프로파일링이 꺼져 있어 측정하지 않습니다. 켠 뒤 대시보드를 사용하고 다시 확인하세요.',
+    'reset_profile': '초기화',
+    'profiled_reruns': '측정된 재실행',
+    'profiled_sessions': '세션',
+    'bytes_emitted': '전송 바이트',
+    'profiling_since': '측정 시작',
+    'spans_title': '구간',
+    'reruns_by_page': '페이지별 재실행',
+    'bytes_by_element': '요소 유형별 바이트',
+    'recent_reruns': '최근 재실행',
+    'export_prometheus': 'Prometheus 텍스트',
+    'export_json': 'JSON',
+    'save_profile': 'JSON을 디스크에 저장',
+    'saved_to': '저장 위치',
+}
@@ -0,0 +1,268 @@
+# -*- coding: utf-8 -*-
+"""
+Per-rerun profiling: timing spans, rerun counters and bytes emitted.
+
+The script marks a rerun with ``begin(page)`` / ``end()`` and wraps its
+sections in ``with span('sidebar'):``; figures and page sections add their
+own spans, and a fragment rerunning on its own timer counts as a rerun of
+``fragment:<name>``. While enabled, every element Streamlit enqueues is
+also counted by type with its serialised size (``markdown``,
+``plotly_chart``, ``arrow_data_frame``, ...), through a wrapper installed
+on ``DeltaGenerator._enqueue``.
+
+Disabled (the default; ``REKARBON_PROFILE=1`` enables at start, the
+diagnostics page toggles it), ``span`` returns one shared no-op context
+manager, ``begin``/``end`` return at once and the enqueue wrapper is not
+installed: nothing is timed, counted or allocated. Enabled, a span costs
+two clock reads and a dict update; an element inside a rerun is counted
+in that rerun's own dict, without the lock, and folded into the totals
+once at ``end()`` (or when the next ``begin`` discards the rerun).
+
+Aggregates are process-wide: spans by name (count, total, max), reruns and
+their duration by page, reruns by session (the latest ``MAX_SESSIONS``),
+bytes by element type, and the last ``RECENT_RERUNS`` reruns with their
+span breakdown. ``prometheus()`` renders them in the Prometheus text
+format (served at ``/metrics`` by ``asgi.py``) and ``save()`` writes them
+as JSON.
+"""
+
+import json
+import os
+import threading
+import time
+from collections import Counter, OrderedDict, deque
+from contextlib import nullcontext
+from pathlib import Path
+
+ENV = 'REKARBON_PROFILE'
+DEFAULT_PATH = Path(__file__).resolve().parent.parent / 'diagnostics' / 'profile.json'
+RECENT_RERUNS = 50
+MAX_SESSIONS = 1000
+PREFIX = 'rekarbon'
+
+_NULL = nullcontext()
+
+
+class _Span:
+    __slots__ = ('profiler', 'name', 'start')
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.profiler.record(self.name, time.perf_counter() - self.start)
+
+
+class Profiler:
+
+    def __init__(self, enabled=False):
+        self.enabled = False
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._enqueue = None
+        self.reset()
+        self.enable(enabled)
+
+    def reset(self):
+        with self._lock:
+            self.started = time.time()
+            self.spans = {}                 # name -> [count, seconds, max]
+            self.reruns = Counter()         # page -> reruns
+            self.rerun_s = Counter()        # page -> seconds
+            self.sessions = OrderedDict()   # session id -> reruns, most recent last
+            self.elements = Counter()       # element type -> count
+            self.bytes = Counter()          # element type -> serialised bytes
+            self.recent = deque(maxlen=RECENT_RERUNS)
+
+    def enable(self, on=True):
+        """Switch profiling on or off, installing or removing the enqueue wrapper."""
+        from streamlit.delta_generator import DeltaGenerator
+
+        with self._lock:
+            if on and self._enqueue is None:
+                self._enqueue = enqueue = DeltaGenerator._enqueue
+                profiler = self
+
+                def counted(dg, delta_type, element_proto, *args, **kwargs):
+                    profiler.emitted(delta_type, element_proto.ByteSize())
+                    return enqueue(dg, delta_type, element_proto, *args, **kwargs)
+
+                DeltaGenerator._enqueue = counted
+            elif not on and self._enqueue is not None:
+                DeltaGenerator._enqueue = self._enqueue
+                self._enqueue = None
+            self.enabled = bool(on)
+
+    # -------------------------------------------------------------------------
+    # Recording
+    # -------------------------------------------------------------------------
+
+    def span(self, name):
+        """Context manager timing ``name``; a shared no-op while disabled."""
+        return _Span(self, name) if self.enabled else _NULL
+
+    def record(self, name, seconds):
+        with self._lock:
+            entry = self.spans.get(name)
+            if entry is None:
+                self.spans[name] = [1, seconds, seconds]
+            else:
+                entry[0] += 1
+                entry[1] += seconds
+                if seconds > entry[2]:
+                    entry[2] = seconds
+        rerun = getattr(self._local, 'rerun', None)
+        if rerun is not None:
+            rerun['spans'][name] = rerun['spans'].get(name, 0.0) + seconds
+
+    def emitted(self, element, size):
+        rerun = getattr(self._local, 'rerun', None)
+        if rerun is None:
+            with self._lock:
+                self.elements[element] += 1
+                self.bytes[element] += size
+            return
+        rerun['bytes'] += size
+        entry = rerun['elements'].get(element)
+        if entry is None:
+            rerun['elements'][element] = [1, size]
+        else:
+            entry[0] += 1
+            entry[1] += size
+
+    def _fold(self, elements):
+        # Under the lock: a rerun's element counts into the totals
+        for element, (count, size) in elements.items():
+            self.elements[element] += count
+            self.bytes[element] += size
+
+    def begin(self, page):
+        """Start timing a rerun of ``page`` on this thread; False if disabled.
+
+        A rerun cut short by ``st.rerun()`` or ``st.stop()`` never reaches
+        ``end()``; the next ``begin`` on the thread discards it.
+        """
+        if not self.enabled:
+            return False
+        discarded = getattr(self._local, 'rerun', None)
+        if discarded is not None:
+            with self._lock:
+                self._fold(discarded['elements'])
+        self._local.rerun = {'page': page, 'session': _session_id(), 'ts': time.time(),
+                             'start': time.perf_counter(), 'spans': {}, 'bytes': 0, 'elements': {}}
+        return True
+
+    def end(self):
+        rerun = getattr(self._local, 'rerun', None)
+        if rerun is None:
+            return
+        self._local.rerun = None
+        seconds = time.perf_counter() - rerun.pop('start')
+        rerun['seconds'] = seconds
+        elements = rerun.pop('elements')
+        with self._lock:
+            self._fold(elements)
+            self.reruns[rerun['page']] += 1
+            self.rerun_s[rerun['page']] += seconds
+            session = rerun['session']
+            if session is not None:
+                self.sessions[session] = self.sessions.pop(session, 0) + 1
+                if len(self.sessions) > MAX_SESSIONS:
+                    self.sessions.popitem(last=False)
+            self.recent.append(rerun)
+
+    # -------------------------------------------------------------------------
+    # Export
+    # -------------------------------------------------------------------------
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                'enabled': self.enabled,
+                'started': self.started,
+                'spans': {name: {'count': c, 'seconds': s, 'max_s': m} for name, (c, s, m) in self.spans.items()},
+                'reruns': dict(self.reruns),
+                'rerun_seconds': dict(self.rerun_s),
+                'sessions': dict(self.sessions),
+                'elements': dict(self.elements),
+                'bytes': dict(self.bytes),
+                'recent': [dict(r, spans=dict(r['spans'])) for r in self.recent],
+            }
+
+    def prometheus(self):
+        """Aggregates in the Prometheus text exposition format."""
+        snap = self.snapshot()
+        lines = []
+
+        def metric(name, kind, help_text, samples):
+            lines.append(f"# HELP {PREFIX}_{name} {help_text}")
+            lines.append(f"# TYPE {PREFIX}_{name} {kind}")
+            for labels, value in samples:
+                label = ','.join(f'{k}="{_escape(v)}"' for k, v in labels.items())
+                lines.append(f"{PREFIX}_{name}{{{label}}} {value:.9g}" if label else f"{PREFIX}_{name} {value:.9g}")
+
+        metric('profiling_enabled', 'gauge', 'Whether profiling is on.', [({}, snap['enabled'])])
+        metric('reruns_total', 'counter', 'Script reruns by page.',
+               [({'page': p}, n) for p, n in snap['reruns'].items()])
+        metric('rerun_seconds_total', 'counter', 'Time spent in script reruns by page.',
+               [({'page': p}, s) for p, s in snap['rerun_seconds'].items()])
+        metric('sessions', 'gauge', 'Sessions with a profiled rerun.', [({}, len(snap['sessions']))])
+        metric('span_seconds_total', 'counter', 'Time spent in a span.',
+               [({'span': n}, s['seconds']) for n, s in snap['spans'].items()])
+        metric('span_calls_total', 'counter', 'Times a span ran.',
+               [({'span': n}, s['count']) for n, s in snap['spans'].items()])
+        metric('span_max_seconds', 'gauge', 'Slowest run of a span.',
+               [({'span': n}, s['max_s']) for n, s in snap['spans'].items()])
+        metric('emitted_elements_total', 'counter', 'Elements sent to the browser by type.',
+               [({'element': e}, n) for e, n in snap['elements'].items()])
+        metric('emitted_bytes_total', 'counter', 'Serialised bytes sent to the browser by element type.',
+               [({'element': e}, n) for e, n in snap['bytes'].items()])
+        return '\n'.join(lines) + '\n'
+
+    def save(self, path=DEFAULT_PATH):
+        """Write ``snapshot()`` as JSON to ``path``; returns the path."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix('.tmp')
+        tmp.write_text(json.dumps(self.snapshot(), indent=1))
+        os.replace(tmp, path)
+        return path
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _session_id():
+    from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+    ctx = get_script_run_ctx(suppress_warning=True)
+    return ctx.session_id if ctx is not None else None
+
+
+def fragment_rerun():
+    """True while Streamlit runs only fragments, not the whole script."""
+    from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+    ctx = get_script_run_ctx(suppress_warning=True)
+    return bool(ctx is not None and ctx.fragment_ids_this_run)
+
+
+PROFILER = Profiler(enabled=os.environ.get(ENV) == '1')
+
+
+def span(name):
+    return PROFILER.span(name)
+
+
+def begin(page):
+    return PROFILER.begin(page)
+
+
+def end():
+    PROFILER.end()
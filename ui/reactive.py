@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+"""
+Reactive cells: derived values and figures recomputed only when what they
+depend on changed.
+
+A ``Graph`` names its cells and, for each, the inputs (slider values,
+language, ...) and other cells it reads. Cells are pulled: ``graph.run(
+inputs, memo)`` returns a ``Run`` whose ``run[name]`` evaluates a cell at
+most once, after its dependencies. The ``memo`` (a dict the caller keeps,
+e.g. in ``st.session_state``) holds each cell's last dependency values and
+result across reruns, so a cell whose dependencies are unchanged returns
+its previous result object as is: inputs are compared by value, cells by
+identity. A figure cell whose inputs did not move hands back the same
+serialised spec.
+
+A recomputed cell whose result equals the previous one (scalars, strings
+and tuples of them; arrays are not compared) keeps the previous object, so the cells below it are not
+recomputed either: an early cut-off, e.g. a heatmap's fixed parameters
+when only its axis parameter moved.
+
+Recomputations are timed as ``cell:<name>`` spans when ``ui.profiling``
+is on.
+"""
+
+from collections import namedtuple
+
+from ui import profiling
+
+Cell = namedtuple('Cell', ['fn', 'deps'])
+
+_MISSING = object()
+_SCALARS = (type(None), bool, int, float, str)
+
+
+class Graph:
+
+    def __init__(self, name):
+        self.name = name
+        self.cells = {}
+
+    def cell(self, *deps):
+        """Decorator registering ``fn`` as the cell ``fn.__name__`` of ``deps`` (inputs or cells)."""
+        def register(fn):
+            self.cells[fn.__name__] = Cell(fn, deps)
+            return fn
+        return register
+
+    def downstream(self, names):
+        """Cells that depend, directly or not, on any of ``names``."""
+        found = set()
+        changed = True
+        while changed:
+            changed = False
+            for name, cell in self.cells.items():
+                if name not in found and any(d in names or d in found for d in cell.deps):
+                    found.add(name)
+                    changed = True
+        return found
+
+    def run(self, inputs, memo):
+        return Run(self, inputs, memo)
+
+
+class Run:
+    """One rerun's view of a ``Graph``: cell values, pulled on first access."""
+
+    def __init__(self, graph, inputs, memo):
+        self.graph = graph
+        self.inputs = inputs
+        self.memo = memo                # name -> (dependency values, result)
+        self.values = {}
+        self.computed = []
+        self.reused = []
+
+    def update(self, **inputs):
+        """Add inputs known later in the script (widgets further down), before the cells that read them."""
+        self.inputs.update(inputs)
+
+    def __getitem__(self, name):
+        value = self.values.get(name, _MISSING)
+        if value is not _MISSING:
+            return value
+        if name in self.inputs:
+            return self.inputs[name]
+        cell = self.graph.cells[name]
+        args = tuple(self[d] for d in cell.deps)
+        previous = self.memo.get(name)
+        if previous is not None and self._unchanged(cell.deps, previous[0], args):
+            value = previous[1]
+            self.reused.append(name)
+        else:
+            with profiling.span(f"cell:{self.graph.name}/{name}"):
+                value = cell.fn(*args)
+            if previous is not None and _comparable(value) and _comparable(previous[1]) \
+                    and type(value) is type(previous[1]) and value == previous[1]:
+                value = previous[1]
+            self.memo[name] = (args, value)
+            self.computed.append(name)
+        self.values[name] = value
+        return value
+
+    def _unchanged(self, deps, before, now):
+        for dep, a, b in zip(deps, before, now):
+            if a is b:
+                continue
+            if dep in self.graph.cells or a != b:
+                return False
+        return True
+
+
+def _comparable(value):
+    """Whether ``==`` on ``value`` is a plain bool (not an array's elementwise result)."""
+    if isinstance(value, tuple):
+        return all(_comparable(v) for v in value)
+    return isinstance(value, _SCALARS)
@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+"""
+Scheduled, fragment-scoped refresh for the Live Monitoring page.
+
+Instead of sleeping and calling ``st.rerun()`` (which re-executes the whole
+script, CSS, sidebar and footer included), the live panels are wrapped in an
+``st.fragment`` with ``run_every`` set to the configured interval. Only the
+fragment body is re-run by the frontend timer. When the browser tab is
+hidden the interval backs off to ``HIDDEN_INTERVAL_S``.
+"""
+
+import threading
+import time
+from functools import wraps
+from pathlib import Path
+
+import streamlit as st
+import streamlit.components.v1 as components
+
+from ui import profiling
+
+# =============================================================================
+# SCHEDULE
+# =============================================================================
+
+INTERVAL_OPTIONS = [2, 5, 10, 30, 60]
+DEFAULT_INTERVAL_S = 5
+HIDDEN_INTERVAL_S = 60
+
+_VISIBILITY_DIR = Path(__file__).parent / 'components' / 'visibility'
+
+
+def tab_visible(key='live_tab_visibility'):
+    """Return False while the viewer's browser tab is hidden.
+
+    The component is a zero-height iframe that reports
+    ``document.visibilityState`` only when it changes, so it does not cause
+    reruns on its own while the tab stays visible.
+    """
+    visibility = components.declare_component('tab_visibility', path=str(_VISIBILITY_DIR))
+    current = st.session_state.get(key) or 'visible'
+    return visibility(current=current, key=key, default='visible') != 'hidden'
+
+
+def effective_interval(interval_s, visible=True):
+    """Seconds between fragment reruns, backing off while the tab is hidden."""
+    if not visible:
+        return max(interval_s, HIDDEN_INTERVAL_S)
+    return interval_s
+
+
+# =============================================================================
+# STATS
+# =============================================================================
+
+class RefreshStats:
+    """Process-wide count and cumulative duration of fragment reruns."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.runs = 0
+            self.seconds = 0.0
+            self.started = time.perf_counter()
+
+    def record(self, seconds):
+        with self._lock:
+            self.runs += 1
+            self.seconds += seconds
+
+    def snapshot(self):
+        with self._lock:
+            elapsed = time.perf_counter() - self.started
+            return {
+                'runs': self.runs,
+                'seconds': self.seconds,
+                'mean_s': self.seconds / self.runs if self.runs else 0.0,
+                'runs_per_s': self.runs / elapsed if elapsed > 0 else 0.0,
+            }
+
+
+STATS = RefreshStats()
+
+
+def live_fragment(run_every):
+    """Decorate a panel function as a fragment re-run every ``run_every`` seconds.
+
+    ``run_every=None`` renders the panel once per full script run, exactly as
+    if it were inline code. A timer rerun of the panel alone is profiled as
+    a rerun of ``fragment:<name>``.
+    """
+    def decorate(func):
+        name = f"fragment:{func.__name__}"
+
+        @wraps(func)
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            own = profiling.fragment_rerun() and profiling.begin(name)
+            try:
+                with profiling.span(name):
+                    return func(*args, **kwargs)
+            finally:
+                STATS.record(time.perf_counter() - start)
+                if own:
+                    profiling.end()
+        return st.fragment(timed, run_every=run_every)
+    return decorate
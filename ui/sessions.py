@@ -0,0 +1,316 @@
+# -*- coding: utf-8 -*-
+"""
+Server-side store of what each session works on, and of the scenarios
+analysts save and share.
+
+A Streamlit session keeps only a short key in ``st.session_state``
+(``workspace``), next to its language, page and widget values. The rest
+lives in a ``Workspace`` of the process-wide ``STORE``: page parameters
+(simulation sliders, HyREX operating point, 2050 constraints), the
+session's recent simulation scenarios, and a cache of what can be
+recomputed (the reactive cell memo with its serialised figures, Monte
+Carlo summaries). Pages get theirs with ``workspace()``; a session that
+never opens such a page, e.g. a wallboard on Live Monitoring, has none.
+
+Workspaces are kept least recently used first. One handed out by ``get``
+is sized again (strings, arrays and containers, each object counted once)
+at the store's next call, after the rerun that used it; then workspaces
+idle for more than ``ttl_s`` and, while the total exceeds ``max_bytes``,
+the least recently used are evicted. ``workspace()`` pins the session's
+workspace until ``release()`` at the end of its rerun, so another
+session's call never evicts one a rerun is still writing to; a pin older
+than ``ttl_s`` (a rerun that never released) no longer holds. With a SQLite ``path``
+(``REKARBON_STORE=/path/to/store.db``) an evicted workspace's parameters
+and history, a few hundred bytes of JSON, are spilled to local disk and
+read back when its session returns; spilled rows idle for ``spill_ttl_s``
+are purged. The cache is dropped either way, and without SQLite the
+session starts again from the defaults.
+
+Saved scenarios are shared by every session: ``save`` returns the id that
+goes into a link (``?scenario=<id>``) another analyst opens. The latest
+``max_saved`` are kept in memory and, with SQLite, every one is written
+through, so links outlive eviction and restarts.
+"""
+
+import json
+import os
+import sqlite3
+import sys
+import threading
+import time
+import uuid
+from collections import OrderedDict, deque, namedtuple
+from pathlib import Path
+
+import streamlit as st
+
+PATH_ENV = 'REKARBON_STORE'
+BUDGET_ENV = 'REKARBON_STORE_MB'
+DEFAULT_BUDGET_MB = 64
+DEFAULT_TTL_S = 30 * 60
+SPILL_TTL_S = 30 * 86400
+PURGE_EVERY_S = 3600
+HISTORY = 10
+MAX_SAVED = 1000
+KEY = 'workspace'
+
+Scenario = namedtuple('Scenario', ['id', 'name', 'params', 'created'])
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS workspaces (key TEXT PRIMARY KEY, touched REAL, record TEXT);
+CREATE INDEX IF NOT EXISTS workspaces_touched ON workspaces (touched);
+CREATE TABLE IF NOT EXISTS scenarios (id TEXT PRIMARY KEY, name TEXT, params TEXT, created REAL);
+CREATE INDEX IF NOT EXISTS scenarios_created ON scenarios (created);
+"""
+
+
+def sizeof(value, seen=None):
+    """Estimated bytes held by ``value``: containers, strings and arrays, each object counted once."""
+    if seen is None:
+        seen = set()
+    if id(value) in seen:
+        return 0
+    seen.add(id(value))
+    # An array view's data is not in its getsizeof
+    size = max(sys.getsizeof(value), getattr(value, 'nbytes', 0))
+    if isinstance(value, dict):
+        size += sum(sizeof(k, seen) + sizeof(v, seen) for k, v in tuple(value.items()))
+    elif isinstance(value, (list, tuple, set, frozenset, deque)):
+        size += sum(sizeof(v, seen) for v in tuple(value))
+    return size
+
+
+class Workspace:
+    """One session's page parameters, recent scenarios and recomputable cache."""
+
+    __slots__ = ('key', 'params', 'history', 'shared', 'cache', 'touched', 'nbytes')
+
+    def __init__(self, key, params=None, history=(), shared=None):
+        self.key = key
+        self.params = dict(params or {})                # page -> {parameter: value}, spilled
+        self.history = deque(history, maxlen=HISTORY)   # scenarios as (parameter, value) pairs, newest last
+        self.shared = shared                            # id of the scenario last saved, spilled
+        self.cache = {}                                 # dropped on eviction
+        self.touched = 0.0
+        self.nbytes = 0
+
+    def remember(self, params):
+        """Add ``params`` to the history unless it is the latest entry already."""
+        entry = tuple(params.items())
+        if not self.history or self.history[-1] != entry:
+            self.history.append(entry)
+
+    def size(self):
+        seen = set()
+        return sizeof(self.params, seen) + sizeof(self.history, seen) + sizeof(self.cache, seen)
+
+    def record(self):
+        """The spilled part (parameters, history and shared scenario) as JSON."""
+        return json.dumps({'params': self.params, 'history': list(self.history), 'shared': self.shared})
+
+    @classmethod
+    def from_record(cls, key, record):
+        data = json.loads(record)
+        return cls(key, data['params'], (tuple(tuple(item) for item in entry) for entry in data['history']),
+                   data.get('shared'))
+
+
+class SessionStore:
+
+    def __init__(self, max_bytes=DEFAULT_BUDGET_MB * 1024 * 1024, ttl_s=DEFAULT_TTL_S, path=None,
+                 max_saved=MAX_SAVED, spill_ttl_s=SPILL_TTL_S, clock=time.time):
+        self.max_bytes = max_bytes
+        self.ttl_s = ttl_s
+        self.max_saved = max_saved
+        self.spill_ttl_s = spill_ttl_s
+        self.clock = clock
+        self._workspaces = OrderedDict()    # key -> Workspace, least recently used first
+        self._handed_out = {}               # key -> Workspace to size at the next call
+        self._pinned = {}                   # key -> when a rerun pinned it, until released
+        self._saved = OrderedDict()         # id -> Scenario, oldest first
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._db = _connect(path) if path else None
+        self._purged = 0.0
+        self.hits = self.misses = self.loads = self.evictions = self.expirations = self.spills = 0
+
+    # -------------------------------------------------------------------------
+    # Workspaces
+    # -------------------------------------------------------------------------
+
+    def get(self, key=None, pin=False):
+        """The workspace of ``key``: kept, spilled or a new one (with a new key for None).
+
+        With ``pin`` it is not evicted until ``release``.
+        """
+        now = self.clock()
+        with self._lock:
+            ws = self._workspaces.pop(key, None) if key else None
+            if ws is not None:
+                self.hits += 1
+            else:
+                self.misses += 1
+                ws = self._load(key) if key and self._db is not None else None
+                if ws is not None:
+                    self.loads += 1
+                else:
+                    ws = Workspace(key or uuid.uuid4().hex[:12])
+            ws.touched = now
+            self._workspaces[ws.key] = ws
+            if pin:
+                self._pinned[ws.key] = now
+            self._collect(now)
+            self._handed_out[ws.key] = ws
+        return ws
+
+    def release(self, key):
+        """Unpin the workspace of ``key`` once its rerun is done, and size it."""
+        with self._lock:
+            if self._pinned.pop(key, None) is None:
+                return
+            ws = self._handed_out.pop(key, None) or self._workspaces.get(key)
+            if ws is not None:
+                self._size(ws)
+
+    def _collect(self, now):
+        """Size the workspaces handed out since the last call, then evict expired and over-budget ones."""
+        for ws in self._handed_out.values():
+            self._size(ws)
+        self._handed_out.clear()
+        expired = now - self.ttl_s
+        for key, since in list(self._pinned.items()):
+            if since < expired:
+                del self._pinned[key]
+        for ws in list(self._workspaces.values()):
+            if ws.key in self._pinned:
+                continue
+            if ws.touched < expired:
+                self.expirations += 1
+            elif self._bytes > self.max_bytes and len(self._workspaces) > 1:
+                self.evictions += 1
+            else:
+                break
+            self._evict(ws)
+        if self._db is not None and now - self._purged > PURGE_EVERY_S:
+            self._purged = now
+            self._db.execute('DELETE FROM workspaces WHERE touched < ?', (now - self.spill_ttl_s,))
+
+    def _size(self, ws):
+        if self._workspaces.get(ws.key) is ws:
+            size = ws.size()
+            self._bytes += size - ws.nbytes
+            ws.nbytes = size
+
+    def _evict(self, ws):
+        del self._workspaces[ws.key]
+        self._bytes -= ws.nbytes
+        if self._db is not None:
+            self._db.execute('INSERT OR REPLACE INTO workspaces VALUES (?, ?, ?)', (ws.key, ws.touched, ws.record()))
+            self.spills += 1
+
+    def _load(self, key):
+        row = self._db.execute('SELECT record FROM workspaces WHERE key = ?', (key,)).fetchone()
+        return Workspace.from_record(key, row[0]) if row else None
+
+    # -------------------------------------------------------------------------
+    # Saved scenarios
+    # -------------------------------------------------------------------------
+
+    def save(self, name, params):
+        """Share ``params`` under ``name``; returns the ``Scenario``, whose id goes into a link."""
+        scenario = Scenario(uuid.uuid4().hex[:12], name, tuple(params.items()), self.clock())
+        with self._lock:
+            self._saved[scenario.id] = scenario
+            while len(self._saved) > self.max_saved:
+                self._saved.popitem(last=False)
+            if self._db is not None:
+                self._db.execute('INSERT INTO scenarios VALUES (?, ?, ?, ?)',
+                                 (scenario.id, name, json.dumps(params), scenario.created))
+        return scenario
+
+    def scenario(self, scenario_id):
+        """The saved scenario ``scenario_id`` (None if unknown)."""
+        with self._lock:
+            scenario = self._saved.get(scenario_id)
+            if scenario is None and self._db is not None:
+                row = self._db.execute('SELECT id, name, params, created FROM scenarios WHERE id = ?',
+                                       (scenario_id,)).fetchone()
+                scenario = _scenario(row) if row else None
+        return scenario
+
+    def scenarios(self, n=20):
+        """The latest ``n`` saved scenarios, newest first."""
+        with self._lock:
+            if self._db is not None:
+                rows = self._db.execute('SELECT id, name, params, created FROM scenarios '
+                                        'ORDER BY created DESC LIMIT ?', (n,)).fetchall()
+                return [_scenario(row) for row in rows]
+            return list(reversed(self._saved.values()))[:n]
+
+    # -------------------------------------------------------------------------
+    # Housekeeping
+    # -------------------------------------------------------------------------
+
+    def stats(self):
+        with self._lock:
+            spilled = self._db.execute('SELECT COUNT(*) FROM workspaces').fetchone()[0] if self._db else 0
+            return {
+                'workspaces': len(self._workspaces),
+                'bytes': self._bytes,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'loads': self.loads,
+                'evictions': self.evictions,
+                'expirations': self.expirations,
+                'spills': self.spills,
+                'spilled': spilled,
+                'pinned': len(self._pinned),
+                'saved': len(self._saved),
+            }
+
+    def clear(self):
+        with self._lock:
+            self._workspaces.clear()
+            self._handed_out.clear()
+            self._pinned.clear()
+            self._bytes = 0
+
+    def close(self):
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+
+def _connect(path):
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    # Autocommit; every call holds the store's lock, so one connection serves all sessions
+    db = sqlite3.connect(str(path), check_same_thread=False, isolation_level=None)
+    db.execute('PRAGMA journal_mode=WAL')
+    db.execute('PRAGMA synchronous=NORMAL')
+    db.executescript(SCHEMA)
+    return db
+
+
+def _scenario(row):
+    scenario_id, name, params, created = row
+    return Scenario(scenario_id, name, tuple(json.loads(params).items()), created)
+
+
+STORE = SessionStore(max_bytes=int(os.environ.get(BUDGET_ENV, DEFAULT_BUDGET_MB)) * 1024 * 1024,
+                     path=os.environ.get(PATH_ENV) or None)
+
+
+def workspace(store=STORE):
+    """This session's ``Workspace``, pinned for the rest of the rerun; ``st.session_state`` keeps only its key."""
+    ws = store.get(st.session_state.get(KEY), pin=True)
+    st.session_state[KEY] = ws.key
+    return ws
+
+
+def release(store=STORE):
+    """Unpin this session's workspace; the app script calls it once the page is rendered."""
+    key = st.session_state.get(KEY)
+    if key is not None:
+        store.release(key)
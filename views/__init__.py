@@ -0,0 +1,32 @@
+# -*- coding: utf-8 -*-
+"""
+Page registry for the dashboard.
+
+Each page lives in its own module exposing ``render(data, version)`` and is
+imported the first time it is visited, so a page's heavy dependencies
+(pandas, the telemetry store, the scenario engine) are only loaded by the
+pages that use them. The rest of the script (sidebar, footer) stays light.
+"""
+
+import importlib
+
+# Navigation order.
+PAGES = ('home', 'live', 'greensteel', 'credits', 'business', 'simulation',
+         'hyrex', 'carbon_neutral', 'compliance', 'mrv')
+
+# Not in the navigation; opened by URL, e.g. ``?page=diagnostics``.
+HIDDEN = ('diagnostics',)
+
+MODULES = {page: f'views.{page}' for page in PAGES + HIDDEN}
+
+
+def load(page):
+    """The page's module, importing it on first use (None if it has none)."""
+    name = MODULES.get(page)
+    return importlib.import_module(name) if name else None
+
+
+def render(page, data, version):
+    module = load(page)
+    if module is not None:
+        module.render(data, version)
@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+"""Business Case page: ROI headline and five-year projection."""
+
+from functools import lru_cache
+
+import plotly.graph_objects as go
+import streamlit as st
+from plotly.subplots import make_subplots
+
+from core import credits
+from ui import assets, figures
+from ui.i18n import messages
+
+
+@lru_cache(maxsize=None)
+def headline_cards(lang):
+    """Investment, payback, ROI and profit cards, rendered once per language."""
+    m = messages(lang)
+    return (
+        f"""
+        <div class='metric-card'>
+            <div class='metric-label'>{m.investment}</div>
+            <div class='metric-value'>₩3.75B</div>
+            <span class='metric-delta warning'>$3M</span>
+        </div>
+        """,
+        f"""
+        <div class='metric-card'>
+            <div class='metric-label'>{m.payback_card}</div>
+            <div class='metric-value'>1 {m.days}</div>
+            <span class='metric-delta positive'>~24{m.hours_short}</span>
+        </div>
+        """,
+        f"""
+        <div class='metric-card'>
+            <div class='metric-label'>{m.roi_5y}</div>
+            <div class='metric-value'>425,000%</div>
+            <span class='metric-delta positive'>{m.exceptional}</span>
+        </div>
+        """,
+        f"""
+        <div class='metric-card'>
+            <div class='metric-label'>{m.profit_5y}</div>
+            <div class='metric-value'>₩38T</div>
+            <span class='metric-delta positive'>$30B</span>
+        </div>
+        """,
+    )
+
+
+def render(data, version):
+    m = messages()
+    st.markdown(assets.header(m.business, m.business_subtitle), unsafe_allow_html=True)
+    
+    for col, card in zip(st.columns(4), headline_cards(m.lang)):
+        with col:
+            st.markdown(card, unsafe_allow_html=True)
+    
+    st.markdown("---")
+    
+    # 5-Year Projection
+    def projection_figure():
+        projection = credits.projection(data.projection)
+        years, cumulative = projection['years'], projection['cumulative']
+        l1_rev, l2_rev, l3_rev = projection['level_1'], projection['level_2'], projection['level_3']
+        
+        fig = make_subplots(specs=[[{"secondary_y": True}]])
+        
+        fig.add_trace(go.Bar(x=years, y=l1_rev, name='Level 1', marker_color='#003DA5'), secondary_y=False)
+        fig.add_trace(go.Bar(x=years, y=l2_rev, name='Level 2', marker_color='#E4002B'), secondary_y=False)
+        fig.add_trace(go.Bar(x=years, y=l3_rev, name='Level 3', marker_color='#00B894'), secondary_y=False)
+        fig.add_trace(go.Scatter(x=years, y=cumulative, name='Cumulative (₩T)',
+                                 mode='lines+markers', line=dict(color='#001F5B', width=4),
+                                 marker=dict(size=12)), secondary_y=True)
+        
+        fig.update_layout(
+            title={'text': m.projection_chart, 'x': 0.5},
+            barmode='stack', height=500, paper_bgcolor='rgba(0,0,0,0)', plot_bgcolor='rgba(0,0,0,0)',
+            legend=dict(orientation='h', yanchor='bottom', y=1.02, xanchor='center', x=0.5)
+        )
+        return fig
+    
+    figures.plotly_chart('business', 'projection', m.lang, version, projection_figure)
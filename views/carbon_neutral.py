@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+"""Korea 2050 Carbon Neutral page: progress against national targets and the cheapest path to 2050."""
+
+from functools import lru_cache
+
+import numpy as np
+import plotly.graph_objects as go
+import streamlit as st
+
+from core import progress, trajectory
+from ui import assets, figures, sessions
+from ui.i18n import messages
+
+ROUTE_COLORS = {'bf_bof': '#E4002B', 'eaf': '#003DA5', 'hyrex': '#00B894'}
+ROUTE_NAMES = {'bf_bof': 'BF-BOF', 'eaf': 'EAF', 'hyrex': 'HyREX'}
+
+
+@lru_cache(maxsize=None)
+def overall_score(lang):
+    """Overall alignment banner, rendered once per language."""
+    m = messages(lang)
+    return f"""
+    <div class='korea-box' style='text-align:center;'>
+        <h2 style='color:white;margin:0;'>{m.overall_alignment}</h2>
+        <div style='font-size:5rem;font-weight:800;color:#FFD700;'>89.5%</div>
+        <p style='color:rgba(255,255,255,0.9);'>{m.industry_leader}</p>
+    </div>
+    """
+
+
+def production_figure(plan, title):
+    """Output by route along ``plan``, stacked."""
+    fig = go.Figure()
+    for route in trajectory.ROUTES:
+        fig.add_trace(go.Scatter(x=plan.years, y=np.round(plan.output[route], 2), name=ROUTE_NAMES[route],
+                                 stackgroup='output', line=dict(width=0.5, color=ROUTE_COLORS[route])))
+    fig.update_layout(
+        title={'text': title, 'x': 0.5},
+        height=450, paper_bgcolor='rgba(0,0,0,0)', plot_bgcolor='rgba(0,0,0,0)',
+        legend=dict(orientation='h', yanchor='bottom', y=1.02, xanchor='center', x=0.5)
+    )
+    return fig
+
+
+def emissions_figure(plan, m):
+    fig = go.Figure()
+    fig.add_trace(go.Bar(x=plan.years, y=np.round(plan.capture, 2), name=m.captured, marker_color='#00B894'))
+    fig.add_trace(go.Scatter(x=plan.years, y=np.round(plan.emissions, 2), name=m.net_emissions,
+                             mode='lines+markers', line=dict(color='#001F5B', width=3)))
+    fig.update_layout(
+        title={'text': m.emissions_path, 'x': 0.5},
+        height=400, paper_bgcolor='rgba(0,0,0,0)', plot_bgcolor='rgba(0,0,0,0)',
+        legend=dict(orientation='h', yanchor='bottom', y=1.02, xanchor='center', x=0.5)
+    )
+    return fig
+
+
+def capex_figure(plan, m):
+    fig = go.Figure()
+    colors = dict(ROUTE_COLORS, ccus='#6C5CE7')
+    for tech in trajectory.BUILT:
+        fig.add_trace(go.Bar(x=plan.years, y=np.round(plan.built[tech] * trajectory.CAPEX_B[tech] / 1000, 3),
+                             name=ROUTE_NAMES.get(tech, 'CCUS'), marker_color=colors[tech]))
+    fig.update_layout(
+        title={'text': m.capex_path, 'x': 0.5},
+        barmode='stack', height=400, paper_bgcolor='rgba(0,0,0,0)', plot_bgcolor='rgba(0,0,0,0)',
+        legend=dict(orientation='h', yanchor='bottom', y=1.02, xanchor='center', x=0.5)
+    )
+    return fig
+
+
+def render(data, version):
+    m = messages()
+    st.markdown(assets.header(m.carbon_neutral, m.carbon_neutral_subtitle), unsafe_allow_html=True)
+    
+    # Overall Score
+    st.markdown(overall_score(m.lang), unsafe_allow_html=True)
+    
+    st.markdown("<br>", unsafe_allow_html=True)
+    
+    # Korea 2050 Targets Progress
+    colors = {'on_track': "#00B894", 'at_risk': "#F39C12", 'behind': "#E4002B"}
+    for row in progress.target_progress(data.korea_2050):
+        color = colors[row['status']]
+        unit = row['unit']
+        
+        st.markdown(f"""
+        <div class='metric-card' style='display:flex;justify-content:space-between;align-items:center;border-left-color:{color};'>
+            <div>
+                <strong>{row['key'].replace('_', ' ').title()}</strong><br>
+                <small>{m.current}: {row['current']}{unit} | {m.target}: {row['target']}{unit} ({row['year']})</small>
+            </div>
+            <div style='font-size:2rem;font-weight:800;color:{color};'>{row['pct']:.0f}%</div>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    # Cheapest path to 2050 (core/trajectory.py), re-solved warm on every slider move
+    st.markdown("---")
+    st.markdown(f"### {m.trajectory_title}")
+    st.caption(m.trajectory_caption)
+    
+    ws = sessions.workspace()
+    current = ws.params.get('trajectory', trajectory.DEFAULTS)
+    labels = {'budget': m.capex_budget, 'h2_2030': m.h2_supply_2030, 'h2_2050': m.h2_supply_2050,
+              'ccus_2050': m.ccus_capacity_2050}
+    params = {}
+    for col, (p, (lo, hi)) in zip(st.columns(len(labels)), trajectory.RANGES.items()):
+        with col:
+            params[p] = st.slider(labels[p], lo, hi, current.get(p, trajectory.DEFAULTS[p]),
+                                  step=trajectory.STEPS[p], key=f"trajectory_{p}")
+    modules = st.checkbox(m.whole_plants, value=current.get('modules', False), key='trajectory_modules')
+    ws.params['trajectory'] = dict(params, modules=modules)
+    
+    plan = trajectory.plan(modules=modules, **params)
+    if plan.status not in trajectory.FEASIBLE:
+        st.warning(m.trajectory_time_limit if plan.status == 'time_limit' else m.trajectory_infeasible)
+        return
+    if plan.status == 'feasible':
+        st.caption(m.trajectory_feasible)
+    
+    years = list(plan.years)
+    running = np.nonzero(plan.output['bf_bof'] > 0.01)[0]
+    c1, c2, c3, c4 = st.columns(4)
+    with c1: st.metric(m.discounted_cost, f"₩{plan.cost:,.1f}T")
+    with c2:
+        net_2030 = plan.emissions[years.index(2030)]
+        st.metric(m.emissions_2030, f"{net_2030:.1f} Mt", f"{(net_2030 / plan.emissions[0] - 1) * 100:+.0f}%")
+    with c3: st.metric(m.bf_bof_exit, f"{years[running[-1]]}" if len(running) else "—")
+    with c4: st.metric(m.solve_time, f"{plan.seconds * 1000:.1f} ms", m.warm_start if plan.warm else m.cold_start,
+                       delta_color='off')
+    
+    # Only optimal plans are memoised, so only their charts are shared: a
+    # time-limited plan is solved again and may differ next time
+    fig_key = f"{trajectory.key(params)}:{modules}"
+    cache = figures.FIGURES if plan.status == 'optimal' else None
+    figures.plotly_chart('carbon_neutral', f"production:{fig_key}", m.lang, version,
+                         lambda: production_figure(plan, m.production_path), cache=cache)
+    figures.plotly_chart('carbon_neutral', f"emissions:{fig_key}", m.lang, version,
+                         lambda: emissions_figure(plan, m), cache=cache)
+    figures.plotly_chart('carbon_neutral', f"capex:{fig_key}", m.lang, version, lambda: capex_figure(plan, m),
+                         cache=cache)
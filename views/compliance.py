@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+"""Compliance page: standards scorecard and K-ETS emission reports."""
+
+from functools import lru_cache, partial
+
+import pandas as pd
+import streamlit as st
+
+from telemetry import history, reports
+from ui import assets
+from ui.i18n import messages
+
+REPORT_KINDS = ('month', 'year')
+REPORT_POLL_S = 1
+
+
+@st.cache_resource
+def report_jobs():
+    """Process-wide K-ETS report queue over the furnace history and its cached daily aggregates."""
+    return reports.ReportJobs(reports.DailyAggregates(history.HistoryStore()))
+
+
+@lru_cache(maxsize=None)
+def regulation_boxes(lang):
+    """Korean and international regulation summaries, rendered once per language."""
+    m = messages(lang)
+    korea = f"""
+        <div class='success-box'>
+            <h4 style='margin:0;'>🇰🇷 {m.korean_regulations}</h4>
+            <ul>
+                <li><strong>K-ETS:</strong> {m.kets_phase_3}</li>
+                <li><strong>{m.carbon_neutral_act}:</strong> {m.compliant}</li>
+                <li><strong>{m.clean_air_act}:</strong> {m.compliant}</li>
+            </ul>
+        </div>
+        """
+    international = f"""
+        <div class='info-box'>
+            <h4 style='margin:0;'>🌍 {m.international_standards}</h4>
+            <ul>
+                <li><strong>ResponsibleSteel:</strong> {m.certified}</li>
+                <li><strong>ISO 14064 + 50001:</strong> {m.certified}</li>
+                <li><strong>TCFD + CDP:</strong> A- {m.rating}</li>
+            </ul>
+        </div>
+        """
+    return korea, international
+
+
+def render(data, version):
+    m = messages()
+    st.markdown(assets.header(m.compliance, m.compliance_subtitle), unsafe_allow_html=True)
+    
+    comp_data = []
+    for standard in data.compliance.values():
+        comp_data.append({'Standard': standard.name, 'Score': f"{standard.score}%", 'Status': standard.status})
+    
+    st.dataframe(pd.DataFrame(comp_data), use_container_width=True, hide_index=True)
+    
+    st.markdown("<br>", unsafe_allow_html=True)
+    
+    for col, box in zip(st.columns(2), regulation_boxes(m.lang)):
+        with col:
+            st.markdown(box, unsafe_allow_html=True)
+    
+    # K-ETS reports: built in the background, polled while the job runs
+    st.markdown(f"### 📑 {m.kets_reports}")
+    jobs = report_jobs()
+    days = jobs.aggregates.history.days()
+    if not days:
+        st.caption(m.history_empty)
+        return
+    c1, c2, c3 = st.columns([1, 2, 1])
+    with c1:
+        kind = st.radio(m.report_kind, REPORT_KINDS, format_func=lambda k: getattr(m, f"report_{k}"), horizontal=True)
+    with c2:
+        period = st.selectbox(m.report_period, reports.periods(days, kind))
+    with c3:
+        if st.button(m.generate_report, use_container_width=True):
+            st.session_state['kets_job'] = jobs.submit(kind, period).id
+    
+    job = jobs.get(st.session_state.get('kets_job'))
+    if job is None:
+        return
+    polling = job.pending
+    
+    @st.fragment(run_every=REPORT_POLL_S if polling else None)
+    def report_panel():
+        if job.pending:
+            st.progress(job.progress, text=f"{m.report_building} {job.period}: {job.done}/{job.total or '…'} {m.days}")
+            return
+        if polling:
+            st.rerun()
+        if job.status == 'failed':
+            st.error(f"{m.report_failed}: {job.error}")
+            return
+        report = job.report
+        t = report.totals
+        c1, c2, c3, c4 = st.columns(4)
+        with c1: st.metric(m.production + " (t)", f"{t['production_t']:,.0f}")
+        with c2: st.metric("CO₂ (t)", f"{t['emissions_t']:,.0f}")
+        with c3: st.metric("CO₂ (kg/t)", f"{t['intensity_kg_t']:,.1f}")
+        with c4: st.metric(m.days_with_data, f"{t['days_with_data']}/{t['days']}")
+        st.caption(f"{getattr(m, f'report_{report.kind}')} {report.period} · {report.recomputed} {m.days_recomputed}")
+        st.dataframe(report.routes.drop(columns='minutes'), use_container_width=True, hide_index=True)
+        st.dataframe(report.furnaces.drop(columns='minutes'), use_container_width=True, hide_index=True)
+        # Each format is built when its button is clicked, not on every rerun
+        for col, fmt in zip(st.columns(len(reports.EXPORTS)), reports.EXPORTS):
+            with col:
+                st.download_button(fmt.upper(), partial(job.export, fmt), file_name=f"k-ets-{report.period}.{fmt}",
+                                   mime=reports.EXPORTS[fmt][1], on_click='ignore', use_container_width=True)
+    
+    report_panel()
@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+"""Environmental Credits page: the three-level valuation framework."""
+
+import streamlit as st
+
+from core import credits
+from ui import assets
+from ui.i18n import messages
+
+
+def render(data, version):
+    m = messages()
+    st.markdown(assets.header(m.credits, m.credits_subtitle), unsafe_allow_html=True)
+    
+    # Level 1
+    st.markdown(f"### {m.level_1_title}")
+    
+    l1 = data.credits.level_1
+    cols = st.columns(4)
+    items = [('K-ETS Carbon', l1.lines['carbon_k_ets']), ('Green Steel Premium', l1.lines['green_steel_premium']),
+             ('Scrap Recycling', l1.lines['scrap_recycling']), ('Green Hydrogen', l1.lines['hydrogen'])]
+    
+    for i, (name, val) in enumerate(items):
+        with cols[i]:
+            st.markdown(f"""
+            <div class='metric-card'>
+                <div class='metric-label'>{name.upper()}</div>
+                <div class='metric-value' style='font-size:1.8rem;'>₩{val/1e9:.0f}B</div>
+            </div>
+            """, unsafe_allow_html=True)
+    
+    st.markdown(f"""
+    <div style='text-align:center;margin:2rem 0;'>
+        <span class='level-badge level-1' style='font-size:1.5rem;padding:1rem 3rem;'>
+            {m.level_1_total}: ₩{l1.total/1e9:.0f}B/{m.year} (${credits.to_usd(l1.total)/1e6:.0f}M)
+        </span>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # Level 2 + 3
+    c1, c2 = st.columns(2)
+    
+    with c1:
+        st.markdown(f"### {m.level_2_title}")
+        l2 = data.credits.level_2
+        for name, val in credits.line_items(l2):
+            st.markdown(f"""
+            <div class='metric-card' style='border-left-color:#E4002B;'>
+                <div class='metric-label'>{name.upper()}</div>
+                <div class='metric-value' style='font-size:1.5rem;color:#E4002B;'>₩{val/1e9:.0f}B</div>
+            </div>
+            """, unsafe_allow_html=True)
+    
+    with c2:
+        st.markdown(f"### {m.level_3_title}")
+        l3 = data.credits.level_3
+        for name, val in credits.line_items(l3):
+            st.markdown(f"""
+            <div class='metric-card' style='border-left-color:#00B894;'>
+                <div class='metric-label'>{name.replace('_', ' ').upper()}</div>
+                <div class='metric-value' style='font-size:1.5rem;color:#00B894;'>₩{val/1e9:.0f}B</div>
+            </div>
+            """, unsafe_allow_html=True)
+    
+    # Total
+    total = credits.total_value(data.credits)
+    st.markdown(f"""
+    <div class='steel-box' style='text-align:center;margin-top:2rem;'>
+        <h2 style='color:white;margin:0;'>{m.total_value}</h2>
+        <div style='font-size:5rem;font-weight:800;margin:1rem 0;'>₩{total/1e12:.1f}T</div>
+        <p style='color:rgba(255,255,255,0.8);font-size:1.3rem;'>${credits.to_usd(total)/1e9:.1f}B / {m.year}</p>
+    </div>
+    """, unsafe_allow_html=True)
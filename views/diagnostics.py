@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+"""Diagnostics page (hidden, ``?page=diagnostics``): the rerun profile of ``ui.profiling``."""
+
+import json
+from datetime import datetime
+
+import pandas as pd
+import streamlit as st
+
+from ui import assets, profiling
+from ui.i18n import messages
+
+SPAN_ROWS = 40
+
+
+def render(data, version):
+    m = messages()
+    st.markdown(assets.header(m.diagnostics, m.diagnostics_subtitle), unsafe_allow_html=True)
+    profiler = profiling.PROFILER
+    
+    c1, c2 = st.columns([3, 1])
+    with c1:
+        enabled = st.toggle(m.profiling_enabled, value=profiler.enabled)
+        if enabled != profiler.enabled:
+            profiler.enable(enabled)
+    with c2:
+        if st.button(m.reset_profile, use_container_width=True):
+            profiler.reset()
+    if not profiler.enabled:
+        st.info(m.profiling_off)
+    
+    snap = profiler.snapshot()
+    rerun_s = sum(snap['rerun_seconds'].values())
+    
+    c1, c2, c3, c4 = st.columns(4)
+    with c1: st.metric(m.profiled_reruns, f"{sum(snap['reruns'].values()):,}")
+    with c2: st.metric(m.profiled_sessions, f"{len(snap['sessions']):,}")
+    with c3: st.metric(m.bytes_emitted, f"{sum(snap['bytes'].values()) / 1024:,.0f} KB")
+    with c4: st.metric(m.profiling_since, datetime.fromtimestamp(snap['started']).strftime('%H:%M:%S'))
+    
+    # Spans: where rerun time goes, slowest total first
+    st.markdown(f"### {m.spans_title}")
+    spans = sorted(snap['spans'].items(), key=lambda item: -item[1]['seconds'])[:SPAN_ROWS]
+    if spans:
+        st.dataframe(pd.DataFrame([{
+            "Span": name,
+            "Calls": s['count'],
+            "Total (ms)": round(s['seconds'] * 1000, 1),
+            "Mean (ms)": round(s['seconds'] / s['count'] * 1000, 2),
+            "Max (ms)": round(s['max_s'] * 1000, 1),
+            "Share of reruns": f"{s['seconds'] / rerun_s:.1%}" if rerun_s else "",
+        } for name, s in spans]), use_container_width=True, hide_index=True)
+    
+    c1, c2 = st.columns(2)
+    
+    with c1:
+        st.markdown(f"### {m.reruns_by_page}")
+        if snap['reruns']:
+            st.dataframe(pd.DataFrame([{
+                "Page": page,
+                "Reruns": n,
+                "Mean (ms)": round(snap['rerun_seconds'][page] / n * 1000, 1),
+            } for page, n in sorted(snap['reruns'].items(), key=lambda item: -item[1])]),
+                use_container_width=True, hide_index=True)
+    
+    with c2:
+        st.markdown(f"### {m.bytes_by_element}")
+        if snap['bytes']:
+            st.dataframe(pd.DataFrame([{
+                "Element": element,
+                "Count": snap['elements'][element],
+                "KB": round(size / 1024, 1),
+                "Mean (bytes)": round(size / snap['elements'][element]),
+            } for element, size in sorted(snap['bytes'].items(), key=lambda item: -item[1])]),
+                use_container_width=True, hide_index=True)
+    
+    st.markdown(f"### {m.recent_reruns}")
+    if snap['recent']:
+        st.dataframe(pd.DataFrame([{
+            "Time": datetime.fromtimestamp(r['ts']).strftime('%H:%M:%S'),
+            "Page": r['page'],
+            "Session": (r['session'] or '')[:8],
+            "ms": round(r['seconds'] * 1000, 1),
+            "KB": round(r['bytes'] / 1024, 1),
+            "Slowest span": max(r['spans'], key=r['spans'].get) if r['spans'] else "",
+        } for r in reversed(snap['recent'])]), use_container_width=True, hide_index=True)
+    
+    # Exports
+    c1, c2, c3 = st.columns(3)
+    with c1:
+        st.download_button(m.export_prometheus, profiler.prometheus(), file_name='rekarbon-profile.prom',
+                           mime='text/plain', use_container_width=True)
+    with c2:
+        st.download_button(m.export_json, json.dumps(snap, indent=1), file_name='rekarbon-profile.json',
+                           mime='application/json', use_container_width=True)
+    with c3:
+        if st.button(m.save_profile, use_container_width=True):
+            st.success(f"{m.saved_to} {profiler.save()}")
@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+"""Green Steel page: production roadmap (the optimised 2050 path) and route intensities."""
+
+from functools import lru_cache
+
+import numpy as np
+import plotly.graph_objects as go
+import streamlit as st
+
+from core import trajectory
+from ui import assets, figures, sessions
+from ui.i18n import messages
+
+
+@lru_cache(maxsize=None)
+def hyrex_summary(lang):
+    """HyREX key facts, rendered once per language."""
+    m = messages(lang)
+    return f"""
+        <div class='hyrex-box'>
+            <h4 style='color:white;margin:0;'>⚗️ HyREX {m.hyrex_core}</h4>
+            <ul style='color:rgba(255,255,255,0.9);margin-top:1rem;'>
+                <li><strong>{m.principle}:</strong> {m.h2_reduces_ore}</li>
+                <li><strong>{m.efficiency}:</strong> 50 kg H₂/t {m.steel}</li>
+                <li><strong>CO₂:</strong> 95% {m.reduction} vs BF-BOF</li>
+                <li><strong>{m.pilot}:</strong> 2024 (50 kt/{m.year})</li>
+                <li><strong>{m.commercial}:</strong> 2030 (5 Mt/{m.year})</li>
+            </ul>
+        </div>
+        """
+
+
+def render(data, version):
+    m = messages()
+    st.markdown(assets.header(m.greensteel, m.greensteel_subtitle), unsafe_allow_html=True)
+    
+    # Green Steel Roadmap: the cheapest path to 2050 under this session's
+    # constraints, set on the carbon neutral page (core/trajectory.py)
+    st.markdown(f"### {m.roadmap_title}")
+    params = dict(sessions.workspace().params.get('trajectory', trajectory.DEFAULTS))
+    modules = params.pop('modules', False)
+    plan = trajectory.plan(modules=modules, **params)
+    caption = m.roadmap_computed
+    if plan.status not in trajectory.FEASIBLE:
+        plan, caption = trajectory.plan(), m.roadmap_default
+    if plan.status in trajectory.FEASIBLE:
+        years, output = plan.years, {r: np.round(plan.output[r], 2) for r in trajectory.ROUTES}
+        fig_id = f"roadmap:{trajectory.key(plan.params)}:{plan.modules}"
+        # A time-limited plan is solved again next time, so its chart is not shared
+        cache = figures.FIGURES if plan.status == 'optimal' else None
+    else:
+        # Not even the default constraints solved (e.g. the time limit): the published roadmap
+        roadmap = data.green_steel.roadmap
+        years, output = roadmap.years, {'bf_bof': roadmap.bf_bof, 'eaf': roadmap.eaf, 'hyrex': roadmap.hyrex}
+        fig_id, caption = 'roadmap:published', m.roadmap_published
+        cache = figures.FIGURES
+    
+    def roadmap_figure():
+        fig = go.Figure()
+        fig.add_trace(go.Bar(x=years, y=output['bf_bof'], name='BF-BOF', marker_color='#E4002B'))
+        fig.add_trace(go.Bar(x=years, y=output['eaf'], name='EAF', marker_color='#003DA5'))
+        fig.add_trace(go.Bar(x=years, y=output['hyrex'], name='HyREX', marker_color='#00B894'))
+        
+        fig.update_layout(
+            title={'text': m.roadmap_chart, 'x': 0.5},
+            barmode='stack', height=450, paper_bgcolor='rgba(0,0,0,0)', plot_bgcolor='rgba(0,0,0,0)',
+            legend=dict(orientation='h', yanchor='bottom', y=1.02, xanchor='center', x=0.5)
+        )
+        return fig
+    
+    figures.plotly_chart('greensteel', fig_id, m.lang, version, roadmap_figure, cache=cache)
+    st.caption(caption)
+    
+    st.markdown("<br>", unsafe_allow_html=True)
+    
+    # CO2 Intensity Comparison
+    c1, c2 = st.columns(2)
+    
+    with c1:
+        def route_intensity_figure():
+            intensities = data.green_steel.route_intensity
+            colors = ['#E4002B', '#003DA5', '#0066CC', '#00B894']
+            
+            fig = go.Figure(data=[go.Bar(x=list(intensities), y=list(intensities.values()), marker_color=colors)])
+            fig.update_layout(
+                title={'text': m.route_intensity_chart, 'x': 0.5},
+                height=400, paper_bgcolor='rgba(0,0,0,0)', plot_bgcolor='rgba(0,0,0,0)'
+            )
+            return fig
+        
+        figures.plotly_chart('greensteel', 'route_intensity', m.lang, version, route_intensity_figure)
+    
+    with c2:
+        st.markdown(hyrex_summary(m.lang), unsafe_allow_html=True)
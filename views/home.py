@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+"""Home / dashboard page: headline credit levels, divisions and technologies."""
+
+from functools import lru_cache
+
+import streamlit as st
+
+from core import credits
+from ui import assets
+from ui.i18n import localized, messages
+
+CERTIFICATIONS = ['K-ETS', 'ResponsibleSteel', 'ISO 14064', 'ISO 50001', 'GHG Protocol', 'TCFD', 'CDP A-', 'SBTi']
+CERTIFICATIONS_HTML = ("<div style='text-align:center;'>"
+                       + " ".join(f"<span class='cert-badge'>{c}</span>" for c in CERTIFICATIONS) + "</div>")
+
+
+@lru_cache(maxsize=None)
+def technology_cards(lang):
+    """HyREX, EAF and CCUS cards, rendered once per language."""
+    m = messages(lang)
+    hyrex = f"""
+        <div class='hyrex-box'>
+            <h4 style='color:white;margin:0;'>⚗️ HyREX {m.hyrex_dri}</h4>
+            <div style='font-size:4rem;font-weight:800;text-align:center;margin:1rem 0;'>95%</div>
+            <p style='color:rgba(255,255,255,0.9);text-align:center;'>{m.co2_reduction_vs_bf}</p>
+            <p style='color:rgba(255,255,255,0.7);text-align:center;font-size:0.85rem;'>{m.pilot_commercial}</p>
+        </div>
+        """
+    eaf = f"""
+        <div class='steel-box'>
+            <h4 style='color:white;margin:0;'>♻️ {m.eaf_name}</h4>
+            <div style='font-size:4rem;font-weight:800;text-align:center;margin:1rem 0;'>8Mt</div>
+            <p style='color:rgba(255,255,255,0.9);text-align:center;'>{m.target_2030}</p>
+            <p style='color:rgba(255,255,255,0.7);text-align:center;font-size:0.85rem;'>{m.scrap_recycling_100}</p>
+        </div>
+        """
+    ccus = f"""
+        <div class='korea-box'>
+            <h4 style='color:white;margin:0;'>🔒 CCUS {m.carbon_capture}</h4>
+            <div style='font-size:4rem;font-weight:800;text-align:center;margin:1rem 0;'>10Mt</div>
+            <p style='color:rgba(255,255,255,0.9);text-align:center;'>{m.target_2050}</p>
+            <p style='color:rgba(255,255,255,0.7);text-align:center;font-size:0.85rem;'>{m.east_sea_storage}</p>
+        </div>
+        """
+    return hyrex, eaf, ccus
+
+
+def render(data, version):
+    m = messages()
+    
+    # Header
+    st.markdown(assets.header(m.home_title, m.home_subtitle), unsafe_allow_html=True)
+    
+    # Top Level Metrics
+    l1, l2, l3 = credits.level_totals(data.credits).values()
+    
+    c1, c2, c3, c4 = st.columns(4)
+    
+    with c1:
+        st.markdown(f"""
+        <div class='metric-card'>
+            <div class='metric-label'>{m.level_1_card}</div>
+            <div class='metric-value'>₩{l1/1e12:.2f}T</div>
+            <span class='level-badge level-1'>/{m.year}</span>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with c2:
+        st.markdown(f"""
+        <div class='metric-card'>
+            <div class='metric-label'>{m.level_2_card}</div>
+            <div class='metric-value'>₩{l2/1e12:.2f}T</div>
+            <span class='level-badge level-2'>/{m.year}</span>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with c3:
+        st.markdown(f"""
+        <div class='metric-card'>
+            <div class='metric-label'>{m.level_3_card}</div>
+            <div class='metric-value'>₩{l3/1e12:.2f}T</div>
+            <span class='level-badge level-3'>/{m.year}</span>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with c4:
+        st.markdown(f"""
+        <div class='metric-card'>
+            <div class='metric-label'>{m.usd_equivalent}</div>
+            <div class='metric-value'>${credits.to_usd(l3)/1e9:.1f}B</div>
+            <span class='metric-delta positive'>/{m.year}</span>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    st.markdown("<br>", unsafe_allow_html=True)
+    
+    # 4 Divisions
+    st.markdown(f"### {m.divisions_title}")
+    
+    cols = st.columns(4)
+    divs = list(data.divisions.items())
+    
+    for i, (key, div) in enumerate(divs):
+        with cols[i]:
+            st.markdown(f"""
+            <div class='metric-card' style='text-align:center;'>
+                <div style='font-size:3rem;'>{div.emoji}</div>
+                <h4 style='color:#003DA5;margin:0.5rem 0;'>{localized(div, 'name', m.lang)}</h4>
+                <p style='font-size:0.85rem;color:#666;'>{div.pct}% {m.revenue}</p>
+                <div style='font-size:1.8rem;font-weight:800;color:#001F5B;'>₩{div.credits_krw/1e9:.0f}B</div>
+                <p style='font-size:0.75rem;color:#00B894;margin-top:0.5rem;'>{div.sensors} {m.sensors}</p>
+            </div>
+            """, unsafe_allow_html=True)
+    
+    st.markdown("<br>", unsafe_allow_html=True)
+    
+    # Green Steel Technologies
+    st.markdown(f"### {m.technologies_title}")
+    
+    for col, card in zip(st.columns(3), technology_cards(m.lang)):
+        with col:
+            st.markdown(card, unsafe_allow_html=True)
+    
+    st.markdown("<br>", unsafe_allow_html=True)
+    
+    # Certifications
+    st.markdown(f"### {m.certifications_title}")
+    
+    st.markdown(CERTIFICATIONS_HTML, unsafe_allow_html=True)
@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+"""HyREX Technology page: H2 shaft-furnace mass and energy balance."""
+
+from functools import lru_cache
+
+import pandas as pd
+import plotly.graph_objects as go
+import streamlit as st
+
+from core import hyrex
+from ui import assets, figures, sessions
+from ui.i18n import messages
+
+ENVELOPE_METRICS = ('h2_makeup_kg', 'energy_kwh', 'co2_kg', 'utilisation')
+
+
+def envelope_labels(m):
+    return {'h2_makeup_kg': m.h2_makeup, 'energy_kwh': 'kWh/t', 'co2_kg': m.co2_per_t, 'utilisation': m.h2_utilisation}
+
+
+@lru_cache(maxsize=256)
+def envelope_heatmap(grade, metric, lang):
+    """Layout and heatmap trace of the operating envelope, serialised once per (grade, metric, language)."""
+    m = messages(lang)
+    label = envelope_labels(m)[metric]
+    purities, temperatures, envelope = hyrex.envelope(grade)
+    fig = go.Figure(data=go.Heatmap(
+        x=temperatures, y=purities, z=getattr(envelope, metric),
+        colorscale='Blues' if metric == 'utilisation' else 'RdYlGn_r', colorbar=dict(title=label)
+    ))
+    fig.update_layout(
+        title={'text': f"{label} • {grade:g}% Fe", 'x': 0.5},
+        xaxis_title=m.gas_temperature, yaxis_title=m.h2_purity,
+        height=450, paper_bgcolor='rgba(0,0,0,0)', plot_bgcolor='rgba(0,0,0,0)'
+    )
+    # Through the figure, whose arrays serialise as base64 typed arrays
+    return figures.frame(fig), figures.trace(**fig.to_plotly_json()['data'][0])
+
+
+def render(data, version):
+    m = messages()
+    plan = data.green_steel.hyrex
+    bf_bof = data.green_steel.route_intensity['BF-BOF']
+    st.markdown(assets.header(m.hyrex, m.hyrex_subtitle), unsafe_allow_html=True)
+
+    ws = sessions.workspace()
+    current = ws.params.setdefault('hyrex', dict(hyrex.DEFAULTS))
+
+    # Operating point: keyed, so a slider keeps its identity when its default
+    # follows the stored point (an unkeyed widget drops every other move)
+    c1, c2, c3 = st.columns(3)
+    with c1:
+        purity = st.slider(m.h2_purity, *hyrex.RANGES['purity'], current['purity'],
+                           step=hyrex.STEPS['purity'], key='hyrex_purity')
+    with c2:
+        grade = st.slider(m.ore_grade, *hyrex.RANGES['grade'], current['grade'],
+                          step=hyrex.STEPS['grade'], key='hyrex_grade')
+    with c3:
+        temperature = st.slider(m.gas_temperature, *hyrex.RANGES['temperature'], current['temperature'],
+                                step=hyrex.STEPS['temperature'], key='hyrex_temperature')
+    ws.params['hyrex'] = {'purity': purity, 'grade': grade, 'temperature': temperature}
+
+    b = hyrex.steady_state(purity, grade, temperature)
+    reduction = 1 - b.co2_kg / bf_bof
+
+    c1, c2, c3, c4 = st.columns(4)
+    with c1: st.metric(m.h2_makeup, f"{b.h2_makeup_kg:.1f}",
+                       f"{b.h2_makeup_kg - plan.h2_per_tonne:+.1f} {m.vs_plan} ({plan.h2_per_tonne})", delta_color='inverse')
+    with c2: st.metric(m.h2_utilisation, f"{b.utilisation:.1%}",
+                       f"{b.bed_temperature:.0f} °C {m.bed_temperature}", delta_color='off')
+    with c3: st.metric(m.electricity, f"{b.energy_kwh / 1000:.2f}")
+    with c4: st.metric(m.co2_per_t, f"{b.co2_kg:.0f}",
+                       f"{-reduction:.1%} {m.vs_bf_bof} ({m.vs_plan} -{plan.co2_reduction}%)", delta_color='inverse')
+
+    st.markdown("---")
+
+    c1, c2 = st.columns(2)
+
+    with c1:
+        st.markdown(f"### {m.mass_balance_title}")
+        rows = [
+            (m.flow_in, m.iron_ore, b.ore_t, 't'),
+            (m.flow_in, 'H₂', b.h2_makeup_kg, 'kg'),
+            (m.flow_in, m.inerts, b.inert_purged_kg, 'kg'),
+            (m.flow_out, m.dri, 1.0, 't'),
+            (m.flow_out, m.water, b.water_t, 't'),
+            (m.flow_out, m.purge_h2, b.h2_purged_kg, 'kg'),
+            (m.flow_out, m.purge_inerts, b.inert_purged_kg, 'kg'),
+        ]
+        st.dataframe(pd.DataFrame([
+            {'': direction, m.stream: name, m.amount: f"{amount:,.3f}" if unit == 't' else f"{amount:,.1f}", m.unit: unit}
+            for direction, name, amount, unit in rows
+        ]), use_container_width=True, hide_index=True)
+        st.caption(f"{m.mass_closure} {hyrex.mass_closure(b):.1e} • {b.iterations} {m.iterations}")
+
+    with c2:
+        st.markdown(f"### {m.energy_title}")
+        st.markdown(f"""
+        <div class='hyrex-box'>
+            <ul style='color:rgba(255,255,255,0.9);margin-top:0.5rem;'>
+                <li><strong>{m.electrolysis}:</strong> {b.electrolysis_kwh:,.0f} kWh/t</li>
+                <li><strong>{m.gas_heater}:</strong> {b.heater_kwh:,.0f} kWh/t</li>
+                <li><strong>{m.gas_flow}:</strong> {b.gas_flow_nm3:,.0f} Nm³/t ({b.inert_fraction:.1%} N₂)</li>
+                <li><strong>{m.temperature_profile}:</strong> {b.temperature:.0f} → {b.bed_temperature:.0f} → {b.top_gas_temperature:.0f} °C</li>
+            </ul>
+            <p style='color:rgba(255,255,255,0.8);margin:0;'>
+                {m.at_commercial_scale} ({plan.commercial_mt:g} Mt/{m.year}, {plan.commercial_year}):
+                H₂ {b.h2_makeup_kg * plan.commercial_mt:,.0f} kt • {b.energy_kwh * plan.commercial_mt / 1000:,.1f} TWh
+            </p>
+        </div>
+        """, unsafe_allow_html=True)
+
+    # Operating envelope: every purity × temperature position at this ore grade, one vectorised solve
+    st.markdown("---")
+    st.markdown(f"### {m.envelope_title}")
+
+    metric = st.selectbox(m.envelope_metric, ENVELOPE_METRICS, format_func=envelope_labels(m).get)
+    # The heatmap is serialised once per grade and metric; only the operating point moves per rerun
+    frame, heatmap = envelope_heatmap(grade, metric, m.lang)
+    figures.plotly_spec('hyrex', 'envelope', figures.compose(frame, heatmap, figures.trace(
+        type='scatter', x=[temperature], y=[purity], mode='markers',
+        marker=dict(color='#E4002B', size=14, symbol='x'), showlegend=False
+    )))
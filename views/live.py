@@ -0,0 +1,295 @@
+# -*- coding: utf-8 -*-
+"""Live Monitoring page: gauges, furnace table and charts over the telemetry store."""
+
+import os
+import time
+from datetime import datetime
+from functools import partial
+
+import pandas as pd
+import plotly.graph_objects as go
+import streamlit as st
+
+from telemetry import CHANNELS, Feed, RingStore, SensorSimulator, build_catalogue, edge, history, proofs, site, snapshot
+from ui import assets, downsample, figures, profiling, refresh
+from ui.i18n import messages
+
+# =============================================================================
+# SHARED RESOURCES - TELEMETRY STORE
+# =============================================================================
+
+TELEMETRY_PERIOD_S = 10
+TELEMETRY_HISTORY_S = 24 * 3600
+TELEMETRY_SEED = 2024
+OPERATOR_SEED = 2050
+SEQUENCES_FILE = 'sequences.json'
+STALE_TICKS = 3
+ALERT_ROWS = snapshot.ALERT_ROWS
+FURNACE_STATUS = {
+    'running': "🟢 Running", 'maintenance': "🟡 Maintenance",
+    'drift': "🟠 Drift", 'anomaly': "🔴 Anomaly",
+}
+HISTORY_DAYS = 90
+HISTORY_BUCKET_S = 3600
+TREND_RANGES = {'1h': 3600, '6h': 6 * 3600, '24h': 24 * 3600, '7d': 7 * 24 * 3600}
+GAUGES = {
+    'production': dict(
+        mode="gauge+number", title="Steel Production (t/day)",
+        gauge={'axis': {'range': [30000, 50000]}, 'bar': {'color': "#003DA5"}}),
+    'intensity': dict(
+        mode="gauge+number+delta", title="CO₂ Intensity (kg/t)",
+        delta={'reference': 1857, 'decreasing': {'color': "#00B894"}},
+        gauge={'axis': {'range': [1000, 2500]}, 'bar': {'color': "#E4002B"},
+               'steps': [{'range': [1000, 1500], 'color': "#E8F5E9"}, {'range': [1500, 2000], 'color': "#FFF3E0"},
+                         {'range': [2000, 2500], 'color': "#FFEBEE"}]}),
+    'scrap': dict(
+        mode="gauge+number+delta", title="Scrap Rate (%)", delta={'reference': 20},
+        gauge={'axis': {'range': [0, 50]}, 'bar': {'color': "#00B894"}}),
+    'compliance': dict(
+        mode="gauge+number", title="K-ETS Compliance (%)",
+        gauge={'axis': {'range': [80, 100]}, 'bar': {'color': "#003DA5"}}),
+}
+# Live figures are keyed by snapshot version: one build per tick, shared by every viewer.
+# Superseded versions age out of the byte budget.
+LIVE_FIGURES = figures.FigureCache(max_bytes=2 * 1024 * 1024)
+HISTORY_LABELS = {
+    'output_t_day': 'Output (t/day)', 'temp_c': 'Temp (°C)',
+    'co2_kg_t': 'CO₂ (kg/t)', 'efficiency_pct': 'Efficiency (%)',
+}
+
+
+@st.cache_resource
+def furnace_history():
+    """Process-wide on-disk per-minute history of the furnaces."""
+    return history.HistoryStore()
+
+
+@st.cache_resource
+def proof_packs():
+    """Process-wide DT-SEQ proof packs of the verified readings, and the operator key that seals them."""
+    return proofs.ProofPacks(), edge.seeded_key(OPERATOR_SEED)
+
+
+@st.cache_resource
+def live_snapshots(division_sensors):
+    """Process-wide live snapshot producer over the 60 edge sensors, fed by the simulator.
+
+    ``division_sensors`` is a tuple of ``(division, sensor count)`` pairs.
+    The feed maintains the ring store, the site rollup pyramid the trend
+    charts read and the anomaly detectors behind the furnace statuses and
+    alerts, records the furnaces' live frames into ``furnace_history``, and
+    publishes one ``telemetry.snapshot.Snapshot`` per frame that every
+    viewer reads. Live frames arrive as Ed25519-signed device payloads; only
+    those the verifier accepts are ingested, and they are appended to the
+    current period's proof pack. The verifier keeps each device's last
+    accepted sequence number next to the packs, and the simulated devices
+    resume after it, so a restart neither reuses nor accepts old numbers.
+    """
+    sensors = build_catalogue(dict(division_sensors))
+    store = RingStore(sensors, CHANNELS, TELEMETRY_HISTORY_S // TELEMETRY_PERIOD_S)
+    rollup = site.SiteRollup(sensors, CHANNELS)
+    monitor = site.SiteMonitor(sensors, CHANNELS)
+    recorder = history.HistoryRecorder(furnace_history(), sensors)
+    devices = edge.EdgeDevices(sensors, seed=TELEMETRY_SEED)
+    packs, operator = proof_packs()
+    verifier = edge.Verifier(edge.KeyRing(devices.public_keys()), channels=len(CHANNELS),
+                             state=os.path.join(packs.root, SEQUENCES_FILE))
+    devices.resume(verifier.last_seqs())
+    source = edge.VerifiedSource(SensorSimulator(sensors, seed=TELEMETRY_SEED), devices, verifier, proofs=packs)
+    producer = snapshot.SnapshotProducer(store, rollup, monitor, verifier, proofs=packs, signer=operator,
+                                         ranges=TREND_RANGES.values(), alert_rows=ALERT_ROWS)
+    Feed(store, source, period_s=TELEMETRY_PERIOD_S,
+         rollup=rollup, monitor=monitor, recorder=recorder, snapshots=producer).start()
+    return producer
+
+
+@st.cache_data(ttl=60, max_entries=len(HISTORY_LABELS), show_spinner=False)
+def furnace_trend(channel, end):
+    """``HISTORY_DAYS`` of ``channel`` per furnace up to ``end``, in ``HISTORY_BUCKET_S`` means.
+
+    Returns one LTTB-downsampled ``(x_ms, y)`` per furnace.
+    """
+    furnaces = furnace_history()
+    starts, means = furnaces.trend(channel, end - HISTORY_DAYS * history.DAY_S, end, HISTORY_BUCKET_S)
+    n = downsample.points_per_trace(len(furnaces.furnaces))
+    return [downsample.trace(starts, series, n) for series in means]
+
+# =============================================================================
+# FIGURES - BUILT ONCE PER SNAPSHOT VERSION
+# =============================================================================
+
+
+def gauge_figure(key, value):
+    spec = dict(GAUGES[key])
+    fig = go.Figure(go.Indicator(value=value, title={'text': spec.pop('title'), 'font': {'size': 14}}, **spec))
+    fig.update_layout(height=250, margin=dict(t=50, b=0, l=20, r=20), paper_bgcolor='rgba(0,0,0,0)')
+    return fig
+
+
+def production_figure(rollup, window, title):
+    n = downsample.points_per_trace(2)
+    fig = go.Figure()
+    for name, series, color, fill in (('BF-BOF', 'bf_bof', '#003DA5', 'rgba(0,61,165,0.3)'),
+                                      ('EAF', 'eaf', '#00B894', 'rgba(0,184,148,0.3)')):
+        x, y = downsample.trace(window.ts, window.mean[rollup.series_index(series)], n)
+        fig.add_trace(go.Scatter(x=x, y=y, name=name, fill='tozeroy', fillcolor=fill, line=dict(color=color, width=2)))
+
+    fig.update_layout(
+        title={'text': title, 'x': 0.5},
+        height=350, paper_bgcolor='rgba(0,0,0,0)', plot_bgcolor='rgba(0,0,0,0)',
+        xaxis_type='date', yaxis_title='Tonnes'
+    )
+    return fig
+
+
+def intensity_figure(rollup, window, title):
+    i = rollup.series_index('intensity')
+    x, y, low, high = downsample.trace(window.ts, window.mean[i], downsample.points_per_trace(3),
+                                       low=window.min[i], high=window.max[i])
+
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(x=x, y=high, line=dict(width=0), hoverinfo='skip', showlegend=False))
+    fig.add_trace(go.Scatter(x=x, y=low, line=dict(width=0), fill='tonexty', fillcolor='rgba(228,0,43,0.1)',
+                             hoverinfo='skip', showlegend=False))
+    fig.add_trace(go.Scatter(x=x, y=y, name='Intensity', line=dict(color='#E4002B', width=2)))
+    fig.add_hline(y=1650, line_dash="dash", line_color="#00B894", annotation_text="2030 Target")
+
+    fig.update_layout(
+        title={'text': title, 'x': 0.5},
+        height=350, paper_bgcolor='rgba(0,0,0,0)', plot_bgcolor='rgba(0,0,0,0)', xaxis_type='date'
+    )
+    return fig
+
+# =============================================================================
+# PAGE
+# =============================================================================
+
+
+def render(data, version):
+    m = messages()
+    st.markdown(assets.header(m.live, f"<span class='live-dot'></span>{m.live_subtitle}"), unsafe_allow_html=True)
+    
+    # Auto-refresh: only the panels below rerun, on the fragment's own timer
+    c1, c2 = st.columns([1, 3])
+    with c1:
+        auto_refresh = st.checkbox("🔄 Auto-refresh", value=False)
+    run_every = None
+    if auto_refresh:
+        with c2:
+            interval = st.select_slider(
+                m.refresh_interval,
+                options=refresh.INTERVAL_OPTIONS, value=refresh.DEFAULT_INTERVAL_S
+            )
+        run_every = refresh.effective_interval(interval, refresh.tab_visible())
+    
+    @refresh.live_fragment(run_every)
+    def live_panels():
+        producer = live_snapshots(tuple((d.key, d.sensors) for d in data.divisions.values()))
+        # One immutable snapshot for the whole rerun, shared with every other viewer
+        snap = producer.latest()
+        feed = snap.feed
+        stale = feed is not None and (
+            (feed.error_ts or 0) > feed.last_tick or time.time() - feed.last_tick > STALE_TICKS * TELEMETRY_PERIOD_S)
+        
+        # CERBERE Status
+        st.markdown(f"""
+        <div style='background:linear-gradient(135deg,#001F5B,#003DA5);padding:1rem;border-radius:10px;margin-bottom:1rem;'>
+            <span style='color:#00B894;font-weight:bold;'>🛡️ CERBERE</span>
+            <span style='color:white;margin-left:1rem;'>{m.status}:</span>
+            <span style='color:{"#FDCB6E" if stale else "#00B894"};margin-left:0.5rem;'>● {"STALE" if stale else "ACTIVE"}</span>
+            <span style='color:{"#FDCB6E" if snap.alerts_last_hour else "#00B894"};margin-left:2rem;'>Watchdog: {snap.alerts_last_hour} {m.alerts_last_hour}</span>
+            <span style='color:{"#FDCB6E" if snap.quarantined else "#00B894"};margin-left:2rem;'>Ed25519: {snap.verified:,} {m.signatures_verified} · {snap.quarantined:,} {m.quarantined}</span>
+            <span style='color:rgba(255,255,255,0.7);margin-left:2rem;'>Last scan: {datetime.fromtimestamp(snap.ts).strftime('%H:%M:%S')}</span>
+        </div>
+        """, unsafe_allow_html=True)
+        if stale:
+            error = f" · {m.feed_error}: {feed.last_error}" if feed.last_error else ''
+            st.warning(f"{m.feed_stale} {datetime.fromtimestamp(feed.last_tick).strftime('%H:%M:%S')}{error}")
+        
+        # DT-SEQ proof pack of the current period, with its signed root for export
+        proof = snap.proof
+        c1, c2 = st.columns([3, 1])
+        with c1:
+            st.caption(f"🔏 DT-SEQ {proof.period}: {proof.size:,} {m.proof_leaves} · root {proof.root[:16]}…")
+        with c2:
+            st.download_button(m.export_root, proof.sealed, file_name=f"dtseq-{proof.period}.json",
+                               mime='application/json')
+        
+        # Real-Time Gauges
+        with profiling.span('live:gauges'):
+            st.markdown(f"### {m.gauges_title}")
+            
+            for col, key in zip(st.columns(len(GAUGES)), GAUGES):
+                with col:
+                    figures.plotly_chart('live', f'gauge_{key}', m.lang, snap.version,
+                                         partial(gauge_figure, key, snap.gauges[key]), cache=LIVE_FIGURES)
+        
+        st.markdown("---")
+        
+        # Blast Furnace Dashboard
+        with profiling.span('live:furnace_table'):
+            st.markdown(f"### 🏭 {m.furnace_dashboard}")
+            
+            bf_data = []
+            for bf in snap.furnaces:
+                bf_data.append({
+                    "🏭 Furnace": bf['name'],
+                    "Output (t/day)": f"{bf['output']:,.0f}",
+                    "Temp (°C)": f"{bf['temp']:,.0f}",
+                    "CO₂ (kg/t)": round(bf['co2']),
+                    "Efficiency": f"{bf['efficiency']:.1f}%",
+                    "Status": FURNACE_STATUS[bf['status']]
+                })
+            
+            df_bf = pd.DataFrame(bf_data)
+            st.dataframe(df_bf, use_container_width=True, hide_index=True)
+        
+        # Alert panel: latest detector signals across every sensor channel
+        with profiling.span('live:alerts'):
+            st.markdown(f"#### 🚨 {m.alerts_title}")
+            if snap.alerts:
+                st.dataframe(pd.DataFrame([{
+                    "Time": datetime.fromtimestamp(a.ts).strftime('%m-%d %H:%M:%S'),
+                    "Sensor": a.sensor,
+                    "Channel": a.channel,
+                    "Detector": a.kind,
+                    "Value": f"{a.value:,.1f}",
+                    "Score": f"{a.score:,.1f}",
+                } for a in snap.alerts]), use_container_width=True, hide_index=True)
+            else:
+                st.caption(m.no_alerts)
+        
+        # Furnace history: per-minute readings on disk, averaged per window
+        with profiling.span('live:history'):
+            channel = st.selectbox(m.furnace_history, list(HISTORY_LABELS), format_func=HISTORY_LABELS.get)
+            end = (time.time() // HISTORY_BUCKET_S + 1) * HISTORY_BUCKET_S
+            traces = furnace_trend(channel, end)
+            if not any(len(x) for x, _ in traces):
+                st.caption(m.history_empty)
+            else:
+                fig = go.Figure()
+                for furnace, (x, y) in zip(furnace_history().furnaces, traces):
+                    fig.add_trace(go.Scatter(x=x, y=y, name=furnace, mode='lines', line=dict(width=1.5)))
+                fig.update_layout(
+                    title={'text': f"{HISTORY_LABELS[channel]} • {HISTORY_DAYS} {m.days}", 'x': 0.5},
+                    height=350, paper_bgcolor='rgba(0,0,0,0)', plot_bgcolor='rgba(0,0,0,0)', xaxis_type='date'
+                )
+                st.plotly_chart(fig, use_container_width=True)
+        
+        # Production Charts: rollup buckets for the range, LTTB-capped per trace
+        with profiling.span('live:trends'):
+            span = TREND_RANGES[st.radio(m.trend_range, list(TREND_RANGES), index=2, horizontal=True)]
+            window = snap.trends[span]
+            c1, c2 = st.columns(2)
+            
+            with c1:
+                figures.plotly_chart('live', f'production_{span}', m.lang, snap.version,
+                                     partial(production_figure, producer.rollup, window, m.production_chart),
+                                     cache=LIVE_FIGURES)
+            
+            with c2:
+                figures.plotly_chart('live', f'intensity_{span}', m.lang, snap.version,
+                                     partial(intensity_figure, producer.rollup, window, m.intensity_chart),
+                                     cache=LIVE_FIGURES)
+    
+    live_panels()
@@ -0,0 +1,22 @@
+# -*- coding: utf-8 -*-
+"""MRV Architecture page."""
+
+import streamlit as st
+
+from ui import assets
+from ui.i18n import messages
+
+
+def render(data, version):
+    m = messages()
+    st.markdown(assets.header(m.mrv, m.mrv_subtitle), unsafe_allow_html=True)
+    
+    # Architecture
+    st.markdown(assets.mrv_architecture(), unsafe_allow_html=True)
+    
+    st.markdown("<br>", unsafe_allow_html=True)
+    
+    # CERBERE
+    st.markdown(f"### 🛡️ {m.cerbere_title}")
+    
+    st.markdown(assets.cerbere(m.lang), unsafe_allow_html=True)
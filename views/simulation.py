@@ -0,0 +1,337 @@
+# -*- coding: utf-8 -*-
+"""Simulation page: scenario sliders, sensitivity heatmap and Monte Carlo bands."""
+
+import pandas as pd
+import plotly.graph_objects as go
+import streamlit as st
+
+from core import montecarlo, scenarios
+from ui import assets, figures, reactive, sessions
+from ui.i18n import messages
+
+CATEGORIES = ['HyREX', 'EAF', 'Scrap', 'H2', 'CCUS']
+LABELS = dict(zip(scenarios.PARAMS, CATEGORIES))
+SAVED_SHOWN = 20
+METRICS = {'l1': 'Level 1 (₩B)', 'l2': 'Level 2 (₩B)', 'l3': 'Total (₩B)', 'intensity': 'CO₂ (kg/t)'}
+
+
+@st.cache_resource
+def monte_carlo_pool():
+    """Process pool shared by every session for Monte Carlo runs (None on one core)."""
+    return montecarlo.make_pool()
+
+
+# =============================================================================
+# DERIVED VALUES AND FIGURES (ui/reactive.py)
+# =============================================================================
+# Inputs: the five sliders, and the heatmap's axes (sx, sy) and metric.
+# Each cell recomputes only when one of its dependencies changed; figures
+# are kept serialised, so an unchanged one is re-sent as is. A figure's
+# layout (its frame) is serialised once and a move re-serialises only the
+# traces it changed.
+
+SIMULATION = reactive.Graph('simulation')
+
+
+@SIMULATION.cell('ccus')
+def carbon(ccus):
+    return scenarios.carbon_credit(ccus)
+
+
+@SIMULATION.cell('hyrex', 'eaf')
+def green(hyrex, eaf):
+    return scenarios.green_credit(hyrex, eaf)
+
+
+@SIMULATION.cell('scrap')
+def scrap_v(scrap):
+    return scenarios.scrap_credit(scrap)
+
+
+@SIMULATION.cell('h2')
+def h2_v(h2):
+    return scenarios.h2_credit(h2)
+
+
+@SIMULATION.cell('carbon', 'green', 'scrap_v', 'h2_v')
+def l1(carbon, green, scrap_v, h2_v):
+    return scenarios.level_1(carbon, green, scrap_v, h2_v)
+
+
+@SIMULATION.cell('l1', 'hyrex', 'eaf')
+def l2(l1, hyrex, eaf):
+    return scenarios.level_2(l1, hyrex, eaf)
+
+
+@SIMULATION.cell('l2', 'hyrex', 'h2')
+def l3(l2, hyrex, h2):
+    return scenarios.level_3(l2, hyrex, h2)
+
+
+@SIMULATION.cell('hyrex')
+def intensity(hyrex):
+    return scenarios.co2_intensity(hyrex)
+
+
+@SIMULATION.cell()
+def radar_frame():
+    fig = go.Figure()
+    fig.update_layout(
+        title={'text': 'Performance Radar', 'x': 0.5},
+        polar=dict(radialaxis=dict(range=[0, 100])), height=400, paper_bgcolor='rgba(0,0,0,0)'
+    )
+    return figures.frame(fig)
+
+
+@SIMULATION.cell('radar_frame', 'hyrex', 'eaf', 'scrap', 'h2', 'ccus')
+def radar(radar_frame, hyrex, eaf, scrap, h2, ccus):
+    values = [hyrex/200*100, eaf/200*100, scrap/150*100, h2/200*100, ccus/200*100]
+    return figures.compose(radar_frame, figures.trace(
+        type='scatterpolar', r=values + [values[0]], theta=CATEGORIES + [CATEGORIES[0]],
+        fill='toself', fillcolor='rgba(0,61,165,0.2)', line=dict(color='#003DA5', width=3)
+    ))
+
+
+@SIMULATION.cell()
+def credits_frame():
+    fig = go.Figure()
+    fig.update_layout(title={'text': 'Credits Comparison (₩B)', 'x': 0.5}, barmode='group', height=400, paper_bgcolor='rgba(0,0,0,0)')
+    return figures.frame(fig)
+
+
+@SIMULATION.cell('credits_frame', 'carbon', 'green', 'scrap_v', 'h2_v')
+def credits(credits_frame, carbon, green, scrap_v, h2_v):
+    base = scenarios.BASELINE
+    baseline = [base['carbon'], base['green'], base['scrap'], base['h2'], 0]
+    simulated = [carbon, green, scrap_v, h2_v, 0]
+    return figures.compose(
+        credits_frame,
+        figures.trace(type='bar', name='Baseline', x=CATEGORIES, y=baseline, marker=dict(color='#001F5B')),
+        figures.trace(type='bar', name='Simulated', x=CATEGORIES, y=simulated, marker=dict(color='#003DA5')),
+    )
+
+
+@SIMULATION.cell('sx', 'sy', 'hyrex', 'eaf', 'scrap', 'h2', 'ccus')
+def fixed(sx, sy, *values):
+    """The three parameters off the heatmap's axes, as ``(name, value)`` pairs."""
+    return tuple((p, v) for p, v in zip(scenarios.PARAMS, values) if p not in (sx, sy))
+
+
+@SIMULATION.cell('sx', 'sy', 'hyrex', 'eaf', 'scrap', 'h2', 'ccus')
+def marker(sx, sy, *values):
+    """The current scenario's position on the heatmap."""
+    scenario = dict(zip(scenarios.PARAMS, values))
+    return scenario[sx], scenario[sy]
+
+
+@SIMULATION.cell('sx', 'sy', 'metric', 'fixed')
+def sweep(sx, sy, metric, fixed):
+    return scenarios.sensitivity(sx, sy, metric, dict(fixed))
+
+
+@SIMULATION.cell('sx', 'sy', 'metric')
+def heatmap_frame(sx, sy, metric):
+    fig = go.Figure()
+    fig.update_layout(
+        title={'text': f"{METRICS[metric]}: {LABELS[sx]} × {LABELS[sy]}", 'x': 0.5},
+        xaxis_title=f"{LABELS[sx]} (%)", yaxis_title=f"{LABELS[sy]} (%)",
+        height=450, paper_bgcolor='rgba(0,0,0,0)', plot_bgcolor='rgba(0,0,0,0)'
+    )
+    return figures.frame(fig)
+
+
+@SIMULATION.cell('sweep', 'metric')
+def heatmap_z(sweep, metric):
+    """The heatmap trace, serialised: the bulk of the figure, kept while only the marker moves."""
+    xs, ys, z = sweep
+    # To 0.1 ₩B or kg/t: a third of the JSON full float64 precision takes
+    return figures.trace(
+        type='heatmap', x=xs, y=ys, z=z.round(1), colorscale='RdYlGn_r' if metric == 'intensity' else 'Blues',
+        colorbar=dict(title=dict(text=METRICS[metric]))
+    )
+
+
+@SIMULATION.cell('heatmap_frame', 'heatmap_z', 'marker')
+def heatmap(heatmap_frame, heatmap_z, marker):
+    return figures.compose(heatmap_frame, heatmap_z, figures.trace(
+        type='scatter', x=[marker[0]], y=[marker[1]], mode='markers',
+        marker=dict(color='#E4002B', size=14, symbol='x'), showlegend=False
+    ))
+
+
+# =============================================================================
+# PAGE
+# =============================================================================
+
+def load(params):
+    """Move the sliders to ``params``: before they are drawn, from a button callback or a shared link."""
+    ws = sessions.workspace()
+    ws.params['sim'] = {p: int(params[p]) for p in scenarios.PARAMS}
+    for p in scenarios.PARAMS:
+        st.session_state.pop(f"sim_{p}", None)
+
+
+def describe(params):
+    return ' · '.join(f"{LABELS[p]} {v}" for p, v in params)
+
+
+def share_link(scenario_id):
+    base = (st.context.url or '').split('?')[0]
+    return f"{base}?scenario={scenario_id}"
+
+
+def scenario_panel(m, ws):
+    """Save and share this scenario, load one an analyst saved, or go back to a recent one."""
+    with st.expander(m.scenarios_title):
+        c1, c2, c3 = st.columns(3)
+        with c1:
+            name = st.text_input(m.scenario_name, key='sim_scenario_name').strip()
+            if st.button(m.save_share, disabled=not name, use_container_width=True):
+                ws.shared = sessions.STORE.save(name, ws.params['sim']).id
+            if ws.shared is not None:
+                st.caption(m.share_link)
+                st.code(share_link(ws.shared), language=None)
+        with c2:
+            saved = {s.id: s for s in sessions.STORE.scenarios(SAVED_SHOWN)}
+            choice = st.selectbox(m.shared_scenarios, list(saved), index=None,
+                                  format_func=lambda i: f"{saved[i].name} ({describe(saved[i].params)})")
+            st.button(m.load_scenario, disabled=choice is None, use_container_width=True, key='sim_load_saved',
+                      on_click=load, args=(dict(saved[choice].params) if choice else None,))
+        with c3:
+            recent = list(reversed(ws.history))[1:]
+            choice = st.selectbox(m.recent_scenarios, range(len(recent)), index=None,
+                                  format_func=lambda i: describe(recent[i]))
+            st.button(m.restore, disabled=choice is None, use_container_width=True, key='sim_load_recent',
+                      on_click=load, args=(dict(recent[choice]) if choice is not None else None,))
+
+
+def render(data, version):
+    m = messages()
+    st.markdown(assets.header(m.simulation_title, m.simulation_subtitle), unsafe_allow_html=True)
+    
+    # This session's scenario lives server-side (ui/sessions.py); a shared
+    # link (?scenario=<id>) replaces it
+    shared = st.query_params.pop('scenario', None)
+    if shared:
+        scenario = sessions.STORE.scenario(shared)
+        if scenario is None:
+            st.warning(m.scenario_missing)
+        else:
+            load(dict(scenario.params))
+            st.success(f"{m.scenario_loaded}: {scenario.name}")
+    ws = sessions.workspace()
+    sim = ws.params.setdefault('sim', dict(scenarios.DEFAULTS))
+    
+    # Keyed, so a slider keeps its identity when its default follows the
+    # scenario (an unkeyed widget is re-created and drops every other move)
+    c1, c2 = st.columns(2)
+    
+    with c1:
+        hyrex = st.slider(m.slider_hyrex, 50, 200, sim['hyrex'], key='sim_hyrex')
+        eaf = st.slider(m.slider_eaf, 50, 200, sim['eaf'], key='sim_eaf')
+        scrap = st.slider(m.slider_scrap, 50, 150, sim['scrap'], key='sim_scrap')
+    
+    with c2:
+        h2 = st.slider(m.slider_h2, 50, 200, sim['h2'], key='sim_h2')
+        ccus = st.slider(m.slider_ccus, 50, 200, sim['ccus'], key='sim_ccus')
+    
+    ws.params['sim'] = {'hyrex': hyrex, 'eaf': eaf, 'scrap': scrap, 'h2': h2, 'ccus': ccus}
+    ws.remember(ws.params['sim'])
+    scenario_panel(m, ws)
+    
+    # Calculate: only the cells downstream of a moved slider recompute
+    base = scenarios.BASELINE  # ₩B, sliders at 100%
+    cells = SIMULATION.run(dict(ws.params['sim']), ws.cache.setdefault('sim_cells', {}))
+    sim_l1, sim_l2, sim_l3, intensity = (cells[k] for k in ('l1', 'l2', 'l3', 'intensity'))
+    
+    st.markdown("---")
+    st.markdown(f"### {m.results_title}")
+    
+    c1, c2, c3, c4 = st.columns(4)
+    with c1: st.metric("Level 1", f"₩{sim_l1:.0f}B", f"{((sim_l1/base['l1'])-1)*100:+.1f}%")
+    with c2: st.metric("Level 2", f"₩{sim_l2/1000:.2f}T", f"{((sim_l2/base['l2'])-1)*100:+.1f}%")
+    with c3: st.metric("Total", f"₩{sim_l3/1000:.2f}T", f"{((sim_l3/base['l3'])-1)*100:+.1f}%")
+    with c4: st.metric("CO₂ (kg/t)", f"{intensity:.0f}", f"{((intensity/base['intensity'])-1)*100:+.1f}%")
+    
+    # Charts
+    c1, c2 = st.columns(2)
+    with c1:
+        figures.plotly_spec('simulation', 'radar', cells['radar'])
+    with c2:
+        figures.plotly_spec('simulation', 'credits', cells['credits'])
+    
+    # Sensitivity Heatmap
+    st.markdown("---")
+    st.markdown(f"### {m.sensitivity_title}")
+    
+    c1, c2, c3 = st.columns(3)
+    with c1:
+        sx = st.selectbox("X", scenarios.PARAMS, index=0, format_func=LABELS.get)
+    with c2:
+        sy = st.selectbox("Y", [p for p in scenarios.PARAMS if p != sx], index=0, format_func=LABELS.get)
+    with c3:
+        metric = st.selectbox(m.metric, list(METRICS), index=2, format_func=METRICS.get)
+    
+    cells.update(sx=sx, sy=sy, metric=metric)
+    figures.plotly_spec('simulation', 'sensitivity', cells['heatmap'])
+    
+    # Monte Carlo Uncertainty
+    st.markdown("---")
+    st.markdown(f"### 🎲 {m.mc_title}")
+    
+    if st.toggle(m.mc_mode, value=False):
+        distributions = {}
+        with st.expander(m.mc_distributions):
+            for key, (kind, *params) in montecarlo.DEFAULT_DISTRIBUTIONS.items():
+                cols = st.columns([2, 1, 1, 1])
+                cols[0].markdown(f"**{getattr(m, 'mc_' + key)}**")
+                low, mode, high = (
+                    cols[i + 1].number_input(name, value=float(v), key=f"mc_{key}_{name}", label_visibility='collapsed')
+                    for i, (name, v) in enumerate(zip(('low', 'mode', 'high'), params))
+                )
+                low, mode, high = sorted((low, mode, high))
+                distributions[key] = ('fixed', low) if low == high else ('triangular', low, mode, high)
+        
+        c1, c2, c3 = st.columns(3)
+        with c1:
+            n_draws = st.select_slider(m.draws, options=[100_000, 1_000_000, 10_000_000],
+                                       value=1_000_000, format_func=lambda n: f"{n:,}")
+        with c2:
+            seed = st.number_input(m.seed, value=2024, step=1)
+        with c3:
+            st.markdown("<br>", unsafe_allow_html=True)
+            run_mc = st.button(m.run, use_container_width=True)
+        
+        # A summary holds only for the scenario, distributions, seed and draws it was run with
+        mc_key = (tuple(ws.params['sim'].items()), tuple(distributions.items()), int(seed), n_draws)
+        if run_mc:
+            with st.spinner(m.simulating):
+                sketches = montecarlo.run(n_draws, ws.params['sim'], distributions, seed=int(seed),
+                                          executor=monte_carlo_pool())
+            ws.cache['mc'] = {'key': mc_key, 'draws': n_draws, 'seed': int(seed),
+                              'summary': montecarlo.summarise(sketches)}
+        elif 'mc' in ws.cache and ws.cache['mc']['key'] != mc_key:
+            del ws.cache['mc']
+            st.caption(m.mc_rerun)
+        
+        if 'mc' in ws.cache:
+            mc = ws.cache['mc']['summary']
+            point = {'l1': sim_l1, 'l2': sim_l2, 'l3': sim_l3, 'intensity': intensity}
+            st.dataframe(pd.DataFrame([
+                {'': METRICS[k], 'Point': f"{point[k]:,.0f}", 'P5': f"{mc[k][5]:,.0f}", 'P50': f"{mc[k][50]:,.0f}",
+                 'P95': f"{mc[k][95]:,.0f}", 'Mean': f"{mc[k]['mean']:,.0f}"}
+                for k in montecarlo.OUTPUTS
+            ]), use_container_width=True, hide_index=True)
+            
+            levels = ['l1', 'l2', 'l3']
+            fig = go.Figure(go.Bar(
+                x=[METRICS[k] for k in levels], y=[mc[k][50] for k in levels], marker_color=['#003DA5', '#E4002B', '#00B894'],
+                error_y=dict(type='data', symmetric=False,
+                             array=[mc[k][95] - mc[k][50] for k in levels],
+                             arrayminus=[mc[k][50] - mc[k][5] for k in levels])
+            ))
+            fig.update_layout(
+                title={'text': f"P5 / P50 / P95 ({ws.cache['mc']['draws']:,} draws, seed {ws.cache['mc']['seed']})", 'x': 0.5},
+                height=400, paper_bgcolor='rgba(0,0,0,0)', plot_bgcolor='rgba(0,0,0,0)'
+            )
+            st.plotly_chart(fig, use_container_width=True)